@@ -9,10 +9,11 @@ Idempotency:
 - UniqueViolation caught and logged (race condition between re-deliveries)
 
 Reliability: connection/topology/retry/DLQ boilerplate lives in the shared
-``messaging.ConsumerBase`` — whose retry mechanics (republish to our OWN
-queue via the default exchange with an incremented ``x-retry-count``
-header) were modelled on this very consumer. Unparseable payloads raise
-``PoisonMessageError`` and are dead-lettered without retries.
+``messaging.ConsumerBase`` — whose retry mechanics (republish with an
+incremented ``x-retry-count`` header, only ever back to our OWN queue)
+were modelled on this very consumer; retries now wait in the queue's
+delay tiers first. Unparseable payloads raise ``PoisonMessageError`` and
+are dead-lettered without retries.
 
 DB access is sync SQLAlchemy (this service's persistence is still sync,
 see P3-01) and runs via ``asyncio.to_thread`` so it never blocks the
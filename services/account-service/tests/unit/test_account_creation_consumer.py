@@ -13,6 +13,7 @@ from app.consumers.account_creation_consumer import (
     QUEUE_NAME,
     AccountCreationConsumer,
 )
+from messaging import RetryTiers
 
 
 def _make_consumer() -> AccountCreationConsumer:
@@ -55,7 +56,8 @@ class TestAccountCreationConsumerRetry:
         publish = consumer._channel.default_exchange.publish
         publish.assert_awaited_once()
         republished, kwargs = publish.await_args
-        assert kwargs["routing_key"] == QUEUE_NAME
+        # Parked in the first delay tier, which dead-letters back to QUEUE_NAME.
+        assert kwargs["routing_key"] == RetryTiers(QUEUE_NAME).queue_for(1)
         assert republished[0].headers["x-retry-count"] == 1
         assert republished[0].body == message.body
         # Republished copy replaces the original, which is acked (not nacked)
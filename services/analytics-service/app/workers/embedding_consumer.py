@@ -9,6 +9,13 @@ til egen kø (default exchange), ikke til topic-exchangen — en
 topic-republish ville fan-oute retry-kopien til alle andre
 ``transaction.*``-bundne køer (projektioner, budget, goals).
 
+Retries går via forsinkelses-køer ``analytics.embeddings.retry.<ms>ms``
+(TTL 1 s, 5 s, 25 s) der dead-letter'er tilbage til egen kø, valgt ud fra
+``x-retry-count``. Samme layout som ``messaging.RetryTiers`` — denne
+service afhænger ikke af messaging-pakken. Tidligere sov consumeren
+mellem forsøg, hvilket stallede hele køen (prefetch=1) under et
+Ollama-udfald.
+
 Kør som selvstændig proces::
 
     python -m app.workers.embedding_consumer
@@ -49,7 +56,9 @@ EXCHANGE_NAME = "finans_tracker.events"
 QUEUE_NAME = "analytics.embeddings"
 ROUTING_KEYS = ["transaction.*"]
 MAX_RETRIES = 3
-STALE_RETRY_BACKOFF_S = 1.0
+# Eksponentielle forsinkelser pr. retry; giver også projektions-køen tid
+# til at indhente et stale event.
+RETRY_DELAYS_S = (1.0, 5.0, 25.0)
 
 # deleted er bevidst udeladt: tombstones filtreres af alle queries, en
 # vektor på dem er ligegyldig — eventet ackes som ignoreret.
@@ -88,6 +97,17 @@ class EmbeddingConsumer:
         for routing_key in ROUTING_KEYS:
             await queue.bind(exchange, routing_key=routing_key)
 
+        for delay_s in RETRY_DELAYS_S:
+            await self._channel.declare_queue(
+                retry_queue_name(delay_s),
+                durable=True,
+                arguments={
+                    "x-message-ttl": int(delay_s * 1000),
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": QUEUE_NAME,
+                },
+            )
+
         await queue.consume(self._on_message)
         logger.info("Consumer %s lytter på %s", QUEUE_NAME, ROUTING_KEYS)
 
@@ -136,11 +156,6 @@ class EmbeddingConsumer:
                     correlation_id,
                     exc,
                 )
-                if isinstance(exc, StaleProjectionError):
-                    # Giv projektions-køen tid til at indhente eventet.
-                    # Blokerer hele køen (prefetch=1) — acceptabelt: lav
-                    # throughput, og senere events er typisk lige så stale.
-                    await asyncio.sleep(STALE_RETRY_BACKOFF_S * (retry_count + 1))
                 await self._republish(message, retry_count + 1)
                 await message.ack()
             else:
@@ -162,8 +177,14 @@ class EmbeddingConsumer:
             content_type="application/json",
             headers=headers,
         )
-        # Direkte til egen kø — retry må ikke fan-oute via topic-exchangen.
-        await self._channel.default_exchange.publish(msg, routing_key=QUEUE_NAME)
+        # Via forsinkelses-køen tilbage til egen kø — retry må ikke fan-oute
+        # via topic-exchangen.
+        delay_s = RETRY_DELAYS_S[min(retry_count, len(RETRY_DELAYS_S)) - 1]
+        await self._channel.default_exchange.publish(msg, routing_key=retry_queue_name(delay_s))
+
+
+def retry_queue_name(delay_s: float) -> str:
+    return f"{QUEUE_NAME}.retry.{int(delay_s * 1000)}ms"
 
 
 async def main() -> None:
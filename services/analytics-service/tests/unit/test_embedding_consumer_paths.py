@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 from unittest.mock import AsyncMock
 
-import pytest
 from app.application.embedding_projection import StaleProjectionError
-from app.workers.embedding_consumer import MAX_RETRIES, QUEUE_NAME, EmbeddingConsumer
+from app.workers.embedding_consumer import (
+    MAX_RETRIES,
+    QUEUE_NAME,
+    RETRY_DELAYS_S,
+    EmbeddingConsumer,
+    retry_queue_name,
+)
 from contracts.events.transaction import TransactionCreatedEvent
 
 
@@ -72,11 +78,8 @@ async def test_unparseable_body_goes_to_dlq() -> None:
     message.nack.assert_awaited_once_with(requeue=False)
 
 
-async def test_stale_projection_republishes_to_own_queue_not_topic_exchange(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+async def test_stale_projection_republishes_to_own_queue_not_topic_exchange() -> None:
     """Retry må ikke fan-oute til andre transaction.*-bundne køer."""
-    monkeypatch.setattr("app.workers.embedding_consumer.STALE_RETRY_BACKOFF_S", 0.0)
     handler = AsyncMock(side_effect=StaleProjectionError("ikke projiceret endnu"))
     consumer = make_consumer(handler)
     consumer._channel = AsyncMock()
@@ -86,12 +89,28 @@ async def test_stale_projection_republishes_to_own_queue_not_topic_exchange(
 
     publish = consumer._channel.default_exchange.publish
     publish.assert_awaited_once()
-    assert publish.await_args.kwargs["routing_key"] == QUEUE_NAME
+    # Første forsinkelses-kø, som dead-letter'er tilbage til QUEUE_NAME.
+    assert publish.await_args.kwargs["routing_key"] == retry_queue_name(RETRY_DELAYS_S[0])
+    assert retry_queue_name(RETRY_DELAYS_S[0]).startswith(f"{QUEUE_NAME}.retry.")
     assert publish.await_args.args[0].headers["x-retry-count"] == 1
     consumer._channel.declare_exchange.assert_not_awaited()
     message.ack.assert_awaited_once()
 
 
+async def test_retry_does_not_block_the_consumer() -> None:
+    """Ingen sleep i callbacken: næste retry-tier vælges ud fra x-retry-count."""
+    handler = AsyncMock(side_effect=RuntimeError("Ollama nede"))
+    consumer = make_consumer(handler)
+    consumer._channel = AsyncMock()
+    message = make_message(valid_body(), retry_count=MAX_RETRIES - 1)
+
+    await asyncio.wait_for(consumer._on_message(message), timeout=0.5)
+
+    publish = consumer._channel.default_exchange.publish
+    assert publish.await_args.kwargs["routing_key"] == retry_queue_name(RETRY_DELAYS_S[MAX_RETRIES - 1])
+    message.ack.assert_awaited_once()
+
+
 async def test_failure_at_max_retries_goes_to_dlq() -> None:
     handler = AsyncMock(side_effect=RuntimeError("Ollama nede"))
     consumer = make_consumer(handler)
@@ -25,7 +25,7 @@ import logging
 from typing import Any
 
 from aio_pika.abc import AbstractIncomingMessage
-from messaging import ConsumerBase, setup_worker_logging
+from messaging import ConsumerBase, InboxFilter, setup_worker_logging
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -50,12 +50,22 @@ class AccountProjectionConsumer(ConsumerBase):
             queue_name=QUEUE_NAME,
             routing_keys=ROUTING_KEYS,
         )
+        self._inbox = InboxFilter()
+
+    async def on_start(self) -> None:
+        async with async_session_factory() as session:
+            await self._inbox.warm(
+                session,
+                select(ProcessedEventModel.correlation_id).where(ProcessedEventModel.consumer_name == QUEUE_NAME),
+            )
 
     async def handle(self, payload: dict[str, Any], message: AbstractIncomingMessage) -> None:
         correlation_id = payload.get("correlation_id", "")
 
         async with async_session_factory() as session:
-            if correlation_id and await self._is_duplicate(session, correlation_id):
+            if correlation_id and await self._inbox.is_duplicate(
+                correlation_id, lambda: self._is_duplicate(session, correlation_id)
+            ):
                 logger.info("Skipping duplicate (correlation_id=%s)", correlation_id)
                 return
 
@@ -84,6 +94,9 @@ class AccountProjectionConsumer(ConsumerBase):
                 )
                 return
 
+            if correlation_id:
+                self._inbox.add(correlation_id)
+
         logger.info(
             "Upserted account projection: account_id=%d, name=%s",
             account_id,
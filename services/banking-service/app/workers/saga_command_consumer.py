@@ -17,7 +17,7 @@ import aio_pika
 from aio_pika import ExchangeType
 from aio_pika.abc import AbstractIncomingMessage
 from contracts.events.bank import BankSyncCompletedEvent, SyncTrigger
-from messaging import OutboxRepository
+from messaging import OutboxRepository, RetryTiers
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -36,6 +36,10 @@ EXCHANGE_NAME = "finans_tracker.events"
 QUEUE_NAME = "banking_service.saga_commands"
 ROUTING_KEYS = ["saga.cmd.bank_fetch_transactions", "saga.cmd.mark_sync_complete"]
 MAX_RETRIES = 3
+#: Failed commands wait in TTL'd delay queues (1 s, 5 s, 25 s) that
+#: dead-letter back to QUEUE_NAME, instead of an immediate republish that
+#: burns every retry within milliseconds of a downstream outage.
+RETRY_TIERS = RetryTiers(QUEUE_NAME)
 
 
 def _parse_sync_trigger(raw: str | None) -> SyncTrigger:
@@ -154,6 +158,7 @@ class BankingSagaCommandConsumer:
         )
         for key in ROUTING_KEYS:
             await queue.bind(exchange, routing_key=key)
+        await RETRY_TIERS.declare(self._channel)
         await queue.consume(self._on_message)
 
         logger.info("Banking saga command consumer started, listening on %s", ROUTING_KEYS)
@@ -444,16 +449,9 @@ class BankingSagaCommandConsumer:
     async def _republish(self, original: AbstractIncomingMessage, retry_count: int) -> None:
         if self._channel is None:
             return
-        exchange = await self._channel.declare_exchange(EXCHANGE_NAME, ExchangeType.TOPIC, durable=True)
-        headers = dict(original.headers or {})
-        headers["x-retry-count"] = retry_count
-        msg = aio_pika.Message(
-            body=original.body,
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-            content_type="application/json",
-            headers=headers,
-        )
-        await exchange.publish(msg, routing_key=original.routing_key or "")
+        # Via the delay tier straight back to our own queue — not the topic
+        # exchange, which would fan the retry out to every bound queue.
+        await RETRY_TIERS.schedule(self._channel, original.body, retry_count, headers=original.headers)
 
 
 async def main() -> None:
@@ -0,0 +1,165 @@
+"""Aho-Corasick multi-keyword matcher.
+
+Answers "which of these keywords occur in this text, and which of them
+comes first in priority order?" in one pass over the text, however many
+keywords there are — the question :class:`RuleEngine` used to answer by
+testing every keyword with ``in``.
+
+Keywords are given in priority order; :meth:`KeywordAutomaton.first`
+returns the payload of the lowest-index keyword occurring anywhere in the
+text.  Each trie node carries the best (lowest) index among the keywords
+ending there *or* at any node on its failure chain, computed once at
+build time, so matching is a single walk that keeps a running minimum.
+
+:meth:`KeywordAutomaton.matches` returns every keyword occurring in the
+text instead, in priority order, for callers whose best text hit can
+still be rejected by other constraints; :class:`PrefixIndex` answers the
+same for keywords the text starts with.
+
+Build is O(total keyword length) and memory one dict per trie node —
+about 15 µs and 1 KiB per keyword for merchant-name keywords; see
+``benchmarks/bench_rule_engine.py``.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import deque
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_NONE = -1
+
+
+class KeywordAutomaton(Generic[T]):
+    """Compiled keyword set; ``first(text)`` is the highest-priority hit."""
+
+    __slots__ = ("_goto", "_fail", "_ends", "_out", "_best", "_payloads", "_always")
+
+    def __init__(self, keywords: Sequence[tuple[str, T]]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        ends: list[tuple[int, ...]] = [()]
+        always: list[int] = []
+        for index, (keyword, _payload) in enumerate(keywords):
+            if not keyword:
+                # ``"" in text`` is always true: the empty keyword matches
+                # everything, at its place in the priority order.
+                always.append(index)
+                continue
+            node = 0
+            for char in keyword:
+                child = goto[node].get(char)
+                if child is None:
+                    child = len(goto)
+                    goto[node][char] = child
+                    goto.append({})
+                    ends.append(())
+                node = child
+            ends[node] = (*ends[node], index)
+
+        fail = [0] * len(goto)
+        # Nearest node on the failure chain where a keyword ends (0: none).
+        out = [0] * len(goto)
+        best = [node_ends[0] if node_ends else _NONE for node_ends in ends]
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = target = goto[state].get(char, 0)
+                out[child] = target if ends[target] else out[target]
+                inherited = best[target]
+                if inherited != _NONE and (best[child] == _NONE or inherited < best[child]):
+                    best[child] = inherited
+                queue.append(child)
+
+        self._goto = goto
+        self._fail = fail
+        self._ends = ends
+        self._out = out
+        self._best = best
+        self._payloads = [payload for _keyword, payload in keywords]
+        self._always = tuple(always)
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def approximate_bytes(self) -> int:
+        """Rough memory footprint: trie nodes, link tables and payloads."""
+        size = sys.getsizeof
+        return (
+            sum(map(size, self._goto))
+            + sum(map(size, self._payloads))
+            + sum(map(size, (self._goto, self._fail, self._ends, self._out, self._best, self._payloads)))
+        )
+
+    def first(self, text: str) -> T | None:
+        """Payload of the highest-priority keyword occurring in ``text``."""
+        goto, fail, best_at = self._goto, self._fail, self._best
+        best = self._always[0] if self._always else _NONE
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found = best_at[state]
+            if found != _NONE and (best == _NONE or found < best):
+                best = found
+                if best == 0:
+                    break
+        return None if best == _NONE else self._payloads[best]
+
+    def matches(self, text: str) -> list[T]:
+        """Payloads of every keyword occurring in ``text``, in priority order."""
+        goto, fail, ends, out = self._goto, self._fail, self._ends, self._out
+        found = set(self._always)
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            node = state if ends[state] else out[state]
+            while node:
+                found.update(ends[node])
+                node = out[node]
+        return [self._payloads[index] for index in sorted(found)]
+
+
+class PrefixIndex(Generic[T]):
+    """Compiled keyword set; ``matches(text)`` is every keyword ``text`` starts with."""
+
+    __slots__ = ("_goto", "_ends", "_payloads")
+
+    def __init__(self, keywords: Sequence[tuple[str, T]]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        ends: list[tuple[int, ...]] = [()]
+        for index, (keyword, _payload) in enumerate(keywords):
+            node = 0
+            for char in keyword:
+                child = goto[node].get(char)
+                if child is None:
+                    child = len(goto)
+                    goto[node][char] = child
+                    goto.append({})
+                    ends.append(())
+                node = child
+            ends[node] = (*ends[node], index)
+        self._goto = goto
+        self._ends = ends
+        self._payloads = [payload for _keyword, payload in keywords]
+
+    def matches(self, text: str) -> list[T]:
+        """Payloads of every keyword that is a prefix of ``text``, in priority order."""
+        goto, ends = self._goto, self._ends
+        found = list(ends[0])
+        node = 0
+        for char in text:
+            node = goto[node].get(char, _NONE)
+            if node == _NONE:
+                break
+            found.extend(ends[node])
+        return [self._payloads[index] for index in sorted(found)]
@@ -28,6 +28,26 @@ class PostgresCategorizationResultRepository(ICategorizationResultRepository):
         await self._session.refresh(model)
         return self._to_entity(model)
 
+    async def save_many(self, records: list[CategorizationResultRecord]) -> None:
+        """Add a batch of audit rows with one flush and no per-row refresh.
+
+        The batched consumer never reads the generated ids back, so the
+        ``refresh`` round-trip ``save`` pays per row is skipped here.
+        """
+        self._session.add_all(
+            CategorizationResultModel(
+                transaction_id=record.transaction_id,
+                category_id=record.category_id,
+                subcategory_id=record.subcategory_id,
+                merchant_id=record.merchant_id,
+                tier=record.tier.value,
+                confidence=record.confidence.value,
+                model_version=record.model_version,
+            )
+            for record in records
+        )
+        await self._session.flush()
+
     async def find_by_transaction_id(
         self,
         transaction_id: int,
@@ -3,15 +3,21 @@
 Two core behaviors:
   1. Longest-match-first: keywords sorted by length descending
   2. Danish-character normalisation: oe->oe, ae->ae, aa->aa
+
+Keywords are compiled at construction into a :class:`KeywordAutomaton`,
+so a match is one pass over the description however many rules there
+are, instead of a substring test per keyword.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Optional
 
+from app.adapters.outbound.keyword_automaton import KeywordAutomaton, PrefixIndex
 from app.domain.value_objects import (
     CategorizationResult,
     CategorizationTier,
@@ -21,6 +27,9 @@ from app.domain.value_objects import (
 
 logger = logging.getLogger(__name__)
 
+#: Evidence a :class:`PersistedSeedRule` can match on.
+_EVIDENCE_FIELDS = ("description", "merchant", "counterparty")
+
 
 def _normalize_for_matching(text: str) -> str:
     """Lowercase + Danish ASCII transliteration (oe->oe, ae->ae, aa->aa)."""
@@ -34,7 +43,9 @@ class RuleEngine:
       keyword_mappings:    list of (keyword, subcategory_name)
       subcategory_lookup:  dict[subcategory_name -> (subcategory_id, category_id)]
 
-    Keywords are normalised once at construction time.
+    Keywords are normalised and compiled once at construction time.  A
+    keyword whose subcategory is not in the lookup can never match; it is
+    dropped then, with one warning.
     """
 
     def __init__(
@@ -42,11 +53,61 @@ class RuleEngine:
         keyword_mappings: list[tuple[str, str]],
         subcategory_lookup: dict[str, tuple[int, int]],
     ):
-        normalised = [
-            (_normalize_for_matching(keyword), subcategory_name) for keyword, subcategory_name in keyword_mappings
-        ]
-        self._sorted_keywords = sorted(normalised, key=lambda kv: len(kv[0]), reverse=True)
-        self._lookup = subcategory_lookup
+        self._automaton = self._compile([keyword_mappings], subcategory_lookup)
+
+    @classmethod
+    def tiered(
+        cls,
+        keyword_tiers: Sequence[list[tuple[str, str]]],
+        subcategory_lookup: dict[str, tuple[int, int]],
+    ) -> RuleEngine:
+        """One engine equivalent to ``TieredRuleEngine`` over one ``RuleEngine`` per tier.
+
+        Tier order decides across tiers and longest-match within one, as
+        there — but every tier shares a single automaton and a single
+        pass over the description.
+        """
+        engine = cls.__new__(cls)
+        engine._automaton = cls._compile(keyword_tiers, subcategory_lookup)
+        return engine
+
+    @staticmethod
+    def _compile(
+        keyword_tiers: Sequence[list[tuple[str, str]]],
+        subcategory_lookup: dict[str, tuple[int, int]],
+    ) -> KeywordAutomaton[CategorizationResult]:
+        prioritised: list[tuple[str, CategorizationResult]] = []
+        for keyword_mappings in keyword_tiers:
+            normalised = [
+                (_normalize_for_matching(keyword), subcategory_name) for keyword, subcategory_name in keyword_mappings
+            ]
+            # Stable: equal-length keywords keep their given order.
+            for keyword, subcategory_name in sorted(normalised, key=lambda kv: len(kv[0]), reverse=True):
+                ids = subcategory_lookup.get(subcategory_name)
+                if ids is None:
+                    logger.warning(
+                        "Keyword '%s' mapped to unknown subcategory '%s'",
+                        keyword,
+                        subcategory_name,
+                    )
+                    continue
+                subcat_id, cat_id = ids
+                prioritised.append(
+                    (
+                        keyword,
+                        CategorizationResult(
+                            category_id=cat_id,
+                            subcategory_id=subcat_id,
+                            tier=CategorizationTier.RULE,
+                            confidence=Confidence.HIGH,
+                        ),
+                    )
+                )
+        return KeywordAutomaton(prioritised)
+
+    def approximate_bytes(self) -> int:
+        """Rough memory footprint of the compiled keywords (cache sizing)."""
+        return self._automaton.approximate_bytes()
 
     def match(
         self,
@@ -59,30 +120,7 @@ class RuleEngine:
         provider: str | None = None,
         country: str | None = None,
     ) -> Optional[CategorizationResult]:
-        desc_normalised = _normalize_for_matching(description)
-
-        for keyword, subcategory_name in self._sorted_keywords:
-            if keyword not in desc_normalised:
-                continue
-
-            ids = self._lookup.get(subcategory_name)
-            if ids is None:
-                logger.warning(
-                    "Keyword '%s' mapped to unknown subcategory '%s'",
-                    keyword,
-                    subcategory_name,
-                )
-                continue
-
-            subcat_id, cat_id = ids
-            return CategorizationResult(
-                category_id=cat_id,
-                subcategory_id=subcat_id,
-                tier=CategorizationTier.RULE,
-                confidence=Confidence.HIGH,
-            )
-
-        return None
+        return self._automaton.first(_normalize_for_matching(description))
 
 
 class TieredRuleEngine:
@@ -141,13 +179,74 @@ class PersistedSeedRule:
     merchant_id: int | None = None
 
 
+class _FieldIndex:
+    """Text index over the rules of one (match field, direction) bucket.
+
+    ``equals`` aliases live in a dict, ``prefix`` aliases in a
+    :class:`PrefixIndex` and everything else — ``contains`` and unknown
+    operators, which the engine has always treated as ``contains`` — in a
+    :class:`KeywordAutomaton`.  Payloads are rule ranks.
+    """
+
+    __slots__ = ("_equals", "_prefix", "_contains")
+
+    def __init__(self, entries: list[tuple[int, str, str]]):
+        equals: dict[str, list[int]] = {}
+        prefix: list[tuple[str, int]] = []
+        contains: list[tuple[str, int]] = []
+        for rank, operator, alias in entries:
+            if operator == "equals":
+                equals.setdefault(alias, []).append(rank)
+            elif operator == "prefix":
+                prefix.append((alias, rank))
+            else:
+                contains.append((alias, rank))
+        self._equals = equals
+        self._prefix = PrefixIndex(prefix) if prefix else None
+        self._contains = KeywordAutomaton(contains) if contains else None
+
+    def candidates(self, value: str, into: set[int]) -> None:
+        """Add the rank of every rule whose text test ``value`` passes."""
+        into.update(self._equals.get(value, ()))
+        if self._prefix is not None:
+            into.update(self._prefix.matches(value))
+        if self._contains is not None:
+            into.update(self._contains.matches(value))
+
+
 class ConstrainedRuleEngine:
-    """TAX-06 rule engine: every match applies the persisted evidence constraints."""
+    """TAX-06 rule engine: every match applies the persisted evidence constraints.
+
+    Rules are ranked once, longest alias first, and their aliases
+    normalised and indexed per (match field, direction) at construction.
+    A match looks the normalised evidence up in the few indexes that
+    apply, then checks provider, country and amount range on the
+    candidate rules only, in rank order — the first rule the linear scan
+    over every rule would have returned.
+    """
 
     def __init__(self, rules: list[PersistedSeedRule]):
         self._rules = sorted(
             rules, key=lambda rule: max((len(v) for v in rule.aliases), default=len(rule.pattern)), reverse=True
         )
+        self._results = [
+            CategorizationResult(
+                category_id=rule.target_category_id,
+                subcategory_id=rule.target_subcategory_id,
+                merchant_id=rule.merchant_id,
+                tier=CategorizationTier.RULE,
+                confidence=rule.confidence,
+            )
+            for rule in self._rules
+        ]
+        buckets: dict[tuple[str, str], list[tuple[int, str, str]]] = {}
+        for rank, rule in enumerate(self._rules):
+            if rule.match_field not in _EVIDENCE_FIELDS:
+                continue
+            entries = buckets.setdefault((rule.match_field, rule.direction), [])
+            for value in rule.aliases or (rule.pattern,):
+                entries.append((rank, rule.operator, _normalize_for_matching(value)))
+        self._indexes = {key: _FieldIndex(entries) for key, entries in buckets.items()}
 
     def match(
         self,
@@ -168,11 +267,24 @@ class ConstrainedRuleEngine:
         # Direction is supplied, never inferred: the amount carries only
         # magnitude on this path, so guessing from its sign classified every
         # transaction as incoming and skipped all 75 outgoing rules (TAX-14).
-        absolute_amount = Decimal(str(abs(amount)))
-        for rule in self._rules:
-            raw = evidence.get(rule.match_field)
-            if raw is None or (rule.direction != "any" and rule.direction != direction):
+        candidates: set[int] = set()
+        for field, raw in evidence.items():
+            if raw is None:
                 continue
+            normalized: str | None = None
+            for rule_direction in ("any", direction):
+                index = self._indexes.get((field, rule_direction))
+                if index is None:
+                    continue
+                if normalized is None:
+                    normalized = _normalize_for_matching(raw)
+                index.candidates(normalized, candidates)
+        if not candidates:
+            return None
+
+        absolute_amount = Decimal(str(abs(amount)))
+        for rank in sorted(candidates):
+            rule = self._rules[rank]
             if rule.provider is not None and rule.provider != provider:
                 continue
             if rule.country is not None and rule.country != country:
@@ -181,25 +293,5 @@ class ConstrainedRuleEngine:
                 continue
             if rule.maximum_amount is not None and absolute_amount > rule.maximum_amount:
                 continue
-            normalized = _normalize_for_matching(raw)
-            candidates = rule.aliases or (rule.pattern,)
-            if not any(
-                self._matches(normalized, _normalize_for_matching(value), rule.operator) for value in candidates
-            ):
-                continue
-            return CategorizationResult(
-                category_id=rule.target_category_id,
-                subcategory_id=rule.target_subcategory_id,
-                merchant_id=rule.merchant_id,
-                tier=CategorizationTier.RULE,
-                confidence=rule.confidence,
-            )
+            return self._results[rank]
         return None
-
-    @staticmethod
-    def _matches(value: str, pattern: str, operator: str) -> bool:
-        if operator == "equals":
-            return value == pattern
-        if operator == "prefix":
-            return value.startswith(pattern)
-        return pattern in value
@@ -51,27 +51,76 @@ class CategorizationService:
         self,
         requests: list[CategorizeRequestDTO],
     ) -> list[CategorizeResponseDTO]:
-        """Batch categorization — rule engine on all, then ML/LLM on remainder."""
-        return [await self.categorize(r) for r in requests]
+        """Batch categorization — rule engine on all, then ML/LLM on remainder.
+
+        Requests whose match inputs are identical (everything but
+        ``transaction_id``) go through the pipeline once, and the result is
+        fanned back out: re-imports and reclassification batches repeat the
+        same recurring payments many times over.  The LLM tier, when wired,
+        gets the rule and ML misses in one ``predict_batch`` call.
+        """
+        keys = [self._match_key(request) for request in requests]
+        distinct: dict[tuple[object, ...], CategorizeRequestDTO] = {}
+        for key, request in zip(keys, requests):
+            distinct.setdefault(key, request)
+        results = dict(zip(distinct, self._run_pipeline_batch(list(distinct.values()))))
+        return [self._to_response(results[key]) for key in keys]
+
+    @staticmethod
+    def _match_key(request: CategorizeRequestDTO) -> tuple[object, ...]:
+        # Exact values, not normalised ones: an ``equals`` rule or the ML
+        # tier may tell apart inputs a normalised key would merge.
+        return (
+            request.description,
+            request.amount,
+            request.direction,
+            request.merchant,
+            request.counterparty,
+            request.provider,
+            request.country,
+        )
+
+    def _run_pipeline_batch(self, requests: list[CategorizeRequestDTO]) -> list[CategorizationResult]:
+        results: list[CategorizationResult | None] = [self._try_tier("rules", self._rule_matcher(r)) for r in requests]
+
+        ml = self._ml
+        if ml is not None:
+            for index, request in enumerate(requests):
+                if results[index] is None:
+                    results[index] = self._try_tier("ml", partial(ml.predict, request.description))
+
+        llm = self._llm
+        pending = [index for index, result in enumerate(results) if result is None]
+        if llm is not None and pending:
+            for index, result in zip(pending, self._predict_llm_batch(llm, [requests[i] for i in pending])):
+                results[index] = result
+
+        exhausted = sum(result is None for result in results)
+        if exhausted:
+            logger.warning(
+                "All categorization tiers exhausted for %d of %d requests; using fallback", exhausted, len(requests)
+            )
+        return [self._absolute_fallback() if result is None else result for result in results]
+
+    def _predict_llm_batch(
+        self, llm: ILlmCategorizer, requests: list[CategorizeRequestDTO]
+    ) -> list[CategorizationResult | None]:
+        try:
+            results: list[CategorizationResult | None] = list(
+                llm.predict_batch([(request.description, request.amount) for request in requests])
+            )
+            if len(results) != len(requests):
+                raise ValueError(f"predict_batch returned {len(results)} results for {len(requests)} requests")
+            return results
+        except Exception:
+            # One bad item must not cost the others their LLM answer.
+            logger.exception("Categorization tier 'llm' failed for a batch; retrying per request")
+            return [self._try_tier("llm", partial(llm.predict, r.description, r.amount)) for r in requests]
 
     def _run_pipeline(self, request: CategorizeRequestDTO) -> CategorizationResult:
         description = request.description
         amount = request.amount
-        evidence = (request.merchant, request.counterparty, request.provider, request.country)
-        if any(value is not None for value in evidence):
-            match_rule = partial(
-                self._rule_engine.match,
-                description,
-                amount,
-                direction=request.direction,
-                merchant=request.merchant,
-                counterparty=request.counterparty,
-                provider=request.provider,
-                country=request.country,
-            )
-        else:
-            match_rule = partial(self._rule_engine.match, description, amount, direction=request.direction)
-        result = self._try_tier("rules", match_rule)
+        result = self._try_tier("rules", self._rule_matcher(request))
         if result is not None:
             return result
 
@@ -100,6 +149,21 @@ class CategorizationService:
         logger.warning("All categorization tiers exhausted; using fallback")
         return self._absolute_fallback()
 
+    def _rule_matcher(self, request: CategorizeRequestDTO) -> Callable[[], CategorizationResult | None]:
+        evidence = (request.merchant, request.counterparty, request.provider, request.country)
+        if any(value is not None for value in evidence):
+            return partial(
+                self._rule_engine.match,
+                request.description,
+                request.amount,
+                direction=request.direction,
+                merchant=request.merchant,
+                counterparty=request.counterparty,
+                provider=request.provider,
+                country=request.country,
+            )
+        return partial(self._rule_engine.match, request.description, request.amount, direction=request.direction)
+
     def _try_tier(
         self,
         tier_name: str,
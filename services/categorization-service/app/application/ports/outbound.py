@@ -120,6 +120,9 @@ class ICategorizationResultRepository(ABC):
     @abstractmethod
     async def save(self, record: CategorizationResultRecord) -> CategorizationResultRecord: ...
 
+    @abstractmethod
+    async def save_many(self, records: list[CategorizationResultRecord]) -> None: ...
+
     @abstractmethod
     async def find_by_transaction_id(self, transaction_id: int) -> list[CategorizationResultRecord]: ...
 
@@ -9,7 +9,7 @@ untouchable here — they are migration-managed.
 ``on_rules_changed(user_id)`` is an optional callback fired after every
 mutation; the composition root wires it to the rule-engine provider's
 per-user cache invalidation so changes apply instantly in the API
-process (the consumer process converges via TTL).
+process (other processes on the rule-change notification).
 """
 
 from __future__ import annotations
@@ -15,6 +15,22 @@ class Settings(BaseSettings):
     # No dev-string default: an unconfigured key must make /categorize
     # answer 503, not accept a well-known value (P1-15).
     INTERNAL_API_KEY: str | None = None
+    # Key-partitioned handler pool for the transaction.created consumer;
+    # ordering is kept per transaction_id. 1 = the old strictly-serial mode.
+    TRANSACTION_CONSUMER_CONCURRENCY: int = 8
+    # Messages per partition handled in one DB transaction (micro-batch).
+    # 1 = one transaction per message.
+    TRANSACTION_CONSUMER_BATCH_SIZE: int = 25
+    # LISTEN for rule-change notifications (migration 012) and apply them
+    # to the rule engines as they commit; off = TTL reloads only.
+    RULE_CHANGE_LISTENER_ENABLED: bool = True
+    # Byte budget of the per-user rule overlay cache (LRU) in each process.
+    USER_OVERLAY_CACHE_BYTES: int = 64 * 1024 * 1024
+    # Health endpoint of the combined worker process (app.workers.host).
+    WORKER_HOST_HEALTH_PORT: int = 8081
+    # Prometheus /metrics of the combined worker process (the service
+    # depends on messaging's ``prometheus`` extra); unset = no metrics.
+    WORKER_HOST_METRICS_PORT: int | None = None
 
 
 settings = Settings()
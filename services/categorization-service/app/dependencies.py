@@ -41,7 +41,7 @@ async def get_rule_service(
     db: AsyncSession = Depends(get_db),
 ) -> RuleService:
     """Rule mutations invalidate the in-process user-engine overlay so
-    they apply instantly on the API path; worker processes converge via
-    the provider TTL."""
+    they apply instantly on the API path; other processes drop it on the
+    rule-change notification (``app.rule_changes``)."""
     uow = SQLAlchemyUnitOfWork(db)
     return RuleService(uow=uow, on_rules_changed=rule_engine_provider.invalidate_user)
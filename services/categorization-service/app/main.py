@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import suppress
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
@@ -14,6 +16,7 @@ from app.adapters.inbound.category_api import (
 )
 from app.adapters.inbound.rules_api import rules_router
 from app.config import settings
+from app.database import engine
 from app.domain.exceptions import (
     CategoryHasSubcategories,
     CategoryNotFound,
@@ -25,6 +28,7 @@ from app.domain.exceptions import (
     SubCategoryInUse,
     SubCategoryNotFound,
 )
+from app.rule_changes import RuleChangeListener
 from app.rule_engine_provider import rule_engine_provider
 
 # P3-57: uvicorn konfigurerer kun sine egne loggere — uden dette arver app.* root's WARNING.
@@ -53,6 +57,18 @@ async def startup_warmup() -> None:
             "Startup warmup failed — rule engine will lazy-load on first request",
             exc_info=True,
         )
+    if settings.RULE_CHANGE_LISTENER_ENABLED:
+        listener = RuleChangeListener(engine, rule_engine_provider)
+        app.state.rule_change_listener = asyncio.create_task(listener.run(), name="rule-changes")
+
+
+@app.on_event("shutdown")
+async def stop_rule_change_listener() -> None:
+    task = getattr(app.state, "rule_change_listener", None)
+    if task is not None:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
 
 
 @app.exception_handler(CategoryNotFound)
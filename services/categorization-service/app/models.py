@@ -4,7 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from messaging import OutboxEventMixin
-from sqlalchemy import Boolean, Index, Integer, Numeric, String, Text, func, text
+from sqlalchemy import BigInteger, Boolean, Index, Integer, Numeric, SmallInteger, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -148,6 +148,20 @@ class OutboxEventModel(OutboxEventMixin, Base):
     """
 
 
+class RuleCatalogVersionModel(Base):
+    """Single-row counter bumped by the rule-change trigger (migration 012).
+
+    Every committed change to rules, aliases or taxonomy increments
+    ``version`` and announces it on the ``rule_changes`` channel; see
+    ``app.rule_changes``.
+    """
+
+    __tablename__ = "rule_catalog_version"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
 class ProcessedEventModel(Base):
     """Inbox pattern — deduplication for consumed events.
 
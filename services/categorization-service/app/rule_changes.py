@@ -0,0 +1,280 @@
+"""Versioned rule-change notifications for :class:`RuleEngineProvider`.
+
+Without them every replica rebuilt its whole engine from the database
+once its TTL ran out: a new learned rule was invisible for up to a
+minute, and every API and worker process repeated the same full reload
+every minute.  With them:
+
+* a row-level trigger on ``categorization_rules``, ``merchant_aliases``,
+  ``categories`` and ``subcategories`` bumps the single-row counter in
+  ``rule_catalog_version`` and ``pg_notify``s the new version with the
+  changed row.  Every writer is covered — the rules API, the learned
+  rules of ``CategoryCorrectedConsumer``, the taxonomy admin endpoints,
+  migrations — without any of them publishing anything.  The counter
+  row is locked until commit, so versions are gap-free and Postgres
+  delivers the notifications in version order at commit;
+* the trigger is a ``DEFERRABLE INITIALLY DEFERRED`` constraint trigger,
+  so it runs at commit rather than at each write.  Fired immediately,
+  it locked the counter row at a writer's first rule write: every other
+  rule, alias or taxonomy writer then queued behind that whole
+  transaction, and two multi-row writers touching each other's rows in
+  opposite order deadlocked on the counter.  Deferred, the counter is
+  the last lock a writer takes, held only while its commit runs —
+  writers still commit one at a time, in version order, but their
+  statements no longer wait on each other, and nothing waits on a
+  transaction that is itself waiting for the counter.  A transaction
+  that ``SET CONSTRAINTS ALL IMMEDIATE`` gets the immediate behaviour
+  back;
+* :class:`RuleChangeListener` holds one asyncpg connection that
+  ``LISTEN``s on the channel and hands whatever :class:`RuleChange`
+  notifications are queued to the provider as one batch, which it
+  applies as one delta — the changed rules re-read, the affected user
+  overlays dropped, one recompile — reloading in full only on a
+  version gap or a bulk write.
+
+Notifications raised while the listener is disconnected are lost; the
+listener resynchronises the provider on every (re)connect, and the
+provider's TTL stays as a long safety net.
+
+Migrations paste the literal output of
+:func:`rule_change_notify_install_sql` / :func:`rule_change_notify_drop_sql`
+rather than calling them (see migration 012): an applied revision must
+not change with this module.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+#: Channel shared by the trigger and the listener.
+RULE_CHANGE_CHANNEL = "rule_changes"
+
+#: Tables whose rows feed the compiled engines.
+RULE_CHANGE_TABLES = ("categorization_rules", "merchant_aliases", "categories", "subcategories")
+
+#: Delay before the listener reconnects after its connection dropped.
+RECONNECT_DELAY_S = 5.0
+
+#: How often an idle listener checks that its connection is still open.
+LIVENESS_CHECK_S = 10.0
+
+_FUNCTION = "rule_changes_notify"
+
+
+def rule_change_notify_install_sql(channel: str = RULE_CHANGE_CHANNEL) -> list[str]:
+    """DDL creating the version counter, the notify function and its triggers."""
+    statements = [
+        """
+        CREATE TABLE IF NOT EXISTS rule_catalog_version (
+            id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+            version BIGINT NOT NULL
+        )
+        """,
+        "INSERT INTO rule_catalog_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING",
+        f"""
+        CREATE OR REPLACE FUNCTION {_FUNCTION}() RETURNS trigger AS $$
+        DECLARE
+            new_version BIGINT;
+            changed JSONB;
+            previous JSONB;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                changed := to_jsonb(OLD);
+            ELSE
+                changed := to_jsonb(NEW);
+            END IF;
+            IF TG_OP = 'UPDATE' THEN
+                previous := to_jsonb(OLD);
+            END IF;
+            UPDATE rule_catalog_version SET version = version + 1 WHERE id = 1 RETURNING version INTO new_version;
+            PERFORM pg_notify('{channel}', json_build_object(
+                'version', new_version,
+                'table', TG_TABLE_NAME,
+                'id', changed -> 'id',
+                'user_id', changed -> 'user_id',
+                'previous_user_id', previous -> 'user_id',
+                'merchant_id', changed -> 'merchant_id',
+                'previous_merchant_id', previous -> 'merchant_id'
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+    ]
+    for table in RULE_CHANGE_TABLES:
+        statements += [
+            f"DROP TRIGGER IF EXISTS {_FUNCTION} ON {table}",
+            f"""
+            CREATE CONSTRAINT TRIGGER {_FUNCTION}
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION {_FUNCTION}()
+            """,
+        ]
+    return statements
+
+
+def rule_change_notify_drop_sql() -> list[str]:
+    """DDL reversing :func:`rule_change_notify_install_sql`."""
+    return [
+        *(f"DROP TRIGGER IF EXISTS {_FUNCTION} ON {table}" for table in RULE_CHANGE_TABLES),
+        f"DROP FUNCTION IF EXISTS {_FUNCTION}()",
+        "DROP TABLE IF EXISTS rule_catalog_version",
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class RuleChange:
+    """One changed row, as announced by the trigger."""
+
+    version: int
+    table: str
+    row_id: int | None = None
+    user_id: int | None = None
+    previous_user_id: int | None = None
+    merchant_id: int | None = None
+    previous_merchant_id: int | None = None
+
+    @classmethod
+    def from_payload(cls, payload: str) -> RuleChange:
+        """Parse a notification payload; ``ValueError`` if it is malformed."""
+        try:
+            data = json.loads(payload)
+            return cls(
+                version=int(data["version"]),
+                table=str(data["table"]),
+                row_id=data.get("id"),
+                user_id=data.get("user_id"),
+                previous_user_id=data.get("previous_user_id"),
+                merchant_id=data.get("merchant_id"),
+                previous_merchant_id=data.get("previous_merchant_id"),
+            )
+        except (TypeError, KeyError, json.JSONDecodeError) as exc:
+            raise ValueError(f"malformed rule-change payload: {payload!r}") from exc
+
+
+class RuleChangeSink(Protocol):
+    """What the listener feeds (``RuleEngineProvider`` satisfies it)."""
+
+    async def apply_changes(self, changes: Sequence[RuleChange]) -> None: ...
+
+    async def resync(self) -> None: ...
+
+    def set_listening(self, listening: bool) -> None: ...
+
+
+class RuleChangeListener:
+    """Feeds rule-change notifications to a :class:`RuleChangeSink`.
+
+    Takes the service's asyncpg ``AsyncEngine`` and checks out one
+    connection from it for as long as :meth:`run` runs.  Changes are
+    applied in arrival (= version) order, everything queued by the time
+    the sink is free again as one batch.  After a drop
+    the listener reconnects every ``reconnect_delay`` seconds and, once
+    it is listening again, asks the sink to resync — whatever changed
+    in between was never announced to it.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        sink: RuleChangeSink,
+        channel: str = RULE_CHANGE_CHANNEL,
+        *,
+        reconnect_delay: float = RECONNECT_DELAY_S,
+    ) -> None:
+        if engine.dialect.driver != "asyncpg":
+            raise ValueError(f"RuleChangeListener needs the asyncpg driver, got {engine.dialect.driver!r}")
+        self._engine = engine
+        self._sink = sink
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._connection: AsyncConnection | None = None
+        self._driver_connection: Any = None
+
+    async def run(self) -> None:
+        """Listen and apply changes until cancelled."""
+        try:
+            while True:
+                try:
+                    await self._listen()
+                    await self._sink.resync()
+                    await self._drain()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.warning(
+                        "Rule-change listener on %s failed — reconnecting in %.1fs",
+                        self._channel,
+                        self._reconnect_delay,
+                        exc_info=True,
+                    )
+                self._sink.set_listening(False)
+                await self._reset()
+                await asyncio.sleep(self._reconnect_delay)
+        finally:
+            self._sink.set_listening(False)
+            await self._reset()
+
+    async def _listen(self) -> None:
+        self._connection = await self._engine.connect()
+        raw = await self._connection.get_raw_connection()
+        self._driver_connection = raw.driver_connection
+        await self._driver_connection.add_listener(self._channel, self._on_notify)
+        self._sink.set_listening(True)
+        logger.info("Listening for rule changes on %s", self._channel)
+
+    async def _drain(self) -> None:
+        """Apply queued changes; return when the connection is gone."""
+        while not self._driver_connection.is_closed():
+            try:
+                # asyncio.timeout, not wait_for: on 3.11 wait_for drops a
+                # cancellation that races a ready queue item, and the
+                # listener would then never stop.
+                async with asyncio.timeout(LIVENESS_CHECK_S):
+                    payload = await self._queue.get()
+            except TimeoutError:
+                continue
+            # Everything else already queued goes in the same batch: a bulk
+            # write's notifications arrive together at its commit.
+            payloads = [payload]
+            while not self._queue.empty():
+                payloads.append(self._queue.get_nowait())
+            changes: list[RuleChange] = []
+            malformed = False
+            for payload in payloads:
+                try:
+                    changes.append(RuleChange.from_payload(payload))
+                except ValueError:
+                    logger.warning("Ignoring malformed rule change; resyncing", exc_info=True)
+                    malformed = True
+            if changes:
+                await self._sink.apply_changes(changes)
+            if malformed:
+                await self._sink.resync()
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self._queue.put_nowait(payload)
+
+    async def _reset(self) -> None:
+        connection, self._connection = self._connection, None
+        self._driver_connection = None
+        # Anything still queued belongs to the old connection; the resync
+        # after reconnecting covers it.
+        self._queue = asyncio.Queue()
+        if connection is not None:
+            # Invalidate rather than close: close() would hand a connection
+            # still LISTENing back to the pool for some unrelated session.
+            with suppress(Exception):
+                await connection.invalidate()
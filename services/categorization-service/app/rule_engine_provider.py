@@ -1,16 +1,27 @@
-"""TTL-based RuleEngine provider with startup warmup and per-user overlays.
+"""RuleEngine provider with startup warmup, change notifications and per-user overlays.
 
 Preloads the global rule engine at startup (eliminates cold-start
-latency on first request) and reloads from DB every `ttl_seconds` so
-rule changes take effect without restart.
+latency on first request).  With a ``RuleChangeListener`` attached
+(``app.rule_changes``) every committed rule, alias or taxonomy change
+arrives as a versioned notification and is applied as a delta: global
+rules are re-read and the engine recompiled from memory, a user rule
+drops that user's overlay, a taxonomy change reloads everything.  The
+listener hands over every notification queued at once, so a bulk write
+costs one recompile — or, past ``MAX_DELTA_CHANGES`` rows, one full
+reload.  A version gap — a notification the provider never saw — means
+a full reload.  Without a listener, and as a safety net with one (at
+``LISTENING_TTL_SECONDS``), the provider reloads from DB every
+`ttl_seconds`.
 
 F1-02: `get(user_id=...)` returns a TieredRuleEngine that tries the
 user's own rules first (grouped by priority ascending — learned
 corrections at 10 beat user-created at 50; longest-match within a
 group) and falls through to the shared global engine.  User overlays
-are cached per user with the same TTL; `invalidate_user()` lets the
-API process apply rule mutations instantly (worker processes converge
-via TTL).
+are cached per user with the same TTL in a byte-bounded LRU, loaded at
+most once at a time per user, and optionally shared between replicas
+through an ``OverlayStore`` (``app.user_overlays``).  A user's rule
+change drops that user's overlay only; `invalidate_user()` lets the API
+process apply its own rule mutations before the notification arrives.
 
 Usage:
     provider = RuleEngineProvider(ttl_seconds=60)
@@ -23,30 +34,59 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
 import logging
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from itertools import groupby
 
 from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.outbound.postgres_rule_repository import PostgresRuleRepository
 from app.adapters.outbound.rule_engine import ConstrainedRuleEngine, PersistedSeedRule, RuleEngine, TieredRuleEngine
 from app.application.ports.outbound import IRuleEngine
+from app.config import settings
 from app.database import async_session_factory
 from app.domain.value_objects import Confidence, PatternType
-from app.models import CategorizationRuleModel, CategoryModel, MerchantAliasModel, SubCategoryModel
+from app.models import (
+    CategorizationRuleModel,
+    CategoryModel,
+    MerchantAliasModel,
+    RuleCatalogVersionModel,
+    SubCategoryModel,
+)
+from app.rule_changes import RuleChange
+from app.user_overlays import DEFAULT_MAX_BYTES, OverlayStore, StoredOverlay, UserOverlayCache, store_key
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_TTL_SECONDS = 60
+#: TTL while a RuleChangeListener feeds the provider: only a safety net
+#: then, for whatever a misbehaving listener might have missed.
+LISTENING_TTL_SECONDS = 900
+#: Changes applied as one delta batch at most; a bulk write touching
+#: more rows than this is cheaper to pick up with one full reload.
+MAX_DELTA_CHANGES = 50
+#: Tables whose changes rebuild the taxonomy maps, i.e. everything.
+_TAXONOMY_TABLES = ("categories", "subcategories")
 # Both user-authored keywords and learned merchant patterns are plain
 # contains-matches to the engine; REGEX/AMOUNT_RANGE stay unimplemented.
 _MATCHABLE_PATTERN_TYPES = (PatternType.KEYWORD, PatternType.MERCHANT)
-_MAX_USER_CACHE = 512
+#: Cache cost of an overlay beyond its engines: entry, key, list — and
+#: all a zero-rules user costs.
+_OVERLAY_OVERHEAD_BYTES = 256
 
 
 class RuleEngineProvider:
-    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        *,
+        overlay_cache_bytes: int = DEFAULT_MAX_BYTES,
+        overlay_store: OverlayStore | None = None,
+    ) -> None:
         self._ttl = ttl_seconds
         self._engine: IRuleEngine | None = None
         self._fallback_subcategory_id: int = 0
@@ -56,7 +96,23 @@ class RuleEngineProvider:
         self._subcategory_lookup: dict[str, tuple[int, int]] = {}
         self._subcategory_name_by_id: dict[int, str] = {}
         self._subcategory_key_by_id: dict[int, str] = {}
-        self._user_engines: dict[int, tuple[list[RuleEngine], datetime]] = {}
+        self._user_engines: UserOverlayCache[list[RuleEngine]] = UserOverlayCache(overlay_cache_bytes)
+        # The one running load per user; racing misses await it.  A load
+        # caches its result only while it is still registered here.
+        self._user_loads: dict[int, asyncio.Task[list[RuleEngine]]] = {}
+        self._overlay_store = overlay_store
+        # Users invalidated locally whose stored overlay may be stale
+        # until the notification deletes it: their next load skips it.
+        self._store_bypass: set[int] = set()
+        # Stored overlays read before the last full reload are not trusted.
+        self._overlay_floor = 0
+        # Source of the compiled global engine, kept for delta updates.
+        self._global_rules: dict[int, PersistedSeedRule] = {}
+        self._aliases: dict[int, tuple[str, ...]] = {}
+        self._category_by_subcategory: dict[int, int] = {}
+        # rule_catalog_version the engines reflect; None until first load.
+        self._version: int | None = None
+        self._listening = False
 
     @property
     def fallback_subcategory_id(self) -> int:
@@ -95,47 +151,155 @@ class RuleEngineProvider:
         return TieredRuleEngine([*user_engines, global_engine])
 
     def invalidate_user(self, user_id: int) -> None:
-        """Drop a user's cached overlay so the next categorize rebuilds it."""
-        self._user_engines.pop(user_id, None)
+        """Drop a user's cached overlay so the next categorize rebuilds it.
+
+        A load already running for the user still answers the requests
+        awaiting it, but no longer caches what it read.
+        """
+        self._user_engines.discard(user_id)
+        self._user_loads.pop(user_id, None)
+        if self._overlay_store is not None:
+            self._store_bypass.add(user_id)
+
+    def set_listening(self, listening: bool) -> None:
+        """Called by the RuleChangeListener as its connection comes and goes."""
+        self._listening = listening
+
+    async def apply_change(self, change: RuleChange) -> None:
+        """Bring the engines up to ``change.version`` (a batch of one)."""
+        await self.apply_changes([change])
+
+    async def apply_changes(self, changes: Sequence[RuleChange]) -> None:
+        """Bring the engines up to the newest of ``changes``.
+
+        Notifications arrive in version order; one at or below the loaded
+        version is already reflected.  The rest are applied together: the
+        changed global rules and merchant aliases are re-read in one query
+        each and the engine recompiled once, however many rows a bulk
+        write touched.  Before the first load there is nothing to update
+        — the first ``get()`` loads everything.
+        """
+        async with self._lock:
+            if self._version is None:
+                return
+            pending = sorted(
+                (change for change in changes if change.version > self._version), key=lambda change: change.version
+            )
+            if not pending:
+                return
+            versions = [change.version for change in pending]
+            if versions != list(range(self._version + 1, self._version + 1 + len(pending))):
+                logger.warning("Rule change version gap (%d -> %s) — full reload", self._version, versions)
+                await self._reload()
+                return
+            if len(pending) > MAX_DELTA_CHANGES or any(change.table in _TAXONOMY_TABLES for change in pending):
+                await self._reload()
+                return
+
+            rule_ids: set[int] = set()
+            user_ids: set[int] = set()
+            merchant_ids: set[int] = set()
+            for change in pending:
+                if change.table == "categorization_rules":
+                    user_ids |= {change.user_id, change.previous_user_id} - {None}  # type: ignore[arg-type]
+                    if change.row_id is not None and (change.user_id is None or change.row_id in self._global_rules):
+                        rule_ids.add(change.row_id)
+                elif change.table == "merchant_aliases":
+                    merchant_ids |= {change.merchant_id, change.previous_merchant_id} - {None}  # type: ignore[arg-type]
+            for user_id in user_ids:
+                self.invalidate_user(user_id)
+                await self._delete_stored_overlay(user_id)
+            # Aliases first: a re-read rule picks up its merchant's new aliases.
+            changed = await self._refresh_aliases(merchant_ids)
+            changed = await self._refresh_global_rules(rule_ids) or changed
+            if changed:
+                self._engine = self._compile_global()
+                logger.info(
+                    "RuleEngine updated to version %d: %d change(s), %d constrained rules",
+                    pending[-1].version,
+                    len(pending),
+                    len(self._global_rules),
+                )
+            self._version = pending[-1].version
+
+    async def resync(self) -> None:
+        """Reload in full if the catalog moved on unannounced (listener reconnect)."""
+        async with self._lock:
+            if self._version is None:
+                return
+            async with async_session_factory() as session:
+                current = await self._read_version(session)
+            if current != self._version:
+                logger.info("Rule catalog at version %d, engines at %d — full reload", current, self._version)
+                await self._reload()
+
+    @property
+    def _effective_ttl(self) -> float:
+        return max(self._ttl, LISTENING_TTL_SECONDS) if self._listening else self._ttl
 
     async def _get_global(self) -> IRuleEngine:
         now = datetime.now(timezone.utc)
 
         if self._engine is not None and self._loaded_at is not None:
             age = (now - self._loaded_at).total_seconds()
-            if age < self._ttl:
+            if age < self._effective_ttl:
                 return self._engine
 
         async with self._lock:
             if self._engine is not None and self._loaded_at is not None:
                 age = (now - self._loaded_at).total_seconds()
-                if age < self._ttl:
+                if age < self._effective_ttl:
                     return self._engine
             await self._reload()
 
         return self._engine  # type: ignore[return-value]
 
     async def _get_user_engines(self, user_id: int) -> list[RuleEngine]:
-        now = datetime.now(timezone.utc)
-        cached = self._user_engines.get(user_id)
-        if cached is not None and (now - cached[1]).total_seconds() < self._ttl:
-            return cached[0]
-
-        async with self._lock:
-            cached = self._user_engines.get(user_id)
-            if cached is not None and (now - cached[1]).total_seconds() < self._ttl:
-                return cached[0]
-
-            engines = await self._load_user_engines(user_id)
-            if len(self._user_engines) >= _MAX_USER_CACHE:
-                oldest = min(self._user_engines, key=lambda uid: self._user_engines[uid][1])
-                del self._user_engines[oldest]
-            self._user_engines[user_id] = (engines, datetime.now(timezone.utc))
+        engines = self._user_engines.get(user_id, self._effective_ttl)
+        if engines is not None:
             return engines
 
-    async def _load_user_engines(self, user_id: int) -> list[RuleEngine]:
-        """One RuleEngine per priority group, ascending — tier order is
-        the priority ladder (10 learned < 50 user < seeds in global)."""
+        load = self._user_loads.get(user_id)
+        if load is None:
+            load = asyncio.create_task(self._load_user_overlay(user_id), name=f"user-overlay-{user_id}")
+            self._user_loads[user_id] = load
+            load.add_done_callback(functools.partial(self._user_load_done, user_id))
+        # Shielded: one waiter being cancelled must not cancel the load
+        # for the others.
+        return await asyncio.shield(load)
+
+    def _user_load_done(self, user_id: int, load: asyncio.Task[list[RuleEngine]]) -> None:
+        if self._user_loads.get(user_id) is load:
+            del self._user_loads[user_id]
+        if not load.cancelled():
+            load.exception()  # retrieved even if every waiter went away
+
+    async def _load_user_overlay(self, user_id: int) -> list[RuleEngine]:
+        load = asyncio.current_task()
+        version = self._version or 0
+        stored = None
+        if self._overlay_store is not None and user_id not in self._store_bypass:
+            stored = await self._read_stored_overlay(user_id)
+        self._store_bypass.discard(user_id)
+        tiers = stored.tiers if stored is not None else await self._load_user_tiers(user_id)
+        engines = self._compile_user_tiers(user_id, tiers)
+        if self._user_loads.get(user_id) is not load:
+            return engines  # invalidated mid-load: answer the waiters, cache nothing
+
+        if stored is None and self._overlay_store is not None:
+            await self._write_stored_overlay(user_id, StoredOverlay.from_tiers(version, tiers))
+            if self._user_loads.get(user_id) is not load:
+                # Invalidated while writing: the delete may have landed first.
+                await self._delete_stored_overlay(user_id)
+                return engines
+        nbytes = _OVERLAY_OVERHEAD_BYTES + sum(engine.approximate_bytes() for engine in engines)
+        self._user_engines.put(user_id, engines, nbytes)
+        return engines
+
+    async def _load_user_tiers(self, user_id: int) -> list[list[tuple[str, int]]]:
+        """The user's matchable rules grouped by priority, ascending, as
+        ``(pattern_value, subcategory_id)`` — tier order is the priority
+        ladder (10 learned < 50 user < seeds in global)."""
         async with async_session_factory() as session:
             rules = await PostgresRuleRepository(session).find_by_user(user_id)
 
@@ -146,18 +310,56 @@ class RuleEngineProvider:
             and rule.pattern_type in _MATCHABLE_PATTERN_TYPES
             and rule.matches_subcategory_id in self._subcategory_name_by_id
         ]
+        return [
+            [(r.pattern_value, r.matches_subcategory_id) for r in group]
+            for _prio, group in groupby(matchable, key=lambda r: r.priority)
+        ]
 
-        engines: list[RuleEngine] = []
-        for _prio, group in groupby(matchable, key=lambda r: r.priority):
-            mappings = [(r.pattern_value, self._subcategory_name_by_id[r.matches_subcategory_id]) for r in group]
-            engines.append(RuleEngine(keyword_mappings=mappings, subcategory_lookup=self._subcategory_lookup))
+    def _compile_user_tiers(self, user_id: int, tiers: Sequence[Sequence[tuple[str, int]]]) -> list[RuleEngine]:
+        names = self._subcategory_name_by_id
+        named = [[(pattern, names[target]) for pattern, target in tier if target in names] for tier in tiers]
+        named = [tier for tier in named if tier]
+        if not named:
+            return []
+        # All priority groups share one automaton: same order as one
+        # RuleEngine per group under TieredRuleEngine, one pass per match.
+        logger.debug("Built %d user rule tier(s) for user %d", len(named), user_id)
+        return [RuleEngine.tiered(named, self._subcategory_lookup)]
+
+    async def _read_stored_overlay(self, user_id: int) -> StoredOverlay | None:
+        try:
+            raw = await self._overlay_store.get(store_key(user_id))  # type: ignore[union-attr]
+            stored = None if raw is None else StoredOverlay.decode(raw)
+        except Exception:
+            logger.warning("Overlay store read failed for user %d — loading from DB", user_id, exc_info=True)
+            return None
+        if stored is None or stored.version < self._overlay_floor:
+            return None
+        return stored
+
+    async def _write_stored_overlay(self, user_id: int, stored: StoredOverlay) -> None:
+        try:
+            await self._overlay_store.set(  # type: ignore[union-attr]
+                store_key(user_id), stored.encode(), ex=max(1, int(self._effective_ttl))
+            )
+        except Exception:
+            logger.warning("Overlay store write failed for user %d", user_id, exc_info=True)
 
-        if engines:
-            logger.debug("Built %d user rule tier(s) for user %d", len(engines), user_id)
-        return engines
+    async def _delete_stored_overlay(self, user_id: int) -> None:
+        if self._overlay_store is None:
+            return
+        try:
+            await self._overlay_store.delete(store_key(user_id))
+        except Exception:
+            logger.warning("Overlay store delete failed for user %d", user_id, exc_info=True)
 
     async def _reload(self) -> None:
         async with async_session_factory() as session:
+            # Read first: a change committing after this read has a higher
+            # version, so its notification is applied on top — at worst a
+            # harmless repeat of what the reads below already saw.
+            version = await self._read_version(session)
+
             cat_rows = await session.execute(select(CategoryModel))
             cats = cat_rows.scalars().all()
             cat_ids = {c.id for c in cats}
@@ -183,38 +385,28 @@ class RuleEngineProvider:
                 )
             )
             rules = rule_rows.scalars().all()
-            alias_rows = await session.execute(select(MerchantAliasModel))
+            alias_rows = await session.execute(select(MerchantAliasModel).order_by(MerchantAliasModel.id))
             aliases: dict[int, list[str]] = {}
             for alias in alias_rows.scalars().all():
                 aliases.setdefault(alias.merchant_id, []).append(alias.normalized_value)
 
-        category_by_subcategory = {sub.id: sub.category_id for sub in subs}
-        constrained = [
-            PersistedSeedRule(
-                target_subcategory_id=rule.matches_subcategory_id,
-                target_category_id=category_by_subcategory[rule.matches_subcategory_id],
-                match_field=rule.match_field or "description",
-                operator=rule.match_operator or "contains",
-                direction=rule.direction or "any",
-                confidence=Confidence(rule.confidence or "medium"),
-                pattern=rule.pattern_value,
-                aliases=tuple(aliases.get(rule.merchant_id or 0, ())),
-                provider=rule.provider,
-                country=rule.country,
-                minimum_amount=rule.minimum_amount,
-                maximum_amount=rule.maximum_amount,
-                merchant_id=rule.merchant_id,
-            )
+        self._category_by_subcategory = {sub.id: sub.category_id for sub in subs}
+        self._aliases = {merchant_id: tuple(values) for merchant_id, values in aliases.items()}
+        self._global_rules = {
+            rule.id: self._persisted(rule)
             for rule in rules
-            if rule.matches_subcategory_id in category_by_subcategory
-        ]
-        self._engine = ConstrainedRuleEngine(constrained)
+            if rule.matches_subcategory_id in self._category_by_subcategory
+        }
+        self._engine = self._compile_global()
         self._subcategory_lookup = subcategory_lookup
         self._subcategory_name_by_id = subcategory_name_by_id
         self._subcategory_key_by_id = subcategory_key_by_id
         # Taxonomy maps changed — cached user overlays reference the old
-        # lookup, so rebuild them lazily on next use.
+        # lookup, so rebuild them lazily on next use.  Running loads use
+        # the old maps: they answer their waiters but cache nothing.
         self._user_engines.clear()
+        self._user_loads.clear()
+        self._overlay_floor = version
 
         fallback_model = next((sub for sub in subs if sub.semantic_key == "shopping_unspecified"), None)
         if fallback_model is None:
@@ -222,15 +414,99 @@ class RuleEngineProvider:
         self._fallback_subcategory_id = fallback_model.id if fallback_model is not None else 0
         self._fallback_category_id = fallback_model.category_id if fallback_model is not None else 0
         self._loaded_at = datetime.now(timezone.utc)
+        self._version = version
 
         logger.info(
-            "RuleEngine reloaded: %d constrained rules, %d subcategories",
-            len(constrained),
+            "RuleEngine reloaded: %d constrained rules, %d subcategories (version %d)",
+            len(self._global_rules),
             len(subcategory_lookup),
+            version,
         )
 
+    async def _refresh_global_rules(self, rule_ids: set[int]) -> bool:
+        """Re-read ``rule_ids`` into the global rules; whether any changed."""
+        if not rule_ids:
+            return False
+        async with async_session_factory() as session:
+            rows = await session.execute(
+                select(CategorizationRuleModel).where(CategorizationRuleModel.id.in_(rule_ids))
+            )
+            rules = {rule.id: rule for rule in rows.scalars().all()}
+        changed = False
+        for rule_id in rule_ids:
+            rule = rules.get(rule_id)
+            if (
+                rule is not None
+                and rule.user_id is None
+                and rule.active
+                and rule.rule_key is not None
+                and rule.matches_subcategory_id in self._category_by_subcategory
+            ):
+                self._global_rules[rule_id] = self._persisted(rule)
+                changed = True
+            elif self._global_rules.pop(rule_id, None) is not None:
+                changed = True
+        return changed
+
+    async def _refresh_aliases(self, merchant_ids: set[int]) -> bool:
+        """Re-read the aliases of ``merchant_ids``; whether a global rule changed."""
+        if not merchant_ids:
+            return False
+        async with async_session_factory() as session:
+            rows = await session.execute(
+                select(MerchantAliasModel.merchant_id, MerchantAliasModel.normalized_value)
+                .where(MerchantAliasModel.merchant_id.in_(merchant_ids))
+                .order_by(MerchantAliasModel.id)
+            )
+        aliases: dict[int, list[str]] = {merchant_id: [] for merchant_id in merchant_ids}
+        for merchant_id, value in rows.all():
+            aliases[merchant_id].append(value)
+        for merchant_id, values in aliases.items():
+            if values:
+                self._aliases[merchant_id] = tuple(values)
+            else:
+                self._aliases.pop(merchant_id, None)
+
+        affected = [rule_id for rule_id, rule in self._global_rules.items() if rule.merchant_id in merchant_ids]
+        for rule_id in affected:
+            rule = self._global_rules[rule_id]
+            self._global_rules[rule_id] = dataclasses.replace(
+                rule, aliases=self._aliases.get(rule.merchant_id or 0, ())
+            )
+        return bool(affected)
+
+    def _persisted(self, rule: CategorizationRuleModel) -> PersistedSeedRule:
+        return PersistedSeedRule(
+            target_subcategory_id=rule.matches_subcategory_id,
+            target_category_id=self._category_by_subcategory[rule.matches_subcategory_id],
+            match_field=rule.match_field or "description",
+            operator=rule.match_operator or "contains",
+            direction=rule.direction or "any",
+            confidence=Confidence(rule.confidence or "medium"),
+            pattern=rule.pattern_value,
+            aliases=self._aliases.get(rule.merchant_id or 0, ()),
+            provider=rule.provider,
+            country=rule.country,
+            minimum_amount=rule.minimum_amount,
+            maximum_amount=rule.maximum_amount,
+            merchant_id=rule.merchant_id,
+        )
+
+    def _compile_global(self) -> ConstrainedRuleEngine:
+        # Rule-id order, so a delta update and a full reload compile the
+        # same engine (ties in alias length keep the input order).
+        return ConstrainedRuleEngine([self._global_rules[rule_id] for rule_id in sorted(self._global_rules)])
+
+    @staticmethod
+    async def _read_version(session: AsyncSession) -> int:
+        result = await session.execute(select(RuleCatalogVersionModel.version))
+        return result.scalar_one_or_none() or 0
+
 
 # Module-level singleton — imported by both app.main (startup warmup) and
 # app.dependencies (request-time DI) so neither has to reach into the other
 # and risk a circular import.
-rule_engine_provider = RuleEngineProvider(ttl_seconds=DEFAULT_TTL_SECONDS)
+rule_engine_provider = RuleEngineProvider(
+    ttl_seconds=DEFAULT_TTL_SECONDS,
+    overlay_cache_bytes=settings.USER_OVERLAY_CACHE_BYTES,
+)
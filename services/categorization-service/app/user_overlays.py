@@ -0,0 +1,175 @@
+"""Per-user overlay caching for :class:`RuleEngineProvider`.
+
+The provider used to cache at most 512 compiled user overlays, evicting
+with a scan for the oldest, and loaded a miss under its global lock —
+during a bank-sync burst with more active users than that the cache
+thrashed, and every miss queued behind every other.  Now:
+
+* :class:`UserOverlayCache` is an LRU over an ``OrderedDict`` (O(1) hit,
+  insert and eviction) bounded by the overlays' estimated size in bytes
+  rather than their number: a user with three rules and one with three
+  thousand no longer cost the same slot;
+* the provider loads each user's overlay at most once at a time — the
+  misses racing it await the same load (see ``RuleEngineProvider.get``);
+* an optional :class:`OverlayStore` shared between replicas holds each
+  user's rule tiers as JSON (:class:`StoredOverlay`), so a replica whose
+  local cache misses can compile the overlay another replica already
+  read instead of querying the database.  The store is a plain
+  get/set/delete protocol — a ``redis.asyncio.Redis`` client satisfies
+  it as is; :class:`InMemoryOverlayStore` is the process-local stand-in
+  for tests.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, Protocol, TypeVar
+
+V = TypeVar("V")
+
+#: Default byte budget of the local overlay cache.
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+#: Store key prefix; the user id follows.
+STORE_KEY_PREFIX = "categorization:user-overlay:"
+
+
+@dataclass(slots=True)
+class _Entry(Generic[V]):
+    value: V
+    nbytes: int
+    loaded_at: float
+
+
+class UserOverlayCache(Generic[V]):
+    """LRU of per-user values, bounded by their summed size in bytes.
+
+    A value bigger than the whole budget is not cached at all rather
+    than evicting everything else for it.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[int, _Entry[V]] = OrderedDict()
+        self._nbytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._entries
+
+    @property
+    def nbytes(self) -> int:
+        """Summed size of the cached values."""
+        return self._nbytes
+
+    def get(self, user_id: int, max_age: float) -> V | None:
+        """The user's value if cached less than ``max_age`` seconds ago."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.loaded_at >= max_age:
+            self.discard(user_id)
+            return None
+        self._entries.move_to_end(user_id)
+        return entry.value
+
+    def put(self, user_id: int, value: V, nbytes: int) -> None:
+        """Cache ``value`` as the most recently used, evicting from the cold end."""
+        self.discard(user_id)
+        if nbytes > self._max_bytes:
+            return
+        self._entries[user_id] = _Entry(value, nbytes, time.monotonic())
+        self._nbytes += nbytes
+        while self._nbytes > self._max_bytes:
+            _user_id, evicted = self._entries.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+            self.evictions += 1
+
+    def discard(self, user_id: int) -> None:
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            self._nbytes -= entry.nbytes
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
+
+
+@dataclass(frozen=True, slots=True)
+class StoredOverlay:
+    """A user's matchable rules as one replica read them.
+
+    ``tiers`` are priority groups, ascending, of ``(pattern_value,
+    subcategory_id)``; ids rather than names, so a reader resolves them
+    against its own taxonomy.  ``version`` is the rule catalog version
+    the reading replica had loaded — the rows are at least that recent.
+    """
+
+    version: int
+    tiers: tuple[tuple[tuple[str, int], ...], ...]
+
+    def encode(self) -> bytes:
+        return json.dumps({"version": self.version, "tiers": self.tiers}, separators=(",", ":")).encode()
+
+    @classmethod
+    def decode(cls, raw: bytes | str) -> StoredOverlay:
+        """Parse :meth:`encode` output; ``ValueError`` if it is malformed."""
+        try:
+            data = json.loads(raw)
+            return cls(
+                version=int(data["version"]),
+                tiers=tuple(tuple((str(pattern), int(target)) for pattern, target in tier) for tier in data["tiers"]),
+            )
+        except (TypeError, KeyError, json.JSONDecodeError) as exc:
+            raise ValueError(f"malformed stored overlay: {raw!r}") from exc
+
+    @classmethod
+    def from_tiers(cls, version: int, tiers: Sequence[Sequence[tuple[str, int]]]) -> StoredOverlay:
+        return cls(version=version, tiers=tuple(tuple(tier) for tier in tiers))
+
+
+class OverlayStore(Protocol):
+    """Second-tier overlay store shared between replicas (redis-style)."""
+
+    async def get(self, name: str) -> Any: ...
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> Any: ...
+
+    async def delete(self, *names: str) -> Any: ...
+
+
+class InMemoryOverlayStore:
+    """Process-local :class:`OverlayStore`; shared only by the providers holding it."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[bytes, float | None]] = {}
+
+    async def get(self, name: str) -> bytes | None:
+        item = self._values.get(name)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._values[name]
+            return None
+        return value
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        self._values[name] = (value, None if ex is None else time.monotonic() + ex)
+        return True
+
+    async def delete(self, *names: str) -> int:
+        return sum(self._values.pop(name, None) is not None for name in names)
+
+
+def store_key(user_id: int) -> str:
+    return f"{STORE_KEY_PREFIX}{user_id}"
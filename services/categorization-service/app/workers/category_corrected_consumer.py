@@ -29,8 +29,10 @@ benign rollback+ACK.  Inbox cleanup runs in transaction_consumer only
 (shared table, one janitor is enough).
 
 Note on cache freshness: this worker runs in its own process, so it
-cannot invalidate the API process's per-user engine overlay — learned
-rules take effect within the provider TTL (≤60s) everywhere.
+cannot invalidate the other processes' per-user engine overlays itself.
+It does not need to: the rule-change trigger (migration 012) announces
+the learned rule on commit, and every provider listening drops that
+user's overlay (``app.rule_changes``).
 
 Run as a standalone process::
 
@@ -44,7 +46,7 @@ import logging
 from typing import Any
 
 from aio_pika.abc import AbstractIncomingMessage
-from messaging import ConsumerBase, setup_worker_logging
+from messaging import ConsumerBase, InboxFilter, setup_worker_logging
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -73,13 +75,23 @@ class CategoryCorrectedConsumer(ConsumerBase):
             queue_name=QUEUE_NAME,
             routing_keys=ROUTING_KEY,
         )
+        self._inbox = InboxFilter()
+
+    async def on_start(self) -> None:
+        async with async_session_factory() as session:
+            await self._inbox.warm(
+                session,
+                select(ProcessedEventModel.message_id).where(ProcessedEventModel.consumer_name == QUEUE_NAME),
+            )
 
     async def handle(self, payload: dict[str, Any], message: AbstractIncomingMessage) -> None:
         message_id = payload.get("correlation_id", "")
         event_type = payload.get("event_type", "")
 
         async with async_session_factory() as session:
-            if message_id and await self._is_duplicate(session, message_id):
+            if message_id and await self._inbox.is_duplicate(
+                message_id, lambda: self._is_duplicate(session, message_id)
+            ):
                 logger.info("Skipping duplicate (message_id=%s)", message_id)
                 return
 
@@ -108,6 +120,9 @@ class CategoryCorrectedConsumer(ConsumerBase):
                     return
                 raise
 
+            if message_id:
+                self._inbox.add(message_id)
+
     async def _handle(self, session: AsyncSession, event_data: dict) -> None:
         user_id = event_data.get("user_id")
         subcategory_id = event_data.get("subcategory_id")
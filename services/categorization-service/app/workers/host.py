@@ -0,0 +1,64 @@
+"""All categorization-service workers in one process.
+
+Runs the ``transaction.created`` consumer, the ``category.corrected``
+consumer and the outbox publisher on one event loop, one RabbitMQ
+connection and the service's one engine (``messaging.WorkerHost``),
+instead of three interpreters with three connections and three pools.
+A ``RuleChangeListener`` runs next to them and keeps the shared rule
+engine current (``app.rule_changes``).  Health JSON is served on
+``WORKER_HOST_HEALTH_PORT`` for the k8s probe, pipeline metrics
+(``messaging.metrics``) on ``WORKER_HOST_METRICS_PORT``.
+
+Run as a standalone process::
+
+    python -m app.workers.host
+
+The per-worker entry points (``python -m app.workers.transaction_consumer``
+etc.) still work, for deployments that scale one consumer on its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+
+from messaging import WorkerHost, enable_prometheus, setup_worker_logging
+
+from app.config import settings
+from app.database import engine
+from app.rule_changes import RuleChangeListener
+from app.rule_engine_provider import rule_engine_provider
+from app.workers.category_corrected_consumer import CategoryCorrectedConsumer
+from app.workers.outbox_publisher import build_worker
+from app.workers.transaction_consumer import TransactionCreatedConsumer
+
+
+async def main() -> None:
+    setup_worker_logging(__name__)
+    if settings.WORKER_HOST_METRICS_PORT is not None:
+        enable_prometheus(port=settings.WORKER_HOST_METRICS_PORT)
+    await rule_engine_provider.warmup()
+    host = WorkerHost(
+        settings.RABBITMQ_URL,
+        [
+            TransactionCreatedConsumer(rule_engine_provider),
+            CategoryCorrectedConsumer(),
+            build_worker(),
+        ],
+        engine=engine,
+        health_port=settings.WORKER_HOST_HEALTH_PORT,
+    )
+    listener = None
+    if settings.RULE_CHANGE_LISTENER_ENABLED:
+        listener = asyncio.create_task(RuleChangeListener(engine, rule_engine_provider).run(), name="rule-changes")
+    try:
+        await host.run()
+    finally:
+        if listener is not None:
+            listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await listener
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -9,8 +9,9 @@ The categorization decision is delegated to ``CategorizationService``, built
 fresh (cheaply — cached under the hood) from the shared ``RuleEngineProvider``
 on every message.  This is the same provider/orchestrator combination the
 sync /categorize HTTP endpoint uses, so rule/subcategory changes take effect
-here within the provider's TTL without a consumer restart, and any future
-ML/LLM tier wired into the orchestrator runs here too.
+here as they commit (rule-change notifications, ``app.rule_changes``)
+without a consumer restart, and any future ML/LLM tier wired into the
+orchestrator runs here too.
 
 Connection/topology/retry/DLQ boilerplate lives in the shared
 ``messaging.ConsumerBase``.  Deduplication deliberately does NOT use the
@@ -22,6 +23,21 @@ or none do.  The UNIQUE constraint on (message_id, consumer_name) in
 processed_events is the last line of defense against duplicates — even if
 two consumer instances race on the same message, one fails with
 IntegrityError, rolls back, and the message is ACKed as a benign duplicate.
+The duplicate *check* is fronted by an in-memory ``InboxFilter`` warmed
+from processed_events at startup, so the SELECT only runs for ids it
+cannot rule out.
+
+Messages are handled by ``TRANSACTION_CONSUMER_CONCURRENCY`` partitions
+keyed on ``transaction_id``: a redelivery of the same event can never
+race itself, while unrelated transactions categorize in parallel.
+
+Each partition also micro-batches up to ``TRANSACTION_CONSUMER_BATCH_SIZE``
+messages through ``handle_batch``: at most one inbox lookup (only for ids
+the in-memory ``InboxFilter`` cannot rule out), one name lookup per
+table, one flush of results + outbox + inbox rows and one commit for the
+whole batch.  Any failure rolls the batch back and the base replays it
+through ``handle`` one message at a time, so a poison event still fails
+alone and the processed_events race is still settled per message.
 
 Run as a standalone process::
 
@@ -32,21 +48,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Sequence
+from contextlib import suppress
 from typing import Any
 
 from aio_pika.abc import AbstractIncomingMessage
 from contracts.events.transaction import TransactionCategorizedEvent
-from messaging import ConsumerBase, OutboxRepository, setup_worker_logging
-from sqlalchemy import delete, func, select, text
+from messaging import ConsumerBase, InboxFilter, OutboxRepository, setup_worker_logging
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.outbound.postgres_result_repository import PostgresCategorizationResultRepository
-from app.adapters.outbound.sql_result import rowcount
 from app.application.categorization_service import CategorizationService
 from app.application.dto import CategorizeRequestDTO
 from app.config import settings
 from app.database import async_session_factory
+from app.database import engine as database_engine
 from app.domain.entities import CategorizationResultRecord
 from app.domain.value_objects import (
     CategorizationResult,
@@ -56,6 +74,7 @@ from app.domain.value_objects import (
     direction_from_transaction_type,
 )
 from app.models import CategoryModel, OutboxEventModel, ProcessedEventModel, SubCategoryModel
+from app.rule_changes import RuleChangeListener
 from app.rule_engine_provider import RuleEngineProvider, rule_engine_provider
 
 logger = logging.getLogger(__name__)
@@ -63,8 +82,6 @@ logger = logging.getLogger(__name__)
 QUEUE_NAME = "categorization.transaction_created"
 ROUTING_KEY = "transaction.created"
 MODEL_VERSION = "rules-keyword-v1"
-CLEANUP_DAYS = 30
-_CLEANUP_SAFETY_THRESHOLD = 0.9
 
 
 class TransactionCreatedConsumer(ConsumerBase):
@@ -79,19 +96,31 @@ class TransactionCreatedConsumer(ConsumerBase):
             rabbitmq_url=settings.RABBITMQ_URL,
             queue_name=QUEUE_NAME,
             routing_keys=ROUTING_KEY,
+            concurrency=settings.TRANSACTION_CONSUMER_CONCURRENCY,
+            batch_size=settings.TRANSACTION_CONSUMER_BATCH_SIZE,
         )
         self._rule_engine_provider = rule_engine_provider
+        self._inbox = InboxFilter()
 
-    async def run(self) -> None:
-        await self._cleanup_old_inbox_rows()
-        await super().run()
+    def ordering_key(self, payload: dict[str, Any]) -> str | None:
+        transaction_id = payload.get("transaction_id")
+        return None if transaction_id is None else str(transaction_id)
+
+    async def on_start(self) -> None:
+        async with async_session_factory() as session:
+            await self._inbox.warm(
+                session,
+                select(ProcessedEventModel.message_id).where(ProcessedEventModel.consumer_name == QUEUE_NAME),
+            )
 
     async def handle(self, payload: dict[str, Any], message: AbstractIncomingMessage) -> None:
         message_id = payload.get("correlation_id", "")
         event_type = payload.get("event_type", "")
 
         async with async_session_factory() as session:
-            if message_id and await self._is_duplicate(session, message_id):
+            if message_id and await self._inbox.is_duplicate(
+                message_id, lambda: self._is_duplicate(session, message_id)
+            ):
                 logger.info("Skipping duplicate (message_id=%s)", message_id)
                 return
 
@@ -112,6 +141,66 @@ class TransactionCreatedConsumer(ConsumerBase):
                     return
                 raise
 
+            if message_id:
+                self._inbox.add(message_id)
+
+    async def handle_batch(self, payloads: list[dict[str, Any]]) -> None:
+        """Categorize a micro-batch and commit it as one transaction.
+
+        Exceptions propagate on purpose — including an IntegrityError on
+        processed_events from a racing instance: the base then replays each
+        message through ``handle``, which settles duplicates one by one.
+        """
+        async with async_session_factory() as session:
+            message_ids = [p.get("correlation_id", "") for p in payloads]
+            verdicts = {m: self._inbox.seen(m) for m in message_ids if m}
+            seen = {m for m, verdict in verdicts.items() if verdict}
+            seen |= await self._processed_message_ids(
+                session, [m for m, verdict in verdicts.items() if verdict is None]
+            )
+
+            fresh: list[tuple[str, dict[str, Any]]] = []
+            for message_id, payload in zip(message_ids, payloads, strict=True):
+                if message_id and message_id in seen:
+                    logger.info("Skipping duplicate (message_id=%s)", message_id)
+                    continue
+                if message_id:
+                    # A redelivery inside the same batch counts as seen too.
+                    seen.add(message_id)
+                fresh.append((message_id, payload))
+            if not fresh:
+                return None
+
+            results = [await self._categorize_payload(payload) for _, payload in fresh]
+            category_names = await self._names(session, CategoryModel, {r.category_id for r in results})
+            subcategory_names = await self._names(session, SubCategoryModel, {r.subcategory_id for r in results})
+
+            records: list[CategorizationResultRecord] = []
+            entries: list[tuple[Any, str, str]] = []
+            for (message_id, payload), result in zip(fresh, results, strict=True):
+                transaction_id = payload.get("transaction_id")
+                record, event = self._build_outputs(
+                    transaction_id,
+                    result,
+                    category_names.get(result.category_id, ""),
+                    subcategory_names.get(result.subcategory_id, ""),
+                )
+                records.append(record)
+                entries.append((event, "transaction", str(transaction_id)))
+                if message_id:
+                    self._add_inbox_row(session, message_id, payload.get("event_type", ""))
+
+            await PostgresCategorizationResultRepository(session).save_many(records)
+            await OutboxRepository(session, OutboxEventModel).add_entries(entries)
+            await session.commit()
+
+        for message_id, _ in fresh:
+            if message_id:
+                self._inbox.add(message_id)
+
+        logger.info("Categorized batch of %d transaction(s) (%d duplicate)", len(fresh), len(payloads) - len(fresh))
+        return None
+
     async def _handle(self, session: AsyncSession, event_data: dict) -> None:
         """Run pipeline and write result + outbox within the caller's session."""
         # The payload is an untyped dict off the wire, so transaction_id is
@@ -121,15 +210,7 @@ class TransactionCreatedConsumer(ConsumerBase):
         # message is retried/DLQ'd — no NULL audit row is written. Typing the
         # payload properly is a behaviour change and out of scope for P2-31.
         transaction_id = event_data.get("transaction_id")
-        description = event_data.get("description", "")
-        amount_str = event_data.get("amount", "0")
-        amount = float(amount_str)
-        user_id = event_data.get("user_id")
-        # The event already carries transaction_type; amount is an unsigned
-        # magnitude, so this is the only honest direction source (TAX-14).
-        direction = direction_from_transaction_type(event_data.get("transaction_type"))
-
-        result = await self._categorize(description, amount, direction, user_id)
+        result = await self._categorize_payload(event_data)
 
         subcategory_name = ""
         if result.subcategory_id:
@@ -143,34 +224,10 @@ class TransactionCreatedConsumer(ConsumerBase):
             stmt = select(CategoryModel.name).where(CategoryModel.id == result.category_id)
             category_name = (await session.execute(stmt)).scalar_one_or_none() or ""
 
-        result_repo = PostgresCategorizationResultRepository(session)
-        outbox_repo = OutboxRepository(session, OutboxEventModel)
-
-        await result_repo.save(
-            CategorizationResultRecord(
-                id=None,
-                transaction_id=transaction_id,  # type: ignore[arg-type]  # se note ved udtrækket
-                category_id=result.category_id,
-                subcategory_id=result.subcategory_id,
-                merchant_id=result.merchant_id,
-                tier=result.tier,
-                confidence=result.confidence,
-                model_version=MODEL_VERSION,
-            ),
-        )
-
-        await outbox_repo.add(
-            event=TransactionCategorizedEvent(
-                transaction_id=transaction_id,  # type: ignore[arg-type]  # se note ved udtrækket
-                category_id=result.category_id,
-                category_name=category_name,
-                subcategory_id=result.subcategory_id,
-                subcategory_name=subcategory_name,
-                merchant_id=result.merchant_id,
-                tier=result.tier.value,
-                confidence=result.confidence.value,
-                model_version=MODEL_VERSION,
-            ),
+        record, event = self._build_outputs(transaction_id, result, category_name, subcategory_name)
+        await PostgresCategorizationResultRepository(session).save(record)
+        await OutboxRepository(session, OutboxEventModel).add(
+            event=event,
             aggregate_type="transaction",
             aggregate_id=str(transaction_id),
         )
@@ -184,6 +241,55 @@ class TransactionCreatedConsumer(ConsumerBase):
             result.confidence.value,
         )
 
+    async def _categorize_payload(self, event_data: dict[str, Any]) -> CategorizationResult:
+        description = event_data.get("description", "")
+        amount = float(event_data.get("amount", "0"))
+        user_id = event_data.get("user_id")
+        # The event already carries transaction_type; amount is an unsigned
+        # magnitude, so this is the only honest direction source (TAX-14).
+        direction = direction_from_transaction_type(event_data.get("transaction_type"))
+        return await self._categorize(description, amount, direction, user_id)
+
+    @staticmethod
+    def _build_outputs(
+        transaction_id: Any,
+        result: CategorizationResult,
+        category_name: str,
+        subcategory_name: str,
+    ) -> tuple[CategorizationResultRecord, TransactionCategorizedEvent]:
+        """Audit record + outbound event for one categorized transaction."""
+        record = CategorizationResultRecord(
+            id=None,
+            transaction_id=transaction_id,
+            category_id=result.category_id,
+            subcategory_id=result.subcategory_id,
+            merchant_id=result.merchant_id,
+            tier=result.tier,
+            confidence=result.confidence,
+            model_version=MODEL_VERSION,
+        )
+        event = TransactionCategorizedEvent(
+            transaction_id=transaction_id,
+            category_id=result.category_id,
+            category_name=category_name,
+            subcategory_id=result.subcategory_id,
+            subcategory_name=subcategory_name,
+            merchant_id=result.merchant_id,
+            tier=result.tier.value,
+            confidence=result.confidence.value,
+            model_version=MODEL_VERSION,
+        )
+        return record, event
+
+    @staticmethod
+    async def _names(session: AsyncSession, model: Any, ids: set[int]) -> dict[int, str]:
+        """id -> name for the non-zero ids, in one query."""
+        wanted = [i for i in ids if i]
+        if not wanted:
+            return {}
+        rows = await session.execute(select(model.id, model.name).where(model.id.in_(wanted)))
+        return {row_id: name for row_id, name in rows.all()}
+
     async def _categorize(
         self,
         description: str,
@@ -192,8 +298,9 @@ class TransactionCreatedConsumer(ConsumerBase):
         user_id: int | None = None,
     ) -> CategorizationResult:
         """Run the full pipeline through ``CategorizationService``, built
-        from the shared provider (cached under the hood, TTL-refreshed).
-        With user_id, the user's own rules overlay the global engine."""
+        from the shared provider (cached under the hood, kept current by
+        rule-change notifications).  With user_id, the user's own rules
+        overlay the global engine."""
         engine = await self._rule_engine_provider.get(user_id=user_id)
         service = CategorizationService(
             rule_engine=engine,
@@ -220,6 +327,16 @@ class TransactionCreatedConsumer(ConsumerBase):
         result = await session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    @staticmethod
+    async def _processed_message_ids(session: AsyncSession, message_ids: Sequence[str]) -> set[str]:
+        if not message_ids:
+            return set()
+        stmt = select(ProcessedEventModel.message_id).where(
+            ProcessedEventModel.message_id.in_(message_ids),
+            ProcessedEventModel.consumer_name == QUEUE_NAME,
+        )
+        return set((await session.execute(stmt)).scalars().all())
+
     @staticmethod
     def _add_inbox_row(session: AsyncSession, message_id: str, event_type: str) -> None:
         """Add inbox row to the current session (committed by caller)."""
@@ -231,49 +348,23 @@ class TransactionCreatedConsumer(ConsumerBase):
             ),
         )
 
-    async def _cleanup_old_inbox_rows(self) -> None:
-        async with async_session_factory() as session:
-            try:
-                total = await session.scalar(
-                    select(func.count()).select_from(ProcessedEventModel),
-                )
-                cutoff_stmt = (
-                    select(func.count())
-                    .select_from(ProcessedEventModel)
-                    .where(
-                        ProcessedEventModel.processed_at < text(f"NOW() - INTERVAL '{CLEANUP_DAYS} days'"),
-                    )
-                )
-                to_delete = await session.scalar(cutoff_stmt)
-
-                if total and total > 0 and to_delete and to_delete / total > _CLEANUP_SAFETY_THRESHOLD:
-                    logger.warning(
-                        "Inbox cleanup would delete >%.0f%% of rows (%d/%d), aborting — check container clock",
-                        _CLEANUP_SAFETY_THRESHOLD * 100,
-                        to_delete,
-                        total,
-                    )
-                    return
-
-                result = await session.execute(
-                    delete(ProcessedEventModel).where(
-                        ProcessedEventModel.processed_at < text(f"NOW() - INTERVAL '{CLEANUP_DAYS} days'"),
-                    ),
-                )
-                await session.commit()
-                deleted = rowcount(result)
-                if deleted:
-                    logger.info("Inbox cleanup: removed %d rows older than %d days", deleted, CLEANUP_DAYS)
-            except Exception:
-                await session.rollback()
-                logger.warning("Inbox cleanup failed — will retry next restart", exc_info=True)
-
 
 async def main() -> None:
     setup_worker_logging(__name__)
     await rule_engine_provider.warmup()
     consumer = TransactionCreatedConsumer(rule_engine_provider)
-    await consumer.run()
+    listener = None
+    if settings.RULE_CHANGE_LISTENER_ENABLED:
+        listener = asyncio.create_task(
+            RuleChangeListener(database_engine, rule_engine_provider).run(), name="rule-changes"
+        )
+    try:
+        await consumer.run()
+    finally:
+        if listener is not None:
+            listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await listener
 
 
 if __name__ == "__main__":
@@ -0,0 +1,166 @@
+"""Constrained rule matching: the indexed engine against the old linear scan.
+
+Builds a ``ConstrainedRuleEngine`` over ``--rules`` persisted rules — the
+seed manifest plus synthetic merchant rules (``merchant``/``equals`` on
+aliases, the shape the alias catalogue grows in) and some
+``description``/``contains`` and ``prefix`` rules — and matches the same
+bank-statement corpus as ``bench_rule_engine.py``, with merchant evidence
+on half of the transactions.  Reports build time and per-match time for
+the engine, and per-match time for the pre-index algorithm (every rule,
+longest alias first, constraints then text)::
+
+    python benchmarks/bench_constrained_rule_engine.py --rules 100 1000 10000
+
+The linear baseline runs on the first 2 000 transactions only.
+
+CPython 3.11, 2026-10 (build s / indexed µs per match / linear µs per
+match): 100 rules — 0.001 / 11.4 / 30.8; 1k — 0.005 / 15.5 / 358; 10k —
+0.07 / 18.1 / 5 610.  The indexed match grows only with the number of
+candidate rules a transaction's text hits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("JWT_SECRET", "bench")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.adapters.outbound.rule_engine import (  # noqa: E402
+    ConstrainedRuleEngine,
+    PersistedSeedRule,
+    _normalize_for_matching,
+)
+from app.domain.merchant_aliases import ALIAS_TO_MERCHANT  # noqa: E402
+from app.domain.seed_rules import GLOBAL_RULES  # noqa: E402
+from app.domain.value_objects import Confidence  # noqa: E402
+from bench_rule_engine import _PEOPLE, _TEMPLATES, _merchant, _per_match_us  # noqa: E402
+
+
+def _rules(rng: random.Random, count: int) -> list[PersistedSeedRule]:
+    aliases_by_merchant: dict[str, list[str]] = {}
+    for alias, merchant_key in ALIAS_TO_MERCHANT.items():
+        aliases_by_merchant.setdefault(merchant_key, []).append(alias)
+    rules = [
+        PersistedSeedRule(
+            target_subcategory_id=index,
+            target_category_id=1,
+            match_field=seed.match_field.value,
+            operator=seed.operator.value,
+            direction=seed.direction.value,
+            confidence=seed.confidence,
+            pattern=seed.pattern or seed.merchant_key or "",
+            aliases=tuple(aliases_by_merchant.get(seed.merchant_key or "", ())),
+            country=seed.country,
+            minimum_amount=seed.minimum_amount,
+            maximum_amount=seed.maximum_amount,
+        )
+        for index, seed in enumerate(GLOBAL_RULES[:count], start=1)
+    ]
+    names: set[str] = set()
+    while len(names) < count - len(rules):
+        names.add(_merchant(rng))
+    for index, name in enumerate(sorted(names), start=len(rules) + 1):
+        shape = rng.random()
+        field, operator = (
+            ("merchant", "equals") if shape < 0.7 else ("description", "contains" if shape < 0.9 else "prefix")
+        )
+        rules.append(
+            PersistedSeedRule(
+                target_subcategory_id=index,
+                target_category_id=1,
+                match_field=field,
+                operator=operator,
+                direction=rng.choice(("any", "outgoing", "outgoing", "incoming")),
+                confidence=Confidence.HIGH,
+                pattern=name,
+                aliases=(name, f"{name} aps") if field == "merchant" else (),
+                country=rng.choice((None, None, "DK")),
+                maximum_amount=rng.choice((None, None, Decimal(rng.randint(50, 5_000)))),
+            )
+        )
+    rng.shuffle(rules)
+    return rules
+
+
+def _corpus(rng: random.Random, rules: list[PersistedSeedRule], size: int) -> list[dict]:  # type: ignore[type-arg]
+    calls = []
+    for _ in range(size):
+        merchant = rng.choice(rules).pattern if rng.random() < 0.35 else _merchant(rng)
+        template = rng.choice(_TEMPLATES)
+        calls.append(
+            {
+                "description": template.format(m=merchant.upper(), n=rng.randint(1000, 99999), p=rng.choice(_PEOPLE)),
+                "amount": rng.uniform(1, 2_000),
+                "direction": rng.choice(("incoming", "outgoing")),
+                "merchant": merchant if rng.random() < 0.5 else None,
+                "country": "DK",
+            }
+        )
+    return calls
+
+
+def _linear(rules: list[PersistedSeedRule]):  # type: ignore[no-untyped-def]
+    ordered = sorted(
+        rules, key=lambda rule: max((len(v) for v in rule.aliases), default=len(rule.pattern)), reverse=True
+    )
+
+    def match(call: dict) -> PersistedSeedRule | None:  # type: ignore[type-arg]
+        evidence = {"description": call["description"], "merchant": call["merchant"], "counterparty": None}
+        absolute_amount = Decimal(str(abs(call["amount"])))
+        for rule in ordered:
+            raw = evidence.get(rule.match_field)
+            if raw is None or (rule.direction != "any" and rule.direction != call["direction"]):
+                continue
+            if rule.country is not None and rule.country != call["country"]:
+                continue
+            if rule.minimum_amount is not None and absolute_amount < rule.minimum_amount:
+                continue
+            if rule.maximum_amount is not None and absolute_amount > rule.maximum_amount:
+                continue
+            normalized = _normalize_for_matching(raw)
+            for value in rule.aliases or (rule.pattern,):
+                pattern = _normalize_for_matching(value)
+                if rule.operator == "equals":
+                    hit = normalized == pattern
+                elif rule.operator == "prefix":
+                    hit = normalized.startswith(pattern)
+                else:
+                    hit = pattern in normalized
+                if hit:
+                    return rule
+        return None
+
+    return match
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rules", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--descriptions", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'rules':>8} {'build s':>8} {'indexed µs':>11} {'linear µs':>10}")
+    for count in args.rules:
+        rng = random.Random(count)
+        rules = _rules(rng, count)
+        corpus = _corpus(rng, rules, args.descriptions)
+
+        started = time.perf_counter()
+        engine = ConstrainedRuleEngine(rules)
+        build_s = time.perf_counter() - started
+
+        indexed_us = _per_match_us(lambda call: engine.match(**call), corpus)
+        linear_us = _per_match_us(_linear(rules), corpus[:2_000])
+        print(f"{count:>8} {build_s:>8.3f} {indexed_us:>11.1f} {linear_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
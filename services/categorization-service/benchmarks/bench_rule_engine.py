@@ -0,0 +1,129 @@
+"""Keyword matching: the compiled automaton against the old linear scan.
+
+Builds a ``RuleEngine`` over ``--rules`` keywords (the real seed keywords
+plus synthetic merchant names, the shape learned user rules take) and
+matches a corpus of bank-statement style descriptions — card purchases,
+MobilePay, transfers, direct debits; about one in three hits a keyword.
+Reports build time, build memory (``tracemalloc`` peak) and per-match
+time for the engine, and per-match time for the pre-automaton algorithm
+(every keyword, longest first, with ``in``) on the same keywords::
+
+    python benchmarks/bench_rule_engine.py --rules 100 10000 100000
+
+The linear baseline runs on the first 2 000 descriptions only, and is
+skipped above ``--linear-max`` rules.
+
+CPython 3.11, 2026-10 (build s / build MiB / automaton µs per match /
+linear µs per match): 100 rules — 0.001 / 0.2 / 4.0 / 5.3; 10k —
+0.10 / 11 / 7.4 / 694; 100k — 1.5 / 94 / 6.9 / 15 400.  The automaton
+stays flat as the rule count grows, and it already wins at 100 rules.
+The scan grows linearly with the rule count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("JWT_SECRET", "bench")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.adapters.outbound.rule_engine import RuleEngine, _normalize_for_matching  # noqa: E402
+from app.domain.seed_rules import GLOBAL_RULES  # noqa: E402
+
+_SYLLABLES = ("ka", "ro", "ne", "sto", "bi", "la", "mar", "ken", "sø", "fi", "ta", "gaard", "hus", "by", "vej", "æl")
+_TEMPLATES = (
+    "Dankort-nota {m} {n}",
+    "VISA/Dankort {m} KØBENHAVN {n}",
+    "MobilePay {p}",
+    "Overførsel til {p}",
+    "Betalingsservice {m} kundenr {n}",
+    "{m} {n} Aarhus C",
+    "Nets *{m} {n}",
+)
+_PEOPLE = ("Anders Jensen", "Mette Sørensen", "Lars Nielsen", "Sofie Hansen", "Peter Møller")
+
+
+def _merchant(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 5)))
+
+
+def _keywords(rng: random.Random, count: int) -> tuple[list[tuple[str, str]], dict[str, tuple[int, int]]]:
+    seeds = [((rule.pattern or rule.merchant_key or "").replace("_", " "), rule.target_key) for rule in GLOBAL_RULES]
+    seeds = seeds[:count]
+    subcategories = sorted({rule.target_key for rule in GLOBAL_RULES})
+    lookup = {subcategory: (index, index) for index, subcategory in enumerate(subcategories, start=1)}
+    synthetic: set[str] = set()
+    while len(synthetic) < count - len(seeds):
+        synthetic.add(_merchant(rng))
+    keywords = seeds + [(name, rng.choice(subcategories)) for name in sorted(synthetic)]
+    rng.shuffle(keywords)
+    return keywords, lookup
+
+
+def _corpus(rng: random.Random, keywords: list[tuple[str, str]], size: int) -> list[str]:
+    descriptions = []
+    for _ in range(size):
+        merchant = rng.choice(keywords)[0].upper() if rng.random() < 0.35 else _merchant(rng).upper()
+        template = rng.choice(_TEMPLATES)
+        descriptions.append(template.format(m=merchant, n=rng.randint(1000, 99999), p=rng.choice(_PEOPLE)))
+    return descriptions
+
+
+def _linear(keywords: list[tuple[str, str]], lookup: dict[str, tuple[int, int]]):  # type: ignore[no-untyped-def]
+    ordered = sorted(((_normalize_for_matching(k), s) for k, s in keywords), key=lambda kv: len(kv[0]), reverse=True)
+
+    def match(description: str) -> tuple[int, int] | None:
+        text = _normalize_for_matching(description)
+        for keyword, subcategory in ordered:
+            if keyword in text and subcategory in lookup:
+                return lookup[subcategory]
+        return None
+
+    return match
+
+
+def _per_match_us(match, corpus: list[str]) -> float:  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    for description in corpus:
+        match(description)
+    return (time.perf_counter() - started) / len(corpus) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rules", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--descriptions", type=int, default=20_000)
+    parser.add_argument("--linear-max", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'rules':>8} {'build s':>8} {'build MiB':>10} {'automaton µs':>13} {'linear µs':>10}")
+    for count in args.rules:
+        rng = random.Random(count)
+        keywords, lookup = _keywords(rng, count)
+        corpus = _corpus(rng, keywords, args.descriptions)
+
+        started = time.perf_counter()
+        engine = RuleEngine(keywords, lookup)
+        build_s = time.perf_counter() - started
+        # A second build for memory: tracemalloc slows the first one down.
+        tracemalloc.start()
+        RuleEngine(keywords, lookup)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        automaton_us = _per_match_us(lambda d: engine.match(d, -1.0, direction="outgoing"), corpus)
+        linear_us = (
+            f"{_per_match_us(_linear(keywords, lookup), corpus[:2_000]):10.1f}" if count <= args.linear_max else "-"
+        )
+        print(f"{count:>8} {build_s:>8.3f} {peak / 2**20:>10.1f} {automaton_us:>13.1f} {linear_us:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from app.models import (  # noqa: F401
     MerchantModel,
     OutboxEventModel,
     ProcessedEventModel,
+    RuleCatalogVersionModel,
     SubCategoryModel,
 )
 from sqlalchemy import engine_from_config, pool
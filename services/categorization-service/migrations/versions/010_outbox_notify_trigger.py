@@ -0,0 +1,50 @@
+"""NOTIFY the outbox worker on outbox_events inserts.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+Statement-level ``AFTER INSERT`` trigger calling ``pg_notify`` (see
+``messaging.notify``).  The outbox publisher listens on the channel and
+wakes on commit instead of sleeping out its poll interval.
+
+The DDL is what ``messaging.notify.outbox_notify_install_sql()`` produced
+when this revision was written, frozen here: an applied revision must
+not change with the library.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "010"
+down_revision: str = "009"
+branch_labels = None
+depends_on = None
+
+
+_CREATE_FUNCTION = """
+CREATE OR REPLACE FUNCTION outbox_events_notify() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('outbox_events', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_CREATE_TRIGGER = """
+CREATE TRIGGER outbox_events_notify
+AFTER INSERT ON outbox_events
+FOR EACH STATEMENT EXECUTE FUNCTION outbox_events_notify()
+"""
+
+
+def upgrade() -> None:
+    op.execute(_CREATE_FUNCTION)
+    op.execute("DROP TRIGGER IF EXISTS outbox_events_notify ON outbox_events")
+    op.execute(_CREATE_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS outbox_events_notify ON outbox_events")
+    op.execute("DROP FUNCTION IF EXISTS outbox_events_notify()")
@@ -0,0 +1,126 @@
+"""Range-partition outbox_events (daily).
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+Retention becomes a partition drop instead of a row-by-row DELETE (see
+``messaging.partitioning``).  The copy runs under an ACCESS EXCLUSIVE
+lock on the table: stop the outbox publisher for the duration.  The
+primary key becomes ``(id, created_at)``.
+
+processed_events stays a plain table: PostgreSQL cannot enforce a
+unique index that omits the partition key, and ``uq_processed_events``
+must stay table-wide to catch racing duplicates.  The outbox publisher
+trims it in batches instead (``messaging.InboxPurger``).
+
+The NOTIFY trigger from 010 lives on the old table and is dropped with it,
+so it is installed again on the partitioned parent.
+
+The DDL is what ``OUTBOX_EVENTS.convert_sql()`` / ``revert_sql()`` and
+``messaging.notify`` produced when this revision was written, frozen
+here: an applied revision must not change with the library.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "011"
+down_revision: str = "010"
+branch_labels = None
+depends_on = None
+
+
+_CREATE_PARTITIONS = """
+DO $$
+DECLARE
+    start_at date := date_trunc(
+        'day', COALESCE((SELECT min(created_at) FROM outbox_events_unpartitioned), now())
+    )::date;
+    stop_at date := (date_trunc('day', now()) + interval '3 day')::date;
+    part_name text;
+BEGIN
+    WHILE start_at <= stop_at LOOP
+        part_name := 'outbox_events_p' || to_char(start_at, 'YYYYMMDD');
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF outbox_events FOR VALUES FROM (%L) TO (%L)',
+            part_name, start_at, (start_at + interval '1 day')::date
+        );
+        start_at := (start_at + interval '1 day')::date;
+    END LOOP;
+END $$
+"""
+
+_REOWN_SEQUENCE = """
+DO $$
+DECLARE
+    seq text := pg_get_serial_sequence('{old}', 'id');
+BEGIN
+    IF seq IS NOT NULL THEN
+        EXECUTE format('ALTER SEQUENCE %s OWNED BY outbox_events.id', seq);
+    END IF;
+END $$
+"""
+
+_CREATE_NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION outbox_events_notify() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('outbox_events', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_CREATE_NOTIFY_TRIGGER = """
+CREATE TRIGGER outbox_events_notify
+AFTER INSERT ON outbox_events
+FOR EACH STATEMENT EXECUTE FUNCTION outbox_events_notify()
+"""
+
+_DROP_NOTIFY = [
+    "DROP TRIGGER IF EXISTS outbox_events_notify ON outbox_events",
+    "DROP FUNCTION IF EXISTS outbox_events_notify()",
+]
+
+_INSTALL_NOTIFY = [
+    _CREATE_NOTIFY_FUNCTION,
+    "DROP TRIGGER IF EXISTS outbox_events_notify ON outbox_events",
+    _CREATE_NOTIFY_TRIGGER,
+]
+
+_PENDING_POLL_INDEX = "CREATE INDEX ix_outbox_pending_poll ON outbox_events (status, next_attempt_at, created_at)"
+
+
+def upgrade() -> None:
+    for statement in [
+        *_DROP_NOTIFY,
+        "ALTER TABLE outbox_events RENAME TO outbox_events_unpartitioned",
+        "UPDATE outbox_events_unpartitioned SET created_at = now() WHERE created_at IS NULL",
+        "CREATE TABLE outbox_events (LIKE outbox_events_unpartitioned INCLUDING DEFAULTS)"
+        " PARTITION BY RANGE (created_at)",
+        "ALTER TABLE outbox_events ADD PRIMARY KEY (id, created_at)",
+        "CREATE TABLE outbox_events_default PARTITION OF outbox_events DEFAULT",
+        _CREATE_PARTITIONS,
+        "INSERT INTO outbox_events SELECT * FROM outbox_events_unpartitioned",
+        _REOWN_SEQUENCE.format(old="outbox_events_unpartitioned"),
+        "DROP TABLE outbox_events_unpartitioned",
+        _PENDING_POLL_INDEX,
+        *_INSTALL_NOTIFY,
+    ]:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in [
+        *_DROP_NOTIFY,
+        "ALTER TABLE outbox_events RENAME TO outbox_events_partitioned",
+        "CREATE TABLE outbox_events (LIKE outbox_events_partitioned INCLUDING DEFAULTS)",
+        "ALTER TABLE outbox_events ADD PRIMARY KEY (id)",
+        "INSERT INTO outbox_events SELECT * FROM outbox_events_partitioned",
+        _REOWN_SEQUENCE.format(old="outbox_events_partitioned"),
+        "DROP TABLE outbox_events_partitioned",
+        _PENDING_POLL_INDEX,
+        *_INSTALL_NOTIFY,
+    ]:
+        op.execute(statement)
@@ -0,0 +1,89 @@
+"""Versioned NOTIFY on rule, alias and taxonomy changes.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+
+Creates the single-row ``rule_catalog_version`` counter and a deferred
+row-level constraint trigger on ``categorization_rules``,
+``merchant_aliases``, ``categories`` and ``subcategories`` that bumps it
+at commit and ``pg_notify``s the new version with the changed row (see
+``app.rule_changes``).  Rule-engine providers listen on the channel and
+apply the change as a delta instead of reloading everything on a TTL.
+
+The DDL is what ``app.rule_changes.rule_change_notify_install_sql()``
+produced when this revision was written, frozen here: an applied
+revision must not change with the application code.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "012"
+down_revision: str = "011"
+branch_labels = None
+depends_on = None
+
+
+_TABLES = ("categorization_rules", "merchant_aliases", "categories", "subcategories")
+
+_CREATE_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS rule_catalog_version (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version BIGINT NOT NULL
+)
+"""
+
+_CREATE_FUNCTION = """
+CREATE OR REPLACE FUNCTION rule_changes_notify() RETURNS trigger AS $$
+DECLARE
+    new_version BIGINT;
+    changed JSONB;
+    previous JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := to_jsonb(OLD);
+    ELSE
+        changed := to_jsonb(NEW);
+    END IF;
+    IF TG_OP = 'UPDATE' THEN
+        previous := to_jsonb(OLD);
+    END IF;
+    UPDATE rule_catalog_version SET version = version + 1 WHERE id = 1 RETURNING version INTO new_version;
+    PERFORM pg_notify('rule_changes', json_build_object(
+        'version', new_version,
+        'table', TG_TABLE_NAME,
+        'id', changed -> 'id',
+        'user_id', changed -> 'user_id',
+        'previous_user_id', previous -> 'user_id',
+        'merchant_id', changed -> 'merchant_id',
+        'previous_merchant_id', previous -> 'merchant_id'
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_CREATE_TRIGGER = """
+CREATE CONSTRAINT TRIGGER rule_changes_notify
+AFTER INSERT OR UPDATE OR DELETE ON {table}
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW EXECUTE FUNCTION rule_changes_notify()
+"""
+
+
+def upgrade() -> None:
+    op.execute(_CREATE_VERSION_TABLE)
+    op.execute("INSERT INTO rule_catalog_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING")
+    op.execute(_CREATE_FUNCTION)
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS rule_changes_notify ON {table}")
+        op.execute(_CREATE_TRIGGER.format(table=table))
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS rule_changes_notify ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS rule_changes_notify()")
+    op.execute("DROP TABLE IF EXISTS rule_catalog_version")
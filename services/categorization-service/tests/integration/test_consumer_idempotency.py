@@ -229,3 +229,45 @@ class TestConcurrentRaceCondition:
 
         msg1.ack.assert_awaited()
         msg2.ack.assert_awaited()
+
+
+class TestMicroBatch:
+    """handle_batch commits a whole batch and skips already-seen messages."""
+
+    async def test_batch_commits_fresh_messages_once(self, consumer, session_factory) -> None:
+        from app.models import CategorizationResultModel, OutboxEventModel, ProcessedEventModel
+
+        seen_id = str(uuid4())
+        await consumer._on_message(
+            _make_message(
+                {
+                    "transaction_id": 1,
+                    "description": "Netto",
+                    "amount": "-10.00",
+                    "transaction_type": "expense",
+                    "event_type": "transaction.created",
+                },
+                seen_id,
+            )
+        )
+        redelivered_id = str(uuid4())
+        payloads = [
+            {"correlation_id": seen_id, "transaction_id": 1, "description": "Netto", "amount": "-10.00"},
+            {"correlation_id": redelivered_id, "transaction_id": 2, "description": "Netto", "amount": "-20.00"},
+            {"correlation_id": redelivered_id, "transaction_id": 2, "description": "Netto", "amount": "-20.00"},
+            {"correlation_id": str(uuid4()), "transaction_id": 3, "description": "Lidl", "amount": "-30.00"},
+        ]
+        for payload in payloads:
+            payload.update(event_type="transaction.created", transaction_type="expense")
+
+        await consumer.handle_batch(payloads)
+
+        async with session_factory() as session:
+            results = (await session.execute(select(CategorizationResultModel))).scalars().all()
+            outbox = (await session.execute(select(OutboxEventModel))).scalars().all()
+            inbox = (await session.execute(select(ProcessedEventModel))).scalars().all()
+            assert sorted(r.transaction_id for r in results) == [1, 2, 3]
+            assert len(outbox) == 3
+            assert len(inbox) == 3
+            by_transaction = {json.loads(o.payload_json)["transaction_id"]: json.loads(o.payload_json) for o in outbox}
+            assert by_transaction[2]["subcategory_name"] == "Dagligvarer"
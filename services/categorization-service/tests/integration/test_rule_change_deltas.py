@@ -0,0 +1,192 @@
+"""Rule-change deltas against a REAL sqlite session.
+
+The provider applies each batch of notifications as a delta (the
+changed rules and merchants' aliases re-read, the engine recompiled
+once from memory).  These
+tests mutate real rows, feed the provider the notifications the trigger
+would have sent, and check it ends up where a full reload from the same
+rows lands.  The trigger itself is Postgres-only (migration 012).
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from app.database import Base
+from app.models import CategorizationRuleModel, CategoryModel, MerchantAliasModel, SubCategoryModel
+from app.rule_changes import RuleChange
+from app.rule_engine_provider import RuleEngineProvider
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+
+def _seed_rule(id: int, pattern: str, subcategory_id: int, **fields: object) -> CategorizationRuleModel:
+    defaults: dict = {
+        "priority": 100,
+        "pattern_type": "keyword",
+        "active": True,
+        "rule_key": f"seed_{id}",
+        "match_field": "description",
+        "match_operator": "contains",
+        "direction": "outgoing",
+        "confidence": "high",
+    }
+    defaults.update(fields)
+    return CategorizationRuleModel(
+        id=id, pattern_value=pattern, matches_subcategory_id=subcategory_id, user_id=None, **defaults
+    )
+
+
+@pytest_asyncio.fixture()
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add_all(
+            [
+                CategoryModel(id=1, name="Mad & drikke", type="expense"),
+                SubCategoryModel(id=3, name="Dagligvarer", category_id=1),
+                SubCategoryModel(id=5, name="Restaurant", category_id=1),
+                _seed_rule(1, "netto", 3, match_field="merchant", match_operator="equals", merchant_id=40),
+                _seed_rule(2, "pizza", 5),
+                _seed_rule(3, "sushi", 5, maximum_amount=Decimal("500")),
+                MerchantAliasModel(id=1, merchant_id=40, normalized_value="netto", match_field="merchant"),
+            ],
+        )
+        await session.commit()
+
+    with patch("app.rule_engine_provider.async_session_factory", factory):
+        yield factory
+    await engine.dispose()
+
+
+async def _loaded() -> RuleEngineProvider:
+    provider = RuleEngineProvider()
+    await provider._reload()
+    return provider
+
+
+def _match(provider: RuleEngineProvider, description: str, merchant: str | None = None) -> int | None:
+    result = provider._engine.match(description, 100.0, direction="outgoing", merchant=merchant)  # type: ignore[union-attr]
+    return None if result is None else result.subcategory_id
+
+
+async def _assert_same_as_full_reload(provider: RuleEngineProvider) -> None:
+    fresh = await _loaded()
+    assert provider._global_rules == fresh._global_rules
+    assert provider._aliases == fresh._aliases
+
+
+class TestRuleChangeDeltas:
+    @pytest.mark.asyncio()
+    async def test_new_and_changed_global_rules_apply_without_a_reload(self, session_factory) -> None:
+        provider = await _loaded()
+        assert _match(provider, "SUSHI BAR") == 5
+
+        async with session_factory() as session:
+            session.add(_seed_rule(4, "sushi bar", 3))
+            await session.execute(
+                update(CategorizationRuleModel).where(CategorizationRuleModel.id == 2).values(active=False)
+            )
+            await session.commit()
+
+        with patch.object(provider, "_reload", side_effect=AssertionError("full reload")):
+            await provider.apply_change(RuleChange(version=1, table="categorization_rules", row_id=4))
+            await provider.apply_change(RuleChange(version=2, table="categorization_rules", row_id=2))
+
+        assert _match(provider, "SUSHI BAR") == 3  # longer new rule wins
+        assert _match(provider, "PIZZA HUT") is None  # deactivated
+        assert provider._version == 2
+        await _assert_same_as_full_reload(provider)
+
+    @pytest.mark.asyncio()
+    async def test_batch_is_applied_with_one_recompile(self, session_factory) -> None:
+        provider = await _loaded()
+
+        async with session_factory() as session:
+            session.add(_seed_rule(4, "sushi bar", 3))
+            session.add(MerchantAliasModel(id=2, merchant_id=40, normalized_value="netto city", match_field="merchant"))
+            await session.execute(
+                update(CategorizationRuleModel).where(CategorizationRuleModel.id == 2).values(active=False)
+            )
+            await session.commit()
+
+        with (
+            patch.object(provider, "_reload", side_effect=AssertionError("full reload")),
+            patch.object(provider, "_compile_global", wraps=provider._compile_global) as compile_global,
+        ):
+            await provider.apply_changes(
+                [
+                    RuleChange(version=1, table="categorization_rules", row_id=4),
+                    RuleChange(version=2, table="merchant_aliases", row_id=2, merchant_id=40),
+                    RuleChange(version=3, table="categorization_rules", row_id=2),
+                ]
+            )
+
+        assert compile_global.call_count == 1
+        assert _match(provider, "SUSHI BAR") == 3
+        assert _match(provider, "card purchase", merchant="netto city") == 3
+        assert _match(provider, "PIZZA HUT") is None
+        assert provider._version == 3
+        await _assert_same_as_full_reload(provider)
+
+    @pytest.mark.asyncio()
+    async def test_deleted_global_rule_is_dropped(self, session_factory) -> None:
+        provider = await _loaded()
+
+        async with session_factory() as session:
+            await session.delete(await session.get(CategorizationRuleModel, 3))
+            await session.commit()
+        await provider.apply_change(RuleChange(version=1, table="categorization_rules", row_id=3))
+
+        assert _match(provider, "SUSHI") is None
+        await _assert_same_as_full_reload(provider)
+
+    @pytest.mark.asyncio()
+    async def test_new_alias_reaches_the_merchant_rule(self, session_factory) -> None:
+        provider = await _loaded()
+        assert _match(provider, "card purchase", merchant="netto city") is None
+
+        async with session_factory() as session:
+            session.add(MerchantAliasModel(id=2, merchant_id=40, normalized_value="netto city", match_field="merchant"))
+            await session.commit()
+        await provider.apply_change(RuleChange(version=1, table="merchant_aliases", row_id=2, merchant_id=40))
+
+        assert _match(provider, "card purchase", merchant="netto city") == 3
+        await _assert_same_as_full_reload(provider)
+
+    @pytest.mark.asyncio()
+    async def test_learned_user_rule_leaves_the_global_engine_alone(self, session_factory) -> None:
+        provider = await _loaded()
+        global_engine = provider._engine
+
+        async with session_factory() as session:
+            session.add(
+                CategorizationRuleModel(
+                    id=10,
+                    user_id=7,
+                    priority=10,
+                    pattern_type="merchant",
+                    pattern_value="pizza",
+                    matches_subcategory_id=3,
+                    active=True,
+                )
+            )
+            await session.commit()
+        await provider.apply_change(RuleChange(version=1, table="categorization_rules", row_id=10, user_id=7))
+
+        assert provider._engine is global_engine
+        engine = await provider.get(user_id=7)
+        result = engine.match("PIZZA", 100.0, direction="outgoing")
+        assert result is not None and result.subcategory_id == 3
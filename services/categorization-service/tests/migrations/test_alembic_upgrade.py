@@ -102,6 +102,7 @@ class TestTablesExist:
         "categorization_results",
         "outbox_events",
         "processed_events",
+        "rule_catalog_version",
     ]
 
     def test_all_tables_created(self, engine) -> None:
@@ -339,6 +340,81 @@ class TestUserRulesUniqueIndex:
                 conn.commit()
 
 
+class TestRuleChangeNotify:
+    """Migration 012 — every rule write bumps the catalog version at commit
+    and announces it on the ``rule_changes`` channel."""
+
+    def test_rule_write_bumps_the_version_and_notifies(self, engine) -> None:
+        import json
+
+        listener = engine.raw_connection()
+        try:
+            listener.set_isolation_level(0)  # autocommit: LISTEN takes effect at once
+            listener.cursor().execute("LISTEN rule_changes")
+            with engine.begin() as conn:
+                before = conn.execute(text("SELECT version FROM rule_catalog_version")).scalar()
+                rule_id = conn.execute(text("SELECT min(id) FROM categorization_rules")).scalar()
+                conn.execute(text("UPDATE categorization_rules SET active = active WHERE id = :id"), {"id": rule_id})
+            listener.poll()
+            notifications = list(listener.notifies)
+        finally:
+            listener.invalidate()  # still LISTENing in autocommit: keep it out of the pool
+
+        with engine.connect() as conn:
+            after = conn.execute(text("SELECT version FROM rule_catalog_version")).scalar()
+        assert after == before + 1
+        assert len(notifications) == 1
+        payload = json.loads(notifications[0].payload)
+        assert (payload["version"], payload["table"], payload["id"], payload["user_id"]) == (
+            after,
+            "categorization_rules",
+            rule_id,
+            None,
+        )
+
+    def test_concurrent_rule_writers_do_not_wait_on_the_counter(self, engine) -> None:
+        """The counter is locked at commit only: a second writer's rule
+        write goes through while the first transaction is still open, and
+        the versions follow commit order."""
+        import json
+
+        with engine.connect() as conn:
+            before = conn.execute(text("SELECT version FROM rule_catalog_version")).scalar()
+            first_id, second_id = conn.execute(
+                text("SELECT id FROM categorization_rules ORDER BY id LIMIT 2")
+            ).scalars()
+
+        listener = engine.raw_connection()
+        first = engine.connect()
+        try:
+            listener.set_isolation_level(0)
+            listener.cursor().execute("LISTEN rule_changes")
+            first_tx = first.begin()
+            first.execute(text("UPDATE categorization_rules SET active = active WHERE id = :id"), {"id": first_id})
+            with engine.begin() as second:
+                # Blocking on the counter row would fail here, not hang.
+                second.execute(text("SET LOCAL lock_timeout = '2s'"))
+                second.execute(
+                    text("UPDATE categorization_rules SET active = active WHERE id = :id"), {"id": second_id}
+                )
+            # With an immediate trigger second would still be waiting for
+            # first's counter lock, and this write — waiting for second's
+            # row — would deadlock.
+            first.execute(text("UPDATE categorization_rules SET active = active WHERE id = :id"), {"id": second_id})
+            first_tx.commit()
+            listener.poll()
+            payloads = [json.loads(notification.payload) for notification in listener.notifies]
+        finally:
+            first.close()
+            listener.invalidate()
+
+        assert [(payload["version"], payload["id"]) for payload in payloads] == [
+            (before + 1, second_id),  # committed first
+            (before + 2, first_id),
+            (before + 3, second_id),
+        ]
+
+
 class TestTaxonomyRepair:
     def test_same_run_id_is_idempotent(self, engine) -> None:
         from app.tools.repair_taxonomy import enqueue_repair
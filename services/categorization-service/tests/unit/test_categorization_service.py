@@ -122,6 +122,30 @@ class TestCategorizationPipeline:
         assert responses[0].tier == "rule"
         assert responses[1].tier == "fallback"
 
+    async def test_batch_matches_identical_requests_once(self) -> None:
+        calls: list[str] = []
+
+        class CountingRuleEngine(FakeRuleEngine):
+            def match(self, description: str, amount: float, **kwargs: object) -> CategorizationResult | None:
+                calls.append(description)
+                return super().match(description, amount, **kwargs)
+
+        service = CategorizationService(
+            rule_engine=CountingRuleEngine(), fallback_subcategory_id=99, fallback_category_id=8
+        )
+        requests = [
+            CategorizeRequestDTO(transaction_id=i, description=d, amount=-100.0, direction="outgoing")
+            for i, d in enumerate(["Netto City", "Unknown shop", "Netto City", "Unknown shop", "NETTO CITY"])
+        ]
+        requests.append(CategorizeRequestDTO(description="Netto City", amount=-100.0, direction="incoming"))
+
+        responses = await service.categorize_batch(requests)
+
+        assert calls == ["Netto City", "Unknown shop", "NETTO CITY", "Netto City"]
+        assert [r.tier for r in responses] == ["rule", "fallback", "rule", "fallback", "rule", "rule"]
+        assert responses[0] is not responses[2]
+        assert responses == [await service.categorize(request) for request in requests]
+
 
 class TestOptionalTiers:
     """The ML and LLM branches had no coverage before P2-31.
@@ -172,6 +196,36 @@ class TestOptionalTiers:
         )
         assert response.tier == "llm"
 
+    async def test_batch_sends_rule_and_ml_misses_to_llm_in_one_call(self) -> None:
+        batches: list[list[tuple[str, float]]] = []
+
+        class BatchingLlm(FakeLlmCategorizer):
+            def predict_batch(self, transactions: list[tuple[str, float]]) -> list[CategorizationResult | None]:
+                batches.append(transactions)
+                return [self.predict(description, amount) for description, amount in transactions]
+
+        svc = self._service(ml=FakeMlCategorizer(), llm=BatchingLlm())
+        descriptions = ["Netto", "Føtex Amager", "Irma", "Ukendt butik", "Føtex Amager"]
+        responses = await svc.categorize_batch(
+            [CategorizeRequestDTO(description=d, amount=-10.0, direction="outgoing") for d in descriptions]
+        )
+        assert [r.tier for r in responses] == ["rule", "llm", "ml", "fallback", "llm"]
+        assert batches == [[("Føtex Amager", -10.0), ("Ukendt butik", -10.0)]]
+
+    async def test_failed_llm_batch_retries_per_request(self) -> None:
+        class BrokenBatchLlm(FakeLlmCategorizer):
+            def predict_batch(self, transactions: list[tuple[str, float]]) -> list[CategorizationResult]:
+                raise RuntimeError("LLM batch exploded")
+
+        svc = self._service(llm=BrokenBatchLlm())
+        responses = await svc.categorize_batch(
+            [
+                CategorizeRequestDTO(description="Føtex Amager", amount=-10.0, direction="outgoing"),
+                CategorizeRequestDTO(description="Ukendt butik", amount=-10.0, direction="outgoing"),
+            ]
+        )
+        assert [r.tier for r in responses] == ["llm", "fallback"]
+
     async def test_all_tiers_miss_reaches_fallback(self) -> None:
         svc = self._service(ml=FakeMlCategorizer(), llm=FakeLlmCategorizer())
         response = await svc.categorize(
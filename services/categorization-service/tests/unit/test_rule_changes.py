@@ -0,0 +1,130 @@
+"""Unit tests for the rule-change listener, against a fake asyncpg connection."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.rule_changes import (
+    RULE_CHANGE_CHANNEL,
+    RULE_CHANGE_TABLES,
+    RuleChange,
+    RuleChangeListener,
+    rule_change_notify_install_sql,
+)
+
+
+class FakeDriverConnection:
+    def __init__(self) -> None:
+        self.callback = None
+        self.closed = False
+
+    async def add_listener(self, channel: str, callback) -> None:  # type: ignore[no-untyped-def]
+        assert channel == RULE_CHANGE_CHANNEL
+        self.callback = callback
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def notify(self, payload: str) -> None:
+        self.callback(self, 1, RULE_CHANGE_CHANNEL, payload)  # type: ignore[misc]
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.events: list[object] = []
+
+    async def apply_changes(self, changes: list[RuleChange]) -> None:
+        self.events.append(changes)
+
+    async def resync(self) -> None:
+        self.events.append("resync")
+
+    def set_listening(self, listening: bool) -> None:
+        self.events.append(("listening", listening))
+
+
+def _engine(driver: FakeDriverConnection) -> MagicMock:
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=SimpleNamespace(driver_connection=driver))
+    connection.invalidate = AsyncMock()
+    engine = MagicMock()
+    engine.dialect.driver = "asyncpg"
+    engine.connect = AsyncMock(return_value=connection)
+    return engine
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestRuleChangeListener:
+    @pytest.mark.asyncio()
+    async def test_resyncs_on_connect_then_applies_changes_in_order(self) -> None:
+        driver, sink = FakeDriverConnection(), RecordingSink()
+        task = asyncio.create_task(RuleChangeListener(_engine(driver), sink).run())
+        await _settle()
+
+        driver.notify('{"version": 1, "table": "categorization_rules", "id": 4, "user_id": 7}')
+        await _settle()
+        driver.notify("garbage")
+        await _settle()
+        driver.notify('{"version": 2, "table": "merchant_aliases", "id": 9, "merchant_id": 40}')
+        await _settle()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert sink.events == [
+            ("listening", True),
+            "resync",
+            [RuleChange(version=1, table="categorization_rules", row_id=4, user_id=7)],
+            "resync",  # malformed payload: something was missed
+            [RuleChange(version=2, table="merchant_aliases", row_id=9, merchant_id=40)],
+            ("listening", False),
+        ]
+
+    @pytest.mark.asyncio()
+    async def test_changes_queued_together_are_applied_as_one_batch(self) -> None:
+        driver, sink = FakeDriverConnection(), RecordingSink()
+        task = asyncio.create_task(RuleChangeListener(_engine(driver), sink).run())
+        await _settle()
+
+        for version in (1, 2, 3):
+            driver.notify(f'{{"version": {version}, "table": "categorization_rules", "id": {version}}}')
+        driver.notify("garbage")
+        await _settle()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert sink.events[2:] == [
+            [RuleChange(version=version, table="categorization_rules", row_id=version) for version in (1, 2, 3)],
+            "resync",  # after the well-formed part of the batch
+            ("listening", False),
+        ]
+
+    def test_requires_asyncpg(self) -> None:
+        engine = MagicMock()
+        engine.dialect.driver = "aiosqlite"
+        with pytest.raises(ValueError, match="asyncpg"):
+            RuleChangeListener(engine, RecordingSink())
+
+
+def test_trigger_covers_every_table_the_engines_read() -> None:
+    ddl = "\n".join(rule_change_notify_install_sql())
+    for table in ("categorization_rules", "merchant_aliases", "categories", "subcategories"):
+        assert f"AFTER INSERT OR UPDATE OR DELETE ON {table}" in ddl
+
+
+def test_trigger_fires_at_commit() -> None:
+    # Deferred: the counter row is locked at commit, not at the first write.
+    ddl = " ".join(" ".join(rule_change_notify_install_sql()).split())
+    for table in RULE_CHANGE_TABLES:
+        assert (
+            f"CREATE CONSTRAINT TRIGGER rule_changes_notify AFTER INSERT OR UPDATE OR DELETE ON {table} "
+            "DEFERRABLE INITIALLY DEFERRED FOR EACH ROW"
+        ) in ddl
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import random
 from decimal import Decimal
 
 import pytest
-from app.adapters.outbound.rule_engine import ConstrainedRuleEngine, PersistedSeedRule, RuleEngine, TieredRuleEngine
+from app.adapters.outbound.rule_engine import (
+    ConstrainedRuleEngine,
+    PersistedSeedRule,
+    RuleEngine,
+    TieredRuleEngine,
+    _normalize_for_matching,
+)
+from app.domain.merchant_aliases import ALIAS_TO_MERCHANT
+from app.domain.seed_rules import GLOBAL_RULES
 from app.domain.value_objects import CategorizationTier, Confidence
 
 
@@ -153,6 +162,62 @@ class TestTieredRuleEngine:
         assert TieredRuleEngine([]).match("Netto", -10.0, direction="outgoing") is None
 
 
+def _linear_reference(
+    keyword_mappings: list[tuple[str, str]],
+    subcategory_lookup: dict[str, tuple[int, int]],
+    description: str,
+) -> int | None:
+    """The pre-automaton algorithm: every keyword, longest first, with ``in``."""
+    normalised = [(k.lower().replace("ø", "oe").replace("æ", "ae").replace("å", "aa"), s) for k, s in keyword_mappings]
+    text = description.lower().replace("ø", "oe").replace("æ", "ae").replace("å", "aa")
+    for keyword, subcategory_name in sorted(normalised, key=lambda kv: len(kv[0]), reverse=True):
+        if keyword in text and subcategory_name in subcategory_lookup:
+            return subcategory_lookup[subcategory_name][0]
+    return None
+
+
+class TestAutomatonMatchesLinearScan:
+    """Randomised differential check against the old per-keyword scan.
+
+    A four-letter alphabet makes overlapping, nested and repeated keywords
+    common; duplicates, the empty keyword and unknown subcategories are in
+    the mix on purpose.
+    """
+
+    LOOKUP = {f"sub{i}": (i, 100 + i) for i in range(8)}
+
+    @staticmethod
+    def _keywords(rng: random.Random, count: int) -> list[tuple[str, str]]:
+        return [
+            ("".join(rng.choice("abcø") for _ in range(rng.randint(0, 5))), f"sub{rng.randint(0, 9)}")
+            for _ in range(count)
+        ]
+
+    def test_single_engine(self) -> None:
+        rng = random.Random(21)
+        for _ in range(300):
+            keywords = self._keywords(rng, rng.randint(1, 40))
+            engine = RuleEngine(keywords, self.LOOKUP)
+            for _ in range(10):
+                description = "".join(rng.choice("abcdøABC ") for _ in range(rng.randint(0, 20)))
+                result = engine.match(description, -1.0, direction="outgoing")
+                assert (result.subcategory_id if result else None) == _linear_reference(
+                    keywords, self.LOOKUP, description
+                ), (keywords, description)
+
+    def test_tiered_constructor_matches_tiered_engines(self) -> None:
+        rng = random.Random(2101)
+        for _ in range(200):
+            tiers = [self._keywords(rng, rng.randint(0, 15)) for _ in range(rng.randint(1, 4))]
+            merged = RuleEngine.tiered(tiers, self.LOOKUP)
+            composed = TieredRuleEngine([RuleEngine(tier, self.LOOKUP) for tier in tiers])
+            for _ in range(10):
+                description = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 20)))
+                assert merged.match(description, -1.0, direction="outgoing") == composed.match(
+                    description, -1.0, direction="outgoing"
+                ), (tiers, description)
+
+
 class TestConstrainedRuleEngine:
     def test_requires_structured_merchant_evidence_and_direction(self) -> None:
         rule = PersistedSeedRule(
@@ -193,3 +258,154 @@ class TestConstrainedRuleEngine:
         assert engine.match("PIZZERIA", -50, direction="outgoing") is not None
         assert engine.match("PIZZERIA", -200, direction="outgoing") is not None
         assert engine.match("PIZZERIA", -200.01, direction="outgoing") is None
+
+
+def _constrained_reference(
+    rules: list[PersistedSeedRule],
+    description: str,
+    amount: float,
+    *,
+    direction: str,
+    merchant: str | None = None,
+    counterparty: str | None = None,
+    provider: str | None = None,
+    country: str | None = None,
+) -> PersistedSeedRule | None:
+    """The pre-index ConstrainedRuleEngine: every rule, longest alias first."""
+    ordered = sorted(
+        rules, key=lambda rule: max((len(v) for v in rule.aliases), default=len(rule.pattern)), reverse=True
+    )
+    evidence = {"description": description, "merchant": merchant, "counterparty": counterparty}
+    absolute_amount = Decimal(str(abs(amount)))
+    for rule in ordered:
+        raw = evidence.get(rule.match_field)
+        if raw is None or (rule.direction != "any" and rule.direction != direction):
+            continue
+        if rule.provider is not None and rule.provider != provider:
+            continue
+        if rule.country is not None and rule.country != country:
+            continue
+        if rule.minimum_amount is not None and absolute_amount < rule.minimum_amount:
+            continue
+        if rule.maximum_amount is not None and absolute_amount > rule.maximum_amount:
+            continue
+        normalized = _normalize_for_matching(raw)
+        for value in rule.aliases or (rule.pattern,):
+            pattern = _normalize_for_matching(value)
+            if rule.operator == "equals":
+                hit = normalized == pattern
+            elif rule.operator == "prefix":
+                hit = normalized.startswith(pattern)
+            else:
+                hit = pattern in normalized
+            if hit:
+                return rule
+    return None
+
+
+class TestConstrainedIndexMatchesLinearScan:
+    """Differential check of the indexed ConstrainedRuleEngine against the
+    old per-rule scan, over the seed manifest and over random rule sets."""
+
+    @staticmethod
+    def _assert_same(rules: list[PersistedSeedRule], engine: ConstrainedRuleEngine, **call) -> bool:  # type: ignore[no-untyped-def]
+        rule = _constrained_reference(rules, **call)
+        result = engine.match(**call)
+        expected = (
+            None
+            if rule is None
+            else (rule.target_category_id, rule.target_subcategory_id, rule.merchant_id, rule.confidence)
+        )
+        actual = (
+            None
+            if result is None
+            else (result.category_id, result.subcategory_id, result.merchant_id, result.confidence)
+        )
+        assert actual == expected, (rules, call)
+        return actual is not None
+
+    def test_seed_manifest(self) -> None:
+        aliases_by_merchant: dict[str, list[str]] = {}
+        for alias, merchant_key in ALIAS_TO_MERCHANT.items():
+            aliases_by_merchant.setdefault(merchant_key, []).append(alias)
+        rules = [
+            PersistedSeedRule(
+                target_subcategory_id=index,
+                target_category_id=1000 + index,
+                match_field=seed.match_field.value,
+                operator=seed.operator.value,
+                direction=seed.direction.value,
+                confidence=seed.confidence,
+                pattern=seed.pattern or seed.merchant_key or "",
+                aliases=tuple(aliases_by_merchant.get(seed.merchant_key or "", ())),
+                provider=seed.provider,
+                country=seed.country,
+                minimum_amount=seed.minimum_amount,
+                maximum_amount=seed.maximum_amount,
+                merchant_id=index if seed.merchant_key else None,
+            )
+            for index, seed in enumerate(GLOBAL_RULES, start=1)
+        ]
+        engine = ConstrainedRuleEngine(rules)
+        words = sorted({value for rule in rules for value in (rule.pattern, *rule.aliases)})
+        rng = random.Random(22)
+        hits = 0
+        for _ in range(2_000):
+            picked = rng.sample(words, rng.randint(0, 3)) + ["købmand", "1234", "aarhus"][: rng.randint(0, 3)]
+            rng.shuffle(picked)
+            text = " ".join(picked)
+            hits += self._assert_same(
+                rules,
+                engine,
+                description=text.upper() if rng.random() < 0.5 else text,
+                amount=rng.uniform(-5_000, 5_000),
+                direction=rng.choice(("incoming", "outgoing")),
+                merchant=rng.choice((None, rng.choice(words), text)),
+                counterparty=rng.choice((None, rng.choice(words))),
+                country=rng.choice((None, "DK", "SE")),
+            )
+        # Both engines returning None throughout would prove nothing.
+        assert hits > 500
+
+    def test_random_rule_sets(self) -> None:
+        rng = random.Random(2202)
+
+        def text(low: int, high: int) -> str:
+            return "".join(rng.choice("abcø") for _ in range(rng.randint(low, high)))
+
+        hits = 0
+        for _ in range(300):
+            rules = []
+            for index in range(rng.randint(1, 30)):
+                minimum = rng.choice((None, Decimal(rng.randint(0, 50))))
+                rules.append(
+                    PersistedSeedRule(
+                        target_subcategory_id=index,
+                        target_category_id=100 + index,
+                        match_field=rng.choice(("description", "merchant", "counterparty", "iban")),
+                        operator=rng.choice(("equals", "prefix", "contains", "regex")),
+                        direction=rng.choice(("any", "incoming", "outgoing")),
+                        confidence=rng.choice((Confidence.HIGH, Confidence.MEDIUM)),
+                        pattern=text(0, 4),
+                        aliases=tuple(text(0, 4) for _ in range(rng.choice((0, 0, 1, 3)))),
+                        provider=rng.choice((None, None, "nordea", "danske")),
+                        country=rng.choice((None, None, "DK", "SE")),
+                        minimum_amount=minimum,
+                        maximum_amount=rng.choice((None, (minimum or Decimal(0)) + rng.randint(0, 50))),
+                        merchant_id=rng.choice((None, index)),
+                    )
+                )
+            engine = ConstrainedRuleEngine(rules)
+            for _ in range(10):
+                hits += self._assert_same(
+                    rules,
+                    engine,
+                    description=text(0, 12).upper() if rng.random() < 0.3 else text(0, 12),
+                    amount=rng.choice((-1, 1)) * rng.randint(0, 120) / 2,
+                    direction=rng.choice(("incoming", "outgoing")),
+                    merchant=rng.choice((None, text(0, 5))),
+                    counterparty=rng.choice((None, text(0, 5))),
+                    provider=rng.choice((None, "nordea", "danske")),
+                    country=rng.choice((None, "DK", "SE")),
+                )
+        assert hits > 800
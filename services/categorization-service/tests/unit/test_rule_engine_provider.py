@@ -1,4 +1,4 @@
-"""Unit tests for the provider's per-user overlay (F1-02).
+"""Unit tests for the provider's per-user overlay (F1-02) and rule-change handling.
 
 The global engine + taxonomy maps are injected directly (the global
 reload path is exercised live and by integration tests); the user-rule
@@ -7,6 +7,7 @@ DB fetch is faked at the repository seam.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,7 +15,9 @@ import pytest
 from app.adapters.outbound.rule_engine import RuleEngine
 from app.domain.entities import CategorizationRule
 from app.domain.value_objects import PatternType
-from app.rule_engine_provider import RuleEngineProvider
+from app.rule_changes import RuleChange
+from app.rule_engine_provider import LISTENING_TTL_SECONDS, MAX_DELTA_CHANGES, RuleEngineProvider
+from app.user_overlays import InMemoryOverlayStore, StoredOverlay, store_key
 
 LOOKUP = {
     "Dagligvarer": (1, 1),
@@ -39,8 +42,8 @@ def _rule(**overrides: object) -> CategorizationRule:
     return CategorizationRule(**defaults)
 
 
-def _provider(global_keywords: list[tuple[str, str]]) -> RuleEngineProvider:
-    provider = RuleEngineProvider(ttl_seconds=3600)
+def _provider(global_keywords: list[tuple[str, str]], **kwargs: object) -> RuleEngineProvider:
+    provider = RuleEngineProvider(ttl_seconds=3600, **kwargs)  # type: ignore[arg-type]
     provider._engine = RuleEngine(global_keywords, LOOKUP)
     provider._loaded_at = datetime.now(timezone.utc)
     provider._subcategory_lookup = LOOKUP
@@ -161,3 +164,281 @@ class TestUserOverlay:
 
         called_with = [call.args[0] for call in repo.return_value.find_by_user.await_args_list]
         assert called_with == [7, 8]
+
+
+def _gate_user_rules(repo: MagicMock) -> asyncio.Event:
+    """Hold every find_by_user until the returned event is set."""
+    released = asyncio.Event()
+    rules = repo.return_value.find_by_user.return_value
+
+    async def find_by_user(user_id: int) -> list[CategorizationRule]:
+        await released.wait()
+        return rules
+
+    repo.return_value.find_by_user.side_effect = find_by_user
+    return released
+
+
+def _subcategory(engine: object) -> int | None:
+    result = engine.match("Netto", -50.0, direction="outgoing")  # type: ignore[attr-defined]
+    return None if result is None else result.subcategory_id
+
+
+class TestOverlayLoading:
+    @pytest.mark.asyncio()
+    async def test_concurrent_misses_share_one_load(self) -> None:
+        provider = _provider([])
+        ctx, repo = _patch_user_rules([_rule()])
+
+        with ctx:
+            released = _gate_user_rules(repo)
+            gets = [asyncio.create_task(provider.get(user_id=7)) for _ in range(20)]
+            await asyncio.sleep(0)
+            released.set()
+            engines = await asyncio.gather(*gets)
+
+        assert repo.return_value.find_by_user.await_count == 1
+        assert all(_subcategory(engine) == 2 for engine in engines)
+        assert not provider._user_loads
+
+    @pytest.mark.asyncio()
+    async def test_cancelled_waiter_does_not_cancel_the_shared_load(self) -> None:
+        provider = _provider([])
+        ctx, repo = _patch_user_rules([_rule()])
+
+        with ctx:
+            released = _gate_user_rules(repo)
+            first = asyncio.create_task(provider.get(user_id=7))
+            second = asyncio.create_task(provider.get(user_id=7))
+            await asyncio.sleep(0)
+            first.cancel()
+            released.set()
+            assert _subcategory(await second) == 2
+
+        assert first.cancelled()
+        assert 7 in provider._user_engines
+
+    @pytest.mark.asyncio()
+    async def test_invalidation_during_a_load_keeps_its_result_out_of_the_cache(self) -> None:
+        provider = _provider([])
+        ctx, repo = _patch_user_rules([_rule()])
+
+        with ctx:
+            released = _gate_user_rules(repo)
+            stale = asyncio.create_task(provider.get(user_id=7))
+            await asyncio.sleep(0)
+            provider.invalidate_user(7)
+            released.set()
+            await stale
+
+            assert 7 not in provider._user_engines
+            await provider.get(user_id=7)
+            assert repo.return_value.find_by_user.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_cache_is_bounded_in_bytes_and_evicts_least_recently_used(self) -> None:
+        provider = _provider([])
+        ctx, repo = _patch_user_rules([_rule()])
+        with ctx:
+            await provider.get(user_id=1)
+        one_overlay = provider._user_engines.nbytes
+        provider = _provider([], overlay_cache_bytes=3 * one_overlay)
+        ctx, repo = _patch_user_rules([_rule()])
+
+        with ctx:
+            for user_id in (1, 2, 3):
+                await provider.get(user_id=user_id)
+            await provider.get(user_id=1)  # 2 is now the coldest
+            await provider.get(user_id=4)
+
+        assert [uid for uid in (1, 2, 3, 4) if uid in provider._user_engines] == [1, 3, 4]
+        assert provider._user_engines.nbytes <= 3 * one_overlay
+        assert repo.return_value.find_by_user.await_count == 4
+
+
+class TestOverlayStore:
+    @pytest.mark.asyncio()
+    async def test_replica_compiles_the_overlay_another_replica_stored(self) -> None:
+        store = InMemoryOverlayStore()
+        warm, cold = _provider([], overlay_store=store), _provider([], overlay_store=store)
+        ctx, repo = _patch_user_rules([_rule()])
+
+        with ctx:
+            await warm.get(user_id=7)
+            engine = await cold.get(user_id=7)
+
+        assert repo.return_value.find_by_user.await_count == 1
+        assert _subcategory(engine) == 2
+
+    @pytest.mark.asyncio()
+    async def test_user_rule_change_deletes_the_stored_overlay(self) -> None:
+        store = InMemoryOverlayStore()
+        provider = _provider([], overlay_store=store)
+        provider._version = 5
+        ctx, _ = _patch_user_rules([_rule()])
+        with ctx:
+            await provider.get(user_id=7)
+        assert await store.get(store_key(7)) is not None
+
+        await provider.apply_change(RuleChange(version=6, table="categorization_rules", row_id=1, user_id=7))
+
+        assert await store.get(store_key(7)) is None
+
+    @pytest.mark.asyncio()
+    async def test_local_invalidation_skips_the_stored_overlay_once(self) -> None:
+        store = InMemoryOverlayStore()
+        await store.set(store_key(7), StoredOverlay(version=0, tiers=((("netto", 1),),)).encode())
+        provider = _provider([], overlay_store=store)
+        ctx, repo = _patch_user_rules([_rule(matches_subcategory_id=2)])
+
+        with ctx:
+            assert _subcategory(await provider.get(user_id=7)) == 1
+            provider.invalidate_user(7)
+            assert _subcategory(await provider.get(user_id=7)) == 2
+
+        assert repo.return_value.find_by_user.await_count == 1
+        assert StoredOverlay.decode(await store.get(store_key(7))).tiers == ((("netto", 2),),)
+
+    @pytest.mark.asyncio()
+    async def test_overlay_stored_before_the_last_full_reload_is_ignored(self) -> None:
+        store = InMemoryOverlayStore()
+        await store.set(store_key(7), StoredOverlay(version=3, tiers=((("netto", 1),),)).encode())
+        provider = _provider([], overlay_store=store)
+        provider._overlay_floor = 4
+        ctx, repo = _patch_user_rules([_rule(matches_subcategory_id=2)])
+
+        with ctx:
+            assert _subcategory(await provider.get(user_id=7)) == 2
+
+        assert repo.return_value.find_by_user.await_count == 1
+
+    @pytest.mark.asyncio()
+    async def test_failing_store_falls_back_to_the_database(self) -> None:
+        store = MagicMock()
+        store.get = AsyncMock(side_effect=ConnectionError("store down"))
+        store.set = AsyncMock(side_effect=ConnectionError("store down"))
+        provider = _provider([], overlay_store=store)
+        ctx, repo = _patch_user_rules([_rule()])
+
+        with ctx:
+            assert _subcategory(await provider.get(user_id=7)) == 2
+
+        assert 7 in provider._user_engines
+
+
+class TestRuleChanges:
+    """Notification handling that needs no DB: parsing and version gating.
+    Deltas against real rows are in tests/integration/test_rule_change_deltas.py."""
+
+    def test_payload_round_trip(self) -> None:
+        change = RuleChange.from_payload(
+            '{"version": 8, "table": "categorization_rules", "id": 3, "user_id": 7,'
+            ' "previous_user_id": null, "merchant_id": null, "previous_merchant_id": null}'
+        )
+        assert change == RuleChange(version=8, table="categorization_rules", row_id=3, user_id=7)
+
+    @pytest.mark.parametrize("payload", ["", "not json", '{"table": "categories"}', '{"version": null, "table": 1}'])
+    def test_malformed_payload_raises_value_error(self, payload: str) -> None:
+        with pytest.raises(ValueError):
+            RuleChange.from_payload(payload)
+
+    @pytest.mark.asyncio()
+    async def test_change_already_reflected_is_ignored(self) -> None:
+        provider = _provider([])
+        provider._version = 5
+        provider._user_engines.put(7, [], 1)
+
+        await provider.apply_change(RuleChange(version=5, table="categorization_rules", row_id=1, user_id=7))
+
+        assert 7 in provider._user_engines
+        assert provider._version == 5
+
+    @pytest.mark.asyncio()
+    async def test_user_rule_change_drops_only_that_overlay(self) -> None:
+        provider = _provider([])
+        provider._version = 5
+        provider._user_engines.put(7, [], 1)
+        provider._user_engines.put(8, [], 1)
+        global_engine = provider._engine
+
+        await provider.apply_change(RuleChange(version=6, table="categorization_rules", row_id=1, user_id=7))
+
+        assert 7 not in provider._user_engines
+        assert 8 in provider._user_engines
+        assert provider._engine is global_engine
+        assert provider._version == 6
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "change",
+        [
+            RuleChange(version=8, table="categorization_rules", row_id=1, user_id=7),  # gap: 6 and 7 missed
+            RuleChange(version=6, table="subcategories", row_id=12),
+        ],
+    )
+    async def test_gap_or_taxonomy_change_reloads_in_full(self, change: RuleChange) -> None:
+        provider = _provider([])
+        provider._version = 5
+        provider._reload = AsyncMock()  # type: ignore[method-assign]
+
+        await provider.apply_change(change)
+
+        provider._reload.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_user_rule_batch_drops_each_overlay_once_without_a_reload(self) -> None:
+        provider = _provider([])
+        provider._version = 5
+        provider._reload = AsyncMock(side_effect=AssertionError("full reload"))  # type: ignore[method-assign]
+        for user_id in (7, 8, 9):
+            provider._user_engines.put(user_id, [], 1)
+
+        await provider.apply_changes(
+            [
+                RuleChange(version=7, table="categorization_rules", row_id=2, user_id=8),
+                RuleChange(version=6, table="categorization_rules", row_id=1, user_id=7),
+                RuleChange(version=8, table="categorization_rules", row_id=3, user_id=7),
+            ]
+        )
+
+        assert (7 in provider._user_engines, 8 in provider._user_engines, 9 in provider._user_engines) == (
+            False,
+            False,
+            True,
+        )
+        assert provider._version == 8
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "versions",
+        [
+            range(6, 7 + MAX_DELTA_CHANGES),  # a bulk write: one reload beats a long delta
+            (6, 8),  # gap inside the batch: 7 missed
+        ],
+    )
+    async def test_bulk_or_gapped_batch_reloads_once(self, versions: range | tuple[int, ...]) -> None:
+        provider = _provider([])
+        provider._version = 5
+        provider._reload = AsyncMock()  # type: ignore[method-assign]
+
+        await provider.apply_changes(
+            [RuleChange(version=version, table="categorization_rules", row_id=version) for version in versions]
+        )
+
+        provider._reload.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_nothing_to_update_before_the_first_load(self) -> None:
+        provider = RuleEngineProvider()
+        provider._reload = AsyncMock()  # type: ignore[method-assign]
+
+        await provider.apply_change(RuleChange(version=9, table="categories", row_id=1))
+        await provider.resync()
+
+        provider._reload.assert_not_awaited()
+
+    def test_listening_stretches_the_ttl_to_a_safety_net(self) -> None:
+        provider = RuleEngineProvider(ttl_seconds=60)
+        assert provider._effective_ttl == 60
+        provider.set_listening(True)
+        assert provider._effective_ttl == LISTENING_TTL_SECONDS
@@ -0,0 +1,96 @@
+"""Unit tests for the byte-bounded overlay LRU and the overlay store stand-in."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from app.user_overlays import InMemoryOverlayStore, StoredOverlay, UserOverlayCache
+
+
+class TestUserOverlayCache:
+    def test_evicts_least_recently_used_until_within_budget(self) -> None:
+        cache: UserOverlayCache[str] = UserOverlayCache(max_bytes=100)
+        cache.put(1, "a", 40)
+        cache.put(2, "b", 40)
+        assert cache.get(1, max_age=60) == "a"  # 2 is now the coldest
+
+        cache.put(3, "c", 40)
+
+        assert 2 not in cache
+        assert (cache.get(1, max_age=60), cache.get(3, max_age=60)) == ("a", "c")
+        assert cache.nbytes == 80
+        assert cache.evictions == 1
+
+    def test_one_large_value_evicts_several_small_ones(self) -> None:
+        cache: UserOverlayCache[str] = UserOverlayCache(max_bytes=100)
+        for user_id in range(10):
+            cache.put(user_id, "small", 10)
+
+        cache.put(99, "large", 75)
+
+        assert len(cache) == 3
+        assert cache.nbytes == 95
+
+    def test_value_over_the_whole_budget_is_not_cached(self) -> None:
+        cache: UserOverlayCache[str] = UserOverlayCache(max_bytes=100)
+        cache.put(1, "a", 40)
+
+        cache.put(2, "huge", 101)
+
+        assert 2 not in cache
+        assert 1 in cache
+
+    def test_replacing_a_value_recounts_its_size(self) -> None:
+        cache: UserOverlayCache[str] = UserOverlayCache(max_bytes=100)
+        cache.put(1, "a", 40)
+        cache.put(1, "b", 10)
+        cache.discard(1)
+        cache.discard(1)
+
+        assert cache.nbytes == 0
+
+    def test_expired_entry_is_a_miss_and_is_dropped(self) -> None:
+        cache: UserOverlayCache[str] = UserOverlayCache(max_bytes=100)
+        with patch("app.user_overlays.time.monotonic", return_value=1000.0):
+            cache.put(1, "a", 40)
+        with patch("app.user_overlays.time.monotonic", return_value=1060.0):
+            assert cache.get(1, max_age=61) == "a"
+            assert cache.get(1, max_age=60) is None
+
+        assert cache.nbytes == 0
+
+    def test_budget_must_be_positive(self) -> None:
+        with pytest.raises(ValueError):
+            UserOverlayCache(max_bytes=0)
+
+
+class TestStoredOverlay:
+    def test_round_trip(self) -> None:
+        stored = StoredOverlay.from_tiers(12, [[("netto", 3), ("føtex", 3)], [("pizza", 5)]])
+
+        assert StoredOverlay.decode(stored.encode()) == stored
+
+    @pytest.mark.parametrize("raw", [b"", b"[]", b'{"version": 1}', b'{"version": 1, "tiers": [[["netto"]]]}'])
+    def test_malformed_raises_value_error(self, raw: bytes) -> None:
+        with pytest.raises(ValueError):
+            StoredOverlay.decode(raw)
+
+
+class TestInMemoryOverlayStore:
+    @pytest.mark.asyncio()
+    async def test_set_get_delete(self) -> None:
+        store = InMemoryOverlayStore()
+        await store.set("k", b"v")
+
+        assert await store.get("k") == b"v"
+        assert await store.delete("k", "missing") == 1
+        assert await store.get("k") is None
+
+    @pytest.mark.asyncio()
+    async def test_values_expire(self) -> None:
+        store = InMemoryOverlayStore()
+        with patch("app.user_overlays.time.monotonic", return_value=1000.0):
+            await store.set("k", b"v", ex=60)
+        with patch("app.user_overlays.time.monotonic", return_value=1060.0):
+            assert await store.get("k") is None
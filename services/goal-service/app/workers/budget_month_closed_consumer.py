@@ -10,6 +10,10 @@ republished to this consumer's OWN queue via the default exchange — the
 old local copy republished to the topic exchange, re-delivering the
 event to every other bound consumer.
 
+The body is validated straight into ``BudgetMonthClosedEvent`` by the
+base (``event_model=``) in one pass from the raw bytes; a body that does
+not validate is dead-lettered before ``handle`` runs.
+
 Deduplication is handled by the handler itself: _already_handled(source_key)
 checks allocation/unallocated tables before writing, and unique constraints
 on (source_key, goal_id) / (source_key) catch concurrent races. The
@@ -30,7 +34,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
 
 from aio_pika.abc import AbstractIncomingMessage
 from app.adapters.outbound.unit_of_work import SQLAlchemyBudgetMonthClosedUnitOfWork
@@ -38,7 +41,7 @@ from app.application.budget_month_closed_handler import BudgetMonthClosedHandler
 from app.config import settings
 from app.database import async_session_factory
 from contracts.events.budget import BudgetMonthClosedEvent
-from messaging import ConsumerBase, PoisonMessageError, setup_worker_logging
+from messaging import ConsumerBase, setup_worker_logging
 from sqlalchemy.exc import IntegrityError
 
 logger = logging.getLogger(__name__)
@@ -53,15 +56,11 @@ class BudgetMonthClosedConsumer(ConsumerBase):
             rabbitmq_url=settings.RABBITMQ_URL,
             queue_name=QUEUE_NAME,
             routing_keys=ROUTING_KEY,
+            event_model=BudgetMonthClosedEvent,
         )
 
-    async def handle(self, payload: dict[str, Any], message: AbstractIncomingMessage) -> None:
-        correlation_id = payload.get("correlation_id", "unknown")
-
-        try:
-            event = BudgetMonthClosedEvent.model_validate(payload)
-        except Exception as err:
-            raise PoisonMessageError(f"Invalid event payload (correlation_id={correlation_id})") from err
+    async def handle(self, event: BudgetMonthClosedEvent, message: AbstractIncomingMessage) -> None:
+        correlation_id = event.correlation_id
 
         try:
             async with async_session_factory() as session:
@@ -0,0 +1,142 @@
+"""Bytes and CPU per event, old wire path vs. the codec paths.
+
+Covers every ``BaseEvent`` subclass exported from ``contracts.events``,
+each filled with representative values.  Per class and in total it
+reports encoded size and microseconds per event for:
+
+* ``before`` — what services did: ``to_json()`` on the producer,
+  ``json.loads`` + ``model_validate`` on the consumer;
+* ``json``  — ``to_bytes()`` / ``from_bytes()`` (one-pass validation from bytes);
+* ``msgpack`` — the same with ``application/msgpack`` (if installed).
+
+Run::
+
+    python benchmarks/bench_serialization.py [--number 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import enum
+import inspect
+import json
+import timeit
+import types
+import typing
+from datetime import date, datetime, timezone
+from typing import Any
+
+import contracts.events as events_package
+from contracts.base import BaseEvent
+from contracts.codec import JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE, available_content_types
+
+_SAMPLE_STRINGS = {
+    "email": "alice@example.com",
+    "currency": "DKK",
+}
+_SAMPLE_INTS = {"year": 2026, "month": 10, "threshold": 80}
+_SAMPLE_ITEM = {
+    "external_id": "entry-0001",
+    "amount": "125.50",
+    "date": "2026-10-17",
+    "description": "NETTO NORDHAVN 1234",
+    "transaction_type": "expense",
+}
+
+
+def _sample_value(name: str, annotation: Any) -> Any:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in (typing.Union, types.UnionType):
+        return _sample_value(name, next(arg for arg in args if arg is not type(None)))
+    if origin is typing.Literal:
+        return args[0]
+    if origin is list:
+        return [_sample_value(name, args[0]) for _ in range(3)] if args else []
+    if origin is dict or annotation is dict:
+        return dict(_SAMPLE_ITEM)
+    if inspect.isclass(annotation) and issubclass(annotation, enum.Enum):
+        return next(iter(annotation))
+    if annotation is bool:
+        return True
+    if annotation is int:
+        return _SAMPLE_INTS.get(name, 4217)
+    if annotation is float:
+        return 0.87
+    if annotation is datetime:
+        return datetime(2026, 10, 17, 12, 30, tzinfo=timezone.utc)
+    if annotation is date:
+        return date(2026, 10, 17)
+    if any(token in name for token in ("amount", "spent", "budgeted", "surplus", "threshold", "limit")):
+        return "4200.00"
+    return _SAMPLE_STRINGS.get(name, f"sample {name.replace('_', ' ')}")
+
+
+def sample_events() -> list[BaseEvent]:
+    """One representative, valid instance per event class."""
+    samples = []
+    for _, module in inspect.getmembers(events_package, inspect.ismodule):
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(cls, BaseEvent) or cls.__module__ != module.__name__ or cls.__name__.startswith("_"):
+                continue
+            hints = typing.get_type_hints(cls)
+            values = {
+                name: _sample_value(name, hints[name])
+                for name, field in cls.model_fields.items()
+                if field.is_required()
+            }
+            samples.append(cls(**values))
+    return sorted(samples, key=lambda event: type(event).__name__)
+
+
+def _per_call_us(func: Any, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def measure(event: BaseEvent, number: int) -> dict[str, tuple[int, float, float]]:
+    """``{path: (bytes, encode µs, decode µs)}`` for one event."""
+    cls = type(event)
+    legacy_body = event.to_json().encode("utf-8")
+    results = {
+        "before": (
+            len(legacy_body),
+            _per_call_us(lambda: event.to_json().encode("utf-8"), number),
+            _per_call_us(lambda: cls.model_validate(json.loads(legacy_body.decode("utf-8"))), number),
+        )
+    }
+    for label, content_type in (("json", JSON_CONTENT_TYPE), ("msgpack", MSGPACK_CONTENT_TYPE)):
+        if content_type not in available_content_types():
+            continue
+        body = event.to_bytes(content_type)
+        assert cls.from_bytes(body, content_type) == event
+        results[label] = (
+            len(body),
+            _per_call_us(lambda ct=content_type: event.to_bytes(ct), number),
+            _per_call_us(lambda b=body, ct=content_type: cls.from_bytes(b, ct), number),
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing sample")
+    number = parser.parse_args().number
+
+    totals: dict[str, list[float]] = {}
+    print(f"{'event':42} {'path':8} {'bytes':>6} {'enc µs':>8} {'dec µs':>8}")
+    for event in sample_events():
+        for label, (size, encode_us, decode_us) in measure(event, number).items():
+            print(f"{type(event).__name__:42} {label:8} {size:6d} {encode_us:8.2f} {decode_us:8.2f}")
+            total = totals.setdefault(label, [0, 0.0, 0.0, 0])
+            total[0] += size
+            total[1] += encode_us
+            total[2] += decode_us
+            total[3] += 1
+    print()
+    print(f"{'mean per event':42} {'path':8} {'bytes':>6} {'enc µs':>8} {'dec µs':>8}")
+    for label, (size, encode_us, decode_us, count) in totals.items():
+        print(f"{'':42} {label:8} {size / count:6.0f} {encode_us / count:8.2f} {decode_us / count:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from contracts.codec import JSON_CONTENT_TYPE, decode_event, encode_event
+
 
 class BaseEvent(BaseModel):
     """Immutable base class for all inter-service domain events.
@@ -31,3 +33,12 @@ class BaseEvent(BaseModel):
     @classmethod
     def from_json(cls, data: str) -> Self:
         return cls.model_validate_json(data)
+
+    def to_bytes(self, content_type: str = JSON_CONTENT_TYPE) -> bytes:
+        """Wire body for ``content_type`` (see :mod:`contracts.codec`)."""
+        return encode_event(self, content_type)
+
+    @classmethod
+    def from_bytes(cls, body: bytes, content_type: str | None = JSON_CONTENT_TYPE) -> Self:
+        """Validate a wire body straight into the event, without a dict in between."""
+        return decode_event(cls, body, content_type)
@@ -0,0 +1,118 @@
+"""Wire encodings for events, chosen per message by ``content_type``.
+
+The JSON path is what every service has always sent — ``application/json``
+produced by pydantic's Rust serializer — and stays the default.  On top
+of it:
+
+* **Decoding straight from bytes.**  :func:`decode_event` hands the raw
+  body to ``model_validate_json``, which parses and validates in one
+  pass.  The old consumer path (``json.loads`` into a dict, then
+  ``model_validate`` the dict) built every value twice.
+* **msgpack** (``application/msgpack``, needs the ``msgpack`` extra) —
+  a denser binary encoding for high-volume producers.  Dates and
+  datetimes travel as ISO strings, exactly as in JSON, so a msgpack body
+  validates to the same event.
+* **orjson** (the ``orjson`` extra) is used for untyped dict payloads when
+  installed; pydantic models never need it.
+
+The consumer decides nothing: it reads ``content_type`` off the message
+and decodes accordingly, so producers can switch one at a time.  One
+rule for every caller, ``finans-tracker-messaging`` included (it uses
+this module rather than a copy): parameters and case are ignored
+(``application/json; charset=utf-8`` is JSON), a missing content type is
+JSON — what producers sent before negotiation — and anything else is
+:class:`UnsupportedContentTypeError`, which a consumer dead-letters.
+
+``benchmarks/bench_serialization.py`` measures bytes and CPU per event
+for every class in ``contracts.events``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+try:  # optional extras
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is absent
+    orjson = None  # type: ignore[assignment]
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None  # type: ignore[assignment]
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class UnsupportedContentTypeError(ValueError):
+    """The content type is unknown, or its optional codec is not installed."""
+
+
+def available_content_types() -> tuple[str, ...]:
+    """Content types this process can encode and decode."""
+    if msgpack is None:
+        return (JSON_CONTENT_TYPE,)
+    return (JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE)
+
+
+def is_json(content_type: str | None) -> bool:
+    """Whether ``content_type`` names JSON (a missing one does)."""
+    return _media_type(content_type) == JSON_CONTENT_TYPE
+
+
+def encode_event(event: BaseModel, content_type: str = JSON_CONTENT_TYPE) -> bytes:
+    """Serialize an event for the wire."""
+    if is_json(content_type):
+        return event.model_dump_json().encode("utf-8")
+    if _is_msgpack(content_type):
+        return _msgpack().packb(event.model_dump(mode="json"))
+    raise UnsupportedContentTypeError(content_type)
+
+
+def encode_payload(payload_json: str, content_type: str = JSON_CONTENT_TYPE) -> bytes:
+    """Body for an already-serialized JSON payload (e.g. an outbox row)."""
+    if is_json(content_type):
+        return payload_json.encode("utf-8")
+    if _is_msgpack(content_type):
+        return _msgpack().packb(loads(payload_json))
+    raise UnsupportedContentTypeError(content_type)
+
+
+def decode_event(model: type[ModelT], body: bytes | str, content_type: str | None = JSON_CONTENT_TYPE) -> ModelT:
+    """Parse and validate ``body`` into ``model`` in one pass where possible."""
+    if is_json(content_type):
+        return model.model_validate_json(body)
+    if _is_msgpack(content_type):
+        return model.model_validate(_msgpack().unpackb(body))
+    raise UnsupportedContentTypeError(content_type)
+
+
+def loads(body: bytes | str, content_type: str | None = JSON_CONTENT_TYPE) -> Any:
+    """Decode an untyped payload (dict) from the wire."""
+    if is_json(content_type):
+        return orjson.loads(body) if orjson is not None else json.loads(body)
+    if _is_msgpack(content_type):
+        return _msgpack().unpackb(body)
+    raise UnsupportedContentTypeError(content_type)
+
+
+def _is_msgpack(content_type: str | None) -> bool:
+    return _media_type(content_type) == MSGPACK_CONTENT_TYPE
+
+
+def _media_type(content_type: str | None) -> str:
+    # Missing content type = a pre-negotiation producer, which sent JSON.
+    if not content_type:
+        return JSON_CONTENT_TYPE
+    return content_type.split(";", 1)[0].strip().lower()
+
+
+def _msgpack() -> Any:
+    if msgpack is None:
+        raise UnsupportedContentTypeError(f"{MSGPACK_CONTENT_TYPE} needs the msgpack package")
+    return msgpack
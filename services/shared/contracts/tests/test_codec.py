@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from contracts import BudgetMonthClosedEvent, UserCreatedEvent
+from contracts.codec import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    UnsupportedContentTypeError,
+    available_content_types,
+    decode_event,
+    encode_event,
+    encode_payload,
+    is_json,
+    loads,
+)
+from pydantic import ValidationError
+
+PAYLOAD_JSON = json.dumps({"event_type": "thing.happened", "amount": "12.50", "ids": [1, 2]})
+
+
+def _event() -> UserCreatedEvent:
+    return UserCreatedEvent(user_id=1, email="a@b.com", username="alice")
+
+
+class TestJson:
+    def test_bytes_match_to_json(self) -> None:
+        event = _event()
+
+        assert event.to_bytes() == event.to_json().encode("utf-8")
+
+    def test_roundtrip_from_bytes(self) -> None:
+        event = _event()
+
+        assert UserCreatedEvent.from_bytes(event.to_bytes()) == event
+
+    def test_missing_content_type_means_json(self) -> None:
+        event = _event()
+
+        assert decode_event(UserCreatedEvent, event.to_bytes(), None) == event
+
+    def test_invalid_body_raises_validation_error(self) -> None:
+        with pytest.raises(ValidationError):
+            UserCreatedEvent.from_bytes(b'{"user_id": "not-a-number"}')
+
+    def test_loads_untyped_payload(self) -> None:
+        assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_encode_payload_is_utf8_of_the_stored_json(self) -> None:
+        assert encode_payload(PAYLOAD_JSON) == PAYLOAD_JSON.encode("utf-8")
+
+    @pytest.mark.parametrize(
+        "content_type", [None, "", JSON_CONTENT_TYPE, "application/json; charset=utf-8", "Application/JSON"]
+    )
+    def test_parameters_and_case_are_ignored(self, content_type: str | None) -> None:
+        assert is_json(content_type)
+        assert loads(b'{"a": 1}', content_type) == {"a": 1}
+        event = _event()
+        assert decode_event(UserCreatedEvent, event.to_bytes(), content_type) == event
+
+
+class TestMsgpack:
+    @pytest.fixture(autouse=True)
+    def _require_msgpack(self) -> None:
+        pytest.importorskip("msgpack")
+
+    def test_advertised(self) -> None:
+        assert available_content_types() == (JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE)
+
+    def test_roundtrip_preserves_event(self) -> None:
+        event = BudgetMonthClosedEvent(
+            account_id=7,
+            year=2026,
+            month=4,
+            budgeted_amount="5000.00",
+            actual_spent="4200.10",
+            surplus_amount="799.90",
+        )
+
+        body = event.to_bytes(MSGPACK_CONTENT_TYPE)
+
+        assert BudgetMonthClosedEvent.from_bytes(body, MSGPACK_CONTENT_TYPE) == event
+
+    def test_encode_payload_transcodes_stored_json(self) -> None:
+        body = encode_payload(PAYLOAD_JSON, "application/msgpack; v=1")
+
+        assert loads(body, MSGPACK_CONTENT_TYPE) == json.loads(PAYLOAD_JSON)
+        assert len(body) < len(PAYLOAD_JSON)
+
+    def test_smaller_than_json(self) -> None:
+        event = _event()
+
+        assert len(encode_event(event, MSGPACK_CONTENT_TYPE)) < len(encode_event(event))
+
+
+class TestUnsupported:
+    def test_unknown_content_type_rejected(self) -> None:
+        with pytest.raises(UnsupportedContentTypeError):
+            encode_event(_event(), "application/xml")
+
+        with pytest.raises(UnsupportedContentTypeError):
+            decode_event(UserCreatedEvent, b"<x/>", "application/xml")
+
+    @pytest.mark.parametrize("content_type", ["text/plain", "application/xml"])
+    def test_unknown_content_type_is_not_read_as_json(self, content_type: str) -> None:
+        assert not is_json(content_type)
+        with pytest.raises(UnsupportedContentTypeError):
+            loads(b'{"a": 1}', content_type)
+        with pytest.raises(UnsupportedContentTypeError):
+            encode_payload(PAYLOAD_JSON, content_type)
@@ -1,43 +1,101 @@
 """finans-tracker-messaging — shared messaging infrastructure.
 
 Transactional outbox (model mixin, repository, publisher worker),
-RabbitMQ topic-exchange publisher, and consumer base class with
-DLQ + header-based retry.
+RabbitMQ topic-exchange publisher, consumer base class with
+DLQ + header-based retry (delayed through TTL'd retry tiers), an
+in-memory inbox filter, and a host running several of them in one
+process.
 """
 
 from __future__ import annotations
 
+from contracts.codec import JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE, UnsupportedContentTypeError
+
 from messaging.consumer import (
     ConsumerBase,
+    EventModel,
     InboxDeduplicator,
     PoisonMessageError,
 )
+from messaging.host import ComponentHealth, WorkerHost
+from messaging.inbox import BloomFilter, InboxFilter, InboxPurger
 from messaging.logging import setup_worker_logging
+from messaging.metrics import (
+    MessagingMetrics,
+    PrometheusMetrics,
+    default_metrics,
+    enable_prometheus,
+    set_default_metrics,
+    start_metrics_server,
+)
+from messaging.notify import (
+    OUTBOX_NOTIFY_CHANNEL,
+    OutboxNotifyListener,
+    OutboxWakeup,
+    outbox_notify_drop_sql,
+    outbox_notify_install_sql,
+)
 from messaging.outbox import (
+    OutboxBacklog,
     OutboxEntry,
     OutboxEventMixin,
     OutboxRepository,
     OutboxStatus,
     compute_backoff,
 )
+from messaging.partitioning import (
+    OUTBOX_EVENTS,
+    PartitionedTable,
+    PartitionMaintainer,
+)
 from messaging.rabbitmq import EXCHANGE_NAME, RabbitMQPublisher, SerializableEvent
+from messaging.retry import DEFAULT_RETRY_DELAYS_S, RETRY_HEADER, RetryTiers, exponential_delays, read_retry_count
 from messaging.time import utcnow, utcnow_naive
 from messaging.worker import OutboxPublisherWorker
 
 __all__ = [
+    "DEFAULT_RETRY_DELAYS_S",
     "EXCHANGE_NAME",
+    "JSON_CONTENT_TYPE",
+    "MSGPACK_CONTENT_TYPE",
+    "OUTBOX_EVENTS",
+    "OUTBOX_NOTIFY_CHANNEL",
+    "RETRY_HEADER",
+    "BloomFilter",
+    "ComponentHealth",
     "ConsumerBase",
+    "EventModel",
     "InboxDeduplicator",
+    "InboxFilter",
+    "InboxPurger",
+    "MessagingMetrics",
+    "OutboxBacklog",
     "OutboxEntry",
     "OutboxEventMixin",
+    "OutboxNotifyListener",
     "OutboxPublisherWorker",
     "OutboxRepository",
     "OutboxStatus",
+    "OutboxWakeup",
+    "PartitionMaintainer",
+    "PartitionedTable",
     "PoisonMessageError",
+    "PrometheusMetrics",
     "RabbitMQPublisher",
+    "RetryTiers",
     "SerializableEvent",
+    "UnsupportedContentTypeError",
+    "WorkerHost",
     "compute_backoff",
+    "default_metrics",
+    "enable_prometheus",
+    "exponential_delays",
+    "outbox_notify_drop_sql",
+    "outbox_notify_install_sql",
+    "read_retry_count",
+    "set_default_metrics",
     "setup_worker_logging",
+    "start_metrics_server",
     "utcnow",
     "utcnow_naive",
 ]
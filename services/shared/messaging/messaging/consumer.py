@@ -12,7 +12,11 @@ semantics follow the two best existing implementations:
   (the fixed variant): failed messages are republished to the consumer's
   OWN queue via the default exchange with an incremented ``x-retry-count``
   header — NOT to the topic exchange, which would re-deliver the event to
-  every other bound consumer (goal-service's remaining bug).
+  every other bound consumer (goal-service's remaining bug).  By default
+  the republish goes through a delay tier first (``retry_delays``, see
+  :mod:`messaging.retry`): a TTL'd queue that dead-letters back to the
+  main queue after 1 s, 5 s, 25 s — so an outage is not retried away in
+  milliseconds.  ``retry_delays=None`` restores the immediate republish.
 
 Poison messages (unparseable JSON, non-object payloads, or handler
 raising :class:`PoisonMessageError`) are nacked without requeue and land
@@ -24,19 +28,61 @@ inbox) for a fast-path duplicate skip.  For strict once-only effects the
 handler should additionally record the idempotency key inside its own
 database transaction.
 
+Concurrency (opt-in, ``concurrency=N``): deliveries are parsed on the
+channel callback and handed to one of N asyncio worker partitions,
+chosen by hashing :meth:`ConsumerBase.ordering_key`.  Messages with the
+same key always land in the same partition and are handled in arrival
+order; unrelated keys are handled in parallel.  Ack, retry and DLQ
+decisions are the same code path as the serial mode — each delivery is
+acked/nacked individually by its own partition, which AMQP allows in
+any order.  ``prefetch_count`` defaults to ``4 * concurrency`` so every
+partition has work queued.
+
+Micro-batching (opt-in, ``batch_size=N``): each partition collects up
+to N deliveries or waits at most ``batch_max_wait`` seconds, then hands
+the payloads to :meth:`ConsumerBase.handle_batch` — one DB transaction,
+bulk inserts.  On success the whole batch is acked; with a single
+partition that is one ``basic.ack(multiple=True)``.  If ``handle_batch``
+raises, every message in the batch is re-run through the ordinary
+per-message path, so one poison payload is isolated and dead-lettered
+on its own instead of taking its neighbours with it.  ``handle_batch``
+may also return the positions of payloads it did not apply (e.g. a row
+not visible yet); those go through the per-message path too.
+
+Body decoding follows the message's ``content_type`` (JSON, or msgpack
+when the producer opted in — see :mod:`contracts.codec`).  With
+``event_model=SomeEvent`` the body is validated straight into that model
+(``model_validate_json`` on the raw bytes for JSON — one pass instead of
+``json.loads`` then ``model_validate``) and ``handle`` receives the model
+instance instead of a dict; a body that fails validation is poison and
+goes to the DLQ.
+
+Metrics: every settled delivery is reported to ``metrics`` (default:
+the process-wide sink from :mod:`messaging.metrics`, a no-op unless a
+process enables Prometheus) with its outcome and handling time.
+
 Subclass contract::
 
     class MyConsumer(ConsumerBase):
         async def handle(self, payload: dict[str, Any],
                          message: AbstractIncomingMessage) -> None:
             ...  # raise PoisonMessageError for unrecoverable payloads
+
+        async def handle_batch(self, payloads: list[dict[str, Any]]) -> None:
+            ...  # only with batch_size > 1; one transaction for all payloads
+
+        def ordering_key(self, payload: dict[str, Any]) -> str | None:
+            return payload.get("transaction_id")  # only with concurrency > 1
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
 import logging
+import time
+import zlib
+from collections.abc import Collection
 from typing import Any, Protocol, Sequence
 
 import aio_pika
@@ -46,14 +92,24 @@ from aio_pika.abc import (
     AbstractIncomingMessage,
     AbstractRobustConnection,
 )
+from contracts.codec import JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE, is_json, loads
 
+from messaging.metrics import MessagingMetrics, Outcome, default_metrics
 from messaging.rabbitmq import EXCHANGE_NAME
+from messaging.retry import DEFAULT_RETRY_DELAYS_S, RETRY_HEADER, RetryTiers, read_retry_count
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_PREFETCH_COUNT = 1
-RETRY_HEADER = "x-retry-count"
+DEFAULT_CONCURRENCY = 1
+#: Default prefetch per partition when ``concurrency > 1``.
+PREFETCH_PER_PARTITION = 4
+#: How long :meth:`ConsumerBase.run` waits for in-flight partitions on stop.
+DRAIN_TIMEOUT_S = 30.0
+DEFAULT_BATCH_SIZE = 1
+#: Longest a partial batch waits for more deliveries before it is handled.
+DEFAULT_BATCH_MAX_WAIT_S = 0.05
 
 
 class PoisonMessageError(Exception):
@@ -72,6 +128,14 @@ class InboxDeduplicator(Protocol):
     async def mark_processed(self, message_id: str, event_type: str) -> None: ...
 
 
+class EventModel(Protocol):
+    """What ``event_model=`` needs — satisfied by any pydantic model class."""
+
+    def model_validate(self, obj: Any) -> Any: ...
+
+    def model_validate_json(self, json_data: bytes | str) -> Any: ...
+
+
 class ConsumerBase:
     """Connection/topology/retry boilerplate; subclasses implement ``handle``."""
 
@@ -83,53 +147,133 @@ class ConsumerBase:
         *,
         exchange_name: str = EXCHANGE_NAME,
         max_retries: int = DEFAULT_MAX_RETRIES,
-        prefetch_count: int = DEFAULT_PREFETCH_COUNT,
+        prefetch_count: int | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_max_wait: float = DEFAULT_BATCH_MAX_WAIT_S,
         deduplicator: InboxDeduplicator | None = None,
+        event_model: EventModel | None = None,
+        retry_delays: Sequence[float] | None = DEFAULT_RETRY_DELAYS_S,
+        metrics: MessagingMetrics | None = None,
     ) -> None:
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if prefetch_count is None:
+            if batch_size > 1:
+                # Two batches' worth per partition: one being handled, one filling.
+                prefetch_count = concurrency * batch_size * 2
+            elif concurrency > 1:
+                prefetch_count = concurrency * PREFETCH_PER_PARTITION
+            else:
+                prefetch_count = DEFAULT_PREFETCH_COUNT
         self._rabbitmq_url = rabbitmq_url
         self._queue_name = queue_name
         self._routing_keys: tuple[str, ...] = (routing_keys,) if isinstance(routing_keys, str) else tuple(routing_keys)
         self._exchange_name = exchange_name
         self._max_retries = max_retries
         self._prefetch_count = prefetch_count
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._batch_max_wait = batch_max_wait
         self._dedup = deduplicator
+        self._event_model = event_model
+        self._metrics_override = metrics
+        self._retry_tiers = RetryTiers(queue_name, tuple(retry_delays)) if retry_delays else None
         self._connection: AbstractRobustConnection | None = None
         self._channel: AbstractChannel | None = None
         self._stopped = asyncio.Event()
+        self._partitions: list[asyncio.Queue[tuple[AbstractIncomingMessage, dict[str, Any]]]] = []
+        self._partition_tasks: list[asyncio.Task[None]] = []
+        self._round_robin = itertools.count()
+
+    @property
+    def queue_name(self) -> str:
+        return self._queue_name
+
+    @property
+    def _metrics(self) -> MessagingMetrics:
+        # Resolved per use so a default installed after construction
+        # (``enable_prometheus`` in ``main``) still applies.
+        return self._metrics_override or default_metrics()
 
     async def handle(
         self,
-        payload: dict[str, Any],
+        payload: Any,
         message: AbstractIncomingMessage,
     ) -> None:
         """Process one parsed message.  Must be overridden.
 
+        ``payload`` is the decoded dict, or an ``event_model`` instance
+        when one was given.
+
         Raise :class:`PoisonMessageError` for unrecoverable payloads
         (schema validation failures) — any other exception triggers the
         retry/DLQ ladder.
         """
         raise NotImplementedError
 
-    async def run(self) -> None:
-        """Declare topology, consume until :meth:`stop` is called."""
+    async def handle_batch(self, payloads: list[dict[str, Any]]) -> Collection[int] | None:
+        """Process a micro-batch in one go (``batch_size > 1``).
+
+        ``payloads`` are in delivery order.  Return ``None`` when all were
+        applied, or the indexes of those that were not — they are re-run
+        through :meth:`handle` individually.  Raising sends the *whole*
+        batch down that per-message path, so the batch must be atomic
+        (one DB transaction) for the fallback to be safe.
+        """
+        raise NotImplementedError
+
+    def ordering_key(self, payload: dict[str, Any]) -> str | None:
+        """Key whose messages must be handled in order (``concurrency > 1``).
+
+        Override to return the aggregate id (e.g. ``transaction_id``).
+        ``None`` — the default — means the message has no ordering
+        constraint and goes to the next partition round-robin.
+        """
+        return None
+
+    async def on_start(self) -> None:
+        """Hook run before consuming starts (e.g. warming an inbox filter)."""
+
+    async def run(self, connection: AbstractRobustConnection | None = None) -> None:
+        """Declare topology, consume until :meth:`stop` is called.
+
+        With ``connection`` (a :class:`~messaging.host.WorkerHost` shares
+        one between its consumers) the consumer opens its own channel on
+        it and closes only that channel on exit; otherwise it connects to
+        ``rabbitmq_url`` itself.
+        """
         self._stopped.clear()
-        self._connection = await aio_pika.connect_robust(self._rabbitmq_url)
+        await self.on_start()
+        owns_connection = connection is None
+        self._connection = connection or await aio_pika.connect_robust(self._rabbitmq_url)
         try:
             self._channel = await self._connection.channel()
             await self._channel.set_qos(prefetch_count=self._prefetch_count)
 
             queue = await self._declare_topology(self._channel)
-            await queue.consume(self._on_message)
+            self._start_partitions()
+            consumer_tag = await queue.consume(self._on_message)
 
             logger.info(
-                "Consumer %s listening on %s (exchange=%s)",
+                "Consumer %s listening on %s (exchange=%s, concurrency=%d)",
                 self._queue_name,
                 ", ".join(self._routing_keys),
                 self._exchange_name,
+                self._concurrency,
             )
             await self._stopped.wait()
+            # Stop new deliveries first, then let partitions finish what
+            # they hold so their acks still reach the open channel.
+            await queue.cancel(consumer_tag)
         finally:
-            await self._connection.close()
+            await self._stop_partitions()
+            if owns_connection:
+                await self._connection.close()
+            elif self._channel is not None and not self._channel.is_closed:
+                await self._channel.close()
             logger.info("Consumer %s stopped", self._queue_name)
 
     async def stop(self) -> None:
@@ -164,51 +308,223 @@ class ConsumerBase:
         )
         for routing_key in self._routing_keys:
             await queue.bind(exchange, routing_key=routing_key)
+        if self._retry_tiers is not None:
+            await self._retry_tiers.declare(channel)
         return queue
 
+    def _start_partitions(self) -> None:
+        if (self._concurrency == 1 and self._batch_size == 1) or self._partitions:
+            return
+        runner = self._run_batch_partition if self._batch_size > 1 else self._run_partition
+        for _ in range(self._concurrency):
+            partition: asyncio.Queue[tuple[AbstractIncomingMessage, dict[str, Any]]] = asyncio.Queue()
+            self._partitions.append(partition)
+            self._partition_tasks.append(asyncio.create_task(runner(partition)))
+
+    async def _stop_partitions(self, timeout: float = DRAIN_TIMEOUT_S) -> None:
+        if not self._partitions:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(partition.join() for partition in self._partitions)),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            # Unacked deliveries are redelivered by the broker once the
+            # channel closes — abandoning them loses nothing.
+            logger.warning(
+                "Consumer %s: partitions not drained after %.0fs — abandoning in-flight messages",
+                self._queue_name,
+                timeout,
+            )
+        for task in self._partition_tasks:
+            task.cancel()
+        await asyncio.gather(*self._partition_tasks, return_exceptions=True)
+        self._partitions = []
+        self._partition_tasks = []
+
+    async def _run_partition(
+        self,
+        partition: asyncio.Queue[tuple[AbstractIncomingMessage, dict[str, Any]]],
+    ) -> None:
+        while True:
+            message, payload = await partition.get()
+            try:
+                await self._process(message, payload)
+            except Exception:
+                # _process already turns handler errors into ack/nack; what
+                # reaches here is the ack/nack itself failing (channel gone).
+                # The broker redelivers — keep the partition alive.
+                logger.error(
+                    "Settling message on %s failed",
+                    self._queue_name,
+                    exc_info=True,
+                )
+            finally:
+                partition.task_done()
+
+    async def _run_batch_partition(
+        self,
+        partition: asyncio.Queue[tuple[AbstractIncomingMessage, dict[str, Any]]],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await partition.get()]
+            deadline = loop.time() + self._batch_max_wait
+            while len(batch) < self._batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(partition.get(), timeout=remaining))
+                except TimeoutError:
+                    break
+            try:
+                await self._process_batch(batch)
+            except Exception:
+                logger.error(
+                    "Settling batch of %d on %s failed",
+                    len(batch),
+                    self._queue_name,
+                    exc_info=True,
+                )
+            finally:
+                for _ in batch:
+                    partition.task_done()
+
+    async def _process_batch(self, batch: list[tuple[AbstractIncomingMessage, dict[str, Any]]]) -> None:
+        """Dedup → ``handle_batch`` → ack together, or per-message fallback."""
+        started = time.perf_counter()
+        fresh: list[tuple[AbstractIncomingMessage, dict[str, Any]]] = []
+        for message, payload in batch:
+            try:
+                duplicate = await self._is_duplicate(payload)
+            except Exception:
+                # Same outcome as the serial path would reach: an unknown
+                # dedup state means "handle it" — a DB outage then fails the
+                # batch below and every message takes the retry ladder.
+                logger.warning("Dedup check on %s failed", self._queue_name, exc_info=True)
+                duplicate = False
+            if duplicate:
+                await message.ack()
+                self._settled("duplicate", started)
+            else:
+                fresh.append((message, payload))
+        if not fresh:
+            return
+
+        try:
+            deferred = set(await self.handle_batch([payload for _, payload in fresh]) or ())
+        except Exception:
+            logger.warning(
+                "Batch of %d on %s failed — falling back to per-message handling",
+                len(fresh),
+                self._queue_name,
+                exc_info=True,
+            )
+            for message, payload in fresh:
+                await self._process(message, payload)
+            return
+
+        applied: list[tuple[AbstractIncomingMessage, dict[str, Any]]] = []
+        for index, (message, payload) in enumerate(fresh):
+            if index in deferred:
+                continue
+            try:
+                await self._mark_processed(payload)
+            except Exception:
+                # Serial semantics: a failed inbox mark counts as a failed
+                # handle, so the message goes round again.
+                logger.warning("Inbox mark on %s failed", self._queue_name, exc_info=True)
+                deferred.add(index)
+                continue
+            applied.append((message, payload))
+
+        # Settle the stragglers first: after this, every delivery in the
+        # batch that is not in ``applied`` has been acked or nacked.
+        for index in sorted(deferred):
+            await self._process(*fresh[index])
+        if not applied:
+            return
+        if len(self._partitions) == 1:
+            # The only partition settles its batches in order, so every
+            # delivery up to this tag is either in ``applied`` or already
+            # settled — one multiple-ack covers exactly the applied ones.
+            await applied[-1][0].ack(multiple=True)
+        else:
+            for message, _ in applied:
+                await message.ack()
+        for _ in applied:
+            self._settled("ack", started)
+        logger.debug("Applied batch of %d on %s", len(applied), self._queue_name)
+
+    def _partition_index(self, payload: dict[str, Any]) -> int:
+        key = self.ordering_key(payload)
+        if key is None:
+            return next(self._round_robin) % len(self._partitions)
+        # crc32, not hash(): stable across processes, which keeps the
+        # mapping reproducible in logs and tests.
+        return zlib.crc32(str(key).encode("utf-8")) % len(self._partitions)
+
     async def _on_message(self, message: AbstractIncomingMessage) -> None:
-        # JSON parsing sits inside its own error handling: a malformed
-        # body can never crash the consumer — it is dead-lettered.
+        payload = await self._parse(message)
+        if payload is None:
+            return
+        if self._partitions:
+            self._partitions[self._partition_index(payload)].put_nowait((message, payload))
+            return
+        await self._process(message, payload)
+
+    async def _parse(self, message: AbstractIncomingMessage) -> Any:
+        """Decode the body; dead-letter and return ``None`` when unusable."""
+        # Decoding sits inside its own error handling: a malformed body
+        # (or an unknown content type) can never crash the consumer — it
+        # is dead-lettered.
         try:
-            payload = json.loads(message.body.decode("utf-8"))
+            payload = self._decode(message.body, message.content_type)
         except Exception:
             logger.error(
-                "Invalid JSON on %s — sending to DLQ",
+                "Undecodable body on %s — sending to DLQ",
                 self._queue_name,
                 exc_info=True,
             )
             await message.nack(requeue=False)
-            return
+            self._settled("dlq")
+            return None
 
-        if not isinstance(payload, dict):
+        if self._event_model is None and not isinstance(payload, dict):
             logger.error(
                 "Non-object payload on %s (%s) — sending to DLQ",
                 self._queue_name,
                 type(payload).__name__,
             )
             await message.nack(requeue=False)
-            return
-
-        correlation_id = payload.get("correlation_id")
-        event_type = str(payload.get("event_type", ""))
+            self._settled("dlq")
+            return None
+        return payload
+
+    def _decode(self, body: bytes, content_type: str | None) -> Any:
+        if self._event_model is None:
+            return loads(body, content_type)
+        if is_json(content_type):
+            return self._event_model.model_validate_json(body)
+        return self._event_model.model_validate(loads(body, content_type))
+
+    async def _process(self, message: AbstractIncomingMessage, payload: dict[str, Any]) -> None:
+        """Dedup → handle → ack, or the poison/retry/DLQ ladder."""
+        correlation_id = _field(payload, "correlation_id")
+        started = time.perf_counter()
 
         try:
-            if self._dedup is not None and correlation_id:
-                if await self._dedup.already_processed(str(correlation_id), event_type):
-                    logger.info(
-                        "Duplicate %s (correlation_id=%s) — acking without handling",
-                        event_type or "message",
-                        correlation_id,
-                    )
-                    await message.ack()
-                    return
+            if await self._is_duplicate(payload):
+                await message.ack()
+                self._settled("duplicate", started)
+                return
 
             await self.handle(payload, message)
-
-            if self._dedup is not None and correlation_id:
-                await self._dedup.mark_processed(str(correlation_id), event_type)
-
+            await self._mark_processed(payload)
             await message.ack()
+            self._settled("ack", started)
 
         except PoisonMessageError:
             logger.error(
@@ -218,9 +534,10 @@ class ConsumerBase:
                 exc_info=True,
             )
             await message.nack(requeue=False)
+            self._settled("dlq", started)
 
         except Exception:
-            retry_count = int((message.headers or {}).get(RETRY_HEADER, 0))
+            retry_count = read_retry_count(message.headers)
             if retry_count < self._max_retries:
                 logger.warning(
                     "Handler failed on %s (retry=%d/%d, correlation_id=%s) — republishing",
@@ -239,8 +556,10 @@ class ConsumerBase:
                         exc_info=True,
                     )
                     await message.nack(requeue=True)
+                    self._settled("requeue", started)
                     return
                 await message.ack()
+                self._settled("retry", started)
             else:
                 logger.error(
                     "Max retries reached on %s (correlation_id=%s) — sending to DLQ",
@@ -249,6 +568,30 @@ class ConsumerBase:
                     exc_info=True,
                 )
                 await message.nack(requeue=False)
+                self._settled("dlq", started)
+
+    def _settled(self, outcome: Outcome, started: float | None = None) -> None:
+        seconds = None if started is None else time.perf_counter() - started
+        self._metrics.message_settled(self._queue_name, outcome, seconds)
+
+    async def _is_duplicate(self, payload: Any) -> bool:
+        correlation_id = _field(payload, "correlation_id")
+        if self._dedup is None or not correlation_id:
+            return False
+        event_type = str(_field(payload, "event_type") or "")
+        if not await self._dedup.already_processed(str(correlation_id), event_type):
+            return False
+        logger.info(
+            "Duplicate %s (correlation_id=%s) — acking without handling",
+            event_type or "message",
+            correlation_id,
+        )
+        return True
+
+    async def _mark_processed(self, payload: Any) -> None:
+        correlation_id = _field(payload, "correlation_id")
+        if self._dedup is not None and correlation_id:
+            await self._dedup.mark_processed(str(correlation_id), str(_field(payload, "event_type") or ""))
 
     async def _republish(
         self,
@@ -259,14 +602,33 @@ class ConsumerBase:
 
         Publishing to the queue directly (instead of the topic exchange)
         avoids re-delivering the event to every other bound consumer.
+        With retry tiers the message goes to the delay queue for
+        ``retry_count``, which dead-letters it back to our queue.
         """
         assert self._channel is not None
+        content_type = JSON_CONTENT_TYPE if is_json(original.content_type) else MSGPACK_CONTENT_TYPE
+        if self._retry_tiers is not None:
+            await self._retry_tiers.schedule(
+                self._channel,
+                original.body,
+                retry_count,
+                headers=original.headers,
+                content_type=content_type,
+            )
+            return
         headers = dict(original.headers or {})
         headers[RETRY_HEADER] = retry_count
         msg = aio_pika.Message(
             body=original.body,
             delivery_mode=DeliveryMode.PERSISTENT,
-            content_type="application/json",
+            content_type=content_type,
             headers=headers,
         )
         await self._channel.default_exchange.publish(msg, routing_key=self._queue_name)
+
+
+def _field(payload: Any, name: str) -> Any:
+    """``payload[name]`` for dicts, the attribute for ``event_model`` instances."""
+    if isinstance(payload, dict):
+        return payload.get(name)
+    return getattr(payload, name, None)
@@ -0,0 +1,254 @@
+"""Run several consumers and outbox workers in one process.
+
+Every consumer and outbox publisher used to be its own process
+(``python -m app.workers.<name>``): one interpreter, one RabbitMQ
+connection and one DB pool each.  :class:`WorkerHost` runs a service's
+whole worker set on one event loop instead:
+
+* **One robust connection**, one channel per component — a consumer's
+  prefetch and acks stay isolated on its own channel, and aio-pika
+  restores every channel after a reconnect.
+* **One engine** — components built on the service's module-level
+  ``async_session_factory`` already share its pool; pass ``engine=`` and
+  the host disposes it on shutdown.
+* **Supervision** — a component whose ``run`` raises is logged, marked
+  ``failed`` and restarted after ``restart_backoff`` seconds; the others
+  keep running.  :meth:`WorkerHost.health` reports each component's
+  state, restart count and last error, and ``health_port`` serves the
+  same as JSON over HTTP (200 when all are running, 503 otherwise) for a
+  k8s probe.
+* **Graceful shutdown** — on SIGTERM/SIGINT (or :meth:`WorkerHost.stop`)
+  consumers cancel their subscriptions and drain in-flight messages,
+  outbox workers finish the batch they hold; anything still running
+  after ``shutdown_timeout`` is cancelled, and unacked deliveries are
+  redelivered by the broker.
+
+Usage (``app/workers/host.py``)::
+
+    host = WorkerHost(
+        settings.RABBITMQ_URL,
+        [TransactionCreatedConsumer(provider), CategoryCorrectedConsumer(), outbox_worker],
+        engine=engine,
+        health_port=8081,
+    )
+    asyncio.run(host.run())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import signal
+import time
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol
+
+import aio_pika
+from aio_pika.abc import AbstractRobustConnection
+
+from messaging.consumer import ConsumerBase
+from messaging.worker import OutboxPublisherWorker
+
+logger = logging.getLogger(__name__)
+
+ComponentStatus = Literal["starting", "running", "failed", "stopped"]
+
+#: Delay before a crashed component is restarted.
+RESTART_BACKOFF_S = 5.0
+#: How long :meth:`WorkerHost.run` waits for components to drain on stop.
+SHUTDOWN_TIMEOUT_S = 30.0
+
+
+class Disposable(Protocol):
+    """The engine handed to the host (``AsyncEngine`` satisfies it)."""
+
+    async def dispose(self) -> None: ...
+
+
+@dataclass
+class ComponentHealth:
+    """Point-in-time state of one hosted component."""
+
+    name: str
+    status: ComponentStatus = "starting"
+    restarts: int = 0
+    last_error: str | None = None
+    #: ``time.time()`` of the last status change.
+    since: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "restarts": self.restarts,
+            "last_error": self.last_error,
+            "since": self.since,
+        }
+
+
+class WorkerHost:
+    """Supervises consumers and outbox workers on one connection and loop."""
+
+    def __init__(
+        self,
+        rabbitmq_url: str,
+        components: Sequence[ConsumerBase | OutboxPublisherWorker],
+        *,
+        engine: Disposable | None = None,
+        health_port: int | None = None,
+        health_host: str = "0.0.0.0",
+        restart_backoff: float = RESTART_BACKOFF_S,
+        shutdown_timeout: float = SHUTDOWN_TIMEOUT_S,
+    ) -> None:
+        if not components:
+            raise ValueError("WorkerHost needs at least one component")
+        self._rabbitmq_url = rabbitmq_url
+        self._components = _name_components(components)
+        self._engine = engine
+        self._health_port = health_port
+        self._health_host = health_host
+        self._restart_backoff = restart_backoff
+        self._shutdown_timeout = shutdown_timeout
+        self._health = {name: ComponentHealth(name, since=time.time()) for name in self._components}
+        self._stopping = asyncio.Event()
+        self._connection: AbstractRobustConnection | None = None
+
+    def health(self) -> dict[str, ComponentHealth]:
+        return dict(self._health)
+
+    @property
+    def healthy(self) -> bool:
+        return all(component.status == "running" for component in self._health.values())
+
+    def stop(self) -> None:
+        """Begin graceful shutdown; :meth:`run` returns once it is done."""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """Connect, run every component until :meth:`stop` or a signal."""
+        self._stopping.clear()
+        self._install_signal_handlers()
+        self._connection = await aio_pika.connect_robust(self._rabbitmq_url)
+        health_server = await self._start_health_server()
+        tasks = [
+            asyncio.create_task(self._supervise(name, component), name=f"host:{name}")
+            for name, component in self._components.items()
+        ]
+        logger.info("Worker host running %d components: %s", len(tasks), ", ".join(self._components))
+        try:
+            await self._stopping.wait()
+        finally:
+            await self._shutdown(tasks)
+            if health_server is not None:
+                health_server.close()
+                await health_server.wait_closed()
+            await self._connection.close()
+            if self._engine is not None:
+                await self._engine.dispose()
+            logger.info("Worker host stopped")
+
+    async def _supervise(self, name: str, component: ConsumerBase | OutboxPublisherWorker) -> None:
+        assert self._connection is not None
+        while not self._stopping.is_set():
+            self._set_status(name, "running")
+            try:
+                if isinstance(component, ConsumerBase):
+                    await component.run(self._connection)
+                else:
+                    await component.run_forever(self._connection)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if self._stopping.is_set():
+                    break
+                error = f"{type(exc).__name__}: {exc}"
+                logger.exception("%s crashed — restarting in %.1fs", name, self._restart_backoff)
+            else:
+                if self._stopping.is_set():
+                    break
+                # run() only returns on stop(); anything else is a bug in
+                # the component — treat it as a crash so it is restarted.
+                error = "returned without a stop request"
+                logger.error("%s returned unexpectedly — restarting in %.1fs", name, self._restart_backoff)
+            health = self._health[name]
+            health.restarts += 1
+            health.last_error = error
+            self._set_status(name, "failed")
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._restart_backoff)
+        self._set_status(name, "stopped")
+
+    async def _shutdown(self, tasks: list[asyncio.Task[None]]) -> None:
+        self._stopping.set()
+        for component in self._components.values():
+            if isinstance(component, ConsumerBase):
+                await component.stop()
+            else:
+                component.stop()
+        _, pending = await asyncio.wait(tasks, timeout=self._shutdown_timeout)
+        if pending:
+            logger.warning(
+                "Worker host: %d components did not stop within %.0fs — cancelling",
+                len(pending),
+                self._shutdown_timeout,
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        for component in self._components.values():
+            if isinstance(component, OutboxPublisherWorker):
+                with suppress(Exception):
+                    await component.close()
+
+    def _set_status(self, name: str, status: ComponentStatus) -> None:
+        health = self._health[name]
+        health.status = status
+        health.since = time.time()
+
+    def _install_signal_handlers(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            # Not available on every platform/loop (e.g. Windows, non-main
+            # threads); Ctrl-C then still raises KeyboardInterrupt.
+            with suppress(NotImplementedError, RuntimeError):
+                loop.add_signal_handler(sig, self.stop)
+
+    async def _start_health_server(self) -> asyncio.Server | None:
+        if self._health_port is None:
+            return None
+        return await asyncio.start_server(self._serve_health, self._health_host, self._health_port)
+
+    async def _serve_health(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Minimal HTTP/1.0 responder: any request gets the health JSON."""
+        try:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=2.0)
+            body = json.dumps({name: h.as_dict() for name, h in self._health.items()}).encode("utf-8")
+            status = "200 OK" if self.healthy else "503 Service Unavailable"
+            writer.write(
+                f"HTTP/1.0 {status}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii")
+                + body
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _name_components(
+    components: Sequence[ConsumerBase | OutboxPublisherWorker],
+) -> dict[str, ConsumerBase | OutboxPublisherWorker]:
+    """Consumers are named by queue, outbox workers ``outbox_publisher[-N]``."""
+    named: dict[str, ConsumerBase | OutboxPublisherWorker] = {}
+    for component in components:
+        base = component.queue_name if isinstance(component, ConsumerBase) else "outbox_publisher"
+        name, n = base, 1
+        while name in named:
+            n += 1
+            name = f"{base}-{n}"
+        named[name] = component
+    return named
@@ -0,0 +1,226 @@
+"""In-process front for the ``processed_events`` inbox check.
+
+Every inbox-pattern consumer used to ``SELECT`` from ``processed_events``
+before handling a message, and nearly every one of those selects came
+back empty — redeliveries are rare.  :class:`InboxFilter` answers most of
+them from memory:
+
+* a **recent-id LRU** of messages this process committed — a hit is a
+  definite duplicate (the common redelivery: handled, connection dropped
+  before the ack);
+* a **Bloom filter** over every message id known to the process, warmed
+  from the table at startup.  A Bloom filter has no false negatives, so
+  an id it has never seen is definitely not in the snapshot it was built
+  from and the select is skipped.  Only a possible hit falls through to
+  the database.
+
+What it cannot know about is a row committed by *another* instance after
+this one warmed.  That case was always possible (two instances racing
+the same redelivery) and is still settled the same way: the
+``(message_id, consumer_name)`` unique index fails the second commit,
+the transaction rolls back and the message is acked as a benign
+duplicate.  The filter is a fast path, never the guard — which is why
+``processed_events`` stays one plain table, its unique index table-wide,
+and :class:`InboxPurger` trims it by batched ``DELETE`` rather than by
+dropping partitions.
+
+Until :meth:`InboxFilter.warm` has succeeded the Bloom filter knows
+nothing, so every id not in the LRU falls through to the database
+exactly as before.  A failed warm-up therefore costs speed, not
+correctness.
+
+Usage inside a consumer that writes its inbox row in its own
+transaction::
+
+    self._inbox = InboxFilter()
+
+    async def on_start(self) -> None:
+        async with async_session_factory() as session:
+            await self._inbox.warm(session, select(ProcessedEventModel.message_id).where(...))
+
+    async def handle(self, payload, message) -> None:
+        async with async_session_factory() as session:
+            if await self._inbox.is_duplicate(message_id, lambda: self._is_duplicate(session, message_id)):
+                return
+            ...
+            await session.commit()
+            self._inbox.add(message_id)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from messaging.time import utcnow_naive
+
+logger = logging.getLogger(__name__)
+
+#: Ids the Bloom filter is sized for.  Inbox rows are purged after 30
+#: days, so this covers ~33 000 messages a day per consumer; beyond it the
+#: false-positive rate climbs but no duplicate is ever missed.
+DEFAULT_INBOX_CAPACITY = 1_000_000
+#: Share of never-seen ids that still fall through to the database.
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+#: Recently committed ids answered as definite duplicates.
+DEFAULT_RECENT_SIZE = 10_000
+#: Rows fetched per round trip while warming.
+WARM_CHUNK_SIZE = 10_000
+#: Expired inbox rows deleted per transaction by :class:`InboxPurger`.
+PURGE_BATCH_SIZE = 5_000
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on BLAKE2b)."""
+
+    def __init__(self, capacity: int, false_positive_rate: float) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(f"false_positive_rate must be in (0, 1), got {false_positive_rate}")
+        self._size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hashes)]
+
+
+class InboxFilter:
+    """Bloom filter + recent-id LRU in front of one consumer's inbox."""
+
+    def __init__(
+        self,
+        *,
+        capacity: int = DEFAULT_INBOX_CAPACITY,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        recent_size: int = DEFAULT_RECENT_SIZE,
+    ) -> None:
+        self._capacity = capacity
+        self._bloom = BloomFilter(capacity, false_positive_rate)
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        self._recent_size = recent_size
+        self.warmed = False
+
+    def seen(self, message_id: str) -> bool | None:
+        """``True`` duplicate, ``False`` new, ``None`` ask the database."""
+        if message_id in self._recent:
+            self._recent.move_to_end(message_id)
+            return True
+        if self.warmed and message_id not in self._bloom:
+            return False
+        return None
+
+    def add(self, message_id: str) -> None:
+        """Record an id whose inbox row is committed (or known to exist)."""
+        self._bloom.add(message_id)
+        self._recent[message_id] = None
+        self._recent.move_to_end(message_id)
+        if len(self._recent) > self._recent_size:
+            self._recent.popitem(last=False)
+
+    async def is_duplicate(self, message_id: str, lookup: Callable[[], Awaitable[bool]]) -> bool:
+        """Answer from memory, calling ``lookup`` (the SELECT) only on a maybe."""
+        verdict = self.seen(message_id)
+        if verdict is not None:
+            return verdict
+        found = await lookup()
+        if found:
+            self.add(message_id)
+        return found
+
+    async def warm(self, session: AsyncSession, statement: Select[Any]) -> int:
+        """Load every id ``statement`` yields; returns the count.
+
+        Failures are logged and leave the filter cold — every lookup then
+        falls through to the database until the next restart.
+        """
+        loaded = 0
+        try:
+            result = await session.stream_scalars(statement.execution_options(yield_per=WARM_CHUNK_SIZE))
+            async for message_id in result:
+                self._bloom.add(str(message_id))
+                loaded += 1
+        except Exception:
+            logger.warning("Inbox filter warm-up failed — deduplicating via the database", exc_info=True)
+            return 0
+        self.warmed = True
+        if loaded > self._capacity:
+            logger.warning(
+                "Inbox filter holds %d ids, sized for %d — false-positive rate is above target",
+                loaded,
+                self._capacity,
+            )
+        logger.info("Inbox filter warmed with %d processed message id(s)", loaded)
+        return loaded
+
+
+class InboxPurger:
+    """Deletes inbox rows older than ``retention``, ``batch_size`` rows per transaction.
+
+    Short transactions keep each ``DELETE``'s locks and WAL small, so
+    consumers inserting into the same table never queue behind one big
+    purge.  Meant for the outbox publisher's housekeeping tick
+    (``OutboxPublisherWorker(..., inbox_purge=...)``); a failure is
+    logged and the rest waits for the next tick.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        *,
+        retention: timedelta,
+        table: str = "processed_events",
+        column: str = "processed_at",
+        batch_size: int = PURGE_BATCH_SIZE,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self._session_factory = session_factory
+        self._retention = retention
+        self._table = table
+        self._column = column
+        self._batch_size = batch_size
+
+    async def run_once(self) -> int:
+        """Delete every expired row; returns how many went."""
+        cutoff = utcnow_naive() - self._retention
+        statement = text(
+            f"DELETE FROM {self._table} WHERE id IN "
+            f"(SELECT id FROM {self._table} WHERE {self._column} < :cutoff LIMIT :batch)"
+        )
+        deleted = 0
+        try:
+            while True:
+                async with self._session_factory() as session:
+                    result = await session.execute(statement, {"cutoff": cutoff, "batch": self._batch_size})
+                    await session.commit()
+                batch = int(getattr(result, "rowcount", 0) or 0)
+                deleted += batch
+                if batch < self._batch_size:
+                    break
+        except Exception:
+            logger.warning("Inbox purge on %s failed — retrying next tick", self._table, exc_info=True)
+        if deleted:
+            logger.info("Purged %d %s row(s) older than %s", deleted, self._table, self._retention)
+        return deleted
@@ -0,0 +1,172 @@
+"""Pipeline metrics for consumers and the outbox worker.
+
+:class:`MessagingMetrics` is the hook :class:`~messaging.consumer.ConsumerBase`
+and :class:`~messaging.worker.OutboxPublisherWorker` report to.  The base
+class does nothing, so metrics cost nothing until a process opts in;
+:class:`PrometheusMetrics` records them with ``prometheus_client`` (the
+``prometheus`` extra) into the registry you give it — the process-wide
+default, or your own ``CollectorRegistry`` for isolation in tests or to
+expose several registries side by side.
+
+Either pass ``metrics=`` to a consumer/worker, or install a process-wide
+default once at startup — which is what headless workers do, together
+with the ``/metrics`` endpoint::
+
+    enable_prometheus(port=9100)
+
+Series (prefix ``finans_tracker_`` by default):
+
+* ``messaging_messages_total{queue, outcome}`` — how each delivery was
+  settled: ``ack``, ``duplicate``, ``retry`` (parked in a retry tier),
+  ``requeue`` (republish failed, nacked back), ``dlq``.
+* ``messaging_handle_seconds{queue, outcome}`` — dedup check, handler
+  and settlement of one delivery (a micro-batch reports its duration for
+  each of its messages).
+* ``outbox_backlog`` / ``outbox_oldest_pending_age_seconds`` — pending and
+  failed rows, and how long the oldest has waited; sampled every
+  ``metrics_interval`` seconds by the worker.
+* ``outbox_publish_seconds{outcome}`` / ``outbox_published_total{outcome}``
+  — broker publish (confirm included) per entry: ``published``, ``failed``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+try:  # optional extra
+    import prometheus_client
+except ImportError:  # pragma: no cover - exercised when the extra is absent
+    prometheus_client = None  # type: ignore[assignment]
+
+Outcome = Literal["ack", "duplicate", "retry", "requeue", "dlq"]
+PublishOutcome = Literal["published", "failed"]
+
+DEFAULT_NAMESPACE = "finans_tracker"
+#: Handle latency buckets (s): message handlers range from sub-ms cache
+#: hits to multi-second model calls.
+HANDLE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+#: Publish latency buckets (s): a confirmed publish is ~1 ms on a healthy broker.
+PUBLISH_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+class MessagingMetrics:
+    """No-op metrics sink; subclass (or use :class:`PrometheusMetrics`)."""
+
+    #: ``False`` lets callers skip work only done for metrics (the
+    #: worker's backlog query).
+    enabled = False
+
+    def message_settled(self, queue: str, outcome: Outcome, seconds: float | None = None) -> None:
+        """One delivery settled; ``seconds`` is ``None`` when it never reached a handler."""
+
+    def outbox_published(self, outcome: PublishOutcome, seconds: float) -> None:
+        """One outbox entry publish attempt finished."""
+
+    def outbox_backlog(self, pending: int, oldest_age_seconds: float) -> None:
+        """Current unpublished rows and the age of the oldest (0 when empty)."""
+
+
+class PrometheusMetrics(MessagingMetrics):
+    """:class:`MessagingMetrics` backed by ``prometheus_client``."""
+
+    enabled = True
+
+    def __init__(self, registry: Any = None, *, namespace: str = DEFAULT_NAMESPACE) -> None:
+        client = _client()
+        if registry is None:
+            registry = client.REGISTRY
+        self.registry = registry
+        self._messages = client.Counter(
+            "messaging_messages_total",
+            "Deliveries settled by a consumer, by outcome.",
+            ["queue", "outcome"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._handle = client.Histogram(
+            "messaging_handle_seconds",
+            "Time from dedup check to settlement of a delivery, by outcome.",
+            ["queue", "outcome"],
+            namespace=namespace,
+            registry=registry,
+            buckets=HANDLE_BUCKETS,
+        )
+        self._published = client.Counter(
+            "outbox_published_total",
+            "Outbox publish attempts, by outcome.",
+            ["outcome"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._publish = client.Histogram(
+            "outbox_publish_seconds",
+            "Broker publish latency per outbox entry, confirm included.",
+            ["outcome"],
+            namespace=namespace,
+            registry=registry,
+            buckets=PUBLISH_BUCKETS,
+        )
+        self._backlog = client.Gauge(
+            "outbox_backlog",
+            "Unpublished (pending or failed) outbox rows.",
+            namespace=namespace,
+            registry=registry,
+        )
+        self._oldest_age = client.Gauge(
+            "outbox_oldest_pending_age_seconds",
+            "Age of the oldest unpublished outbox row.",
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def message_settled(self, queue: str, outcome: Outcome, seconds: float | None = None) -> None:
+        self._messages.labels(queue, outcome).inc()
+        if seconds is not None:
+            self._handle.labels(queue, outcome).observe(seconds)
+
+    def outbox_published(self, outcome: PublishOutcome, seconds: float) -> None:
+        self._published.labels(outcome).inc()
+        self._publish.labels(outcome).observe(seconds)
+
+    def outbox_backlog(self, pending: int, oldest_age_seconds: float) -> None:
+        self._backlog.set(pending)
+        self._oldest_age.set(oldest_age_seconds)
+
+
+_default: MessagingMetrics = MessagingMetrics()
+
+
+def default_metrics() -> MessagingMetrics:
+    """The process-wide sink used when no ``metrics=`` is passed."""
+    return _default
+
+
+def set_default_metrics(metrics: MessagingMetrics) -> None:
+    global _default
+    _default = metrics
+
+
+def start_metrics_server(port: int, *, registry: Any = None, addr: str = "0.0.0.0") -> None:
+    """Serve ``/metrics`` for ``registry`` from a background thread."""
+    client = _client()
+    client.start_http_server(port, addr=addr, registry=registry if registry is not None else client.REGISTRY)
+
+
+def enable_prometheus(
+    port: int | None = None,
+    *,
+    registry: Any = None,
+    namespace: str = DEFAULT_NAMESPACE,
+) -> PrometheusMetrics:
+    """Install :class:`PrometheusMetrics` as the default, optionally serving it."""
+    metrics = PrometheusMetrics(registry, namespace=namespace)
+    set_default_metrics(metrics)
+    if port is not None:
+        start_metrics_server(port, registry=metrics.registry)
+    return metrics
+
+
+def _client() -> Any:
+    if prometheus_client is None:
+        raise ImportError("Prometheus metrics need prometheus_client — install finans-tracker-messaging[prometheus]")
+    return prometheus_client
@@ -0,0 +1,168 @@
+"""LISTEN/NOTIFY wakeup for the outbox publisher worker.
+
+Without it every worker sleeps ``POLL_INTERVAL_S`` between empty polls,
+which puts up to two seconds on every hop of the event pipeline and
+keeps idle workers querying Postgres.  With it:
+
+* an ``AFTER INSERT ... FOR EACH STATEMENT`` trigger on ``outbox_events``
+  runs ``pg_notify`` — Postgres delivers the notification at commit, so
+  the worker never wakes for a row it cannot yet see;
+* :class:`OutboxNotifyListener` holds one dedicated asyncpg connection
+  that ``LISTEN``s on the channel and wakes the worker immediately;
+* the worker still polls every ``safety_poll_interval`` seconds.  That
+  covers notifications lost while the listener was reconnecting, and
+  ``failed`` rows whose ``next_attempt_at`` comes due — neither of which
+  raises a notification.
+
+The trigger is statement-level on purpose: a 5 000-row CSV import is one
+notification, not 5 000, and Postgres already folds identical
+notifications raised inside one transaction.
+
+Both halves are optional.  A worker without a listener polls exactly as
+before; a table with the trigger but no listening worker just emits
+notifications nobody receives.
+
+:func:`outbox_notify_install_sql` and :func:`outbox_notify_drop_sql`
+generate the DDL.  A migration pastes their output in as literal
+statements rather than calling them, so an applied revision does not
+change when this module does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Protocol
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+#: Channel name shared by the trigger and the listener.  Every service has
+#: its own database, so one name project-wide cannot cross-talk.
+OUTBOX_NOTIFY_CHANNEL = "outbox_events"
+
+#: Fallback poll while a listener is attached.  Long on purpose: it only
+#: has to catch what notifications cannot (retry backoffs, reconnect gaps).
+SAFETY_POLL_INTERVAL_S = 30.0
+
+
+def outbox_notify_install_sql(
+    table: str = "outbox_events",
+    channel: str = OUTBOX_NOTIFY_CHANNEL,
+) -> list[str]:
+    """DDL creating the notify function and statement-level insert trigger."""
+    function = f"{table}_notify"
+    return [
+        f"""
+        CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{channel}', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        f"DROP TRIGGER IF EXISTS {function} ON {table}",
+        f"""
+        CREATE TRIGGER {function}
+        AFTER INSERT ON {table}
+        FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+        """,
+    ]
+
+
+def outbox_notify_drop_sql(table: str = "outbox_events") -> list[str]:
+    """DDL reversing :func:`outbox_notify_install_sql`."""
+    function = f"{table}_notify"
+    return [
+        f"DROP TRIGGER IF EXISTS {function} ON {table}",
+        f"DROP FUNCTION IF EXISTS {function}()",
+    ]
+
+
+class OutboxWakeup(Protocol):
+    """What ``OutboxPublisherWorker`` waits on between empty polls."""
+
+    async def wait(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class OutboxNotifyListener:
+    """Wakes the outbox worker on ``NOTIFY``, else after a safety poll.
+
+    Takes the service's asyncpg ``AsyncEngine`` and checks out one
+    connection from it for the lifetime of the listener.  The connection
+    is opened lazily on the first :meth:`wait` and re-opened after a
+    drop; while it is down ``wait`` degrades to plain
+    ``safety_poll_interval`` sleeping, so a Postgres restart never stops
+    the worker — it only slows it to the safety poll until reconnect.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        channel: str = OUTBOX_NOTIFY_CHANNEL,
+        *,
+        safety_poll_interval: float = SAFETY_POLL_INTERVAL_S,
+    ) -> None:
+        if engine.dialect.driver != "asyncpg":
+            raise ValueError(f"OutboxNotifyListener needs the asyncpg driver, got {engine.dialect.driver!r}")
+        self._engine = engine
+        self._channel = channel
+        self._safety_poll_interval = safety_poll_interval
+        self._event = asyncio.Event()
+        self._connection: AsyncConnection | None = None
+        self._driver_connection: Any = None
+
+    async def wait(self) -> None:
+        """Return on the next notification or after the safety poll."""
+        if self._driver_connection is None or self._driver_connection.is_closed():
+            await self._reset()
+            try:
+                await self._listen()
+            except Exception:
+                logger.warning(
+                    "LISTEN %s failed — polling every %.1fs until reconnect",
+                    self._channel,
+                    self._safety_poll_interval,
+                    exc_info=True,
+                )
+                await self._reset()
+                await asyncio.sleep(self._safety_poll_interval)
+                return
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=self._safety_poll_interval)
+        except TimeoutError:
+            pass
+        # Cleared only after waking: a notification that arrives while the
+        # worker is busy leaves the event set, so the next wait returns at
+        # once and the row is picked up instead of waiting a safety poll.
+        self._event.clear()
+
+    async def close(self) -> None:
+        await self._reset()
+
+    async def _listen(self) -> None:
+        self._connection = await self._engine.connect()
+        raw = await self._connection.get_raw_connection()
+        self._driver_connection = raw.driver_connection
+        await self._driver_connection.add_listener(self._channel, self._on_notify)
+        # Whatever was inserted while we were not listening is picked up by
+        # the poll that follows this wait.
+        self._event.set()
+        logger.info("Listening for outbox notifications on %s", self._channel)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self._event.set()
+
+    async def _reset(self) -> None:
+        connection, self._connection = self._connection, None
+        self._driver_connection = None
+        if connection is not None:
+            # Invalidate rather than close: close() would hand a connection
+            # still LISTENing back to the pool for some unrelated session.
+            try:
+                await connection.invalidate()
+            except Exception:
+                logger.debug("Closing listener connection failed", exc_info=True)
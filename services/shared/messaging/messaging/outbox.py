@@ -18,16 +18,24 @@ Additions over the copies:
   ``max_attempts`` is reached, parks the entry in the new terminal
   status ``'dead'`` instead of retrying forever.
 * ``purge_published`` — housekeeping for old published rows.
+* ``mark_published_many`` — one ``UPDATE`` for a whole confirmed batch
+  (``id = ANY(:ids)`` on PostgreSQL, ``IN (...)`` elsewhere).
+* ``backlog`` — unpublished row count and oldest ``created_at``, for
+  the worker's backlog metrics.
+* ``hot_window`` — on a table partitioned by ``created_at`` (see
+  ``messaging.partitioning``), bounds the pending poll so PostgreSQL
+  prunes every partition older than the window.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Iterable
+from typing import Any, Iterable, Sequence
 from uuid import uuid4
 
-from sqlalchemy import Index, Integer, String, Text, delete, func, select, update
+from sqlalchemy import Index, Integer, String, Text, any_, bindparam, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 
@@ -111,6 +119,14 @@ class OutboxEntry:
     created_at: datetime
 
 
+@dataclass(frozen=True, slots=True)
+class OutboxBacklog:
+    """Unpublished (pending or failed) rows and the oldest one's creation time."""
+
+    pending: int
+    oldest_created_at: datetime | None
+
+
 class OutboxRepository:
     """Async outbox repository bound to a service-specific model class.
 
@@ -119,9 +135,16 @@ class OutboxRepository:
     but an existing hand-rolled model with the same columns works too.
     """
 
-    def __init__(self, session: AsyncSession, model: type[OutboxEventMixin]) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        model: type[OutboxEventMixin],
+        *,
+        hot_window: timedelta | None = None,
+    ) -> None:
         self._session = session
         self._model = model
+        self._hot_window = hot_window
 
     async def add(
         self,
@@ -138,25 +161,34 @@ class OutboxRepository:
         aggregate_type: str,
         aggregate_id: str,
     ) -> None:
-        """Insert several events for one aggregate in a single flush."""
-        self._session.add_all(self._build(event, aggregate_type, aggregate_id) for event in events)
-        await self._session.flush()
+        """Insert several events for one aggregate in one bulk INSERT."""
+        await self._insert_many(self._values(event, aggregate_type, aggregate_id) for event in events)
 
     async def add_entries(
         self,
         entries: Iterable[tuple[SerializableEvent, str, str]],
     ) -> None:
         """Insert several ``(event, aggregate_type, aggregate_id)`` entries
-        in a single flush.
+        in one bulk INSERT.
 
         Unlike ``add_batch`` each entry carries its own aggregate — the
         shape bulk imports need, where every event belongs to a distinct
         row (e.g. one ``transaction.created`` per imported transaction).
         """
-        self._session.add_all(
-            self._build(event, aggregate_type, aggregate_id) for event, aggregate_type, aggregate_id in entries
+        await self._insert_many(
+            self._values(event, aggregate_type, aggregate_id) for event, aggregate_type, aggregate_id in entries
         )
-        await self._session.flush()
+
+    async def _insert_many(self, rows: Iterable[dict[str, Any]]) -> None:
+        """ORM bulk INSERT: multi-row ``VALUES`` pages, no objects tracked.
+
+        Unlike ``add_all`` + ``flush`` nothing enters the session's unit of
+        work, so a batch of thousands costs the INSERT statements and
+        nothing per row on the Python side beyond building the dict.
+        """
+        params = list(rows)
+        if params:
+            await self._session.execute(insert(self._model), params)
 
     async def fetch_pending(self, batch_size: int = 10) -> list[OutboxEntry]:
         """Fetch due pending/failed rows, locked with ``SKIP LOCKED``.
@@ -165,14 +197,21 @@ class OutboxRepository:
         workers never double-publish.  The SQLite dialect silently drops
         the FOR UPDATE clause, so tests running on sqlite exercise the
         query shape but not the locking.
+
+        With ``hot_window`` only rows created within the window are
+        considered; ``PartitionMaintainer`` moves older unpublished rows
+        back into it.
         """
         now = utcnow_naive()
+        predicates = [
+            self._model.status.in_([OutboxStatus.PENDING, OutboxStatus.FAILED]),
+            self._model.next_attempt_at <= now,
+        ]
+        if self._hot_window is not None:
+            predicates.append(self._model.created_at >= now - self._hot_window)
         stmt = (
             select(self._model)
-            .where(
-                self._model.status.in_([OutboxStatus.PENDING, OutboxStatus.FAILED]),
-                self._model.next_attempt_at <= now,
-            )
+            .where(*predicates)
             .order_by(self._model.created_at)
             .limit(batch_size)
             .with_for_update(skip_locked=True)
@@ -180,6 +219,14 @@ class OutboxRepository:
         result = await self._session.execute(stmt)
         return [self._to_entry(m) for m in result.scalars().all()]
 
+    async def backlog(self) -> OutboxBacklog:
+        """Count every pending/failed row, due or not, hot window or not."""
+        stmt = select(func.count(), func.min(self._model.created_at)).where(
+            self._model.status.in_([OutboxStatus.PENDING, OutboxStatus.FAILED])
+        )
+        pending, oldest = (await self._session.execute(stmt)).one()
+        return OutboxBacklog(pending=int(pending or 0), oldest_created_at=oldest)
+
     async def mark_published(self, event_id: str) -> None:
         stmt = (
             update(self._model)
@@ -191,6 +238,33 @@ class OutboxRepository:
         )
         await self._session.execute(stmt)
 
+    async def mark_published_many(self, event_ids: Sequence[str]) -> int:
+        """Mark a whole batch published in a single ``UPDATE``.
+
+        On PostgreSQL the ids travel as one array parameter
+        (``WHERE id = ANY(:ids)``), so the statement text — and asyncpg's
+        prepared-statement cache entry — is the same for every batch
+        size.  Other dialects (sqlite in tests) get an expanding ``IN``.
+        Returns the number of rows updated.
+        """
+        if not event_ids:
+            return 0
+        bind = self._session.bind
+        if bind is not None and bind.dialect.name == "postgresql":
+            predicate = self._model.id == any_(bindparam("event_ids", list(event_ids), type_=ARRAY(String)))
+        else:
+            predicate = self._model.id.in_(list(event_ids))
+        stmt = (
+            update(self._model)
+            .where(predicate)
+            .values(
+                status=OutboxStatus.PUBLISHED,
+                published_at=utcnow_naive(),
+            )
+        )
+        result = await self._session.execute(stmt)
+        return int(result.rowcount or 0)
+
     async def mark_failed(self, event_id: str, next_attempt_at: datetime) -> None:
         """Legacy-compatible failure mark: status='failed', attempts+1."""
         stmt = (
@@ -250,16 +324,20 @@ class OutboxRepository:
         aggregate_type: str,
         aggregate_id: str,
     ) -> OutboxEventMixin:
-        return self._model(
-            id=str(uuid4()),
-            aggregate_type=aggregate_type,
-            aggregate_id=aggregate_id,
-            event_type=event.event_type,
-            payload_json=event.to_json(),
-            correlation_id=getattr(event, "correlation_id", None),
-            status=OutboxStatus.PENDING,
-            attempts=0,
-        )
+        return self._model(**self._values(event, aggregate_type, aggregate_id))
+
+    @staticmethod
+    def _values(event: SerializableEvent, aggregate_type: str, aggregate_id: str) -> dict[str, Any]:
+        return {
+            "id": str(uuid4()),
+            "aggregate_type": aggregate_type,
+            "aggregate_id": aggregate_id,
+            "event_type": event.event_type,
+            "payload_json": event.to_json(),
+            "correlation_id": getattr(event, "correlation_id", None),
+            "status": OutboxStatus.PENDING,
+            "attempts": 0,
+        }
 
     @staticmethod
     def _to_entry(model: OutboxEventMixin) -> OutboxEntry:
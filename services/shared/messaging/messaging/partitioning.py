@@ -0,0 +1,379 @@
+"""Native range partitioning for ``outbox_events``.
+
+The outbox is an append-heavy log with a retention window, trimmed by
+row-by-row ``DELETE`` (``OutboxRepository.purge_published``).  On a busy
+table that churns the heap, bloats every index and slows the
+``ix_outbox_pending_poll`` scan the publisher runs every poll.
+
+Partitioning by time turns retention into ``DROP TABLE <partition>``:
+O(1), no dead tuples, no vacuum debt.  The pieces:
+
+* :class:`PartitionedTable` — what a table is partitioned on, at what
+  granularity, and what may never be dropped (``live_rows``).
+  :data:`OUTBOX_EVENTS` is the standard spec.
+* :meth:`PartitionedTable.convert_sql` / :meth:`PartitionedTable.revert_sql`
+  — the migration path for an existing plain table (rename, create the
+  partitioned parent, pre-create partitions covering every existing
+  row, copy, drop the old table).
+* :class:`PartitionMaintainer` — run periodically (the outbox publisher
+  worker does it on its housekeeping tick); pre-creates upcoming
+  partitions, moves stragglers into the hot range and drops expired
+  partitions.  Each create and drop is its own transaction, so one
+  that fails is logged and retried next tick without holding up the
+  rest.
+
+Two PostgreSQL rules shape the design:
+
+* A unique index on a partitioned table must contain the partition key.
+  The primary key therefore becomes ``(id, <column>)``.  That is also
+  why ``processed_events`` is *not* partitioned: its ``(message_id,
+  consumer_name)`` unique index is the table-wide guard that makes a
+  racing duplicate fail at commit, and per partition it could not catch
+  a race across a partition boundary.  The inbox is small next to the
+  outbox; :class:`~messaging.inbox.InboxPurger` trims it in batches.
+* Rows outside every partition go to ``<table>_default``.  A stalled
+  maintainer therefore never fails a domain transaction's outbox insert.
+  PostgreSQL refuses to create a partition whose range still has rows
+  in the default partition, so when the maintainer catches up it moves
+  those rows out, creates the partition and inserts them back — now
+  routed into it — in one transaction.
+
+The publisher's pending poll only has to look at the hot end of the
+outbox when the repository is given a ``hot_window``
+(``OutboxRepository(..., hot_window=...)``): ``created_at >= now() -
+hot_window`` prunes every older partition.  The maintainer keeps that
+safe by bumping ``created_at`` on pending/failed rows that fell out of
+the window (a broker outage longer than the window) so they are polled
+again; PostgreSQL moves the row into the current partition.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from messaging.time import utcnow
+
+logger = logging.getLogger(__name__)
+
+PartitionInterval = Literal["day", "month"]
+
+#: Partitions created ahead of the current one.
+DEFAULT_PREMAKE = 3
+
+#: Temp table holding default-partition rows while their partition is created.
+_STRANDED = "partition_stranded_rows"
+
+_NAME_FORMATS: dict[str, tuple[str, str]] = {
+    # interval -> (strftime for Python, to_char for PL/pgSQL); must agree.
+    "day": ("%Y%m%d", "YYYYMMDD"),
+    "month": ("%Y%m", "YYYYMM"),
+}
+
+
+def _utc_today() -> date:
+    return utcnow().date()
+
+
+def _advance(start: date, interval: PartitionInterval, steps: int = 1) -> date:
+    if interval == "day":
+        return start + timedelta(days=steps)
+    months = start.year * 12 + start.month - 1 + steps
+    return date(months // 12, months % 12 + 1, 1)
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionedTable:
+    """How one table is range-partitioned and retained."""
+
+    name: str
+    column: str
+    interval: PartitionInterval = "day"
+    primary_key: tuple[str, ...] = ("id",)
+    #: SQL predicate for rows that must outlive retention; a partition
+    #: holding any is never dropped.
+    live_rows: str | None = None
+
+    def partition_start(self, day: date) -> date:
+        """First day of the partition containing ``day``."""
+        return day if self.interval == "day" else day.replace(day=1)
+
+    def partition_name(self, start: date) -> str:
+        return f"{self.name}_p{start.strftime(_NAME_FORMATS[self.interval][0])}"
+
+    def parse_partition(self, partition: str) -> date | None:
+        """Start date encoded in a partition name, ``None`` for foreign names."""
+        match = re.fullmatch(rf"{re.escape(self.name)}_p(\d{{6}}|\d{{8}})", partition)
+        if match is None:
+            return None
+        digits = match.group(1)
+        if self.interval == "day" and len(digits) == 8:
+            return date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+        if self.interval == "month" and len(digits) == 6:
+            return date(int(digits[:4]), int(digits[4:]), 1)
+        return None
+
+    def create_partition_sql(self, start: date) -> list[str]:
+        partition = self.partition_name(start)
+        end = _advance(start, self.interval)
+        return [
+            f"CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {self.name} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ]
+
+    def convert_sql(self, *, indexes: Sequence[str] = (), premake: int = DEFAULT_PREMAKE) -> list[str]:
+        """Migrate an existing plain table to a partitioned one.
+
+        ``indexes`` are the table's non-unique ``CREATE INDEX`` statements;
+        they are re-issued on the partitioned parent (and so cascade to
+        every partition) after the old table and its indexes are gone.
+        Runs inside the migration transaction, holding an ACCESS
+        EXCLUSIVE lock for the copy — schedule it with the workers stopped.
+        """
+        legacy = f"{self.name}_unpartitioned"
+        name_format = _NAME_FORMATS[self.interval][1]
+        pk = ", ".join((*self.primary_key, self.column))
+        statements = [
+            f"ALTER TABLE {self.name} RENAME TO {legacy}",
+            # The key becomes part of the primary key, so it is NOT NULL.
+            f"UPDATE {legacy} SET {self.column} = now() WHERE {self.column} IS NULL",
+            f"CREATE TABLE {self.name} (LIKE {legacy} INCLUDING DEFAULTS) PARTITION BY RANGE ({self.column})",
+            f"ALTER TABLE {self.name} ADD PRIMARY KEY ({pk})",
+            f"CREATE TABLE {self.name}_default PARTITION OF {self.name} DEFAULT",
+            f"""
+            DO $$
+            DECLARE
+                start_at date := date_trunc(
+                    '{self.interval}', COALESCE((SELECT min({self.column}) FROM {legacy}), now())
+                )::date;
+                stop_at date := (date_trunc('{self.interval}', now()) + interval '{premake} {self.interval}')::date;
+                part_name text;
+            BEGIN
+                WHILE start_at <= stop_at LOOP
+                    part_name := '{self.name}_p' || to_char(start_at, '{name_format}');
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF {self.name} FOR VALUES FROM (%L) TO (%L)',
+                        part_name, start_at, (start_at + interval '1 {self.interval}')::date
+                    );
+                    start_at := (start_at + interval '1 {self.interval}')::date;
+                END LOOP;
+            END $$
+            """,
+            f"INSERT INTO {self.name} SELECT * FROM {legacy}",
+            # A serial id's sequence is owned by the old column; re-home it
+            # so dropping the old table keeps the default working.
+            f"""
+            DO $$
+            DECLARE
+                seq text := pg_get_serial_sequence('{legacy}', '{self.primary_key[0]}');
+            BEGIN
+                IF seq IS NOT NULL THEN
+                    EXECUTE format('ALTER SEQUENCE %s OWNED BY {self.name}.{self.primary_key[0]}', seq);
+                END IF;
+            END $$
+            """,
+            f"DROP TABLE {legacy}",
+            *indexes,
+        ]
+        return statements
+
+    def revert_sql(self, *, indexes: Sequence[str] = ()) -> list[str]:
+        """Reverse :meth:`convert_sql`: back to one plain table."""
+        partitioned = f"{self.name}_partitioned"
+        return [
+            f"ALTER TABLE {self.name} RENAME TO {partitioned}",
+            f"CREATE TABLE {self.name} (LIKE {partitioned} INCLUDING DEFAULTS)",
+            f"ALTER TABLE {self.name} ADD PRIMARY KEY ({', '.join(self.primary_key)})",
+            f"INSERT INTO {self.name} SELECT * FROM {partitioned}",
+            f"""
+            DO $$
+            DECLARE
+                seq text := pg_get_serial_sequence('{partitioned}', '{self.primary_key[0]}');
+            BEGIN
+                IF seq IS NOT NULL THEN
+                    EXECUTE format('ALTER SEQUENCE %s OWNED BY {self.name}.{self.primary_key[0]}', seq);
+                END IF;
+            END $$
+            """,
+            f"DROP TABLE {partitioned}",
+            *indexes,
+        ]
+
+
+#: Outbox: daily partitions; unpublished rows pin their partition.
+OUTBOX_EVENTS = PartitionedTable(
+    name="outbox_events",
+    column="created_at",
+    interval="day",
+    live_rows="status IN ('pending', 'failed')",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenancePlan:
+    create: list[date]
+    drop: list[str]
+
+
+class PartitionMaintainer:
+    """Keeps one partitioned table's partitions ahead of time and in retention.
+
+    ``retention`` is measured from a partition's *upper* bound: a daily
+    partition with ``retention=timedelta(days=7)`` is dropped once its
+    last row is a week old.  ``hot_window`` (only meaningful with
+    ``live_rows``) is the window the repository polls; live rows older
+    than it are moved back into it.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        table: PartitionedTable,
+        *,
+        retention: timedelta,
+        premake: int = DEFAULT_PREMAKE,
+        hot_window: timedelta | None = None,
+        today: Callable[[], date] = _utc_today,
+    ) -> None:
+        self._session_factory = session_factory
+        self._table = table
+        self._retention = retention
+        self._premake = premake
+        self._hot_window = hot_window
+        self._today = today
+
+    def plan(self, existing: Sequence[str], today: date) -> MaintenancePlan:
+        """Which partitions to create and which to drop, given the current ones."""
+        table = self._table
+        have = {start for start in map(table.parse_partition, existing) if start is not None}
+        current = table.partition_start(today)
+        create = [
+            start
+            for start in (_advance(current, table.interval, step) for step in range(self._premake + 1))
+            if start not in have
+        ]
+        cutoff = today - self._retention
+        drop = [
+            table.partition_name(start)
+            for start in sorted(have)
+            if _advance(start, table.interval) <= cutoff and start < current
+        ]
+        return MaintenancePlan(create=create, drop=drop)
+
+    async def run_once(self) -> MaintenancePlan:
+        """Create upcoming partitions, rescue stragglers, drop expired ones.
+
+        Returns what was actually created and dropped; a step that failed
+        is logged and left for the next run.
+        """
+        table = self._table
+        async with self._session_factory() as session:
+            existing = await self._partitions(session)
+        plan = self.plan(existing, self._today())
+        has_default = f"{table.name}_default" in existing
+
+        created = []
+        for start in plan.create:
+            if await self._attempt(f"create {table.partition_name(start)}", self._create, start, has_default):
+                created.append(start)
+        if self._hot_window is not None and table.live_rows is not None:
+            await self._attempt("rescue unpublished rows", self._rescue)
+        dropped = []
+        for partition in plan.drop:
+            if await self._attempt(f"drop {partition}", self._drop, partition):
+                dropped.append(partition)
+
+        if created or dropped:
+            logger.info(
+                "Partition maintenance on %s: created %s, dropped %s",
+                table.name,
+                [table.partition_name(start) for start in created],
+                dropped,
+            )
+        return MaintenancePlan(create=created, drop=dropped)
+
+    async def _attempt(self, step: str, action: Callable[..., Awaitable[bool]], *args: Any) -> bool:
+        """Run one maintenance step in its own transaction; ``True`` if it did something."""
+        try:
+            async with self._session_factory() as session:
+                done = await action(session, *args)
+                await session.commit()
+            return done
+        except Exception:
+            logger.exception("Partition maintenance on %s: %s failed", self._table.name, step)
+            return False
+
+    async def _create(self, session: AsyncSession, start: date, has_default: bool) -> bool:
+        table = self._table
+        end = _advance(start, table.interval)
+        in_range = f"{table.column} >= '{start.isoformat()}' AND {table.column} < '{end.isoformat()}'"
+        stranded = False
+        if has_default:
+            result = await session.execute(text(f"SELECT EXISTS (SELECT 1 FROM {table.name}_default WHERE {in_range})"))
+            stranded = bool(result.scalar())
+        if stranded:
+            # The new partition's range must be empty in the default
+            # partition; park the rows, create, and route them back.
+            await session.execute(text(f"CREATE TEMP TABLE {_STRANDED} (LIKE {table.name}) ON COMMIT DROP"))
+            await session.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {table.name}_default WHERE {in_range} RETURNING *) "
+                    f"INSERT INTO {_STRANDED} SELECT * FROM moved"
+                )
+            )
+        for statement in table.create_partition_sql(start):
+            await session.execute(text(statement))
+        if stranded:
+            result = await session.execute(text(f"INSERT INTO {table.name} SELECT * FROM {_STRANDED}"))
+            logger.warning(
+                "Moved %d row(s) from %s_default into %s",
+                int(getattr(result, "rowcount", 0) or 0),
+                table.name,
+                table.partition_name(start),
+            )
+        return True
+
+    async def _drop(self, session: AsyncSession, partition: str) -> bool:
+        if self._table.live_rows is not None and await self._has_live_rows(session, partition):
+            logger.warning("Keeping expired partition %s — it still holds unpublished rows", partition)
+            return False
+        await session.execute(text(f"DROP TABLE {partition}"))
+        return True
+
+    async def _partitions(self, session: AsyncSession) -> list[str]:
+        result = await session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": self._table.name},
+        )
+        return list(result.scalars().all())
+
+    async def _rescue(self, session: AsyncSession) -> bool:
+        table = self._table
+        assert self._hot_window is not None
+        result = await session.execute(
+            text(
+                f"UPDATE {table.name} SET {table.column} = now() "
+                f"WHERE {table.live_rows} AND {table.column} < now() - make_interval(secs => :window)"
+            ),
+            {"window": self._hot_window.total_seconds()},
+        )
+        moved = int(getattr(result, "rowcount", 0) or 0)
+        if moved:
+            logger.warning("Moved %d unpublished row(s) older than the hot window back into it", moved)
+        return bool(moved)
+
+    async def _has_live_rows(self, session: AsyncSession, partition: str) -> bool:
+        result = await session.execute(text(f"SELECT EXISTS (SELECT 1 FROM {partition} WHERE {self._table.live_rows})"))
+        return bool(result.scalar())
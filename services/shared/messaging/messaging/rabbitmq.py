@@ -3,7 +3,8 @@
 Drop-in replacement for the per-service
 ``app/adapters/outbound/rabbitmq_publisher.py`` copies.  Semantics are
 identical: durable topic exchange, persistent JSON messages, routing key
-= ``event_type``.
+= ``event_type``.  ``content_type`` opts into another body encoding
+(see :mod:`contracts.codec`).
 """
 
 from __future__ import annotations
@@ -14,6 +15,7 @@ from typing import Protocol, runtime_checkable
 import aio_pika
 from aio_pika import DeliveryMode, ExchangeType, Message
 from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractExchange
+from contracts.codec import JSON_CONTENT_TYPE, encode_payload
 
 logger = logging.getLogger(__name__)
 
@@ -56,16 +58,29 @@ class SerializableEvent(Protocol):
 class RabbitMQPublisher:
     """Publishes events to the durable topic exchange."""
 
-    def __init__(self, rabbitmq_url: str, exchange_name: str = EXCHANGE_NAME) -> None:
+    def __init__(
+        self,
+        rabbitmq_url: str,
+        exchange_name: str = EXCHANGE_NAME,
+        *,
+        content_type: str = JSON_CONTENT_TYPE,
+    ) -> None:
         self._url = rabbitmq_url
         self._exchange_name = exchange_name
+        self._content_type = content_type
         self._connection: AbstractConnection | None = None
+        self._owns_connection = True
         self._channel: AbstractChannel | None = None
         self._exchange: AbstractExchange | None = None
 
-    async def connect(self) -> None:
-        self._connection = await aio_pika.connect_robust(self._url)
-        self._channel = await self._connection.channel()
+    async def connect(self, connection: AbstractConnection | None = None) -> None:
+        """Open the channel; on ``connection`` if given (shared, not owned)."""
+        self._owns_connection = connection is None
+        self._connection = connection or await aio_pika.connect_robust(self._url)
+        # Publisher confirms (aio-pika's default, made explicit): ``publish``
+        # resolves only after the broker acks and raises on a nack, which is
+        # what the outbox worker's pipelined mode relies on.
+        self._channel = await self._connection.channel(publisher_confirms=True)
         self._exchange = await self._channel.declare_exchange(
             self._exchange_name,
             ExchangeType.TOPIC,
@@ -78,9 +93,9 @@ class RabbitMQPublisher:
             raise RuntimeError("RabbitMQPublisher is not connected")
 
         message = Message(
-            body=event.to_json().encode("utf-8"),
+            body=encode_payload(event.to_json(), self._content_type),
             delivery_mode=DeliveryMode.PERSISTENT,
-            content_type="application/json",
+            content_type=self._content_type,
         )
         await self._exchange.publish(
             message,
@@ -99,6 +114,8 @@ class RabbitMQPublisher:
         await self._exchange.publish(message, routing_key=routing_key)
 
     async def close(self) -> None:
-        if self._connection:
+        if self._connection and self._owns_connection:
             await self._connection.close()
             logger.info("RabbitMQ connection closed")
+        elif self._channel is not None and not self._channel.is_closed:
+            await self._channel.close()
@@ -0,0 +1,133 @@
+"""Delayed-retry tiers: TTL'd delay queues that dead-letter back.
+
+Republishing a failed message straight onto its own queue (the original
+:class:`~messaging.consumer.ConsumerBase` ladder, and the hand-rolled
+copies) retries it within milliseconds.  During a downstream outage every
+retry is burnt before the outage is over, and a consumer that sleeps
+between attempts instead (the old analytics embedding consumer) stalls
+its whole queue.
+
+A :class:`RetryTiers` instead parks the message in a per-queue delay
+queue::
+
+    <queue>.retry.<delay_ms>ms   x-message-ttl=<delay_ms>
+                                 x-dead-letter-exchange=""  (default exchange)
+                                 x-dead-letter-routing-key=<queue>
+
+Nothing consumes a delay queue.  When the TTL expires RabbitMQ
+dead-letters the message back to the main queue through the default
+exchange — still only to *this* consumer, never fanned out again via the
+topic exchange.  ``x-retry-count`` (carried in the headers) picks the
+tier: retry ``n`` waits ``delays[n - 1]``, the last tier repeating if
+``max_retries`` exceeds the number of delays.
+
+One queue per delay, not one queue with per-message expiration: RabbitMQ
+only expires messages at the head of a queue, so mixed TTLs in one queue
+would hold short delays behind long ones.  Queue names carry the delay,
+so changing the delays declares new queues rather than clashing with
+the old queue's ``x-message-ttl`` (``PRECONDITION_FAILED``); the old,
+now unused tier queues can be deleted once empty.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+import aio_pika
+from aio_pika import DeliveryMode
+from aio_pika.abc import AbstractChannel
+from contracts.codec import JSON_CONTENT_TYPE
+
+RETRY_HEADER = "x-retry-count"
+#: Exponential delays (seconds) for the default three retries: x5 per tier.
+DEFAULT_RETRY_DELAYS_S: tuple[float, ...] = (1.0, 5.0, 25.0)
+
+
+def read_retry_count(headers: Mapping[str, Any] | None) -> int:
+    """``x-retry-count`` from ``headers``, or 0 when absent or unusable.
+
+    Anything that is not a count reads as "first attempt", so the ladder
+    still advances and terminates instead of looping on a bad header.
+    """
+    raw = (headers or {}).get(RETRY_HEADER, 0)
+    if isinstance(raw, bool):
+        return 0
+    if isinstance(raw, int):
+        return raw
+    if isinstance(raw, (float, Decimal, bytes, bytearray, str)):
+        try:
+            return int(raw)
+        except (TypeError, ValueError):
+            return 0
+    return 0
+
+
+def exponential_delays(
+    count: int, *, base_s: float = 1.0, factor: float = 5.0, cap_s: float = 300.0
+) -> tuple[float, ...]:
+    """``count`` delays ``base_s * factor**n``, each capped at ``cap_s``."""
+    return tuple(min(base_s * factor**n, cap_s) for n in range(count))
+
+
+@dataclass(frozen=True)
+class RetryTiers:
+    """The delay queues of one consumer queue."""
+
+    queue_name: str
+    delays: Sequence[float] = DEFAULT_RETRY_DELAYS_S
+
+    def __post_init__(self) -> None:
+        if not self.delays:
+            raise ValueError("RetryTiers needs at least one delay")
+        if any(delay <= 0 for delay in self.delays):
+            raise ValueError(f"retry delays must be positive, got {list(self.delays)}")
+
+    def tier_queue_name(self, delay_s: float) -> str:
+        return f"{self.queue_name}.retry.{_ms(delay_s)}ms"
+
+    def delay_for(self, retry_count: int) -> float:
+        """Delay before retry number ``retry_count`` (1-based)."""
+        return self.delays[min(max(retry_count, 1), len(self.delays)) - 1]
+
+    def queue_for(self, retry_count: int) -> str:
+        return self.tier_queue_name(self.delay_for(retry_count))
+
+    async def declare(self, channel: AbstractChannel) -> None:
+        """Declare every tier queue (idempotent)."""
+        for delay_s in dict.fromkeys(self.delays):
+            await channel.declare_queue(
+                self.tier_queue_name(delay_s),
+                durable=True,
+                arguments={
+                    "x-message-ttl": _ms(delay_s),
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self.queue_name,
+                },
+            )
+
+    async def schedule(
+        self,
+        channel: AbstractChannel,
+        body: bytes,
+        retry_count: int,
+        *,
+        headers: Mapping[str, Any] | None = None,
+        content_type: str = JSON_CONTENT_TYPE,
+    ) -> None:
+        """Park ``body`` in the tier for ``retry_count``, header set to it."""
+        retry_headers = dict(headers or {})
+        retry_headers[RETRY_HEADER] = retry_count
+        message = aio_pika.Message(
+            body=body,
+            delivery_mode=DeliveryMode.PERSISTENT,
+            content_type=content_type,
+            headers=retry_headers,
+        )
+        await channel.default_exchange.publish(message, routing_key=self.queue_for(retry_count))
+
+
+def _ms(delay_s: float) -> int:
+    return int(round(delay_s * 1000))
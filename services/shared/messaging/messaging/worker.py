@@ -16,6 +16,30 @@ copies.  Semantics are a superset of the copies:
 * NEW: optional ``max_attempts`` — exhausted entries are marked
   ``'dead'`` instead of retrying forever.
 * NEW: optional periodic ``purge_published_after_days`` housekeeping.
+* NEW: ``pipelined=True`` — lock up to ``batch_size`` rows with
+  ``SKIP LOCKED``, publish them concurrently on the publisher-confirms
+  channel, then mark every confirmed row published in one ``UPDATE``.
+  Nacked or unconfirmed entries go through ``record_failure``.  Crash
+  safety is the same as the legacy batch mode: nothing is marked until
+  the broker has confirmed it, so a crash before commit re-publishes
+  (at-least-once), never loses.
+* NEW: optional ``wakeup`` (see :mod:`messaging.notify`) — instead of
+  sleeping ``poll_interval`` after an empty poll, the worker waits for a
+  Postgres ``NOTIFY`` from the outbox insert trigger, with a long safety
+  poll as fallback.
+* NEW: optional ``partitions`` (see :mod:`messaging.partitioning`) —
+  partition maintainers run on the same hourly housekeeping tick as the
+  purge, replacing row-by-row ``DELETE`` with partition drops.  The
+  inbox is not partitioned; an optional ``inbox_purge``
+  (:class:`~messaging.inbox.InboxPurger`) trims it on the same tick.
+* NEW: optional ``content_type`` — publish outbox rows as another body
+  encoding (see :mod:`contracts.codec`); JSON stays the default.
+* NEW: metrics (see :mod:`messaging.metrics`) — publish latency and
+  outcome per entry, plus backlog size and oldest pending age sampled
+  every ``metrics_interval`` seconds when metrics are enabled.
+* NEW: :meth:`OutboxPublisherWorker.stop` ends ``run_forever`` after the
+  batch in flight, and ``run_forever(connection=...)`` publishes on a
+  shared connection (see :mod:`messaging.host`).
 
 Typical service ``__main__`` shim::
 
@@ -32,13 +56,21 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import Callable, NoReturn, Protocol
+from contextlib import suppress
+from typing import Awaitable, Callable, Protocol, Sequence
 
 from aio_pika import DeliveryMode, Message
+from aio_pika.abc import AbstractConnection
+from contracts.codec import JSON_CONTENT_TYPE, encode_payload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from messaging.inbox import InboxPurger
+from messaging.metrics import MessagingMetrics, default_metrics
+from messaging.notify import OutboxWakeup
 from messaging.outbox import OutboxEntry, OutboxEventMixin, OutboxRepository
+from messaging.partitioning import PartitionMaintainer
 from messaging.rabbitmq import EXCHANGE_NAME, RabbitMQPublisher
+from messaging.time import utcnow_naive
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +78,11 @@ POLL_INTERVAL_S = 2.0
 BATCH_SIZE = 20
 ERROR_BACKOFF_S = 5.0
 PURGE_INTERVAL_S = 3600.0
+#: Upper bound on waiting for one broker confirm in pipelined mode; an
+#: entry still unconfirmed after this is treated as a publish failure.
+CONFIRM_TIMEOUT_S = 10.0
+#: How often the backlog gauges are refreshed (one aggregate query).
+METRICS_INTERVAL_S = 15.0
 
 
 class RawPublisher(Protocol):
@@ -87,10 +124,18 @@ class OutboxPublisherWorker:
         max_attempts: int | None = None,
         *,
         commit_per_entry: bool = True,
+        pipelined: bool = False,
+        confirm_timeout: float = CONFIRM_TIMEOUT_S,
         purge_published_after_days: int | None = None,
         purge_interval: float = PURGE_INTERVAL_S,
         error_backoff: float = ERROR_BACKOFF_S,
         publisher: RawPublisher | None = None,
+        wakeup: OutboxWakeup | None = None,
+        partitions: Sequence[PartitionMaintainer] = (),
+        inbox_purge: InboxPurger | None = None,
+        content_type: str = JSON_CONTENT_TYPE,
+        metrics: MessagingMetrics | None = None,
+        metrics_interval: float = METRICS_INTERVAL_S,
     ) -> None:
         if rabbitmq_url is None and publisher is None:
             raise ValueError("Provide rabbitmq_url or an already-connected publisher")
@@ -108,48 +153,101 @@ class OutboxPublisherWorker:
         self._batch_size = batch_size
         self._max_attempts = max_attempts
         self._commit_per_entry = commit_per_entry
+        self._pipelined = pipelined
+        self._confirm_timeout = confirm_timeout
         self._purge_after_days = purge_published_after_days
         self._purge_interval = purge_interval
         self._error_backoff = error_backoff
         self._publisher = publisher
         self._owns_publisher = publisher is None
+        self._wakeup = wakeup
+        self._partitions = list(partitions)
+        self._inbox_purge = inbox_purge
+        self._content_type = content_type
+        self._connection: AbstractConnection | None = None
+        self._stopped = asyncio.Event()
+        self._metrics_override = metrics
+        self._metrics_interval = metrics_interval
+        self._last_metrics_monotonic: float | None = None
         self._last_purge_monotonic: float | None = None
 
-    async def run_forever(self) -> NoReturn:
-        """Poll-publish loop; transient errors are logged and retried."""
+    async def run_forever(self, connection: AbstractConnection | None = None) -> None:
+        """Poll-publish loop until :meth:`stop`; transient errors are retried.
+
+        ``connection`` is used for the publisher this worker creates (not
+        for an injected ``publisher``) and is never closed by the worker.
+        """
+        self._stopped.clear()
+        if connection is not None:
+            self._connection = connection
         logger.info(
-            "Outbox publisher started (exchange=%s, poll=%.1fs, batch=%d, max_attempts=%s)",
+            "Outbox publisher started (exchange=%s, poll=%s, batch=%d, max_attempts=%s, mode=%s)",
             self._exchange_name,
-            self._poll_interval,
+            "notify" if self._wakeup is not None else f"{self._poll_interval:.1f}s",
             self._batch_size,
             self._max_attempts,
+            self._mode_name(),
         )
-        while True:
+        while not self._stopped.is_set():
             try:
                 await self._ensure_publisher()
                 published = await self._process_batch()
                 await self._maybe_purge()
+                await self._maybe_sample_backlog()
             except Exception:
                 logger.exception("Outbox batch failed — retrying in %.1fs", self._error_backoff)
-                await asyncio.sleep(self._error_backoff)
+                await self._sleep(self._error_backoff)
                 continue
             if published == 0:
-                await asyncio.sleep(self._poll_interval)
+                await self._idle()
+        logger.info("Outbox publisher stopped")
+
+    def stop(self) -> None:
+        """Ask :meth:`run_forever` to return once the current batch is done."""
+        self._stopped.set()
 
     async def close(self) -> None:
         """Close the publisher connection if this worker created it."""
+        if self._wakeup is not None:
+            await self._wakeup.close()
         if self._owns_publisher and isinstance(self._publisher, RabbitMQPublisher):
             await self._publisher.close()
 
+    async def _idle(self) -> None:
+        if self._wakeup is None:
+            await self._sleep(self._poll_interval)
+            return
+        wakeup = asyncio.ensure_future(self._wakeup.wait())
+        stopped = asyncio.ensure_future(self._stopped.wait())
+        try:
+            await asyncio.wait({wakeup, stopped}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            wakeup.cancel()
+            stopped.cancel()
+        if wakeup.done() and not wakeup.cancelled():
+            wakeup.result()  # surface a listener failure, as before
+
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep, cut short by :meth:`stop`."""
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self._stopped.wait(), timeout=seconds)
+
     async def _ensure_publisher(self) -> RawPublisher:
         if self._publisher is None:
             assert self._rabbitmq_url is not None  # guarded in __init__
             publisher = RabbitMQPublisher(self._rabbitmq_url, self._exchange_name)
-            await publisher.connect()
+            await publisher.connect(self._connection)
             self._publisher = publisher
         return self._publisher
 
+    def _mode_name(self) -> str:
+        if self._pipelined:
+            return "pipelined"
+        return "per-entry" if self._commit_per_entry else "legacy-batch"
+
     async def _process_batch(self) -> int:
+        if self._pipelined:
+            return await self._process_batch_pipelined()
         if self._commit_per_entry:
             return await self._process_batch_per_entry()
         return await self._process_batch_legacy()
@@ -187,19 +285,83 @@ class OutboxPublisherWorker:
             await session.commit()
             return len(entries)
 
+    async def _process_batch_pipelined(self) -> int:
+        """Lock N rows → publish all concurrently → one bulk mark → commit.
+
+        ``RabbitMQPublisher`` opens its channel with publisher confirms,
+        so each ``publish_raw`` resolves only once the broker has acked
+        the message (and raises on a nack).  Awaiting them together keeps
+        N messages in flight instead of one, which is where the
+        throughput comes from; the row locks are held until the single
+        commit, so concurrent workers still cannot double-publish.
+        """
+        async with self._session_factory() as session:
+            repo = self._repo_factory(session)
+            entries = await repo.fetch_pending(batch_size=self._batch_size)
+            if not entries:
+                return 0
+
+            results = await asyncio.gather(
+                *(self._publish_confirmed(entry) for entry in entries),
+                return_exceptions=True,
+            )
+            confirmed: list[str] = []
+            for entry, result in zip(entries, results):
+                if isinstance(result, BaseException):
+                    await self._record_failure(repo, entry, result)
+                else:
+                    confirmed.append(entry.id)
+
+            await self._mark_published_many(repo, confirmed)
+            await session.commit()
+
+        logger.info(
+            "Published %d/%d outbox entries (pipelined)",
+            len(confirmed),
+            len(entries),
+        )
+        return len(entries)
+
+    async def _publish_confirmed(self, entry: OutboxEntry) -> None:
+        assert self._publisher is not None  # _ensure_publisher ran first
+        await self._timed_publish(
+            asyncio.wait_for(
+                self._publisher.publish_raw(self._build_message(entry), routing_key=entry.event_type),
+                timeout=self._confirm_timeout,
+            )
+        )
+
+    async def _timed_publish(self, publish: Awaitable[None]) -> None:
+        started = time.perf_counter()
+        try:
+            await publish
+        except BaseException:
+            self._metrics.outbox_published("failed", time.perf_counter() - started)
+            raise
+        self._metrics.outbox_published("published", time.perf_counter() - started)
+
+    @staticmethod
+    async def _mark_published_many(repo: OutboxRepositoryLike, event_ids: list[str]) -> None:
+        """One ``UPDATE`` when the repository supports it, else per id."""
+        if not event_ids:
+            return
+        mark_many = getattr(repo, "mark_published_many", None)
+        if mark_many is not None:
+            await mark_many(event_ids)
+            return
+        for event_id in event_ids:
+            await repo.mark_published(event_id)
+
     async def _try_publish(
         self,
         repo: OutboxRepositoryLike,
         entry: OutboxEntry,
     ) -> None:
         try:
-            message = Message(
-                body=entry.payload_json.encode("utf-8"),
-                delivery_mode=DeliveryMode.PERSISTENT,
-                content_type="application/json",
-            )
             assert self._publisher is not None  # _ensure_publisher ran first
-            await self._publisher.publish_raw(message, routing_key=entry.event_type)
+            await self._timed_publish(
+                self._publisher.publish_raw(self._build_message(entry), routing_key=entry.event_type)
+            )
             await repo.mark_published(entry.id)
             logger.info(
                 "Published %s (id=%s, correlation=%s)",
@@ -207,33 +369,76 @@ class OutboxPublisherWorker:
                 entry.id,
                 entry.correlation_id,
             )
-        except Exception:
-            next_at = await repo.record_failure(entry, max_attempts=self._max_attempts)
-            if next_at is None and self._max_attempts is not None:
-                logger.error(
-                    "Giving up on %s (id=%s) after %d attempts — marked dead",
-                    entry.event_type,
-                    entry.id,
-                    entry.attempts + 1,
-                    exc_info=True,
-                )
-            else:
-                logger.warning(
-                    "Failed to publish %s (id=%s, attempt=%d, next_retry=%s)",
-                    entry.event_type,
-                    entry.id,
-                    entry.attempts + 1,
-                    next_at,
-                    exc_info=True,
-                )
+        except Exception as exc:
+            await self._record_failure(repo, entry, exc)
+
+    def _build_message(self, entry: OutboxEntry) -> Message:
+        return Message(
+            body=encode_payload(entry.payload_json, self._content_type),
+            delivery_mode=DeliveryMode.PERSISTENT,
+            content_type=self._content_type,
+        )
+
+    async def _record_failure(
+        self,
+        repo: OutboxRepositoryLike,
+        entry: OutboxEntry,
+        exc: BaseException,
+    ) -> None:
+        next_at = await repo.record_failure(entry, max_attempts=self._max_attempts)
+        exc_info = (type(exc), exc, exc.__traceback__)
+        if next_at is None and self._max_attempts is not None:
+            logger.error(
+                "Giving up on %s (id=%s) after %d attempts — marked dead",
+                entry.event_type,
+                entry.id,
+                entry.attempts + 1,
+                exc_info=exc_info,
+            )
+        else:
+            logger.warning(
+                "Failed to publish %s (id=%s, attempt=%d, next_retry=%s)",
+                entry.event_type,
+                entry.id,
+                entry.attempts + 1,
+                next_at,
+                exc_info=exc_info,
+            )
+
+    @property
+    def _metrics(self) -> MessagingMetrics:
+        return self._metrics_override or default_metrics()
+
+    async def _maybe_sample_backlog(self) -> None:
+        """Refresh the backlog gauges every ``metrics_interval`` seconds."""
+        if not self._metrics.enabled:
+            return
+        now = time.monotonic()
+        if self._last_metrics_monotonic is not None and now - self._last_metrics_monotonic < self._metrics_interval:
+            return
+        self._last_metrics_monotonic = now
+        async with self._session_factory() as session:
+            backlog = getattr(self._repo_factory(session), "backlog", None)
+            if backlog is None:
+                return
+            stats = await backlog()
+        oldest = stats.oldest_created_at
+        age = 0.0 if oldest is None else max((utcnow_naive() - oldest).total_seconds(), 0.0)
+        self._metrics.outbox_backlog(stats.pending, age)
 
     async def _maybe_purge(self) -> None:
-        if self._purge_after_days is None:
+        if self._purge_after_days is None and not self._partitions and self._inbox_purge is None:
             return
         now = time.monotonic()
         if self._last_purge_monotonic is not None and now - self._last_purge_monotonic < self._purge_interval:
             return
         self._last_purge_monotonic = now
+        for maintainer in self._partitions:
+            await maintainer.run_once()
+        if self._inbox_purge is not None:
+            await self._inbox_purge.run_once()
+        if self._purge_after_days is None:
+            return
         async with self._session_factory() as session:
             repo = self._repo_factory(session)
             purge = getattr(repo, "purge_published", None)
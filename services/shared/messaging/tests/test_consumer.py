@@ -7,12 +7,16 @@ the consumer is exercised directly via ``_on_message`` — no broker.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from aio_pika.abc import AbstractIncomingMessage
+from contracts.codec import JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE
 from messaging.consumer import (
+    PREFETCH_PER_PARTITION,
     RETRY_HEADER,
     ConsumerBase,
     PoisonMessageError,
@@ -54,6 +58,7 @@ def _make_message(body: dict | bytes, headers: dict | None = None) -> MagicMock:
     message = MagicMock()
     message.body = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
     message.headers = headers or {}
+    message.content_type = JSON_CONTENT_TYPE
     message.ack = AsyncMock()
     message.nack = AsyncMock()
     return message
@@ -103,6 +108,106 @@ class TestPoisonMessages:
         consumer._channel.default_exchange.publish.assert_not_awaited()
 
 
+class FakeEventModel:
+    """Stands in for a pydantic event class (``event_model=``)."""
+
+    def __init__(self, correlation_id: str, value: int) -> None:
+        self.correlation_id = correlation_id
+        self.event_type = "thing.happened"
+        self.value = value
+
+    @classmethod
+    def model_validate(cls, obj: Any) -> FakeEventModel:
+        if not isinstance(obj, dict) or not isinstance(obj.get("value"), int):
+            raise ValueError("invalid")
+        return cls(obj["correlation_id"], obj["value"])
+
+    @classmethod
+    def model_validate_json(cls, json_data: bytes | str) -> FakeEventModel:
+        cls.json_calls += 1
+        return cls.model_validate(json.loads(json_data))
+
+    json_calls = 0
+
+
+class TestContentTypes:
+    async def test_msgpack_body_is_decoded(self) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        consumer = _make_consumer()
+        message = _make_message(msgpack.packb({"event_type": "thing.happened", "value": 1}))
+        message.content_type = MSGPACK_CONTENT_TYPE
+
+        await consumer._on_message(message)
+
+        assert consumer.handled == [{"event_type": "thing.happened", "value": 1}]
+        message.ack.assert_awaited_once()
+
+    async def test_json_with_charset_parameter_is_decoded(self) -> None:
+        consumer = _make_consumer()
+        message = _make_message({"event_type": "thing.happened", "value": 1})
+        message.content_type = "application/json; charset=utf-8"
+
+        await consumer._on_message(message)
+
+        assert consumer.handled == [{"event_type": "thing.happened", "value": 1}]
+        message.ack.assert_awaited_once()
+
+    async def test_unknown_content_type_goes_to_dlq(self) -> None:
+        consumer = _make_consumer()
+        message = _make_message({"event_type": "thing.happened", "value": 1})
+        message.content_type = "text/plain"
+
+        await consumer._on_message(message)
+
+        assert consumer.handled == []
+        message.nack.assert_awaited_once_with(requeue=False)
+
+    async def test_event_model_validates_json_bytes_directly(self) -> None:
+        FakeEventModel.json_calls = 0
+        consumer = _make_consumer(event_model=FakeEventModel)
+        message = _make_message({"correlation_id": "c-1", "value": 5})
+        message.content_type = JSON_CONTENT_TYPE
+
+        await consumer._on_message(message)
+
+        assert FakeEventModel.json_calls == 1
+        (event,) = consumer.handled
+        assert isinstance(event, FakeEventModel)
+        assert event.value == 5
+        message.ack.assert_awaited_once()
+
+    async def test_event_model_validation_failure_goes_to_dlq(self) -> None:
+        consumer = _make_consumer(event_model=FakeEventModel)
+        message = _make_message({"correlation_id": "c-1", "value": "five"})
+
+        await consumer._on_message(message)
+
+        assert consumer.handled == []
+        message.nack.assert_awaited_once_with(requeue=False)
+
+    async def test_event_model_feeds_dedup(self) -> None:
+        dedup = FakeDedup(seen={"c-1"})
+        consumer = _make_consumer(event_model=FakeEventModel, deduplicator=dedup)
+        message = _make_message({"correlation_id": "c-1", "value": 5})
+
+        await consumer._on_message(message)
+
+        assert consumer.handled == []
+        message.ack.assert_awaited_once()
+
+    async def test_retry_keeps_content_type(self) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        consumer = _make_consumer(error=RuntimeError("boom"))
+        message = _make_message(msgpack.packb({"value": 1}))
+        message.content_type = MSGPACK_CONTENT_TYPE
+
+        await consumer._on_message(message)
+
+        republished = consumer._channel.default_exchange.publish.await_args.args[0]
+        assert republished.content_type == MSGPACK_CONTENT_TYPE
+        assert republished.body == message.body
+
+
 class TestRetry:
     async def test_failure_republishes_to_own_queue_with_incremented_header(self) -> None:
         consumer = _make_consumer(error=RuntimeError("db down"))
@@ -113,9 +218,10 @@ class TestRetry:
         publish = consumer._channel.default_exchange.publish
         publish.assert_awaited_once()
         args, kwargs = publish.await_args
-        # Republished to the consumer's OWN queue via the default exchange —
-        # never back to the topic exchange (would fan out to other consumers).
-        assert kwargs["routing_key"] == QUEUE_NAME
+        # Parked in the consumer's OWN first delay tier via the default
+        # exchange — never back to the topic exchange (would fan out to
+        # other consumers). The tier dead-letters back to QUEUE_NAME.
+        assert kwargs["routing_key"] == f"{QUEUE_NAME}.retry.1000ms"
         assert args[0].headers[RETRY_HEADER] == 1
         assert args[0].body == message.body
         message.ack.assert_awaited_once()
@@ -127,8 +233,29 @@ class TestRetry:
 
         await consumer._on_message(message)
 
-        args, _ = consumer._channel.default_exchange.publish.await_args
+        args, kwargs = consumer._channel.default_exchange.publish.await_args
         assert args[0].headers[RETRY_HEADER] == 2
+        # Second retry → second, longer tier.
+        assert kwargs["routing_key"] == f"{QUEUE_NAME}.retry.5000ms"
+
+    async def test_without_retry_delays_republishes_to_own_queue_immediately(self) -> None:
+        consumer = _make_consumer(error=RuntimeError("db down"), retry_delays=None)
+        message = _make_message({"event_type": "thing.happened"})
+
+        await consumer._on_message(message)
+
+        args, kwargs = consumer._channel.default_exchange.publish.await_args
+        assert kwargs["routing_key"] == QUEUE_NAME
+        assert args[0].headers[RETRY_HEADER] == 1
+
+    async def test_unusable_retry_header_counts_as_first_attempt(self) -> None:
+        consumer = _make_consumer(error=RuntimeError("db down"))
+        message = _make_message({"event_type": "thing.happened"}, headers={RETRY_HEADER: "garbage"})
+
+        await consumer._on_message(message)
+
+        args, _ = consumer._channel.default_exchange.publish.await_args
+        assert args[0].headers[RETRY_HEADER] == 1
 
     async def test_failure_after_max_retries_goes_to_dlq(self) -> None:
         consumer = _make_consumer(error=RuntimeError("db down"))
@@ -207,3 +334,240 @@ class TestShutdown:
         consumer._stopped.clear()
         await consumer.stop()
         assert consumer._stopped.is_set()
+
+
+class KeyedConsumer(ConsumerBase):
+    """Concurrent test consumer: ``gates`` lets a test hold a handler open."""
+
+    def __init__(self, concurrency: int = 4) -> None:
+        super().__init__("amqp://test", QUEUE_NAME, "thing.happened", concurrency=concurrency)
+        self.gates: dict[int, asyncio.Event] = {}
+        self.started: list[int] = []
+        self.finished: list[int] = []
+
+    def ordering_key(self, payload: dict[str, Any]) -> str | None:
+        return payload.get("key")
+
+    async def handle(self, payload: dict[str, Any], message: AbstractIncomingMessage) -> None:
+        seq = payload["seq"]
+        self.started.append(seq)
+        gate = self.gates.get(seq)
+        if gate is not None:
+            await gate.wait()
+        if payload.get("fail"):
+            raise RuntimeError("boom")
+        self.finished.append(seq)
+
+
+def _make_keyed(concurrency: int = 4) -> KeyedConsumer:
+    consumer = KeyedConsumer(concurrency)
+    channel = MagicMock()
+    channel.default_exchange.publish = AsyncMock()
+    consumer._channel = channel
+    consumer._start_partitions()
+    return consumer
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestConcurrency:
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            KeyedConsumer(concurrency=0)
+
+    def test_prefetch_defaults_scale_with_concurrency(self) -> None:
+        assert RecordingConsumer()._prefetch_count == 1
+        assert KeyedConsumer(concurrency=8)._prefetch_count == 8 * PREFETCH_PER_PARTITION
+
+    async def test_same_key_is_handled_in_order(self) -> None:
+        consumer = _make_keyed()
+        consumer.gates[1] = asyncio.Event()
+
+        await consumer._on_message(_make_message({"key": "tx-1", "seq": 1}))
+        await consumer._on_message(_make_message({"key": "tx-1", "seq": 2}))
+        await _settle()
+
+        # seq 2 shares seq 1's partition, so it waits behind the open gate.
+        assert consumer.started == [1]
+
+        consumer.gates[1].set()
+        await consumer._stop_partitions(timeout=1)
+        assert consumer.finished == [1, 2]
+
+    async def test_unrelated_keys_run_in_parallel(self) -> None:
+        consumer = _make_keyed()
+        keys = ["a", "b"]
+        assert consumer._partition_index({"key": keys[0]}) != consumer._partition_index({"key": keys[1]})
+        consumer.gates[1] = asyncio.Event()
+
+        await consumer._on_message(_make_message({"key": keys[0], "seq": 1}))
+        await consumer._on_message(_make_message({"key": keys[1], "seq": 2}))
+        await _settle()
+
+        # seq 2 finished while seq 1 is still blocked.
+        assert consumer.finished == [2]
+        consumer.gates[1].set()
+        await consumer._stop_partitions(timeout=1)
+        assert sorted(consumer.finished) == [1, 2]
+
+    async def test_acks_and_retries_are_per_message(self) -> None:
+        consumer = _make_keyed()
+        ok = _make_message({"key": "a", "seq": 1})
+        failing = _make_message({"key": "b", "seq": 2, "fail": True})
+
+        await consumer._on_message(ok)
+        await consumer._on_message(failing)
+        await consumer._stop_partitions(timeout=1)
+
+        ok.ack.assert_awaited_once()
+        # Failed message took the normal retry path: republished, then acked.
+        consumer._channel.default_exchange.publish.assert_awaited_once()
+        args, _ = consumer._channel.default_exchange.publish.await_args
+        assert args[0].headers[RETRY_HEADER] == 1
+        failing.ack.assert_awaited_once()
+
+    async def test_invalid_json_is_dead_lettered_before_partitioning(self) -> None:
+        consumer = _make_keyed()
+        message = _make_message(b"not json")
+
+        await consumer._on_message(message)
+
+        message.nack.assert_awaited_once_with(requeue=False)
+        assert all(partition.empty() for partition in consumer._partitions)
+        await consumer._stop_partitions(timeout=1)
+
+    async def test_partition_survives_failed_ack(self) -> None:
+        consumer = _make_keyed(concurrency=2)
+        broken = _make_message({"key": "a", "seq": 1})
+        broken.ack = AsyncMock(side_effect=ConnectionError("channel closed"))
+        after = _make_message({"key": "a", "seq": 2})
+
+        await consumer._on_message(broken)
+        await consumer._on_message(after)
+        await consumer._stop_partitions(timeout=1)
+
+        after.ack.assert_awaited_once()
+
+
+class BatchConsumer(ConsumerBase):
+    """Micro-batch test consumer with scriptable batch outcomes."""
+
+    def __init__(self, *, batch_size: int = 3, **kwargs: Any) -> None:
+        super().__init__(
+            "amqp://test",
+            QUEUE_NAME,
+            "thing.happened",
+            batch_size=batch_size,
+            batch_max_wait=0.01,
+            **kwargs,
+        )
+        self.batches: list[list[int]] = []
+        self.singles: list[int] = []
+        self.batch_error: Exception | None = None
+        self.defer: set[int] = set()
+
+    async def handle_batch(self, payloads: list[dict[str, Any]]) -> set[int] | None:
+        if self.batch_error is not None:
+            raise self.batch_error
+        self.batches.append([p["seq"] for p in payloads])
+        return {i for i, p in enumerate(payloads) if p["seq"] in self.defer}
+
+    async def handle(self, payload: dict[str, Any], message: AbstractIncomingMessage) -> None:
+        if payload.get("poison"):
+            raise PoisonMessageError("bad")
+        self.singles.append(payload["seq"])
+
+
+def _make_batch_consumer(**kwargs: Any) -> BatchConsumer:
+    consumer = BatchConsumer(**kwargs)
+    channel = MagicMock()
+    channel.default_exchange.publish = AsyncMock()
+    consumer._channel = channel
+    consumer._start_partitions()
+    return consumer
+
+
+class TestMicroBatch:
+    def test_prefetch_covers_two_batches(self) -> None:
+        assert BatchConsumer(batch_size=50)._prefetch_count == 100
+
+    async def test_full_batch_is_handled_once_and_multi_acked(self) -> None:
+        consumer = _make_batch_consumer()
+        messages = [_make_message({"seq": i}) for i in range(3)]
+
+        for message in messages:
+            await consumer._on_message(message)
+        await consumer._stop_partitions(timeout=1)
+
+        assert consumer.batches == [[0, 1, 2]]
+        messages[-1].ack.assert_awaited_once_with(multiple=True)
+        messages[0].ack.assert_not_awaited()
+
+    async def test_partial_batch_flushes_after_max_wait(self) -> None:
+        consumer = _make_batch_consumer(batch_size=10)
+        message = _make_message({"seq": 7})
+
+        await consumer._on_message(message)
+        await asyncio.sleep(0.05)
+
+        assert consumer.batches == [[7]]
+        message.ack.assert_awaited_once_with(multiple=True)
+        await consumer._stop_partitions(timeout=1)
+
+    async def test_failed_batch_isolates_poison_message(self) -> None:
+        consumer = _make_batch_consumer()
+        consumer.batch_error = RuntimeError("integrity error somewhere")
+        good = _make_message({"seq": 1})
+        poison = _make_message({"seq": 2, "poison": True})
+        other = _make_message({"seq": 3})
+
+        for message in (good, poison, other):
+            await consumer._on_message(message)
+        await consumer._stop_partitions(timeout=1)
+
+        assert consumer.singles == [1, 3]
+        good.ack.assert_awaited_once_with()
+        other.ack.assert_awaited_once_with()
+        poison.nack.assert_awaited_once_with(requeue=False)
+
+    async def test_deferred_payloads_take_the_per_message_path(self) -> None:
+        consumer = _make_batch_consumer()
+        consumer.defer = {1}
+        messages = [_make_message({"seq": i}) for i in range(3)]
+
+        for message in messages:
+            await consumer._on_message(message)
+        await consumer._stop_partitions(timeout=1)
+
+        assert consumer.singles == [1]
+        messages[1].ack.assert_awaited_once_with()
+        messages[2].ack.assert_awaited_once_with(multiple=True)
+
+    async def test_duplicates_are_acked_and_left_out_of_the_batch(self) -> None:
+        dedup = FakeDedup(seen={"c-dup"})
+        consumer = _make_batch_consumer(deduplicator=dedup)
+        dup = _make_message({"seq": 0, "correlation_id": "c-dup"})
+        fresh = [_make_message({"seq": i, "correlation_id": f"c-{i}"}) for i in (1, 2)]
+
+        for message in (dup, *fresh):
+            await consumer._on_message(message)
+        await consumer._stop_partitions(timeout=1)
+
+        assert consumer.batches == [[1, 2]]
+        dup.ack.assert_awaited_once_with()
+        assert [m for m, _ in dedup.marked] == ["c-1", "c-2"]
+
+    async def test_concurrent_partitions_ack_individually(self) -> None:
+        consumer = _make_batch_consumer(batch_size=2, concurrency=2)
+        messages = [_make_message({"seq": i}) for i in range(4)]
+
+        for message in messages:
+            await consumer._on_message(message)
+        await consumer._stop_partitions(timeout=1)
+
+        assert sorted(seq for batch in consumer.batches for seq in batch) == [0, 1, 2, 3]
+        for message in messages:
+            message.ack.assert_awaited_once_with()
@@ -0,0 +1,180 @@
+"""WorkerHost supervision, shared connection, health and shutdown.
+
+The broker connection is a mock (``aio_pika.connect_robust`` patched);
+the outbox worker runs for real against the sqlite outbox.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aio_pika import Message
+from messaging import host as host_module
+from messaging.consumer import ConsumerBase
+from messaging.host import WorkerHost
+from messaging.worker import OutboxPublisherWorker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.conftest import OutboxEventModel
+
+
+class IdleConsumer(ConsumerBase):
+    """Runs until stopped; optionally crashes on its first N runs."""
+
+    def __init__(self, queue_name: str, *, crash_times: int = 0) -> None:
+        super().__init__("amqp://unused", queue_name, "thing.happened")
+        self.crash_times = crash_times
+        self.connections: list[Any] = []
+
+    async def run(self, connection: Any = None) -> None:
+        self.connections.append(connection)
+        self._stopped.clear()
+        if len(self.connections) <= self.crash_times:
+            raise RuntimeError("broker hiccup")
+        await self._stopped.wait()
+
+
+class NullPublisher:
+    async def publish_raw(self, message: Message, routing_key: str) -> None:
+        return None
+
+
+@pytest.fixture
+def connection(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    connection = MagicMock()
+    connection.close = AsyncMock()
+    monkeypatch.setattr(host_module.aio_pika, "connect_robust", AsyncMock(return_value=connection))
+    return connection
+
+
+async def _wait_until(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+class TestLifecycle:
+    async def test_components_share_one_connection_and_stop_gracefully(
+        self,
+        connection: MagicMock,
+        session_factory: Callable[[], AsyncSession],
+    ) -> None:
+        first, second = IdleConsumer("svc.first"), IdleConsumer("svc.second")
+        worker = OutboxPublisherWorker(session_factory, OutboxEventModel, publisher=NullPublisher(), poll_interval=0.01)
+        engine = MagicMock()
+        engine.dispose = AsyncMock()
+        host = WorkerHost("amqp://test", [first, second, worker], engine=engine)
+
+        run = asyncio.create_task(host.run())
+        await _wait_until(lambda: host.healthy)
+        host.stop()
+        await asyncio.wait_for(run, timeout=2)
+
+        assert first.connections == [connection]
+        assert second.connections == [connection]
+        assert {name: h.status for name, h in host.health().items()} == {
+            "svc.first": "stopped",
+            "svc.second": "stopped",
+            "outbox_publisher": "stopped",
+        }
+        connection.close.assert_awaited_once()
+        engine.dispose.assert_awaited_once()
+
+    async def test_crashed_component_is_restarted_without_touching_others(self, connection: MagicMock) -> None:
+        steady, flaky = IdleConsumer("svc.steady"), IdleConsumer("svc.flaky", crash_times=1)
+        host = WorkerHost("amqp://test", [steady, flaky], restart_backoff=0.01)
+
+        run = asyncio.create_task(host.run())
+        await _wait_until(lambda: len(flaky.connections) == 2 and host.healthy)
+        health = host.health()
+        host.stop()
+        await asyncio.wait_for(run, timeout=2)
+
+        assert health["svc.flaky"].restarts == 1
+        assert health["svc.flaky"].last_error == "RuntimeError: broker hiccup"
+        assert health["svc.steady"].restarts == 0
+        assert len(steady.connections) == 1
+
+    async def test_component_ignoring_stop_is_cancelled_after_timeout(self, connection: MagicMock) -> None:
+        class Stubborn(IdleConsumer):
+            async def stop(self) -> None:
+                return None  # never lets run() return
+
+        host = WorkerHost("amqp://test", [Stubborn("svc.stubborn")], shutdown_timeout=0.05)
+
+        run = asyncio.create_task(host.run())
+        await _wait_until(lambda: host.healthy)
+        host.stop()
+
+        await asyncio.wait_for(run, timeout=2)
+        connection.close.assert_awaited_once()
+
+    def test_duplicate_names_are_suffixed(self, session_factory: Callable[[], AsyncSession]) -> None:
+        workers = [
+            OutboxPublisherWorker(session_factory, OutboxEventModel, publisher=NullPublisher()) for _ in range(2)
+        ]
+
+        host = WorkerHost("amqp://test", [IdleConsumer("svc.a"), *workers])
+
+        assert list(host.health()) == ["svc.a", "outbox_publisher", "outbox_publisher-2"]
+
+    def test_requires_components(self) -> None:
+        with pytest.raises(ValueError):
+            WorkerHost("amqp://test", [])
+
+
+class TestHealthEndpoint:
+    async def _get(self, port: int) -> tuple[str, dict[str, Any]]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /healthz HTTP/1.1\r\nHost: x\r\n\r\n")
+        await writer.drain()
+        raw = await reader.read()
+        writer.close()
+        head, _, body = raw.partition(b"\r\n\r\n")
+        return head.split(b"\r\n")[0].decode(), json.loads(body)
+
+    async def test_reports_each_component(self, connection: MagicMock, unused_tcp_port: int) -> None:
+        host = WorkerHost(
+            "amqp://test",
+            [IdleConsumer("svc.flaky", crash_times=100)],
+            health_port=unused_tcp_port,
+            health_host="127.0.0.1",
+            restart_backoff=10,
+        )
+
+        run = asyncio.create_task(host.run())
+        await _wait_until(lambda: host.health()["svc.flaky"].status == "failed")
+        status_line, body = await self._get(unused_tcp_port)
+        host.stop()
+        await asyncio.wait_for(run, timeout=2)
+
+        assert status_line == "HTTP/1.0 503 Service Unavailable"
+        assert body["svc.flaky"]["status"] == "failed"
+        assert body["svc.flaky"]["restarts"] == 1
+
+
+class TestSharedConnectionConsumer:
+    async def test_consumer_closes_only_its_channel(self) -> None:
+        channel = AsyncMock()
+        channel.is_closed = False
+        connection = MagicMock()
+        connection.channel = AsyncMock(return_value=channel)
+        connection.close = AsyncMock()
+
+        class Plain(ConsumerBase):
+            async def handle(self, payload: Any, message: Any) -> None:
+                return None
+
+        consumer = Plain("amqp://unused", "svc.plain", "thing.happened")
+        run = asyncio.create_task(consumer.run(connection))
+        await _wait_until(lambda: channel.declare_queue.await_count > 0)
+        await consumer.stop()
+        await asyncio.wait_for(run, timeout=2)
+
+        channel.close.assert_awaited_once()
+        connection.close.assert_not_awaited()
@@ -0,0 +1,167 @@
+"""InboxFilter / BloomFilter behaviour and InboxPurger, against a sqlite inbox table."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from messaging.inbox import BloomFilter, InboxFilter, InboxPurger
+from messaging.time import utcnow_naive
+from sqlalchemy import String, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class InboxBase(DeclarativeBase):
+    """Separate metadata: the shared fixture must not create this table."""
+
+
+class ProcessedEventModel(InboxBase):
+    __tablename__ = "processed_events"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    message_id: Mapped[str] = mapped_column(String(36))
+    consumer_name: Mapped[str] = mapped_column(String(100))
+    processed_at: Mapped[datetime] = mapped_column(default=utcnow_naive)
+
+
+@pytest.fixture
+async def inbox_session(engine: AsyncEngine, session_factory: Callable[[], AsyncSession]) -> AsyncSession:
+    async with engine.begin() as conn:
+        await conn.run_sync(ProcessedEventModel.__table__.create)
+    async with session_factory() as session:
+        yield session
+
+
+class CountingLookup:
+    def __init__(self, result: bool) -> None:
+        self.result = result
+        self.calls = 0
+
+    async def __call__(self) -> bool:
+        self.calls += 1
+        return self.result
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self) -> None:
+        bloom = BloomFilter(1000, 0.01)
+        ids = [str(uuid4()) for _ in range(1000)]
+        for message_id in ids:
+            bloom.add(message_id)
+
+        assert all(message_id in bloom for message_id in ids)
+
+    def test_false_positive_rate_near_target(self) -> None:
+        bloom = BloomFilter(1000, 0.01)
+        for _ in range(1000):
+            bloom.add(str(uuid4()))
+
+        hits = sum(str(uuid4()) in bloom for _ in range(10_000))
+
+        assert hits < 300
+
+    def test_rejects_bad_parameters(self) -> None:
+        with pytest.raises(ValueError):
+            BloomFilter(0, 0.01)
+        with pytest.raises(ValueError):
+            BloomFilter(10, 1.0)
+
+
+class TestInboxFilter:
+    async def test_cold_filter_always_asks_the_database(self) -> None:
+        inbox = InboxFilter(capacity=100)
+        lookup = CountingLookup(False)
+
+        assert await inbox.is_duplicate("a", lookup) is False
+        assert await inbox.is_duplicate("a", lookup) is False
+        assert lookup.calls == 2
+
+    async def test_recent_ids_are_definite_duplicates(self) -> None:
+        inbox = InboxFilter(capacity=100)
+        lookup = CountingLookup(False)
+        inbox.add("a")
+
+        assert await inbox.is_duplicate("a", lookup) is True
+        assert lookup.calls == 0
+
+    async def test_database_hit_is_remembered(self) -> None:
+        inbox = InboxFilter(capacity=100)
+        lookup = CountingLookup(True)
+
+        assert await inbox.is_duplicate("a", lookup) is True
+        assert await inbox.is_duplicate("a", lookup) is True
+        assert lookup.calls == 1
+
+    def test_recent_lru_is_bounded(self) -> None:
+        inbox = InboxFilter(capacity=100, recent_size=2)
+        for message_id in ("a", "b", "c"):
+            inbox.add(message_id)
+
+        assert inbox.seen("a") is None  # evicted from the LRU, still in the (cold) Bloom filter
+        assert inbox.seen("c") is True
+
+    async def test_warm_skips_database_for_unknown_ids(self, inbox_session: AsyncSession) -> None:
+        inbox_session.add_all(
+            [
+                ProcessedEventModel(message_id="old-1", consumer_name="q"),
+                ProcessedEventModel(message_id="old-2", consumer_name="q"),
+                ProcessedEventModel(message_id="other", consumer_name="other-q"),
+            ]
+        )
+        await inbox_session.commit()
+        inbox = InboxFilter(capacity=100, recent_size=1)
+
+        loaded = await inbox.warm(
+            inbox_session,
+            select(ProcessedEventModel.message_id).where(ProcessedEventModel.consumer_name == "q"),
+        )
+
+        assert loaded == 2
+        assert inbox.seen("new") is False
+        assert inbox.seen("old-1") is None  # possible hit → the database decides
+
+    async def test_failed_warm_leaves_filter_cold(self, session: AsyncSession) -> None:
+        inbox = InboxFilter(capacity=100)
+
+        # Table not created in this test → the query fails.
+        loaded = await inbox.warm(session, select(ProcessedEventModel.message_id))
+
+        assert loaded == 0
+        assert inbox.warmed is False
+        assert inbox.seen("anything") is None
+
+
+class TestInboxPurger:
+    async def test_deletes_expired_rows_in_batches(
+        self, inbox_session: AsyncSession, session_factory: Callable[[], AsyncSession]
+    ) -> None:
+        expired = utcnow_naive() - timedelta(days=31)
+        inbox_session.add_all(
+            [ProcessedEventModel(message_id=f"old-{i}", consumer_name="q", processed_at=expired) for i in range(5)]
+        )
+        inbox_session.add(ProcessedEventModel(message_id="fresh", consumer_name="q"))
+        await inbox_session.commit()
+        sessions = 0
+
+        def counting_factory() -> AsyncSession:
+            nonlocal sessions
+            sessions += 1
+            return session_factory()
+
+        deleted = await InboxPurger(counting_factory, retention=timedelta(days=30), batch_size=2).run_once()
+
+        assert deleted == 5
+        assert sessions == 3  # 2 + 2 + 1, one transaction each
+        remaining = await inbox_session.scalars(select(ProcessedEventModel.message_id))
+        assert remaining.all() == ["fresh"]
+
+    async def test_failure_is_logged_not_raised(self, session_factory: Callable[[], AsyncSession]) -> None:
+        # Table not created in this test → the DELETE fails.
+        assert await InboxPurger(session_factory, retention=timedelta(days=30)).run_once() == 0
+
+    def test_rejects_empty_batches(self, session_factory: Callable[[], AsyncSession]) -> None:
+        with pytest.raises(ValueError):
+            InboxPurger(session_factory, retention=timedelta(days=30), batch_size=0)
@@ -0,0 +1,236 @@
+"""Consumer and outbox worker metrics: outcomes, latencies, backlog gauges.
+
+A recording sink checks what is reported; the Prometheus sink is checked
+against its own ``CollectorRegistry`` when ``prometheus_client`` is
+installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from aio_pika.abc import AbstractIncomingMessage
+from messaging import metrics as metrics_module
+from messaging.consumer import ConsumerBase, PoisonMessageError
+from messaging.metrics import MessagingMetrics, default_metrics, set_default_metrics
+from messaging.outbox import OutboxRepository
+from messaging.time import utcnow_naive
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.conftest import FakeEvent, OutboxEventModel
+from tests.test_consumer import (
+    QUEUE_NAME,
+    FakeDedup,
+    _make_batch_consumer,
+    _make_consumer,
+    _make_message,
+)
+from tests.test_worker import FakePublisher, _make_worker, _seed
+
+
+class RecordingMetrics(MessagingMetrics):
+    enabled = True
+
+    def __init__(self) -> None:
+        self.settled: list[tuple[str, str, float | None]] = []
+        self.published: list[tuple[str, float]] = []
+        self.backlogs: list[tuple[int, float]] = []
+
+    def message_settled(self, queue: str, outcome: Any, seconds: float | None = None) -> None:
+        self.settled.append((queue, outcome, seconds))
+
+    def outbox_published(self, outcome: Any, seconds: float) -> None:
+        self.published.append((outcome, seconds))
+
+    def outbox_backlog(self, pending: int, oldest_age_seconds: float) -> None:
+        self.backlogs.append((pending, oldest_age_seconds))
+
+    def outcomes(self) -> list[str]:
+        return [outcome for _, outcome, _ in self.settled]
+
+
+@pytest.fixture
+def recorder() -> Iterator[RecordingMetrics]:
+    previous = default_metrics()
+    recorder = RecordingMetrics()
+    set_default_metrics(recorder)
+    yield recorder
+    set_default_metrics(previous)
+
+
+class TestConsumerOutcomes:
+    async def test_ack_is_timed(self, recorder: RecordingMetrics) -> None:
+        consumer = _make_consumer()
+
+        await consumer._on_message(_make_message({"event_type": "thing.happened"}))
+
+        [(queue, outcome, seconds)] = recorder.settled
+        assert (queue, outcome) == (QUEUE_NAME, "ack")
+        assert seconds is not None and seconds >= 0
+
+    async def test_failure_ladder(self, recorder: RecordingMetrics) -> None:
+        consumer = _make_consumer(error=RuntimeError("downstream"))
+
+        await consumer._on_message(_make_message({"event_type": "thing.happened"}))
+        await consumer._on_message(_make_message({"event_type": "thing.happened"}, headers={"x-retry-count": 3}))
+        consumer.error = PoisonMessageError("bad")
+        await consumer._on_message(_make_message({"event_type": "thing.happened"}))
+
+        assert recorder.outcomes() == ["retry", "dlq", "dlq"]
+
+    async def test_failed_republish_is_a_requeue(self, recorder: RecordingMetrics) -> None:
+        consumer = _make_consumer(error=RuntimeError("downstream"))
+        consumer._channel.default_exchange.publish.side_effect = ConnectionError("channel closed")
+
+        await consumer._on_message(_make_message({"event_type": "thing.happened"}))
+
+        assert recorder.outcomes() == ["requeue"]
+
+    async def test_undecodable_body_is_dlq_without_timing(self, recorder: RecordingMetrics) -> None:
+        consumer = _make_consumer()
+
+        await consumer._on_message(_make_message(b"{not json"))
+
+        assert recorder.settled == [(QUEUE_NAME, "dlq", None)]
+
+    async def test_duplicate(self, recorder: RecordingMetrics) -> None:
+        consumer = _make_consumer(deduplicator=FakeDedup(seen={"c-1"}))
+
+        await consumer._on_message(_make_message({"event_type": "thing.happened", "correlation_id": "c-1"}))
+
+        assert recorder.outcomes() == ["duplicate"]
+
+    async def test_batch_reports_each_message(self, recorder: RecordingMetrics) -> None:
+        consumer = _make_batch_consumer()
+        consumer.defer = {1}
+
+        for seq in range(3):
+            await consumer._on_message(_make_message({"seq": seq}))
+        await consumer._stop_partitions(timeout=1)
+
+        assert sorted(recorder.outcomes()) == ["ack", "ack", "ack"]
+
+    async def test_explicit_sink_overrides_default(self, recorder: RecordingMetrics) -> None:
+        own = RecordingMetrics()
+
+        class Plain(ConsumerBase):
+            async def handle(self, payload: Any, message: AbstractIncomingMessage) -> None:
+                return None
+
+        consumer = Plain("amqp://test", QUEUE_NAME, "thing.happened", metrics=own)
+        await consumer._process(_make_message({}), {})
+
+        assert own.outcomes() == ["ack"]
+        assert recorder.settled == []
+
+
+class TestOutboxWorker:
+    async def test_publish_outcomes(
+        self, session_factory: Callable[[], AsyncSession], recorder: RecordingMetrics
+    ) -> None:
+        await _seed(session_factory, FakeEvent("a.happened"), FakeEvent("b.happened"))
+        worker = _make_worker(session_factory, FakePublisher(fail_times=1))
+
+        await worker._process_batch()
+
+        assert sorted(outcome for outcome, _ in recorder.published) == ["failed", "published"]
+
+    async def test_backlog_sampled_at_interval(
+        self, session_factory: Callable[[], AsyncSession], recorder: RecordingMetrics
+    ) -> None:
+        await _seed(session_factory, FakeEvent("a.happened"), FakeEvent("b.happened"))
+        async with session_factory() as session:
+            await session.execute(update(OutboxEventModel).values(created_at=utcnow_naive() - timedelta(minutes=2)))
+            await session.commit()
+        worker = _make_worker(session_factory, FakePublisher(), metrics_interval=60)
+
+        await worker._maybe_sample_backlog()
+        await worker._maybe_sample_backlog()  # within the interval: skipped
+
+        [(pending, age)] = recorder.backlogs
+        assert pending == 2
+        assert 110 < age < 180
+
+    async def test_empty_backlog_has_zero_age(
+        self, session_factory: Callable[[], AsyncSession], recorder: RecordingMetrics
+    ) -> None:
+        worker = _make_worker(session_factory, FakePublisher())
+
+        await worker._maybe_sample_backlog()
+
+        assert recorder.backlogs == [(0, 0.0)]
+
+    async def test_disabled_sink_skips_backlog_query(self, session_factory: Callable[[], AsyncSession]) -> None:
+        calls = 0
+
+        class CountingRepository(OutboxRepository):
+            async def backlog(self) -> Any:
+                nonlocal calls
+                calls += 1
+                return await super().backlog()
+
+        worker = _make_worker(session_factory, FakePublisher(), metrics=MessagingMetrics())
+        worker._repo_factory = lambda session: CountingRepository(session, OutboxEventModel)
+
+        await worker._maybe_sample_backlog()
+
+        assert calls == 0
+
+    async def test_run_loop_samples_backlog(
+        self, session_factory: Callable[[], AsyncSession], recorder: RecordingMetrics
+    ) -> None:
+        await _seed(session_factory, FakeEvent("a.happened"))
+        worker = _make_worker(session_factory, FakePublisher())
+
+        run = asyncio.create_task(worker.run_forever())
+        async with asyncio.timeout(2):
+            while not recorder.backlogs:
+                await asyncio.sleep(0.01)
+        worker.stop()
+        await asyncio.wait_for(run, timeout=2)
+
+        assert recorder.backlogs[0][0] == 0  # the batch published first
+
+
+class TestPrometheusMetrics:
+    @pytest.fixture
+    def registry(self) -> Any:
+        prometheus_client = pytest.importorskip("prometheus_client")
+        return prometheus_client.CollectorRegistry()
+
+    def test_records_series(self, registry: Any) -> None:
+        sink = metrics_module.PrometheusMetrics(registry)
+
+        sink.message_settled("svc.q", "ack", 0.002)
+        sink.message_settled("svc.q", "dlq")
+        sink.outbox_published("published", 0.001)
+        sink.outbox_backlog(7, 42.0)
+
+        value = registry.get_sample_value
+        assert value("finans_tracker_messaging_messages_total", {"queue": "svc.q", "outcome": "ack"}) == 1
+        assert value("finans_tracker_messaging_messages_total", {"queue": "svc.q", "outcome": "dlq"}) == 1
+        assert value("finans_tracker_messaging_handle_seconds_count", {"queue": "svc.q", "outcome": "ack"}) == 1
+        assert value("finans_tracker_messaging_handle_seconds_count", {"queue": "svc.q", "outcome": "dlq"}) is None
+        assert value("finans_tracker_outbox_published_total", {"outcome": "published"}) == 1
+        assert value("finans_tracker_outbox_backlog") == 7
+        assert value("finans_tracker_outbox_oldest_pending_age_seconds") == 42.0
+
+    def test_enable_installs_default(self, registry: Any) -> None:
+        previous = default_metrics()
+        try:
+            sink = metrics_module.enable_prometheus(registry=registry)
+            assert default_metrics() is sink
+        finally:
+            set_default_metrics(previous)
+
+
+def test_missing_client_has_helpful_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(metrics_module, "prometheus_client", None)
+
+    with pytest.raises(ImportError, match=r"messaging\[prometheus\]"):
+        metrics_module.PrometheusMetrics()
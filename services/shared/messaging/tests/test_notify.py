@@ -0,0 +1,50 @@
+"""LISTEN/NOTIFY helpers: trigger DDL shape and listener guard rails.
+
+The listener itself needs a live asyncpg connection, so delivery is not
+covered here — only what can be checked without Postgres.
+"""
+
+from __future__ import annotations
+
+import pytest
+from messaging.notify import (
+    OUTBOX_NOTIFY_CHANNEL,
+    OutboxNotifyListener,
+    outbox_notify_drop_sql,
+    outbox_notify_install_sql,
+)
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class TestTriggerSql:
+    def test_install_is_statement_level_after_insert(self) -> None:
+        sql = " ".join(outbox_notify_install_sql())
+
+        assert "AFTER INSERT ON outbox_events" in sql
+        assert "FOR EACH STATEMENT" in sql
+        assert f"pg_notify('{OUTBOX_NOTIFY_CHANNEL}', '')" in sql
+
+    def test_install_is_rerunnable(self) -> None:
+        statements = outbox_notify_install_sql()
+
+        assert "CREATE OR REPLACE FUNCTION" in statements[0]
+        assert statements[1].startswith("DROP TRIGGER IF EXISTS outbox_events_notify")
+
+    def test_custom_table_and_channel(self) -> None:
+        sql = " ".join(outbox_notify_install_sql("saga_outbox", channel="saga"))
+
+        assert "AFTER INSERT ON saga_outbox" in sql
+        assert "pg_notify('saga', '')" in sql
+        assert "saga_outbox_notify()" in sql
+
+    def test_drop_removes_trigger_then_function(self) -> None:
+        assert outbox_notify_drop_sql() == [
+            "DROP TRIGGER IF EXISTS outbox_events_notify ON outbox_events",
+            "DROP FUNCTION IF EXISTS outbox_events_notify()",
+        ]
+
+
+class TestListener:
+    def test_rejects_non_asyncpg_engine(self, engine: AsyncEngine) -> None:
+        with pytest.raises(ValueError, match="asyncpg"):
+            OutboxNotifyListener(engine)
@@ -113,6 +113,18 @@ class TestFetchPending:
         entries = await repo.fetch_pending(batch_size=3)
         assert [e.event_type for e in entries] == ["o.e4", "o.e3", "o.e2"]
 
+    async def test_hot_window_skips_rows_created_before_it(self, session: AsyncSession) -> None:
+        repo = OutboxRepository(session, OutboxEventModel, hot_window=timedelta(days=1))
+        await repo.add(FakeEvent("h.old"), "h", "1")
+        await repo.add(FakeEvent("h.new"), "h", "2")
+        old = next(r for r in (await session.execute(select(OutboxEventModel))).scalars() if r.event_type == "h.old")
+        old.created_at = utcnow_naive() - timedelta(days=2)
+        await session.flush()
+
+        entries = await repo.fetch_pending(batch_size=10)
+
+        assert [e.event_type for e in entries] == ["h.new"]
+
 
 class TestStatusTransitions:
     async def test_mark_published(self, repo: OutboxRepository, session: AsyncSession) -> None:
@@ -125,6 +137,23 @@ class TestStatusTransitions:
         assert row.status == OutboxStatus.PUBLISHED
         assert row.published_at is not None
 
+    async def test_mark_published_many_updates_only_given_ids(
+        self, repo: OutboxRepository, session: AsyncSession
+    ) -> None:
+        for i in range(3):
+            await repo.add(FakeEvent(f"t.e{i}"), "t", str(i))
+        entries = await repo.fetch_pending()
+
+        updated = await repo.mark_published_many([entries[0].id, entries[2].id])
+
+        assert updated == 2
+        assert (await _get(session, entries[0].id)).status == OutboxStatus.PUBLISHED
+        assert (await _get(session, entries[1].id)).status == OutboxStatus.PENDING
+        assert (await _get(session, entries[2].id)).published_at is not None
+
+    async def test_mark_published_many_empty_is_noop(self, repo: OutboxRepository) -> None:
+        assert await repo.mark_published_many([]) == 0
+
     async def test_mark_failed_increments_attempts_and_sets_next_attempt(
         self, repo: OutboxRepository, session: AsyncSession
     ) -> None:
@@ -0,0 +1,194 @@
+"""PartitionedTable SQL/naming and PartitionMaintainer planning.
+
+The DDL itself is PostgreSQL-only; these tests pin the naming scheme
+both halves (Python and PL/pgSQL) rely on, the create/drop decisions and
+the statements ``run_once`` issues, per transaction, against a recording
+session.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from messaging.partitioning import OUTBOX_EVENTS, PartitionedTable, PartitionMaintainer
+
+#: A monthly spec; the standard ones are all daily.
+MONTHLY = PartitionedTable(name="audit_log", column="logged_at", interval="month")
+
+
+def _maintainer(table=OUTBOX_EVENTS, **kwargs) -> PartitionMaintainer:
+    return PartitionMaintainer(MagicMock(), table, **kwargs)
+
+
+class _RecordingSession:
+    """Stands in for an AsyncSession: records SQL, answers from ``database``."""
+
+    def __init__(self, database: _FakeDatabase) -> None:
+        self._database = database
+        self.statements: list[str] = []
+
+    async def __aenter__(self) -> _RecordingSession:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def execute(self, statement: Any, params: Any = None) -> MagicMock:
+        sql = " ".join(str(statement).split())
+        self.statements.append(sql)
+        if sql in self._database.failing:
+            raise RuntimeError(f"failed: {sql}")
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = self._database.partitions
+        result.scalar.return_value = self._database.default_rows and "_default WHERE" in sql
+        result.rowcount = 1
+        return result
+
+    async def commit(self) -> None:
+        self._database.committed.append(self.statements)
+
+
+class _FakeDatabase:
+    def __init__(self, partitions: list[str], *, default_rows: bool = False, failing: tuple[str, ...] = ()) -> None:
+        self.partitions = partitions
+        self.default_rows = default_rows
+        self.failing = failing
+        self.committed: list[list[str]] = []
+
+    def session(self) -> _RecordingSession:
+        return _RecordingSession(self)
+
+
+class TestPartitionedTable:
+    def test_daily_names_round_trip(self) -> None:
+        name = OUTBOX_EVENTS.partition_name(date(2026, 10, 17))
+
+        assert name == "outbox_events_p20261017"
+        assert OUTBOX_EVENTS.parse_partition(name) == date(2026, 10, 17)
+
+    def test_monthly_names_round_trip(self) -> None:
+        start = MONTHLY.partition_start(date(2026, 10, 17))
+
+        assert start == date(2026, 10, 1)
+        assert MONTHLY.parse_partition(MONTHLY.partition_name(start)) == start
+
+    def test_foreign_names_are_ignored(self) -> None:
+        assert OUTBOX_EVENTS.parse_partition("outbox_events_default") is None
+        assert OUTBOX_EVENTS.parse_partition("outbox_events_p202610") is None
+
+    def test_monthly_partition_bounds_wrap_the_year(self) -> None:
+        statements = MONTHLY.create_partition_sql(date(2026, 12, 1))
+
+        assert statements == [
+            "CREATE TABLE IF NOT EXISTS audit_log_p202612 PARTITION OF audit_log "
+            "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')"
+        ]
+
+    def test_convert_keys_on_id_and_partition_column(self) -> None:
+        statements = OUTBOX_EVENTS.convert_sql(indexes=["CREATE INDEX ix ON outbox_events (status)"])
+
+        assert statements[0] == "ALTER TABLE outbox_events RENAME TO outbox_events_unpartitioned"
+        assert "ALTER TABLE outbox_events ADD PRIMARY KEY (id, created_at)" in statements
+        assert "CREATE TABLE outbox_events_default PARTITION OF outbox_events DEFAULT" in statements
+        assert statements[-2:] == [
+            "DROP TABLE outbox_events_unpartitioned",
+            "CREATE INDEX ix ON outbox_events (status)",
+        ]
+
+
+class TestMaintenancePlan:
+    def test_creates_current_and_upcoming_partitions(self) -> None:
+        plan = _maintainer(retention=timedelta(days=7), premake=2).plan(
+            ["outbox_events_p20261017", "outbox_events_default"], date(2026, 10, 17)
+        )
+
+        assert plan.create == [date(2026, 10, 18), date(2026, 10, 19)]
+        assert plan.drop == []
+
+    def test_drops_partitions_entirely_past_retention(self) -> None:
+        existing = [OUTBOX_EVENTS.partition_name(date(2026, 10, day)) for day in range(8, 21)]
+
+        plan = _maintainer(retention=timedelta(days=7), premake=3).plan(existing, date(2026, 10, 17))
+
+        # The 9th ends on the 10th, exactly 7 days ago; the 10th still holds rows inside retention.
+        assert plan.drop == ["outbox_events_p20261008", "outbox_events_p20261009"]
+
+    def test_never_drops_the_current_month(self) -> None:
+        existing = [MONTHLY.partition_name(date(2026, month, 1)) for month in (8, 9, 10)]
+
+        plan = _maintainer(MONTHLY, retention=timedelta(days=30), premake=1).plan(existing, date(2026, 10, 17))
+
+        assert plan.drop == ["audit_log_p202608"]
+        assert plan.create == [date(2026, 11, 1)]
+
+
+class TestRunOnce:
+    @pytest.mark.asyncio()
+    async def test_rows_in_the_default_partition_are_moved_into_the_new_one(self) -> None:
+        database = _FakeDatabase(["outbox_events_default", "outbox_events_p20261017"], default_rows=True)
+        maintainer = PartitionMaintainer(
+            database.session, OUTBOX_EVENTS, retention=timedelta(days=7), premake=1, today=lambda: date(2026, 10, 17)
+        )
+
+        plan = await maintainer.run_once()
+
+        assert plan.create == [date(2026, 10, 18)]
+        in_range = "created_at >= '2026-10-18' AND created_at < '2026-10-19'"
+        create = next(statements for statements in database.committed if len(statements) > 1)
+        assert create == [
+            f"SELECT EXISTS (SELECT 1 FROM outbox_events_default WHERE {in_range})",
+            "CREATE TEMP TABLE partition_stranded_rows (LIKE outbox_events) ON COMMIT DROP",
+            f"WITH moved AS (DELETE FROM outbox_events_default WHERE {in_range} RETURNING *) "
+            "INSERT INTO partition_stranded_rows SELECT * FROM moved",
+            "CREATE TABLE IF NOT EXISTS outbox_events_p20261018 PARTITION OF outbox_events "
+            "FOR VALUES FROM ('2026-10-18') TO ('2026-10-19')",
+            "INSERT INTO outbox_events SELECT * FROM partition_stranded_rows",
+        ]
+
+    @pytest.mark.asyncio()
+    async def test_empty_default_range_creates_directly(self) -> None:
+        database = _FakeDatabase(["audit_log_default", "audit_log_p202610"])
+        maintainer = PartitionMaintainer(
+            database.session,
+            MONTHLY,
+            retention=timedelta(days=30),
+            premake=1,
+            today=lambda: date(2026, 10, 17),
+        )
+
+        await maintainer.run_once()
+
+        create = database.committed[-1]
+        assert len(create) == 2  # the check, CREATE TABLE
+        assert create[1].startswith("CREATE TABLE IF NOT EXISTS audit_log_p202611 ")
+
+    @pytest.mark.asyncio()
+    async def test_a_failed_step_does_not_block_the_others(self) -> None:
+        existing = [OUTBOX_EVENTS.partition_name(date(2026, 10, day)) for day in (8, 9, 17)]
+        database = _FakeDatabase(
+            existing,
+            failing=(
+                "CREATE TABLE IF NOT EXISTS outbox_events_p20261018 PARTITION OF outbox_events "
+                "FOR VALUES FROM ('2026-10-18') TO ('2026-10-19')",
+                "DROP TABLE outbox_events_p20261008",
+            ),
+        )
+        maintainer = PartitionMaintainer(
+            database.session, OUTBOX_EVENTS, retention=timedelta(days=7), premake=2, today=lambda: date(2026, 10, 17)
+        )
+        maintainer._has_live_rows = AsyncMock(return_value=False)  # type: ignore[method-assign]
+
+        plan = await maintainer.run_once()
+
+        assert plan.create == [date(2026, 10, 19)]
+        assert plan.drop == ["outbox_events_p20261009"]
+
+    def test_today_defaults_to_the_utc_date(self) -> None:
+        maintainer = PartitionMaintainer(MagicMock(), OUTBOX_EVENTS, retention=timedelta(days=7))
+        late_evening_utc = datetime(2026, 10, 17, 23, 30, tzinfo=timezone.utc)
+
+        with patch("messaging.partitioning.utcnow", return_value=late_evening_utc):
+            assert maintainer._today() == date(2026, 10, 17)
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 from aio_pika import DeliveryMode, Message
+from contracts.codec import MSGPACK_CONTENT_TYPE
 from messaging.rabbitmq import EXCHANGE_NAME, RabbitMQPublisher
 
 from tests.conftest import FakeEvent
@@ -48,6 +49,18 @@ class TestPublish:
         assert message.content_type == "application/json"
         assert json.loads(message.body) == json.loads(event.to_json())
 
+    async def test_publish_with_msgpack_content_type(self) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        publisher = RabbitMQPublisher("amqp://test", content_type=MSGPACK_CONTENT_TYPE)
+        publisher._exchange = AsyncMock()
+        event = FakeEvent("user.created", user_id=1)
+
+        await publisher.publish(event)
+
+        message = publisher._exchange.publish.await_args.args[0]
+        assert message.content_type == MSGPACK_CONTENT_TYPE
+        assert msgpack.unpackb(message.body) == json.loads(event.to_json())
+
     async def test_publish_raw_forwards_message_and_routing_key(self) -> None:
         publisher = self._connected()
         message = Message(body=b'{"k": 1}')
@@ -0,0 +1,85 @@
+"""Delay-tier naming, selection and declaration."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from messaging.retry import RETRY_HEADER, RetryTiers, exponential_delays, read_retry_count
+
+QUEUE = "svc.thing"
+
+
+class TestTierSelection:
+    def test_retry_count_picks_tier_and_last_tier_repeats(self) -> None:
+        tiers = RetryTiers(QUEUE, (1.0, 5.0, 25.0))
+
+        assert [tiers.queue_for(n) for n in (1, 2, 3, 4)] == [
+            "svc.thing.retry.1000ms",
+            "svc.thing.retry.5000ms",
+            "svc.thing.retry.25000ms",
+            "svc.thing.retry.25000ms",
+        ]
+
+    def test_rejects_empty_or_non_positive_delays(self) -> None:
+        with pytest.raises(ValueError):
+            RetryTiers(QUEUE, ())
+        with pytest.raises(ValueError):
+            RetryTiers(QUEUE, (1.0, 0.0))
+
+    def test_exponential_delays_are_capped(self) -> None:
+        assert exponential_delays(5, base_s=2.0, factor=4.0, cap_s=100.0) == (2.0, 8.0, 32.0, 100.0, 100.0)
+
+
+class TestDeclare:
+    async def test_tier_queues_dead_letter_back_to_main_queue(self) -> None:
+        channel = MagicMock()
+        channel.declare_queue = AsyncMock()
+
+        await RetryTiers(QUEUE, (1.0, 0.5)).declare(channel)
+
+        calls = {call.args[0]: call.kwargs["arguments"] for call in channel.declare_queue.await_args_list}
+        assert calls == {
+            "svc.thing.retry.1000ms": {
+                "x-message-ttl": 1000,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": QUEUE,
+            },
+            "svc.thing.retry.500ms": {
+                "x-message-ttl": 500,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": QUEUE,
+            },
+        }
+
+
+class TestSchedule:
+    async def test_publishes_to_tier_with_headers_preserved(self) -> None:
+        channel = MagicMock()
+        channel.default_exchange.publish = AsyncMock()
+
+        await RetryTiers(QUEUE).schedule(channel, b"{}", 2, headers={"x-trace": "t-1", RETRY_HEADER: 1})
+
+        message = channel.default_exchange.publish.await_args.args[0]
+        assert channel.default_exchange.publish.await_args.kwargs["routing_key"] == "svc.thing.retry.5000ms"
+        assert message.headers == {"x-trace": "t-1", RETRY_HEADER: 2}
+        assert message.body == b"{}"
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        (None, 0),
+        ({}, 0),
+        ({RETRY_HEADER: 2}, 2),
+        ({RETRY_HEADER: "3"}, 3),
+        ({RETRY_HEADER: b"1"}, 1),
+        ({RETRY_HEADER: Decimal("2")}, 2),
+        ({RETRY_HEADER: True}, 0),
+        ({RETRY_HEADER: "nope"}, 0),
+        ({RETRY_HEADER: [1]}, 0),
+    ],
+)
+def test_read_retry_count(headers: dict | None, expected: int) -> None:
+    assert read_retry_count(headers) == expected
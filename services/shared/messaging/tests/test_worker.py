@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from collections.abc import Callable
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from aio_pika import Message
+from contracts.codec import MSGPACK_CONTENT_TYPE
 from messaging.outbox import OutboxRepository, OutboxStatus
 from messaging.time import utcnow_naive
 from messaging.worker import OutboxPublisherWorker
@@ -87,6 +90,18 @@ class TestProcessBatch:
         assert rows[0].status == OutboxStatus.PUBLISHED
         assert rows[0].published_at is not None
 
+    async def test_content_type_transcodes_stored_payload(self, session_factory: Callable[[], AsyncSession]) -> None:
+        msgpack = pytest.importorskip("msgpack")
+        event = FakeEvent("user.created", user_id=1)
+        await _seed(session_factory, event)
+        publisher = FakePublisher()
+        worker = _make_worker(session_factory, publisher, content_type=MSGPACK_CONTENT_TYPE)
+
+        await worker._process_batch()
+
+        ((body, _),) = publisher.published
+        assert msgpack.unpackb(body) == json.loads(event.to_json())
+
     async def test_per_entry_commit_keeps_marks_when_later_entry_fails(
         self, session_factory: Callable[[], AsyncSession]
     ) -> None:
@@ -158,7 +173,124 @@ class TestProcessBatch:
         assert await worker._process_batch() == 0
 
 
+class TestPipelinedBatch:
+    async def test_publishes_whole_batch_and_marks_published(self, session_factory: Callable[[], AsyncSession]) -> None:
+        events = [FakeEvent(f"p.e{i}") for i in range(5)]
+        await _seed(session_factory, *events)
+        publisher = FakePublisher()
+        worker = _make_worker(session_factory, publisher, pipelined=True)
+
+        processed = await worker._process_batch()
+
+        assert processed == 5
+        assert sorted(rk for _, rk in publisher.published) == sorted(e.event_type for e in events)
+        assert all(r.status == OutboxStatus.PUBLISHED for r in await _rows(session_factory))
+
+    async def test_only_failed_entries_go_through_record_failure(
+        self, session_factory: Callable[[], AsyncSession]
+    ) -> None:
+        await _seed(session_factory, FakeEvent("q.one"), FakeEvent("q.two"), FakeEvent("q.three"))
+        publisher = FakePublisher(fail_times=1)
+        worker = _make_worker(session_factory, publisher, pipelined=True)
+
+        await worker._process_batch()
+
+        rows = await _rows(session_factory)
+        assert sorted(r.status for r in rows) == [
+            OutboxStatus.FAILED,
+            OutboxStatus.PUBLISHED,
+            OutboxStatus.PUBLISHED,
+        ]
+        failed = next(r for r in rows if r.status == OutboxStatus.FAILED)
+        assert failed.attempts == 1
+        assert failed.published_at is None
+
+    async def test_unconfirmed_publish_times_out_as_failure(self, session_factory: Callable[[], AsyncSession]) -> None:
+        class HangingPublisher(FakePublisher):
+            async def publish_raw(self, message: Message, routing_key: str) -> None:
+                await asyncio.sleep(10)
+
+        await _seed(session_factory, FakeEvent("r.hang"))
+        worker = _make_worker(session_factory, HangingPublisher(), pipelined=True, confirm_timeout=0.01)
+
+        await worker._process_batch()
+
+        row = (await _rows(session_factory))[0]
+        assert row.status == OutboxStatus.FAILED
+        assert row.attempts == 1
+
+    async def test_falls_back_to_per_id_mark_for_custom_repositories(
+        self, session_factory: Callable[[], AsyncSession]
+    ) -> None:
+        class LegacyRepo:
+            """Custom repository without ``mark_published_many``."""
+
+            def __init__(self, session: AsyncSession) -> None:
+                self._inner = OutboxRepository(session, OutboxEventModel)
+                self.fetch_pending = self._inner.fetch_pending
+                self.mark_published = self._inner.mark_published
+                self.record_failure = self._inner.record_failure
+
+        await _seed(session_factory, FakeEvent("s.one"), FakeEvent("s.two"))
+        worker = OutboxPublisherWorker(
+            session_factory,
+            lambda session: LegacyRepo(session),
+            publisher=FakePublisher(),
+            pipelined=True,
+        )
+
+        assert await worker._process_batch() == 2
+        assert all(r.status == OutboxStatus.PUBLISHED for r in await _rows(session_factory))
+
+
+class FakeWakeup:
+    def __init__(self) -> None:
+        self.waits = 0
+        self.closed = False
+
+    async def wait(self) -> None:
+        self.waits += 1
+        await asyncio.sleep(0)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class BlockingWakeup(FakeWakeup):
+    async def wait(self) -> None:
+        self.waits += 1
+        await asyncio.Event().wait()
+
+
+class TestWakeup:
+    async def test_idle_waits_on_wakeup_instead_of_sleeping(self, session_factory: Callable[[], AsyncSession]) -> None:
+        wakeup = FakeWakeup()
+        worker = _make_worker(session_factory, FakePublisher(), wakeup=wakeup)
+
+        async with asyncio.timeout(1):
+            await worker._idle()
+
+        assert wakeup.waits == 1
+
+    async def test_close_closes_wakeup(self, session_factory: Callable[[], AsyncSession]) -> None:
+        wakeup = FakeWakeup()
+        worker = _make_worker(session_factory, FakePublisher(), wakeup=wakeup)
+
+        await worker.close()
+
+        assert wakeup.closed
+
+
 class TestRunForever:
+    async def test_stop_returns_from_idle_loop(self, session_factory: Callable[[], AsyncSession]) -> None:
+        worker = _make_worker(session_factory, FakePublisher(), wakeup=BlockingWakeup())
+
+        run = asyncio.create_task(worker.run_forever())
+        await asyncio.sleep(0.05)
+        worker.stop()
+
+        await asyncio.wait_for(run, timeout=1)
+
     @pytest.mark.xfail(
         reason=(
             "Harness race, not a worker defect: the test cancels run_forever the "
@@ -220,3 +352,25 @@ class TestRunForever:
         await worker._maybe_purge()
 
         assert await _rows(session_factory) == []
+
+    async def test_partition_maintainers_run_on_housekeeping_tick(
+        self, session_factory: Callable[[], AsyncSession]
+    ) -> None:
+        maintainer = MagicMock()
+        maintainer.run_once = AsyncMock()
+        worker = _make_worker(session_factory, FakePublisher(), partitions=[maintainer], purge_interval=3600.0)
+
+        await worker._maybe_purge()
+        await worker._maybe_purge()  # same tick — skipped
+
+        maintainer.run_once.assert_awaited_once()
+
+    async def test_inbox_purge_runs_on_housekeeping_tick(self, session_factory: Callable[[], AsyncSession]) -> None:
+        purger = MagicMock()
+        purger.run_once = AsyncMock(return_value=0)
+        worker = _make_worker(session_factory, FakePublisher(), inbox_purge=purger, purge_interval=3600.0)
+
+        await worker._maybe_purge()
+        await worker._maybe_purge()  # same tick — skipped
+
+        purger.run_once.assert_awaited_once()
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import date
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 
 from app.application.dto import (
     BulkCreateResultDTO,
@@ -12,11 +13,13 @@ from app.application.dto import (
     CSVImportResultDTO,
     PlannedTransactionResponse,
     TransactionFiltersDTO,
+    TransactionFilterSetDTO,
     TransactionListResultDTO,
     TransactionResponse,
     UpdatePlannedTransactionDTO,
     UpdateTransactionDTO,
 )
+from app.application.export import ExportFormat
 from app.application.ports.inbound import ITransactionService
 from app.auth import get_current_user_id
 from app.config import settings
@@ -85,6 +88,14 @@ async def list_transactions(
     # and ship that before this.
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=200),
+    # Opt-in keyset paging: ``?cursor=`` (empty) starts at the top, then
+    # pass each response's ``next_cursor`` until it is null.  O(page) at
+    # any depth; ``skip`` must stay 0.  OFFSET mode is untouched — the
+    # backfill and the frontend keep using it.
+    cursor: str | None = Query(default=None, max_length=64),
+    # ``false`` drops the COUNT (``total_count`` is null).  In cursor mode
+    # the total is cached per filter set, so leaving it on is cheap too.
+    include_total: bool = True,
 ) -> TransactionListResultDTO:
     filters = TransactionFiltersDTO(
         account_id=account_id,
@@ -94,10 +105,49 @@ async def list_transactions(
         transaction_type=transaction_type,
         skip=skip,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     return await service.list_transactions(user_id, filters)
 
 
+# Declared before ``/{transaction_id}``, which would otherwise claim the path
+# and 422 on "export" as an id.
+@transaction_router.get("/export", response_class=StreamingResponse)
+async def export_transactions(
+    user_id: int = Depends(get_current_user_id),
+    service: ITransactionService = Depends(get_transaction_service),
+    account_id: int | None = None,
+    category_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    transaction_type: TransactionType | None = None,
+    export_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+) -> StreamingResponse:
+    """The whole filtered set as one download — no paging, constant memory.
+
+    The body is produced while it is sent, so the ``get_db`` session stays
+    open for the length of the download: FastAPI >= 0.118 (the locked
+    version) exits yield-dependencies only after a streamed response has
+    finished.  A failure mid-stream truncates the body; there is no status
+    code left to change by then.
+    """
+    filters = TransactionFilterSetDTO(
+        account_id=account_id,
+        category_id=category_id,
+        start_date=start_date,
+        end_date=end_date,
+        transaction_type=transaction_type,
+    )
+    chunks = service.export_transactions(user_id, filters, export_format)
+    filename = f"transactions.{export_format.value}"
+    return StreamingResponse(
+        chunks,
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @transaction_router.get("/{transaction_id}", response_model=TransactionResponse)
 async def get_transaction(
     transaction_id: int,
@@ -149,14 +199,13 @@ _ALLOWED_CSV_CONTENT_TYPES = frozenset(
 
 
 def _reject_unimportable_upload(file: UploadFile) -> None:
-    """Guard the CSV upload before its bytes are pulled into memory (P2-29).
-
-    Runs before ``file.read()`` on purpose. FastAPI has already parsed the
-    multipart body by the time this handler is entered, so the payload is
-    spooled to disk and ``file.size`` is known and trustworthy — it is counted
-    from received bytes, not read from a client header. The memory blow-up is
-    ``read()`` itself, which holds three live copies of the payload
-    (bytes → str → StringIO) against a 512Mi pod limit.
+    """Guard the CSV upload before it is parsed (P2-29).
+
+    FastAPI has already parsed the multipart body by the time this handler is
+    entered, so the payload is spooled to disk and ``file.size`` is known and
+    trustworthy — it is counted from received bytes, not read from a client
+    header. The import streams the spooled file rather than ``read()``-ing it,
+    so this bounds how long one import may run, not its memory.
     """
     # Only a full-blown "wrong kind of file" is rejected; see the allowlist note.
     media_type = (file.content_type or "").split(";")[0].strip().lower()
@@ -168,7 +217,7 @@ def _reject_unimportable_upload(file: UploadFile) -> None:
 
     # size is Optional: absent when the client sends no content-length for the
     # part. Fall through in that case rather than treating unknown as zero —
-    # the row cap in ParsedCSVResult.add_row is the backstop.
+    # the row cap in ParsedCSVResult.count_row is the backstop.
     if file.size is not None and file.size > settings.CSV_MAX_BYTES:
         limit_mib = settings.CSV_MAX_BYTES // (1024 * 1024)
         raise HTTPException(
@@ -187,10 +236,11 @@ async def import_csv(
     account_name: str | None = Form(None),
 ) -> CSVImportResultDTO:
     _reject_unimportable_upload(file)
-    content = await file.read()
+    # The spooled file itself, not ``await file.read()``: the parser reads
+    # it in chunks, so the upload is never in memory as a whole.
     return await service.import_csv(
         user_id,
-        content,
+        file.file,
         bank_format=bank_format,
         account_id=account_id,
         account_name=account_name,
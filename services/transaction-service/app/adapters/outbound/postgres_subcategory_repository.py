@@ -18,6 +18,10 @@ class PostgresSubCategoryReadRepository(ISubCategoryReadRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    async def find_all(self) -> list[SubCategory]:
+        result = await self._session.execute(select(SubCategoryModel).order_by(SubCategoryModel.id))
+        return [self._to_entity(m) for m in result.scalars().all()]
+
     async def find_by_id(self, subcategory_id: int) -> SubCategory | None:
         stmt = select(SubCategoryModel).where(SubCategoryModel.id == subcategory_id)
         result = await self._session.execute(stmt)
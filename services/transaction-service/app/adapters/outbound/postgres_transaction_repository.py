@@ -1,16 +1,55 @@
 from __future__ import annotations
 
+import hashlib
+from collections.abc import AsyncIterator, Sequence
 from datetime import date
 from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import func, select, tuple_, update
+from sqlalchemy import Row, func, insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.elements import ColumnElement
 
 from app.application.ports.outbound import DedupKey, ExternalIdKey, ITransactionRepository
 from app.domain.entities import Transaction, TransactionType
 from app.models import TransactionModel
 
+#: Columns whose change moves a row to another dedup key.
+_DEDUP_KEY_FIELDS = frozenset({"account_id", "amount", "description", "date"})
+_CENT = Decimal("0.01")
+
+
+def dedup_fingerprint(
+    user_id: int,
+    account_id: int,
+    tx_date: date,
+    amount: Decimal,
+    description: str | None,
+) -> str:
+    """SHA-256 (hex) of the import dedup key ``(user_id, account_id, date,
+    amount, description)``.
+
+    Must stay byte-for-byte equal to the SQL backfill in migration 018:
+    ``concat_ws('|', user_id, account_id, date, amount::text, d)`` where
+    ``d`` is ``''`` for NULL and ``'=' || description`` otherwise — the
+    marker keeps a NULL description apart from an empty one, as the
+    tuple key always did.  The amount is rendered at the column's scale,
+    so ``49.9`` and ``49.90`` are one key, as they are in ``NUMERIC(12, 2)``.
+    """
+    text = "|".join(
+        (
+            str(user_id),
+            str(account_id),
+            tx_date.isoformat(),
+            str(Decimal(amount).quantize(_CENT)),
+            "" if description is None else "=" + description,
+        )
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
 
 class PostgresTransactionRepository(ITransactionRepository):
     def __init__(self, session: AsyncSession) -> None:
@@ -32,25 +71,27 @@ class PostgresTransactionRepository(ITransactionRepository):
         categorization_tier: str | None = None,
         categorization_confidence: str | None = None,
     ) -> Transaction:
-        model = TransactionModel(
-            user_id=user_id,
-            account_id=account_id,
-            account_name=account_name,
-            category_id=category_id,
-            category_name=category_name,
-            amount=amount,
-            transaction_type=transaction_type.value,
-            description=description,
-            date=tx_date,
-            subcategory_id=subcategory_id,
-            subcategory_name=subcategory_name,
-            categorization_tier=categorization_tier,
-            categorization_confidence=categorization_confidence,
+        """A manual entry: always inserted, claiming its dedup key if free."""
+        [created] = await self.bulk_create(
+            [
+                {
+                    "user_id": user_id,
+                    "account_id": account_id,
+                    "account_name": account_name,
+                    "category_id": category_id,
+                    "category_name": category_name,
+                    "amount": amount,
+                    "transaction_type": transaction_type,
+                    "description": description,
+                    "tx_date": tx_date,
+                    "subcategory_id": subcategory_id,
+                    "subcategory_name": subcategory_name,
+                    "categorization_tier": categorization_tier,
+                    "categorization_confidence": categorization_confidence,
+                }
+            ]
         )
-        self._session.add(model)
-        await self._session.flush()
-        await self._session.refresh(model)
-        return self._to_entity(model)
+        return created
 
     async def find_by_id(self, transaction_id: int, user_id: int) -> Transaction | None:
         stmt = select(TransactionModel).where(
@@ -132,6 +173,66 @@ class PostgresTransactionRepository(ITransactionRepository):
         result = await self._session.execute(stmt)
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def find_page_after(
+        self,
+        user_id: int,
+        after: tuple[date, int] | None,
+        limit: int,
+        account_id: int | None = None,
+        category_id: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        transaction_type: TransactionType | None = None,
+    ) -> list[Transaction]:
+        """Keyset counterpart of :meth:`find_filtered` — no OFFSET to walk.
+
+        The row comparison ``(date, id) < (:date, :id)`` matches the
+        ``date DESC, id DESC`` order exactly, so Postgres turns it into an
+        index range start on ``ix_transactions_user_date_id`` (migration
+        017) and reads ``limit`` entries from there, at any depth.
+        """
+        clauses = self._filter_clauses(user_id, account_id, category_id, start_date, end_date, transaction_type)
+        if after is not None:
+            clauses.append(tuple_(TransactionModel.date, TransactionModel.id) < tuple_(*after))
+        stmt = (
+            select(TransactionModel)
+            .where(*clauses)
+            .order_by(TransactionModel.date.desc(), TransactionModel.id.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [self._to_entity(m) for m in result.scalars().all()]
+
+    async def stream_filtered(
+        self,
+        user_id: int,
+        columns: Sequence[str],
+        batch_size: int,
+        account_id: int | None = None,
+        category_id: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        transaction_type: TransactionType | None = None,
+    ) -> AsyncIterator[list[Sequence[Any]]]:
+        """Server-side cursor over the filtered set, ``batch_size`` rows per fetch.
+
+        Core columns rather than ORM entities: a million-row export must
+        not build a million identity-map entries it will never look at.
+        """
+        table = TransactionModel.__table__
+        stmt = (
+            select(*(table.c[name] for name in columns))
+            .where(*self._filter_clauses(user_id, account_id, category_id, start_date, end_date, transaction_type))
+            .order_by(TransactionModel.date.desc(), TransactionModel.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(stmt)
+        try:
+            async for partition in result.partitions():
+                yield list(partition)
+        finally:
+            await result.close()
+
     async def count_filtered(
         self,
         user_id: int,
@@ -169,15 +270,47 @@ class PostgresTransactionRepository(ITransactionRepository):
 
             raise TransactionNotFoundException(transaction_id)
 
+        key_changed = False
         for key, value in fields.items():
             if key == "transaction_type" and value is not None:
                 value = value.value if isinstance(value, TransactionType) else value
+            if key in _DEDUP_KEY_FIELDS and value != getattr(model, key):
+                # The row no longer has the key it claimed; release it.
+                model.dedup_fingerprint = None
+                key_changed = True
             setattr(model, key, value)
 
         await self._session.flush()
+        if key_changed:
+            await self._claim_edited_key(model)
         await self._session.refresh(model)
         return self._to_entity(model)
 
+    async def _claim_edited_key(self, model: TransactionModel) -> None:
+        """Claim the new dedup key of an edited row if no live row holds it.
+
+        Without this an edited row stayed unclaimed, and re-importing the
+        file it now matches inserted it a second time.  The ``NOT EXISTS``
+        leaves a held key alone; the savepoint covers a concurrent import
+        claiming it in between, so a user's edit never fails on the unique
+        index — the row just keeps NULL, like any unclaimed twin.
+        """
+        fingerprint = dedup_fingerprint(model.user_id, model.account_id, model.date, model.amount, model.description)
+        holder = aliased(TransactionModel)
+        stmt = (
+            update(TransactionModel)
+            .where(
+                TransactionModel.id == model.id,
+                ~select(holder.id).where(holder.dedup_fingerprint == fingerprint, holder.deleted_at.is_(None)).exists(),
+            )
+            .values(dedup_fingerprint=fingerprint)
+        )
+        try:
+            async with self._session.begin_nested():
+                await self._session.execute(stmt)
+        except IntegrityError:
+            pass
+
     async def delete(self, transaction_id: int, user_id: int) -> bool:
         """Soft-delete (P2-25): stamp ``deleted_at`` instead of removing the row.
 
@@ -305,38 +438,105 @@ class PostgresTransactionRepository(ITransactionRepository):
         return existing
 
     async def bulk_create(self, transactions: list[dict]) -> list[Transaction]:
-        models = []
-        for tx in transactions:
-            tx_type = tx.get("transaction_type", "expense")
-            if isinstance(tx_type, TransactionType):
-                tx_type = tx_type.value
-            models.append(
-                TransactionModel(
-                    user_id=tx["user_id"],
-                    account_id=tx["account_id"],
-                    account_name=tx["account_name"],
-                    category_id=tx.get("category_id"),
-                    category_name=tx.get("category_name"),
-                    amount=tx["amount"],
-                    transaction_type=tx_type,
-                    description=tx.get("description"),
-                    date=tx["tx_date"],
-                    subcategory_id=tx.get("subcategory_id"),
-                    subcategory_name=tx.get("subcategory_name"),
-                    categorization_tier=tx.get("categorization_tier"),
-                    categorization_confidence=tx.get("categorization_confidence"),
-                    external_id=tx.get("external_id"),
-                    currency=tx.get("currency", "DKK"),
-                )
+        """Insert every one of ``transactions``; return them as entities, in order.
+
+        Each row claims its dedup fingerprint if no live row holds it yet
+        (migration 018); a row whose key is taken — a deliberate duplicate,
+        such as a second identical purchase or a bank row with its own
+        ``external_id`` — is stored without one.  That is one
+        ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` plus, only when
+        something conflicted, a plain ``INSERT ... RETURNING`` for the rest.
+
+        The returned rows carry the generated ids and server defaults
+        (``created_at``, ``currency``); callers zip the result back to their
+        items, so it is put back into input order.
+        """
+        if not transactions:
+            return []
+        params = [self._insert_params(tx) for tx in transactions]
+        claimed = await self._insert_claiming(params)
+
+        created: list[Transaction | None] = [claimed.pop(p["dedup_fingerprint"], None) for p in params]
+        unclaimed = [index for index, tx in enumerate(created) if tx is None]
+        if unclaimed:
+            rest = [{**params[index], "dedup_fingerprint": None} for index in unclaimed]
+            stmt = insert(TransactionModel.__table__).returning(
+                *TransactionModel.__table__.c, sort_by_parameter_order=True
             )
-        self._session.add_all(models)
-        await self._session.flush()
-        for m in models:
-            await self._session.refresh(m)
-        return [self._to_entity(m) for m in models]
+            result = await self._session.execute(stmt, rest)
+            for index, row in zip(unclaimed, result, strict=True):
+                created[index] = self._to_entity(row)
+        return [tx for tx in created if tx is not None]
+
+    async def insert_new(self, transactions: list[dict]) -> list[Transaction]:
+        """Insert the rows whose dedup key no live row holds; skip the rest.
+
+        One ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` against the
+        partial unique index on ``dedup_fingerprint``: there is no window
+        between a check and the insert for a concurrent import to slip
+        through — the second importer waits on the index and skips.  A key
+        repeated within ``transactions`` is inserted once.  Returned in
+        input order; duplicates are ``len(transactions) - len(result)``.
+        """
+        if not transactions:
+            return []
+        claimed = await self._insert_claiming([self._insert_params(tx) for tx in transactions])
+        return list(claimed.values())
+
+    async def _insert_claiming(self, params: list[dict]) -> dict[str, Transaction]:
+        """``ON CONFLICT DO NOTHING`` insert of the first row per fingerprint.
+
+        Keyed by fingerprint, in input order.  Repeats are dropped before
+        the statement rather than left to the conflict clause, so each
+        returned row maps back to exactly one input.
+        """
+        first: dict[str, dict] = {}
+        for p in params:
+            first.setdefault(p["dedup_fingerprint"], p)
+        table = TransactionModel.__table__
+        dialect_insert = sqlite.insert if self._session.get_bind().dialect.name == "sqlite" else postgresql.insert
+        stmt = (
+            dialect_insert(table)
+            .on_conflict_do_nothing(
+                index_elements=[table.c.dedup_fingerprint],
+                index_where=table.c.dedup_fingerprint.is_not(None) & table.c.deleted_at.is_(None),
+            )
+            .returning(*table.c)
+        )
+        result = await self._session.execute(stmt, list(first.values()))
+        inserted = {row.dedup_fingerprint: self._to_entity(row) for row in result}
+        return {fp: inserted[fp] for fp in first if fp in inserted}
+
+    @staticmethod
+    def _insert_params(tx: dict) -> dict:
+        tx_type = tx.get("transaction_type", "expense")
+        if isinstance(tx_type, TransactionType):
+            tx_type = tx_type.value
+        # Every row carries every key: executemany needs one parameter
+        # shape for the whole batch.
+        return {
+            "user_id": tx["user_id"],
+            "account_id": tx["account_id"],
+            "account_name": tx["account_name"],
+            "category_id": tx.get("category_id"),
+            "category_name": tx.get("category_name"),
+            "amount": tx["amount"],
+            "transaction_type": tx_type,
+            "description": tx.get("description"),
+            "date": tx["tx_date"],
+            "subcategory_id": tx.get("subcategory_id"),
+            "subcategory_name": tx.get("subcategory_name"),
+            "categorization_tier": tx.get("categorization_tier"),
+            "categorization_confidence": tx.get("categorization_confidence"),
+            "external_id": tx.get("external_id"),
+            "currency": tx.get("currency", "DKK"),
+            "dedup_fingerprint": dedup_fingerprint(
+                tx["user_id"], tx["account_id"], tx["tx_date"], tx["amount"], tx.get("description")
+            ),
+        }
 
     @staticmethod
-    def _to_entity(model: TransactionModel) -> Transaction:
+    def _to_entity(model: TransactionModel | Row[Any]) -> Transaction:
         return Transaction(
             id=model.id,
             user_id=model.user_id,
@@ -0,0 +1,82 @@
+"""Cross-process invalidation of :class:`~app.application.taxonomy_cache.TaxonomyCache`.
+
+The taxonomy sync consumer runs in its own process; the API workers and
+the categorized consumer each hold their own snapshot.  The consumer
+raises ``NOTIFY taxonomy_changed`` inside the transaction that writes
+the read copy — Postgres delivers it at commit, never for a write that
+rolled back — and every holder of a cache runs a
+:class:`TaxonomyInvalidator` that ``LISTEN``s and marks its snapshot
+stale.
+
+The listening half is ``messaging``'s :class:`OutboxNotifyListener` on
+another channel: one dedicated connection, reconnect with a fallback
+poll.  Its wait also returns after that poll and right after each
+(re)connect — when notifications may have been missed — and both
+invalidate too, which with the poll set to the cache TTL costs nothing
+the TTL would not.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+
+from messaging import OutboxNotifyListener
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.application.taxonomy_cache import TaxonomyCache
+
+logger = logging.getLogger(__name__)
+
+#: Channel the taxonomy sync consumer notifies on.
+TAXONOMY_NOTIFY_CHANNEL = "taxonomy_changed"
+
+
+async def notify_taxonomy_changed(session: AsyncSession) -> None:
+    """Queue the notification in ``session``'s transaction (Postgres only)."""
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    await session.execute(text("SELECT pg_notify(:channel, '')"), {"channel": TAXONOMY_NOTIFY_CHANNEL})
+
+
+class TaxonomyInvalidator:
+    """Invalidates ``cache`` on every ``taxonomy_changed`` notification.
+
+    A no-op on engines other than asyncpg (sqlite in tests): those
+    processes fall back on the cache's TTL alone.
+    """
+
+    def __init__(self, engine: AsyncEngine, cache: TaxonomyCache, *, safety_poll_interval: float) -> None:
+        self._engine = engine
+        self._cache = cache
+        self._safety_poll_interval = safety_poll_interval
+        self._listener: OutboxNotifyListener | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is not None or self._engine.dialect.driver != "asyncpg":
+            return
+        self._listener = OutboxNotifyListener(
+            self._engine,
+            TAXONOMY_NOTIFY_CHANNEL,
+            safety_poll_interval=self._safety_poll_interval,
+        )
+        self._task = asyncio.create_task(self._run(self._listener), name="taxonomy-invalidator")
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        listener, self._listener = self._listener, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if listener is not None:
+            await listener.close()
+
+    async def _run(self, listener: OutboxNotifyListener) -> None:
+        while True:
+            await listener.wait()
+            self._cache.invalidate()
+            logger.debug("Taxonomy snapshot invalidated (version %d)", self._cache.version)
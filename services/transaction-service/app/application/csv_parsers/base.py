@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import BinaryIO, Protocol
 
 from app.config import settings
 from app.domain.exceptions import CSVImportException
@@ -11,39 +12,76 @@ from app.domain.exceptions import CSVImportException
 class ParsedCSVResult:
     """Outcome of parsing a bank CSV file.
 
-    ``rows`` contains dicts ready for ``ITransactionRepository.bulk_create``.
-    ``errors`` holds per-row error messages (e.g. "Row 3: invalid amount").
+    ``rows`` contains dicts ready for ``ITransactionRepository.bulk_create``
+    — filled by :meth:`CSVParserBase.parse` only; the streaming
+    ``iter_rows`` hands rows on instead and leaves it empty.
+    ``errors`` holds per-row error messages (e.g. "Row 3: invalid amount"),
+    at most ``CSV_MAX_REPORTED_ERRORS`` of them.
     ``skipped`` is the count of rows that could not be parsed.
+    ``parsed`` is the count of rows that could.
     """
 
     rows: list[dict] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     skipped: int = 0
+    parsed: int = 0
 
-    def add_row(self, row: dict) -> None:
-        """Append a parsed row, enforcing the row cap (P2-29).
-
-        Every parser appends through here rather than touching ``rows``
-        directly, so the cap has one implementation instead of three. It is
-        checked *during* parsing on purpose: enforcing it afterwards would let
-        the list grow unbounded first, which is the thing being prevented.
+    def count_row(self) -> None:
+        """Count one parsed row, enforcing the row cap (P2-29).
 
-        The cap also bounds what ``import_csv`` commits — one ``bulk_create``
-        plus one outbox batch in a single transaction.
+        Every parser counts through here before handing a row on, so the
+        cap has one implementation instead of three. It is checked *during*
+        parsing on purpose: the import is one DB transaction, so a file
+        over the cap is rejected before anything is committed.
         """
-        if len(self.rows) >= settings.CSV_MAX_ROWS:
+        if self.parsed >= settings.CSV_MAX_ROWS:
             # Danish thousands separator is ".", so format explicitly rather
             # than letting f-string ",": render 50,000 into a Danish message.
             limit = f"{settings.CSV_MAX_ROWS:,}".replace(",", ".")
             raise CSVImportException(
                 f"CSV-filen har for mange rækker (grænsen er {limit} rækker). Del filen op i flere mindre importer."
             )
+        self.parsed += 1
+
+    def add_row(self, row: dict) -> None:
+        """Count and keep a parsed row."""
+        self.count_row()
         self.rows.append(row)
 
+    def add_error(self, row_num: int, exc: Exception) -> None:
+        """Record an unparseable row; only the first messages are kept.
+
+        ``skipped`` counts them all — the message list is capped so a file
+        of garbage cannot grow the response with the file.
+        """
+        self.skipped += 1
+        if len(self.errors) < settings.CSV_MAX_REPORTED_ERRORS:
+            self.errors.append(f"Row {row_num}: {exc}")
+
+    @property
+    def rows_read(self) -> int:
+        return self.parsed + self.skipped
+
 
 class BankCSVParser(Protocol):
     """Contract that every bank-format CSV parser must satisfy."""
 
+    def iter_rows(
+        self,
+        source: bytes | BinaryIO,
+        user_id: int,
+        account_id: int,
+        account_name: str,
+        result: ParsedCSVResult,
+    ) -> Iterator[dict]:
+        """Yield parsed rows while reading ``source`` incrementally.
+
+        Per-row errors and counts go to ``result``; a file-level problem
+        (no header, missing columns, row cap) raises
+        :class:`CSVImportException` from the generator.
+        """
+        ...
+
     def parse(
         self,
         file_content: bytes,
@@ -51,3 +89,37 @@ class BankCSVParser(Protocol):
         account_id: int,
         account_name: str,
     ) -> ParsedCSVResult: ...
+
+
+class CSVParserBase:
+    """``parse`` for parsers that implement ``iter_rows``.
+
+    ``encoding`` decodes the file; ``fallback_encoding``, when set, takes
+    over from the first chunk that does not decode (see
+    :func:`~app.application.csv_parsers.utils.iter_lines`).
+    """
+
+    encoding = "utf-8"
+    fallback_encoding: str | None = None
+
+    def iter_rows(
+        self,
+        source: bytes | BinaryIO,
+        user_id: int,
+        account_id: int,
+        account_name: str,
+        result: ParsedCSVResult,
+    ) -> Iterator[dict]:
+        raise NotImplementedError
+
+    def parse(
+        self,
+        file_content: bytes,
+        user_id: int,
+        account_id: int,
+        account_name: str,
+    ) -> ParsedCSVResult:
+        """Parse the whole file into ``result.rows`` (small files, tests)."""
+        result = ParsedCSVResult()
+        result.rows.extend(self.iter_rows(file_content, user_id, account_id, account_name, result))
+        return result
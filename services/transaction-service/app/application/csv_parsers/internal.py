@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import csv
-import io
+from collections.abc import Iterator
 from datetime import date
 from decimal import Decimal, InvalidOperation
+from typing import BinaryIO
 
-from app.application.csv_parsers.base import ParsedCSVResult
+from app.application.csv_parsers.base import CSVParserBase, ParsedCSVResult
+from app.application.csv_parsers.utils import iter_lines
 from app.domain.exceptions import CSVImportException
 
 _REQUIRED_COLUMNS = {
@@ -17,22 +19,22 @@ _REQUIRED_COLUMNS = {
 }
 
 
-class InternalCSVParser:
+class InternalCSVParser(CSVParserBase):
     """Parser for the internal (English column names) CSV format.
 
     Account information is read from each CSV row, so the ``account_id``
-    and ``account_name`` parameters passed to :meth:`parse` are ignored.
+    and ``account_name`` parameters passed to :meth:`iter_rows` are ignored.
     """
 
-    def parse(
+    def iter_rows(
         self,
-        file_content: bytes,
+        source: bytes | BinaryIO,
         user_id: int,
         account_id: int,
         account_name: str,
-    ) -> ParsedCSVResult:
-        text = file_content.decode("utf-8")
-        reader = csv.DictReader(io.StringIO(text))
+        result: ParsedCSVResult,
+    ) -> Iterator[dict]:
+        reader = csv.DictReader(iter_lines(source, self.encoding))
 
         if reader.fieldnames is None:
             raise CSVImportException("CSV file is empty or has no headers")
@@ -41,8 +43,6 @@ class InternalCSVParser:
         if missing:
             raise CSVImportException(f"CSV missing required columns: {', '.join(sorted(missing))}")
 
-        result = ParsedCSVResult()
-
         for row_num, row in enumerate(reader, start=2):
             try:
                 amount = Decimal(row["amount"])
@@ -53,21 +53,19 @@ class InternalCSVParser:
                 if tx_type not in ("income", "expense"):
                     raise ValueError(f"invalid transaction_type: {tx_type}")
 
-                result.add_row(
-                    {
-                        "user_id": user_id,
-                        "account_id": int(row["account_id"]),
-                        "account_name": row["account_name"].strip(),
-                        "category_id": (int(row["category_id"]) if row.get("category_id") else None),
-                        "category_name": (row.get("category_name", "").strip() or None),
-                        "amount": amount,
-                        "transaction_type": tx_type,
-                        "description": (row.get("description", "").strip() or None),
-                        "tx_date": date.fromisoformat(row["date"].strip()),
-                    }
-                )
+                row_data = {
+                    "user_id": user_id,
+                    "account_id": int(row["account_id"]),
+                    "account_name": row["account_name"].strip(),
+                    "category_id": (int(row["category_id"]) if row.get("category_id") else None),
+                    "category_name": (row.get("category_name", "").strip() or None),
+                    "amount": amount,
+                    "transaction_type": tx_type,
+                    "description": (row.get("description", "").strip() or None),
+                    "tx_date": date.fromisoformat(row["date"].strip()),
+                }
             except (ValueError, KeyError, InvalidOperation) as exc:
-                result.errors.append(f"Row {row_num}: {exc}")
-                result.skipped += 1
-
-        return result
+                result.add_error(row_num, exc)
+                continue
+            result.count_row()
+            yield row_data
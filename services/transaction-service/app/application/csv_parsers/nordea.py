@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 import csv
-import io
+from collections.abc import Iterator
 from datetime import date
 from decimal import InvalidOperation
+from typing import BinaryIO
 
-from app.application.csv_parsers.base import ParsedCSVResult
-from app.application.csv_parsers.utils import parse_danish_amount
+from app.application.csv_parsers.base import CSVParserBase, ParsedCSVResult
+from app.application.csv_parsers.utils import iter_lines, parse_danish_amount
 from app.domain.exceptions import CSVImportException
 
 _REQUIRED_COLUMNS = {"Bogføringsdato", "Beløb", "Beskrivelse"}
 
 
-class NordeaCSVParser:
+class NordeaCSVParser(CSVParserBase):
     """Parser for Nordea netbank CSV exports.
 
     Expected format:
@@ -23,15 +24,19 @@ class NordeaCSVParser:
     - Amount: signed, Danish decimal format (comma as decimal separator)
     """
 
-    def parse(
+    encoding = "utf-8-sig"
+    fallback_encoding = "windows-1252"
+
+    def iter_rows(
         self,
-        file_content: bytes,
+        source: bytes | BinaryIO,
         user_id: int,
         account_id: int,
         account_name: str,
-    ) -> ParsedCSVResult:
-        text = self._decode(file_content)
-        reader = csv.DictReader(io.StringIO(text), delimiter=";")
+        result: ParsedCSVResult,
+    ) -> Iterator[dict]:
+        lines = iter_lines(source, self.encoding, self.fallback_encoding)
+        reader = csv.DictReader(lines, delimiter=";")
 
         if reader.fieldnames is None:
             raise CSVImportException("CSV file is empty or has no headers")
@@ -41,8 +46,6 @@ class NordeaCSVParser:
         if missing:
             raise CSVImportException(f"Nordea CSV missing required columns: {', '.join(sorted(missing))}")
 
-        result = ParsedCSVResult()
-
         for row_num, row in enumerate(reader, start=2):
             if not any(v and v.strip() for v in row.values()):
                 continue
@@ -59,31 +62,22 @@ class NordeaCSVParser:
 
                 description = self._extract_description(row)
 
-                result.add_row(
-                    {
-                        "user_id": user_id,
-                        "account_id": account_id,
-                        "account_name": account_name,
-                        "category_id": None,
-                        "category_name": None,
-                        "amount": abs_amount,
-                        "transaction_type": tx_type,
-                        "description": description,
-                        "tx_date": tx_date,
-                    }
-                )
+                row_data = {
+                    "user_id": user_id,
+                    "account_id": account_id,
+                    "account_name": account_name,
+                    "category_id": None,
+                    "category_name": None,
+                    "amount": abs_amount,
+                    "transaction_type": tx_type,
+                    "description": description,
+                    "tx_date": tx_date,
+                }
             except (ValueError, KeyError, InvalidOperation) as exc:
-                result.errors.append(f"Row {row_num}: {exc}")
-                result.skipped += 1
-
-        return result
-
-    @staticmethod
-    def _decode(content: bytes) -> str:
-        try:
-            return content.decode("utf-8-sig")
-        except UnicodeDecodeError:
-            return content.decode("windows-1252")
+                result.add_error(row_num, exc)
+                continue
+            result.count_row()
+            yield row_data
 
     @staticmethod
     def _parse_date(raw: str) -> date:
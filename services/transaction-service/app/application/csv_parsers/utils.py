@@ -1,6 +1,83 @@
 from __future__ import annotations
 
+import codecs
+from collections.abc import Iterator
 from decimal import Decimal
+from typing import BinaryIO
+
+#: Bytes pulled from the upload per read. Together with one csv row this
+#: is all the parsers hold of the file at any time.
+READ_CHUNK_BYTES = 64 * 1024
+
+
+def iter_lines(
+    source: bytes | BinaryIO,
+    encoding: str,
+    fallback_encoding: str | None = None,
+    chunk_size: int = READ_CHUNK_BYTES,
+) -> Iterator[str]:
+    """Decode ``source`` incrementally into ``"\n"``-terminated lines.
+
+    ``source`` is the raw bytes or a binary file object (the spooled
+    upload), read ``chunk_size`` bytes at a time. Lines keep their line
+    ending and are split on ``"\n"`` only, exactly what iterating
+    ``io.StringIO(text)`` yields, so ``csv.reader`` sees the same input as
+    when the whole file was decoded up front (quoted newlines included).
+
+    With ``fallback_encoding``, the first chunk that does not decode as
+    ``encoding`` switches the rest of the file to the fallback. The bytes
+    before it decoded cleanly; for a Windows-1252 bank export those are
+    plain ASCII (any æ/ø/å byte is invalid UTF-8), so the result is the
+    same as re-decoding the whole file with the fallback.
+    """
+    tail = ""
+    for text in _iter_text(source, encoding, fallback_encoding, chunk_size):
+        if not text:
+            continue
+        lines = (tail + text).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    if tail:
+        yield tail
+
+
+def _iter_text(
+    source: bytes | BinaryIO,
+    encoding: str,
+    fallback_encoding: str | None,
+    chunk_size: int,
+) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    fallback = fallback_encoding
+    for chunk in _iter_chunks(source, chunk_size):
+        pending = decoder.getstate()[0]
+        try:
+            yield decoder.decode(chunk)
+        except UnicodeDecodeError:
+            if fallback is None:
+                raise
+            decoder = codecs.getincrementaldecoder(fallback)()
+            fallback = None
+            yield decoder.decode(pending + chunk)
+    pending = decoder.getstate()[0]
+    try:
+        yield decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        # A truncated multi-byte sequence at the very end.
+        if fallback is None:
+            raise
+        yield pending.decode(fallback)
+
+
+def _iter_chunks(source: bytes | BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+        return
+    while chunk := source.read(chunk_size):
+        yield chunk
 
 
 def parse_danish_amount(raw: str) -> Decimal:
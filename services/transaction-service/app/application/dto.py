@@ -74,14 +74,23 @@ class UpdateTransactionDTO(BaseModel):
     date: DateType | None = None
 
 
-class TransactionFiltersDTO(BaseModel):
+class TransactionFilterSetDTO(BaseModel):
+    """Which rows — shared by the listing and the export."""
+
     account_id: int | None = None
     category_id: int | None = None
     start_date: date | None = None
     end_date: date | None = None
     transaction_type: TransactionType | None = None
+
+
+class TransactionFiltersDTO(TransactionFilterSetDTO):
     skip: int = Field(default=0, ge=0)
     limit: int = Field(default=50, ge=1, le=200)
+    # ``None`` is OFFSET mode (``skip``); any string is cursor mode, where
+    # ``""`` asks for the first page and a ``next_cursor`` for the next one.
+    cursor: str | None = None
+    include_total: bool = True
 
 
 class TransactionListResultDTO(BaseModel):
@@ -103,17 +112,43 @@ class TransactionListResultDTO(BaseModel):
     row is lost or duplicated, and OFFSET paging over a date-ordered set
     already has that property.  ``REPEATABLE READ`` on a list endpoint would
     be disproportionate.
+
+    In cursor mode (``TransactionFiltersDTO.cursor`` set) ``next_cursor``
+    resumes after the last item and is ``None`` on the last page, and
+    ``total_count`` is served from a short-lived per-filter cache — see
+    :mod:`app.application.pagination`.  ``total_count`` is ``None`` when
+    the caller passed ``include_total=false``.
     """
 
-    total_count: int
+    total_count: int | None
     items: list[TransactionResponse]
+    next_cursor: str | None = None
+
+
+class CSVImportProgressDTO(BaseModel):
+    """Running totals of a CSV import, reported after every processed chunk (committed together at the end)."""
+
+    rows_read: int
+    imported: int
+    skipped: int
+    duplicates_skipped: int
+    chunks: int
 
 
 class CSVImportResultDTO(BaseModel):
+    """Outcome of a CSV import.
+
+    ``errors`` holds at most ``CSV_MAX_REPORTED_ERRORS`` messages;
+    ``skipped`` counts every unparseable row. ``rows_read`` and ``chunks``
+    are the final progress totals (data rows seen, dedup/insert rounds).
+    """
+
     imported: int
     skipped: int
     duplicates_skipped: int = 0
     errors: list[str]
+    rows_read: int = 0
+    chunks: int = 0
 
 
 class BulkCreateTransactionItemDTO(BaseModel):
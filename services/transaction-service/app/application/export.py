@@ -0,0 +1,175 @@
+"""Encoders for ``GET /api/v1/transactions/export``.
+
+Rows arrive from :meth:`ITransactionRepository.stream_filtered` as
+tuples in :data:`EXPORT_COLUMNS` order, in batches of
+``settings.EXPORT_BATCH_ROWS`` read from a server-side cursor, and leave
+as byte chunks for a ``StreamingResponse`` — one batch in memory at a
+time, whatever the size of the export.
+
+* ``csv`` — the ``internal`` import format (``csv_parsers/internal.py``):
+  its columns first, UTF-8 without BOM, so an export re-imports as is.
+  ``id`` and ``currency`` trail; the parser ignores columns it does not
+  know.
+* ``ndjson`` — one JSON object per row; amounts are strings so no
+  precision is lost to floats.
+* ``parquet`` — one row group per batch, amounts as ``decimal(12, 2)``.
+  Needs ``pyarrow`` (the ``export-parquet`` extra, which the image
+  installs); without it the format is refused up front
+  (:class:`~app.domain.exceptions.ExportFormatUnavailableException`).
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import date
+from decimal import Decimal
+from enum import StrEnum
+from typing import Any
+
+from app.domain.exceptions import ExportFormatUnavailableException
+
+try:  # optional: only the parquet format needs it
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pyarrow = None  # type: ignore[assignment]
+
+#: Column order of every format; the first eight are the ``internal``
+#: CSV parser's.
+EXPORT_COLUMNS = (
+    "date",
+    "amount",
+    "transaction_type",
+    "account_id",
+    "account_name",
+    "category_id",
+    "category_name",
+    "description",
+    "id",
+    "currency",
+)
+
+ExportRow = Sequence[Any]
+
+
+class ExportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
+
+    @property
+    def media_type(self) -> str:
+        return _MEDIA_TYPES[self]
+
+
+_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def ensure_available(export_format: ExportFormat) -> None:
+    """Refuse a format this process cannot write, before any row is read."""
+    if export_format is ExportFormat.PARQUET and pyarrow is None:
+        raise ExportFormatUnavailableException(export_format.value, "pyarrow is not installed")
+
+
+async def encode(export_format: ExportFormat, batches: AsyncIterator[list[ExportRow]]) -> AsyncIterator[bytes]:
+    """Byte chunks of ``batches`` in ``export_format``, one chunk per batch.
+
+    CSV always starts with its header and a Parquet file is always
+    complete, so an empty export is still a valid, re-importable file.
+    """
+    if export_format is ExportFormat.CSV:
+        yield _csv_lines([EXPORT_COLUMNS])
+        async for batch in batches:
+            yield _csv_lines(batch)
+    elif export_format is ExportFormat.NDJSON:
+        async for batch in batches:
+            yield b"".join(_ndjson_line(row) for row in batch)
+    else:
+        ensure_available(export_format)
+        schema = _parquet_schema()
+        sink = _ChunkSink()
+        with pyarrow.parquet.ParquetWriter(sink, schema) as writer:
+            async for batch in batches:
+                writer.write_table(_parquet_table(batch, schema))
+                yield sink.drain()
+        yield sink.drain()
+
+
+def _csv_lines(rows: Sequence[ExportRow]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _ndjson_line(row: ExportRow) -> bytes:
+    record = dict(zip(EXPORT_COLUMNS, row, strict=True))
+    return (json.dumps(record, default=_json_default, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _json_default(value: object) -> str:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _parquet_schema() -> Any:
+    return pyarrow.schema(
+        [
+            ("date", pyarrow.date32()),
+            ("amount", pyarrow.decimal128(12, 2)),
+            ("transaction_type", pyarrow.string()),
+            ("account_id", pyarrow.int64()),
+            ("account_name", pyarrow.string()),
+            ("category_id", pyarrow.int64()),
+            ("category_name", pyarrow.string()),
+            ("description", pyarrow.string()),
+            ("id", pyarrow.int64()),
+            ("currency", pyarrow.string()),
+        ]
+    )
+
+
+def _parquet_table(batch: Sequence[ExportRow], schema: Any) -> Any:
+    columns = zip(*batch, strict=True)
+    return pyarrow.table(
+        [pyarrow.array(column, type=field.type) for column, field in zip(columns, schema, strict=True)],
+        schema=schema,
+    )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file for ``ParquetWriter`` that hands its bytes on.
+
+    ``tell`` keeps counting across :meth:`drain` — the writer records
+    column-chunk offsets in the footer from it.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
@@ -0,0 +1,79 @@
+"""Keyset cursors and cached totals for ``GET /api/v1/transactions/``.
+
+OFFSET paging makes the database walk and discard every row before the
+page, and the exact ``COUNT`` walks the whole filtered set on every
+request — both grow with the account's history, not with the page.  In
+cursor mode the listing instead resumes *after* the last row it served,
+``(date, id) < (:date, :id)`` under the same ``date DESC, id DESC``
+order, which the ``ix_transactions_user_date_id`` index (migration 017)
+answers in O(page) however deep the caller has scrolled.
+
+The cursor is opaque to clients: URL-safe base64 of ``"<date>:<id>"``.
+It encodes a *position*, not a filter set, so it stays valid across
+inserts and deletes — a row inserted above the cursor is simply not
+seen by later pages, and none is served twice.
+
+The total, when asked for, comes from :class:`TotalCountCache`: one
+``COUNT`` per filter shape per TTL, so a scroll through fifty pages
+costs one count instead of fifty.  It may trail concurrent writes by up
+to the TTL; the rows themselves are always read live.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from datetime import date
+
+from app.domain.exceptions import InvalidCursorException
+
+
+def encode_cursor(tx_date: date, transaction_id: int) -> str:
+    raw = f"{tx_date.isoformat()}:{transaction_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    """Inverse of :func:`encode_cursor`; anything else is :class:`InvalidCursorException`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        day, _, transaction_id = raw.partition(":")
+        return date.fromisoformat(day), int(transaction_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorException(cursor) from None
+
+
+class TotalCountCache:
+    """Process-local ``COUNT`` results keyed by user and filter shape.
+
+    Entries expire after ``ttl_s``; at ``max_entries`` the least recently
+    used key is dropped, so memory stays bounded by the number of distinct
+    filter sets in use rather than by traffic.  Not shared between
+    replicas — a miss on another replica costs one ``COUNT``, nothing more.
+    """
+
+    def __init__(self, ttl_s: float, max_entries: int, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> int | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, total = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return total
+
+    def put(self, key: Hashable, total: int) -> None:
+        self._entries[key] = (self._clock() + self._ttl_s, total)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
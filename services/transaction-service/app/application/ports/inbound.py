@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
+from typing import BinaryIO
 
 from app.application.dto import (
     BulkCreateResultDTO,
     BulkCreateTransactionDTO,
     CreatePlannedTransactionDTO,
     CreateTransactionDTO,
+    CSVImportProgressDTO,
     CSVImportResultDTO,
     PlannedTransactionResponse,
     TransactionFiltersDTO,
+    TransactionFilterSetDTO,
     TransactionListResultDTO,
     TransactionResponse,
     UpdatePlannedTransactionDTO,
     UpdateTransactionDTO,
 )
+from app.application.export import ExportFormat
 
 
 class ITransactionService(ABC):
@@ -31,6 +36,20 @@ class ITransactionService(ABC):
         filters: TransactionFiltersDTO,
     ) -> TransactionListResultDTO: ...
 
+    @abstractmethod
+    def export_transactions(
+        self,
+        user_id: int,
+        filters: TransactionFilterSetDTO,
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """The whole filtered set as byte chunks of ``export_format``.
+
+        Raises :class:`ExportFormatUnavailableException` on the call, not
+        from the iterator, so a refusal can still become a response.
+        """
+        ...
+
     @abstractmethod
     async def update_transaction(
         self,
@@ -46,10 +65,11 @@ class ITransactionService(ABC):
     async def import_csv(
         self,
         user_id: int,
-        csv_content: bytes,
+        csv_content: bytes | BinaryIO,
         bank_format: str = "internal",
         account_id: int | None = None,
         account_name: str | None = None,
+        on_progress: Callable[[CSVImportProgressDTO], None] | None = None,
     ) -> CSVImportResultDTO: ...
 
     @abstractmethod
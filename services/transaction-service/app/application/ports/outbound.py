@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Literal, Protocol, Self
@@ -64,6 +64,45 @@ class ITransactionRepository(ABC):
         limit: int = 50,
     ) -> list[Transaction]: ...
 
+    @abstractmethod
+    async def find_page_after(
+        self,
+        user_id: int,
+        after: tuple[date, int] | None,
+        limit: int,
+        account_id: int | None = None,
+        category_id: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        transaction_type: TransactionType | None = None,
+    ) -> list[Transaction]:
+        """Keyset page: up to ``limit`` rows ordered like :meth:`find_filtered`,
+        strictly after the ``(date, id)`` position ``after`` (``None`` = from
+        the top).  Same filter predicates as :meth:`find_filtered`.
+        """
+        ...
+
+    @abstractmethod
+    def stream_filtered(
+        self,
+        user_id: int,
+        columns: Sequence[str],
+        batch_size: int,
+        account_id: int | None = None,
+        category_id: int | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        transaction_type: TransactionType | None = None,
+    ) -> AsyncIterator[list[Sequence[Any]]]:
+        """Every matching row as a tuple of ``columns``, ``batch_size`` at a time.
+
+        Ordered like :meth:`find_filtered`, same filter predicates, no
+        window.  Rows are read from a server-side cursor, so memory holds
+        one batch however many rows match; the caller keeps the session
+        open until the iterator is exhausted or closed.
+        """
+        ...
+
     @abstractmethod
     async def count_filtered(
         self,
@@ -103,7 +142,21 @@ class ITransactionRepository(ABC):
         ...
 
     @abstractmethod
-    async def bulk_create(self, transactions: list[dict]) -> list[Transaction]: ...
+    async def bulk_create(self, transactions: list[dict]) -> list[Transaction]:
+        """Insert every row, in order — duplicates of existing keys included."""
+        ...
+
+    @abstractmethod
+    async def insert_new(self, transactions: list[dict]) -> list[Transaction]:
+        """Insert only rows whose dedup key ``(user_id, account_id, date,
+        amount, description)`` no live row has; return those, in order.
+
+        The import paths' duplicate check *is* this insert — one statement,
+        no check-then-insert window — and the skipped count is the
+        difference in length.  A key repeated within ``transactions`` is
+        inserted once.
+        """
+        ...
 
     @abstractmethod
     async def find_existing_dedup_keys(
@@ -196,6 +249,9 @@ class ISubCategoryReadRepository(ABC):
     @abstractmethod
     async def find_by_id(self, subcategory_id: int) -> SubCategory | None: ...
 
+    @abstractmethod
+    async def find_all(self) -> list[SubCategory]: ...
+
     @abstractmethod
     async def find_by_ids(self, subcategory_ids: list[int]) -> dict[int, SubCategory]: ...
 
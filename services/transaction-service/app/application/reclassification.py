@@ -1,12 +1,22 @@
-"""Read-only TAX-07 scanner for transaction-service-owned references."""
+"""Read-only TAX-07 scanner for transaction-service-owned references.
+
+The scan streams both tables through a server-side cursor in id order,
+``SCAN_CHUNK_ROWS`` rows at a time, folding each chunk into the
+histograms and report rows as it goes: memory follows the chunk size and
+the report, not the table.  Evidence for a chunk is requested while the
+next chunks are read, with at most ``EVIDENCE_CONCURRENCY`` batch calls
+in flight; chunks are folded in id order, so the report is the same as a
+single full-table pass would produce.
+"""
 
 from __future__ import annotations
 
-from collections import Counter
-from collections.abc import Sequence
+import asyncio
+from collections import Counter, deque
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Protocol
+from typing import Any, Protocol
 
 from contracts.events.transaction import TransactionUpdatedEvent
 from contracts.reclassification import (
@@ -18,7 +28,7 @@ from contracts.reclassification import (
     ServiceReport,
     SnapshotBoundary,
 )
-from sqlalchemy import func, select
+from sqlalchemy import Row, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.outbound.outbox_adapter import TransactionOutboxAdapter
@@ -33,6 +43,11 @@ from app.models import (
 )
 
 EVIDENCE_BATCH_SIZE = 500
+#: Rows fetched per cursor round trip while scanning.
+SCAN_CHUNK_ROWS = 2_000
+#: ``categorize_batch`` calls in flight at once; also bounds the chunks
+#: held in memory while their evidence is outstanding.
+EVIDENCE_CONCURRENCY = 4
 
 
 @dataclass(frozen=True, slots=True)
@@ -251,11 +266,37 @@ def _proposal_row(
     )
 
 
+class ScannedTransaction(Protocol):
+    """The transaction columns the scan reads (an ORM model or a result row)."""
+
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def category_id(self) -> int | None: ...
+
+    @property
+    def subcategory_id(self) -> int | None: ...
+
+    @property
+    def amount(self) -> Decimal: ...
+
+    @property
+    def transaction_type(self) -> str: ...
+
+    @property
+    def description(self) -> str | None: ...
+
+    @property
+    def categorization_tier(self) -> str | None: ...
+
+
 async def _resolve_evidence(
-    transactions: list[TransactionModel],
+    transactions: Sequence[ScannedTransaction],
     *,
     mapping: MappingRegistry,
     categorizer: EvidenceCategorizerPort | None,
+    limiter: asyncio.Semaphore | None = None,
 ) -> dict[int, EvidenceResolution]:
     candidates = [
         model
@@ -279,9 +320,14 @@ async def _resolve_evidence(
         }
         for model in candidates
     ]
-    results: list[CategorizationResultPort | None] = []
-    for offset in range(0, len(inputs), EVIDENCE_BATCH_SIZE):
-        results.extend(await categorizer.categorize_batch(inputs[offset : offset + EVIDENCE_BATCH_SIZE]))
+    limiter = limiter or asyncio.Semaphore(EVIDENCE_CONCURRENCY)
+
+    async def _batch(offset: int) -> Sequence[CategorizationResultPort | None]:
+        async with limiter:
+            return await categorizer.categorize_batch(inputs[offset : offset + EVIDENCE_BATCH_SIZE])
+
+    batches = await asyncio.gather(*(_batch(offset) for offset in range(0, len(inputs), EVIDENCE_BATCH_SIZE)))
+    results = [result for batch in batches for result in batch]
     if len(results) != len(candidates):
         raise ValueError("categorization evidence result count mismatch")
     resolutions: dict[int, EvidenceResolution] = {}
@@ -319,57 +365,92 @@ async def scan_transactions(
     mapping: MappingRegistry,
     evidence_categorizer: EvidenceCategorizerPort | None = None,
 ) -> ServiceReport:
-    transactions = list(
-        (
-            await session.execute(
-                select(TransactionModel).where(TransactionModel.deleted_at.is_(None)).order_by(TransactionModel.id)
+    rows: list[ReportRow] = []
+    category_histogram: Counter[str] = Counter()
+    subcategory_histogram: Counter[str] = Counter()
+    limiter = asyncio.Semaphore(EVIDENCE_CONCURRENCY)
+    pending: deque[tuple[Sequence[ScannedTransaction], asyncio.Task[dict[int, EvidenceResolution]]]] = deque()
+
+    def fold(chunk: Sequence[ScannedTransaction], evidence: dict[int, EvidenceResolution]) -> None:
+        for model in chunk:
+            row = _proposal_row(
+                source_kind="transaction",
+                source_id=model.id,
+                category_id=model.category_id,
+                subcategory_id=model.subcategory_id,
+                amount=model.amount,
+                categorization_tier=model.categorization_tier,
+                mapping=mapping,
+                evidence_resolution=evidence.get(model.id),
             )
-        ).scalars()
-    )
-    planned = list(
-        (await session.execute(select(PlannedTransactionModel).order_by(PlannedTransactionModel.id))).scalars()
-    )
-    evidence = await _resolve_evidence(
-        transactions,
-        mapping=mapping,
-        categorizer=evidence_categorizer,
-    )
-    proposed_rows = [
-        _proposal_row(
-            source_kind="transaction",
-            source_id=model.id,
-            category_id=model.category_id,
-            subcategory_id=model.subcategory_id,
-            amount=model.amount,
-            categorization_tier=model.categorization_tier,
-            mapping=mapping,
-            evidence_resolution=evidence.get(model.id),
-        )
-        for model in transactions
-    ] + [
-        _proposal_row(
-            source_kind="planned_transaction",
-            source_id=model.id,
-            category_id=model.category_id,
-            subcategory_id=None,
-            amount=model.amount,
-            categorization_tier="user",
-            mapping=mapping,
-        )
-        for model in planned
-    ]
-    rows = [row for row in proposed_rows if row is not None]
-    category_histogram = Counter(str(model.category_id) for model in transactions + planned)
-    subcategory_histogram = Counter(
-        str(model.subcategory_id) for model in transactions if model.subcategory_id is not None
-    )
+            if row is not None:
+                rows.append(row)
+
+    transaction_count = 0
+    try:
+        async for chunk in _stream(
+            session,
+            select(
+                TransactionModel.id,
+                TransactionModel.category_id,
+                TransactionModel.subcategory_id,
+                TransactionModel.amount,
+                TransactionModel.transaction_type,
+                TransactionModel.description,
+                TransactionModel.categorization_tier,
+            )
+            .where(TransactionModel.deleted_at.is_(None))
+            .order_by(TransactionModel.id),
+        ):
+            transaction_count += len(chunk)
+            category_histogram.update(str(model.category_id) for model in chunk)
+            subcategory_histogram.update(
+                str(model.subcategory_id) for model in chunk if model.subcategory_id is not None
+            )
+            task = asyncio.create_task(
+                _resolve_evidence(chunk, mapping=mapping, categorizer=evidence_categorizer, limiter=limiter)
+            )
+            pending.append((chunk, task))
+            if len(pending) > EVIDENCE_CONCURRENCY:
+                done, task = pending.popleft()
+                fold(done, await task)
+        while pending:
+            done, task = pending.popleft()
+            fold(done, await task)
+    finally:
+        for _, task in pending:
+            task.cancel()
+        await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+    planned_count = 0
+    async for chunk in _stream(
+        session,
+        select(
+            PlannedTransactionModel.id, PlannedTransactionModel.category_id, PlannedTransactionModel.amount
+        ).order_by(PlannedTransactionModel.id),
+    ):
+        planned_count += len(chunk)
+        category_histogram.update(str(model.category_id) for model in chunk)
+        for model in chunk:
+            row = _proposal_row(
+                source_kind="planned_transaction",
+                source_id=model.id,
+                category_id=model.category_id,
+                subcategory_id=None,
+                amount=model.amount,
+                categorization_tier="user",
+                mapping=mapping,
+            )
+            if row is not None:
+                rows.append(row)
+
     outbox_value = (await session.execute(select(func.max(OutboxEventModel.id)))).scalar_one()
     inbox_value = (await session.execute(select(func.max(ProcessedEventModel.id)))).scalar_one()
     outbox_max = str(outbox_value) if outbox_value is not None else None
     inbox_max = int(inbox_value) if inbox_value is not None else None
     snapshot = SnapshotBoundary(
         captured_at,
-        {"transactions": len(transactions), "planned_transactions": len(planned)},
+        {"transactions": transaction_count, "planned_transactions": planned_count},
         {
             "category_references": dict(sorted(category_histogram.items())),
             "subcategory_references": dict(sorted(subcategory_histogram.items())),
@@ -385,3 +466,13 @@ async def scan_transactions(
         snapshot,
         tuple(rows),
     )
+
+
+async def _stream(session: AsyncSession, statement: Select[Any]) -> AsyncIterator[Sequence[Row[Any]]]:
+    """Yield ``statement``'s rows in chunks of ``SCAN_CHUNK_ROWS`` from a server-side cursor."""
+    result = await session.stream(statement.execution_options(yield_per=SCAN_CHUNK_ROWS))
+    try:
+        async for chunk in result.partitions():
+            yield chunk
+    finally:
+        await result.close()
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from typing import BinaryIO
 
 from contracts.events.transaction import (
     TransactionCategoryCorrectedEvent,
@@ -9,6 +13,7 @@ from contracts.events.transaction import (
     TransactionUpdatedEvent,
 )
 
+from app.application.csv_parsers.base import BankCSVParser, ParsedCSVResult
 from app.application.csv_parsers.registry import get_parser
 from app.application.dto import (
     BulkCreateResultDTO,
@@ -16,14 +21,18 @@ from app.application.dto import (
     BulkCreateTransactionItemDTO,
     CreatePlannedTransactionDTO,
     CreateTransactionDTO,
+    CSVImportProgressDTO,
     CSVImportResultDTO,
     PlannedTransactionResponse,
     TransactionFiltersDTO,
+    TransactionFilterSetDTO,
     TransactionListResultDTO,
     TransactionResponse,
     UpdatePlannedTransactionDTO,
     UpdateTransactionDTO,
 )
+from app.application.export import EXPORT_COLUMNS, ExportFormat, encode, ensure_available
+from app.application.pagination import TotalCountCache, decode_cursor, encode_cursor
 from app.application.ports.inbound import ITransactionService
 from app.application.ports.outbound import (
     DedupKey,
@@ -31,9 +40,12 @@ from app.application.ports.outbound import (
     ICategorizationClient,
     IUnitOfWork,
 )
-from app.domain.entities import PlannedTransaction, Transaction, direction_of
+from app.application.taxonomy_cache import TaxonomyCache, TaxonomySnapshot
+from app.config import settings
+from app.domain.entities import Category, PlannedTransaction, SubCategory, Transaction, direction_of
 from app.domain.exceptions import (
     CSVImportException,
+    InvalidCursorException,
     PlannedTransactionNotFoundException,
     SubcategoryMismatchException,
     SubcategoryNotFoundException,
@@ -42,6 +54,9 @@ from app.domain.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+#: Row fields :meth:`TransactionService._categorize_rows` may set.
+_CATEGORIZATION_FIELDS = ("category_id", "subcategory_id", "categorization_tier", "categorization_confidence")
+
 
 class TransactionService(ITransactionService):
     """Application service for financial transactions.
@@ -56,15 +71,27 @@ class TransactionService(ITransactionService):
     If the client is None or the call fails, transactions are saved
     without categorization — the async pipeline picks them up via
     the transaction.created event.
+
+    ``total_cache`` serves cursor-mode listing totals (see
+    :mod:`app.application.pagination`); without one every cursor page
+    that asks for a total counts afresh.
+
+    ``taxonomy`` serves name resolution and subcategory validation from
+    an in-memory snapshot (see :mod:`app.application.taxonomy_cache`);
+    without one every lookup reads the local read copies.
     """
 
     def __init__(
         self,
         uow: IUnitOfWork,
         categorization_client: ICategorizationClient | None = None,
+        total_cache: TotalCountCache | None = None,
+        taxonomy: TaxonomyCache | None = None,
     ) -> None:
         self._uow = uow
         self._cat_client = categorization_client
+        self._total_cache = total_cache
+        self._taxonomy = taxonomy
 
     # ── Transactions ────────────────────────────────────────────────
 
@@ -180,7 +207,13 @@ class TransactionService(ITransactionService):
         ``count_filtered`` is called **without** ``skip``/``limit`` by design:
         forwarding them would make the total equal the page size, and the
         envelope would answer "is that all there was?" with "yes", always.
+
+        With ``filters.cursor`` set the page is a keyset read instead (see
+        :meth:`_list_page_after`); ``include_total=False`` skips the count
+        in either mode.
         """
+        if filters.cursor is not None:
+            return await self._list_page_after(user_id, filters)
         async with self._uow:
             results = await self._uow.transactions.find_filtered(
                 user_id,
@@ -192,19 +225,102 @@ class TransactionService(ITransactionService):
                 skip=filters.skip,
                 limit=filters.limit,
             )
-            total_count = await self._uow.transactions.count_filtered(
+            total_count = None
+            if filters.include_total:
+                total_count = await self._uow.transactions.count_filtered(
+                    user_id,
+                    account_id=filters.account_id,
+                    category_id=filters.category_id,
+                    start_date=filters.start_date,
+                    end_date=filters.end_date,
+                    transaction_type=filters.transaction_type,
+                )
+        return TransactionListResultDTO(
+            total_count=total_count,
+            items=[self._to_response(t) for t in results],
+        )
+
+    async def _list_page_after(self, user_id: int, filters: TransactionFiltersDTO) -> TransactionListResultDTO:
+        """Cursor mode: one page after the cursor's ``(date, id)``, O(page).
+
+        One row beyond ``limit`` is read so ``next_cursor`` is only issued
+        when a next page exists — the last page says so instead of sending
+        the client after an empty one.  The total is the cached count for
+        this filter shape, counted on a miss.
+        """
+        if filters.skip:
+            raise InvalidCursorException(filters.cursor or "", "cannot be combined with skip")
+        after = decode_cursor(filters.cursor) if filters.cursor else None
+        shape = (
+            user_id,
+            filters.account_id,
+            filters.category_id,
+            filters.start_date,
+            filters.end_date,
+            filters.transaction_type,
+        )
+        async with self._uow:
+            results = await self._uow.transactions.find_page_after(
                 user_id,
+                after,
+                filters.limit + 1,
                 account_id=filters.account_id,
                 category_id=filters.category_id,
                 start_date=filters.start_date,
                 end_date=filters.end_date,
                 transaction_type=filters.transaction_type,
             )
+            total_count = None
+            if filters.include_total:
+                total_count = self._total_cache.get(shape) if self._total_cache is not None else None
+                if total_count is None:
+                    total_count = await self._uow.transactions.count_filtered(
+                        user_id,
+                        account_id=filters.account_id,
+                        category_id=filters.category_id,
+                        start_date=filters.start_date,
+                        end_date=filters.end_date,
+                        transaction_type=filters.transaction_type,
+                    )
+                    if self._total_cache is not None:
+                        self._total_cache.put(shape, total_count)
+        page = results[: filters.limit]
+        next_cursor = encode_cursor(page[-1].date, page[-1].id) if len(results) > filters.limit else None
         return TransactionListResultDTO(
             total_count=total_count,
-            items=[self._to_response(t) for t in results],
+            items=[self._to_response(t) for t in page],
+            next_cursor=next_cursor,
         )
 
+    def export_transactions(
+        self,
+        user_id: int,
+        filters: TransactionFilterSetDTO,
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """Stream the filtered set, newest first, in ``export_format``.
+
+        Not a coroutine: the format check runs here, before the route has
+        committed to a 200, and the rows are only read as the returned
+        iterator is consumed — one ``EXPORT_BATCH_ROWS`` batch at a time.
+        """
+        ensure_available(export_format)
+        return encode(export_format, self._export_batches(user_id, filters))
+
+    async def _export_batches(self, user_id: int, filters: TransactionFilterSetDTO) -> AsyncIterator[list[Sequence]]:
+        async with self._uow:
+            async for batch in self._uow.transactions.stream_filtered(
+                user_id,
+                EXPORT_COLUMNS,
+                settings.EXPORT_BATCH_ROWS,
+                account_id=filters.account_id,
+                category_id=filters.category_id,
+                start_date=filters.start_date,
+                end_date=filters.end_date,
+                transaction_type=filters.transaction_type,
+            ):
+                yield batch
+
     async def update_transaction(
         self,
         transaction_id: int,
@@ -245,7 +361,7 @@ class TransactionService(ITransactionService):
                     )
 
             if fields.get("subcategory_id") is not None:
-                subcategory = await self._uow.subcategories.find_by_id(fields["subcategory_id"])
+                subcategory = await self._find_subcategory(fields["subcategory_id"])
                 if subcategory is None:
                     raise SubcategoryNotFoundException(fields["subcategory_id"])
                 effective_category_id = fields.get("category_id", existing.category_id)
@@ -331,55 +447,123 @@ class TransactionService(ITransactionService):
     async def import_csv(
         self,
         user_id: int,
-        csv_content: bytes,
+        csv_content: bytes | BinaryIO,
         bank_format: str = "internal",
         account_id: int | None = None,
         account_name: str | None = None,
+        on_progress: Callable[[CSVImportProgressDTO], None] | None = None,
     ) -> CSVImportResultDTO:
+        """Stream ``csv_content`` (bytes or the spooled upload) into the DB.
+
+        The parser yields rows while reading the file; every
+        ``CSV_IMPORT_CHUNK_ROWS`` rows get one deduplicating insert
+        (``insert_new``: ``ON CONFLICT DO NOTHING`` on the dedup
+        fingerprint) and their outbox rows flushed, so memory holds one
+        chunk, not the file.  All chunks share one DB transaction,
+        committed at the end: a file that turns out bad halfway (row cap,
+        missing columns) imports nothing, as before.  Rows inserted by
+        earlier chunks hold their fingerprints already, so a row repeated
+        anywhere in the file is imported once.
+
+        Rows are categorized through the batch endpoint before they are
+        inserted (see :meth:`_categorize_csv`), so they land categorized in
+        their first write and the ``transaction.categorized`` that follows
+        each ``transaction.created`` finds nothing to change.  That is a
+        first pass over the file, before the transaction opens: the HTTP
+        calls never run while the import holds its fingerprint claims, and
+        a file that fails to parse is rejected before either pass writes.
+
+        Both passes read and parse the upload off the event loop, one
+        chunk at a time (:func:`_chunked`).
+
+        ``on_progress`` is called after every chunk with running totals.
+        """
         if bank_format != "internal" and (account_id is None or not account_name):
             raise CSVImportException(f"account_id and account_name are required for bank format {bank_format!r}")
 
         parser = get_parser(bank_format)
-        parsed = parser.parse(
-            file_content=csv_content,
-            user_id=user_id,
-            account_id=account_id or 0,
-            account_name=account_name or "",
-        )
-
-        if not parsed.rows:
-            return CSVImportResultDTO(imported=0, skipped=parsed.skipped, errors=parsed.errors)
+        categorized = await self._categorize_csv(parser, csv_content, user_id, account_id, account_name)
+        parsed = ParsedCSVResult()
+        rows = parser.iter_rows(csv_content, user_id, account_id or 0, account_name or "", parsed)
 
+        imported = 0
         duplicates_skipped = 0
-        rows_to_create: list[dict] = []
-
-        # One batch anti-join instead of a SELECT per row (H15), plus an
-        # in-batch seen-set so a row repeated within the same file is
-        # imported once and counted as a duplicate thereafter.
-        keys = [self._row_dedup_key(row) for row in parsed.rows]
+        chunks = 0
+        row_number = 0
         async with self._uow:
-            existing_keys = await self._uow.transactions.find_existing_dedup_keys(user_id, keys)
-
-        seen_keys: set[DedupKey] = set()
-        for row, key in zip(parsed.rows, keys):
-            if key in existing_keys or key in seen_keys:
-                duplicates_skipped += 1
-                continue
-            seen_keys.add(key)
-            rows_to_create.append(row)
-
-        if not rows_to_create:
-            return CSVImportResultDTO(
-                imported=0,
-                skipped=parsed.skipped,
-                duplicates_skipped=duplicates_skipped,
-                errors=parsed.errors,
-            )
+            async for chunk in _chunked(rows, settings.CSV_IMPORT_CHUNK_ROWS):
+                for row in chunk:
+                    values = categorized.get(row_number)
+                    if values is not None:
+                        row.update(zip(_CATEGORIZATION_FIELDS, values))
+                    row_number += 1
+                created, duplicates = await self._import_csv_chunk(user_id, chunk)
+                imported += created
+                duplicates_skipped += duplicates
+                chunks += 1
+                if on_progress is not None:
+                    on_progress(
+                        CSVImportProgressDTO(
+                            rows_read=parsed.rows_read,
+                            imported=imported,
+                            skipped=parsed.skipped,
+                            duplicates_skipped=duplicates_skipped,
+                            chunks=chunks,
+                        )
+                    )
+            if imported:
+                await self._uow.commit()
 
-        async with self._uow:
-            created = await self._uow.transactions.bulk_create(rows_to_create)
+        return CSVImportResultDTO(
+            imported=imported,
+            skipped=parsed.skipped,
+            duplicates_skipped=duplicates_skipped,
+            errors=parsed.errors,
+            rows_read=parsed.rows_read,
+            chunks=chunks,
+        )
 
-            outbox_entries = [
+    async def _categorize_csv(
+        self,
+        parser: BankCSVParser,
+        csv_content: bytes | BinaryIO,
+        user_id: int,
+        account_id: int | None,
+        account_name: str | None,
+    ) -> dict[int, tuple]:
+        """First pass of :meth:`import_csv`: categorize the file chunk by chunk.
+
+        Returns the categorization of every row it changed, by row number
+        — four values a row, not the rows — and rewinds ``csv_content``
+        for the second pass, which parses the same rows in the same order.
+        """
+        if self._cat_client is None:
+            return {}
+        position = None if isinstance(csv_content, bytes) else csv_content.tell()
+        rows = parser.iter_rows(csv_content, user_id, account_id or 0, account_name or "", ParsedCSVResult())
+        categorized: dict[int, tuple] = {}
+        row_number = 0
+        async for chunk in _chunked(rows, settings.CSV_IMPORT_CHUNK_ROWS):
+            before = [tuple(row.get(field) for field in _CATEGORIZATION_FIELDS) for row in chunk]
+            await self._categorize_rows(chunk)
+            for row, values in zip(chunk, before):
+                after = tuple(row.get(field) for field in _CATEGORIZATION_FIELDS)
+                if after != values:
+                    categorized[row_number] = after
+                row_number += 1
+        if position is not None:
+            csv_content.seek(position)  # type: ignore[union-attr]
+        return categorized
+
+    async def _import_csv_chunk(self, user_id: int, rows: list[dict]) -> tuple[int, int]:
+        """Dedup and insert one chunk; returns ``(imported, duplicates)``."""
+        await self._resolve_names_for_rows(rows)
+        created = await self._uow.transactions.insert_new(rows)
+        if not created:
+            return 0, len(rows)
+
+        await self._uow.outbox.add_batch(
+            [
                 (
                     TransactionCreatedEvent(
                         transaction_id=tx.id,
@@ -403,16 +587,8 @@ class TransactionService(ITransactionService):
                 )
                 for tx in created
             ]
-            await self._uow.outbox.add_batch(outbox_entries)
-
-            await self._uow.commit()
-
-        return CSVImportResultDTO(
-            imported=len(created),
-            skipped=parsed.skipped,
-            duplicates_skipped=duplicates_skipped,
-            errors=parsed.errors,
         )
+        return len(created), len(rows) - len(created)
 
     async def bulk_import(
         self,
@@ -431,9 +607,10 @@ class TransactionService(ITransactionService):
         (imported pre-P2-09 or via CSV).  A fuzzy match against a row
         carrying a different external_id does NOT dedupe: two identical
         same-day purchases are distinct transactions (audit H10).  Items
-        without an external_id keep the pure fuzzy behavior.  A partial
-        unique index backstops the id key against concurrent imports
-        (migration 012).
+        without an external_id keep the pure fuzzy behavior, enforced by
+        the insert itself (``insert_new``, migration 018) rather than by a
+        lookup beforehand.  A partial unique index backstops the id key
+        against concurrent imports (migration 012).
 
         Publishes one ``TransactionCreatedEvent`` per newly inserted row
         via the outbox.  If items lack categorization metadata and a
@@ -444,53 +621,37 @@ class TransactionService(ITransactionService):
         errors = 0
         rows_to_create: list[dict] = []
 
-        # Batch anti-joins instead of a SELECT per item (H15): one lookup
-        # on (account_id, external_id) for id-bearing items plus one
-        # fuzzy lookup — scoped to external_id-IS-NULL rows for the
-        # transition fallback, unscoped for id-less items.
+        # Batch anti-joins instead of a SELECT per item (H15) — for
+        # id-bearing items only: one lookup on (account_id, external_id)
+        # plus the transition fallback scoped to external_id-IS-NULL rows.
+        # Id-less items are deduplicated by the insert (see below).
         existing_ext: set[ExternalIdKey] = set()
         legacy_keys: set[DedupKey] = set()
-        existing_keys: set[DedupKey] = set()
-        if dto.skip_duplicates and dto.items:
-            ext_items = [item for item in dto.items if item.external_id]
-            plain_items = [item for item in dto.items if not item.external_id]
+        ext_items = [item for item in dto.items if item.external_id]
+        if dto.skip_duplicates and ext_items:
             async with self._uow:
-                if ext_items:
-                    # Filtered off dto.items rather than off ext_items so the
-                    # external_id narrowing survives into the tuple — ext_items has
-                    # the same members, but its element type still says `str | None`.
-                    existing_ext = await self._uow.transactions.find_existing_external_ids(
-                        user_id,
-                        [(item.account_id, item.external_id) for item in dto.items if item.external_id],
-                    )
-                    legacy_keys = await self._uow.transactions.find_existing_dedup_keys(
-                        user_id,
-                        [self._item_dedup_key(item) for item in ext_items],
-                        only_missing_external_id=True,
-                    )
-                if plain_items:
-                    existing_keys = await self._uow.transactions.find_existing_dedup_keys(
-                        user_id,
-                        [self._item_dedup_key(item) for item in plain_items],
-                    )
+                # Filtered off dto.items rather than off ext_items so the
+                # external_id narrowing survives into the tuple — ext_items has
+                # the same members, but its element type still says `str | None`.
+                existing_ext = await self._uow.transactions.find_existing_external_ids(
+                    user_id,
+                    [(item.account_id, item.external_id) for item in dto.items if item.external_id],
+                )
+                legacy_keys = await self._uow.transactions.find_existing_dedup_keys(
+                    user_id,
+                    [self._item_dedup_key(item) for item in ext_items],
+                    only_missing_external_id=True,
+                )
 
-        seen_keys: set[DedupKey] = set()
         seen_ext: set[ExternalIdKey] = set()
         for item in dto.items:
             try:
-                if dto.skip_duplicates:
-                    if item.external_id:
-                        ext_key = (item.account_id, item.external_id)
-                        if ext_key in existing_ext or ext_key in seen_ext or self._item_dedup_key(item) in legacy_keys:
-                            duplicates_skipped += 1
-                            continue
-                        seen_ext.add(ext_key)
-                    else:
-                        key = self._item_dedup_key(item)
-                        if key in existing_keys or key in seen_keys:
-                            duplicates_skipped += 1
-                            continue
-                        seen_keys.add(key)
+                if dto.skip_duplicates and item.external_id:
+                    ext_key = (item.account_id, item.external_id)
+                    if ext_key in existing_ext or ext_key in seen_ext or self._item_dedup_key(item) in legacy_keys:
+                        duplicates_skipped += 1
+                        continue
+                    seen_ext.add(ext_key)
 
                 rows_to_create.append(
                     {
@@ -514,38 +675,7 @@ class TransactionService(ITransactionService):
                 logger.exception("Bulk-import validation failed for item")
                 errors += 1
 
-        uncategorized = [
-            i
-            for i, row in enumerate(rows_to_create)
-            if not row.get("categorization_tier") or row.get("categorization_tier") == "fallback"
-        ]
-
-        if uncategorized and self._cat_client is not None:
-            batch_items = [
-                {
-                    "description": rows_to_create[i].get("description") or "",
-                    "amount": float(rows_to_create[i]["amount"]),
-                    "direction": direction_of(rows_to_create[i]["transaction_type"]),
-                }
-                for i in uncategorized
-            ]
-            cat_results = await self._cat_client.categorize_batch(batch_items)
-            enriched = 0
-            for idx, cat_result in zip(uncategorized, cat_results):
-                if cat_result is not None:
-                    row = rows_to_create[idx]
-                    # Same rule as create_transaction: the producer's explicit
-                    # parent category wins over the categorizer's suggestion.
-                    if row.get("category_id") is None:
-                        row["category_id"] = cat_result.category_id
-                        row["subcategory_id"] = cat_result.subcategory_id
-                    elif row["category_id"] == cat_result.category_id:
-                        row["subcategory_id"] = cat_result.subcategory_id
-                    row["categorization_tier"] = cat_result.tier
-                    row["categorization_confidence"] = cat_result.confidence
-                    enriched += 1
-            if enriched:
-                logger.info("Bulk categorization: %d/%d items enriched", enriched, len(uncategorized))
+        await self._categorize_rows(rows_to_create)
 
         async with self._uow:
             await self._resolve_names_for_rows(rows_to_create)
@@ -558,7 +688,17 @@ class TransactionService(ITransactionService):
                     imported_ids=[],
                 )
 
-            created = await self._uow.transactions.bulk_create(rows_to_create)
+            if dto.skip_duplicates:
+                # Id-less rows go through ``insert_new``: a key some live row
+                # already holds — or that repeats in this payload — is skipped
+                # by ON CONFLICT DO NOTHING and counted from the difference.
+                plain_rows = [row for row in rows_to_create if not row.get("external_id")]
+                ext_rows = [row for row in rows_to_create if row.get("external_id")]
+                new_rows = await self._uow.transactions.insert_new(plain_rows) if plain_rows else []
+                duplicates_skipped += len(plain_rows) - len(new_rows)
+                created = (await self._uow.transactions.bulk_create(ext_rows) if ext_rows else []) + new_rows
+            else:
+                created = await self._uow.transactions.bulk_create(rows_to_create)
 
             outbox_entries = [
                 (
@@ -584,7 +724,8 @@ class TransactionService(ITransactionService):
                 )
                 for tx in created
             ]
-            await self._uow.outbox.add_batch(outbox_entries)
+            if outbox_entries:
+                await self._uow.outbox.add_batch(outbox_entries)
 
             await self._uow.commit()
 
@@ -660,7 +801,7 @@ class TransactionService(ITransactionService):
         """
         if category_id is None:
             return fallback
-        category = await self._uow.categories.find_by_id(category_id)
+        category = await self._find_category(category_id)
         if category is None:
             return fallback
         return category.name
@@ -668,36 +809,99 @@ class TransactionService(ITransactionService):
     async def _resolve_subcategory_name(self, subcategory_id: int | None) -> str | None:
         if subcategory_id is None:
             return None
-        subcategory = await self._uow.subcategories.find_by_id(subcategory_id)
+        subcategory = await self._find_subcategory(subcategory_id)
         return subcategory.name if subcategory else None
 
+    async def _categorize_rows(self, rows: list[dict]) -> None:
+        """Sync-categorize bulk rows in place through the batch endpoint.
+
+        Rows that arrive categorized (any tier but ``fallback``) are left
+        alone.  The rest go out in slices of ``CATEGORIZATION_BATCH_ITEMS``;
+        a row the categorizer has no answer for — or all of them, while it
+        is down — is inserted as is and categorized by the async pipeline.
+        """
+        if self._cat_client is None:
+            return
+        uncategorized = [
+            i
+            for i, row in enumerate(rows)
+            if not row.get("categorization_tier") or row.get("categorization_tier") == "fallback"
+        ]
+        enriched = 0
+        for start in range(0, len(uncategorized), settings.CATEGORIZATION_BATCH_ITEMS):
+            indexes = uncategorized[start : start + settings.CATEGORIZATION_BATCH_ITEMS]
+            cat_results = await self._cat_client.categorize_batch(
+                [
+                    {
+                        "description": rows[i].get("description") or "",
+                        "amount": float(rows[i]["amount"]),
+                        "direction": direction_of(rows[i]["transaction_type"]),
+                    }
+                    for i in indexes
+                ]
+            )
+            for idx, cat_result in zip(indexes, cat_results):
+                if cat_result is None:
+                    continue
+                row = rows[idx]
+                # Same rule as create_transaction: the producer's explicit
+                # parent category wins over the categorizer's suggestion.
+                if row.get("category_id") is None:
+                    row["category_id"] = cat_result.category_id
+                    row["subcategory_id"] = cat_result.subcategory_id
+                elif row["category_id"] == cat_result.category_id:
+                    row["subcategory_id"] = cat_result.subcategory_id
+                row["categorization_tier"] = cat_result.tier
+                row["categorization_confidence"] = cat_result.confidence
+                enriched += 1
+        if enriched:
+            logger.info("Bulk categorization: %d/%d rows enriched", enriched, len(uncategorized))
+
     async def _resolve_names_for_rows(self, rows: list[dict]) -> None:
         """Batch-resolve denormalized names on bulk rows in place."""
         category_ids = {row["category_id"] for row in rows if row.get("category_id") is not None}
-        subcategory_ids = [row["subcategory_id"] for row in rows if row.get("subcategory_id") is not None]
-
-        category_names: dict[int, str] = {}
-        for cat_id in category_ids:
+        subcategory_ids = {row["subcategory_id"] for row in rows if row.get("subcategory_id") is not None}
+        if not category_ids and not subcategory_ids:
+            return
+
+        snapshot = await self._taxonomy_snapshot()
+        categories = dict(snapshot.categories) if snapshot is not None else {}
+        subcategories = dict(snapshot.subcategories) if snapshot is not None else {}
+        for cat_id in category_ids - categories.keys():
             category = await self._uow.categories.find_by_id(cat_id)
             if category is not None:
-                category_names[cat_id] = category.name
-
-        subcategories = await self._uow.subcategories.find_by_ids(subcategory_ids)
+                categories[cat_id] = category
+        missing_subcategory_ids = sorted(subcategory_ids - subcategories.keys())
+        if missing_subcategory_ids:
+            subcategories.update(await self._uow.subcategories.find_by_ids(missing_subcategory_ids))
 
         for row in rows:
             cat_id = row.get("category_id")
-            if cat_id is not None and cat_id in category_names:
-                row["category_name"] = category_names[cat_id]
+            if cat_id is not None and cat_id in categories:
+                row["category_name"] = categories[cat_id].name
             sub_id = row.get("subcategory_id")
             if sub_id is not None and sub_id in subcategories:
                 row["subcategory_name"] = subcategories[sub_id].name
 
-    # ── Mapping helpers ─────────────────────────────────────────────
+    async def _find_category(self, category_id: int) -> Category | None:
+        """From the taxonomy snapshot; an id it lacks is asked of the read copy."""
+        snapshot = await self._taxonomy_snapshot()
+        if snapshot is not None and category_id in snapshot.categories:
+            return snapshot.categories[category_id]
+        return await self._uow.categories.find_by_id(category_id)
+
+    async def _find_subcategory(self, subcategory_id: int) -> SubCategory | None:
+        snapshot = await self._taxonomy_snapshot()
+        if snapshot is not None and subcategory_id in snapshot.subcategories:
+            return snapshot.subcategories[subcategory_id]
+        return await self._uow.subcategories.find_by_id(subcategory_id)
+
+    async def _taxonomy_snapshot(self) -> TaxonomySnapshot | None:
+        if self._taxonomy is None:
+            return None
+        return await self._taxonomy.get(self._uow.categories, self._uow.subcategories)
 
-    @staticmethod
-    def _row_dedup_key(row: dict) -> DedupKey:
-        """Dedup key for a parsed CSV row (user_id is passed separately)."""
-        return (row["account_id"], row["tx_date"], row["amount"], row.get("description"))
+    # ── Mapping helpers ─────────────────────────────────────────────
 
     @staticmethod
     def _item_dedup_key(item: BulkCreateTransactionItemDTO) -> DedupKey:
@@ -743,3 +947,15 @@ class TransactionService(ITransactionService):
             is_active=entity.is_active,
             created_at=entity.created_at,
         )
+
+
+async def _chunked(rows: Iterable[dict], size: int) -> AsyncIterator[list[dict]]:
+    """``size`` rows at a time, each chunk pulled on a worker thread.
+
+    Pulling rows reads the spooled upload (a disk file past 1 MiB) and
+    parses it — blocking I/O and CPU that would otherwise stall every
+    other request on the event loop for the length of the import.
+    """
+    iterator = iter(rows)
+    while chunk := await asyncio.to_thread(lambda: list(itertools.islice(iterator, size))):
+        yield chunk
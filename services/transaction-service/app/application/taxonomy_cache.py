@@ -0,0 +1,97 @@
+"""Process-local snapshot of the taxonomy read copies.
+
+Every write path resolves denormalized names from ``categories`` and
+``subcategories`` (and ``update_transaction`` validates a subcategory's
+parent), which cost one or more point SELECTs per request for data that
+is ~10 + ~40 rows and changes a few times a year.  :class:`TaxonomyCache`
+holds the whole taxonomy in memory as an immutable, versioned
+:class:`TaxonomySnapshot`, reloaded in one pair of queries when stale.
+
+Staleness has three sources of truth, cheapest first:
+
+* ``invalidate()`` — called when the taxonomy sync consumer's
+  ``NOTIFY`` arrives (``adapters/outbound/taxonomy_notify.py``), so a
+  rename reaches every process within a round trip of its commit;
+* the TTL — the backstop for a notification lost while a listener was
+  reconnecting, or a process with no listener at all;
+* a miss — callers treat an id absent from the snapshot as "ask the read
+  copy" rather than "unknown", so an id synced a moment ago is never
+  refused while its notification is in flight.
+
+A load runs at most once at a time (waiters reuse its result), and a load
+that an ``invalidate()`` overtook is returned to its caller but not kept,
+so a notification can never be lost to a reload that read just before it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from app.application.ports.outbound import ICategoryRepository, ISubCategoryReadRepository
+from app.domain.entities import Category, SubCategory
+
+
+@dataclass(frozen=True)
+class TaxonomySnapshot:
+    """The taxonomy read copies as of one load; ``version`` counts loads."""
+
+    version: int
+    categories: Mapping[int, Category]
+    subcategories: Mapping[int, SubCategory]
+
+
+class TaxonomyCache:
+    def __init__(self, ttl_s: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._snapshot: TaxonomySnapshot | None = None
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._loaded_generation = -1
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        """Version of the last snapshot loaded; 0 before the first load."""
+        return self._snapshot.version if self._snapshot is not None else 0
+
+    async def get(
+        self,
+        categories: ICategoryRepository,
+        subcategories: ISubCategoryReadRepository,
+    ) -> TaxonomySnapshot:
+        """The current snapshot, reloaded through the given repositories if stale."""
+        snapshot = self._fresh()
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            snapshot = self._fresh()
+            if snapshot is not None:
+                return snapshot
+            generation = self._generation
+            snapshot = TaxonomySnapshot(
+                version=self.version + 1,
+                categories={category.id: category for category in await categories.find_all()},
+                subcategories={sub.id: sub for sub in await subcategories.find_all()},
+            )
+            if generation == self._generation:
+                self._snapshot = snapshot
+                self._loaded_at = self._clock()
+                self._loaded_generation = generation
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale; the next :meth:`get` reloads."""
+        self._generation += 1
+
+    def _fresh(self) -> TaxonomySnapshot | None:
+        if (
+            self._snapshot is None
+            or self._loaded_generation != self._generation
+            or self._clock() - self._loaded_at >= self._ttl_s
+        ):
+            return None
+        return self._snapshot
@@ -14,17 +14,53 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     CATEGORIZATION_SERVICE_URL: str = "http://localhost:8005"
     CATEGORIZATION_TIMEOUT_S: float = 0.5
+    # Pooled keep-alive connections to categorization-service; HTTP/2 needs
+    # the ``h2`` package (``httpx[http2]``).
+    CATEGORIZATION_MAX_CONNECTIONS: int = 20
+    CATEGORIZATION_HTTP2: bool = False
+    # Sync categorization is skipped for CATEGORIZATION_BREAKER_RESET_S after
+    # this many consecutive failures; the async pipeline categorizes instead.
+    CATEGORIZATION_BREAKER_FAILURES: int = 5
+    CATEGORIZATION_BREAKER_RESET_S: float = 30.0
+    # Rows per /categorize/batch call from imports; the endpoint's own cap
+    # is 500 (MAX_BATCH_ITEMS in categorization-service).
+    CATEGORIZATION_BATCH_ITEMS: int = 500
     INTERNAL_API_KEY: str | None = None
+    # Key-partitioned handler pool for the transaction.categorized consumer;
+    # ordering is kept per transaction_id. 1 = the old strictly-serial mode.
+    CATEGORIZED_CONSUMER_CONCURRENCY: int = 8
+    # Messages per partition applied in one UPDATE + commit (micro-batch).
+    # 1 = one transaction per message.
+    CATEGORIZED_CONSUMER_BATCH_SIZE: int = 25
 
     # CSV-import guards (P2-29). Both are enforced; they catch different files.
-    # CSV_MAX_BYTES bounds peak memory: import_csv holds three live copies of
-    # the payload (bytes → str → StringIO), and the k8s pod is capped at 512Mi,
-    # so 10 MiB peaks at ~30 MiB (~6%). CSV_MAX_ROWS bounds the single
-    # bulk_create + outbox batch; at ~76 bytes/row a realistic 5-year bank
-    # export is ~3 000 rows, so this is ~17x headroom and is the limit that
-    # actually binds for well-formed files.
+    # CSV_MAX_BYTES bounds the upload spooled to disk; the import streams it
+    # (the parser holds one read chunk + one row chunk; inserts are Core
+    # statements the session does not track), so it no longer sizes memory.
+    # What still grows with the file is the categorization pre-pass: four
+    # values per re-categorized row, kept for the insert pass, bounded by
+    # CSV_MAX_ROWS. CSV_MAX_ROWS bounds the single DB transaction an import
+    # is; at ~76 bytes/row a realistic 5-year bank export is ~3 000 rows, so
+    # this is ~17x headroom and is the limit that actually binds for
+    # well-formed files.
     CSV_MAX_BYTES: int = 10 * 1024 * 1024
     CSV_MAX_ROWS: int = 50_000
+    # Rows per dedup-insert + outbox flush while importing.
+    CSV_IMPORT_CHUNK_ROWS: int = 1_000
+    # Per-row error messages returned by an import; the rest are counted
+    # in ``skipped`` only.
+    CSV_MAX_REPORTED_ERRORS: int = 1_000
+
+    # Cursor-mode listing serves ``total_count`` from a per-filter-shape
+    # cache instead of a COUNT per page; it may trail writes by the TTL.
+    LIST_TOTAL_CACHE_TTL_S: float = 30.0
+    LIST_TOTAL_CACHE_MAX_ENTRIES: int = 10_000
+    # In-memory taxonomy snapshot: reloaded on the sync consumer's NOTIFY,
+    # and at the latest this long after the last load.
+    TAXONOMY_CACHE_TTL_S: float = 300.0
+    # Rows fetched per server-side cursor round trip by the export; one
+    # batch is all the export holds in memory.
+    EXPORT_BATCH_ROWS: int = 2_000
 
 
 settings = Settings()
@@ -1,19 +1,39 @@
 from __future__ import annotations
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.outbound.categorization_client import CategorizationClient
 from app.adapters.outbound.unit_of_work import SQLAlchemyUnitOfWork
+from app.application.pagination import TotalCountCache
 from app.application.ports.inbound import ITransactionService
 from app.application.service import TransactionService
+from app.application.taxonomy_cache import TaxonomyCache
+from app.config import settings
 from app.database import get_db
 
-_categorization_client = CategorizationClient()
+_total_cache = TotalCountCache(settings.LIST_TOTAL_CACHE_TTL_S, settings.LIST_TOTAL_CACHE_MAX_ENTRIES)
+#: Loaded at startup and invalidated by the lifespan's TaxonomyInvalidator.
+taxonomy_cache = TaxonomyCache(settings.TAXONOMY_CACHE_TTL_S)
+
+
+def get_categorization_client(request: Request) -> CategorizationClient | None:
+    """The pooled client the app lifespan opened and will close (``app.state``).
+
+    ``None`` when the app runs without its lifespan (``ASGITransport`` in
+    tests): the service then imports without categorizing.
+    """
+    return getattr(request.app.state, "categorization_client", None)
 
 
 async def get_transaction_service(
     db: AsyncSession = Depends(get_db),
+    categorization_client: CategorizationClient | None = Depends(get_categorization_client),
 ) -> ITransactionService:
     uow = SQLAlchemyUnitOfWork(db)
-    return TransactionService(uow=uow, categorization_client=_categorization_client)
+    return TransactionService(
+        uow=uow,
+        categorization_client=categorization_client,
+        total_cache=_total_cache,
+        taxonomy=taxonomy_cache,
+    )
@@ -34,3 +34,17 @@ class SubcategoryMismatchException(Exception):
         self.subcategory_id = subcategory_id
         self.category_id = category_id
         super().__init__(f"Subcategory {subcategory_id} does not belong to category {category_id}")
+
+
+class InvalidCursorException(Exception):
+    """A ``cursor`` the listing endpoint did not issue (or ``skip`` alongside one)."""
+
+    def __init__(self, cursor: str, reason: str = "is not a valid cursor") -> None:
+        self.cursor = cursor
+        super().__init__(f"Cursor {cursor!r} {reason}")
+
+
+class ExportFormatUnavailableException(Exception):
+    def __init__(self, export_format: str, reason: str) -> None:
+        self.export_format = export_format
+        super().__init__(f"Export format {export_format!r} is unavailable: {reason}")
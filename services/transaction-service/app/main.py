@@ -1,16 +1,25 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from observability import setup_logging
 
 from app.adapters.inbound.rest_api import planned_router, transaction_router
+from app.adapters.outbound.categorization_client import CategorizationClient
+from app.adapters.outbound.postgres_category_repository import PostgresCategoryRepository
+from app.adapters.outbound.postgres_subcategory_repository import PostgresSubCategoryReadRepository
+from app.adapters.outbound.taxonomy_notify import TaxonomyInvalidator
 from app.config import settings
+from app.database import async_session_factory, engine
+from app.dependencies import taxonomy_cache
 from app.domain.exceptions import (
     CSVImportException,
+    ExportFormatUnavailableException,
+    InvalidCursorException,
     InvalidTransactionException,
     PlannedTransactionNotFoundException,
     SubcategoryMismatchException,
@@ -23,12 +32,41 @@ setup_logging(settings.LOG_LEVEL)
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Created here rather than at import: the pool belongs to this loop
+    # and this lifespan, which closes it (see dependencies.get_categorization_client).
+    categorization_client = CategorizationClient()
+    app.state.categorization_client = categorization_client
+    # Listen before loading, so a taxonomy change committed mid-load
+    # still invalidates what the load read.
+    invalidator = TaxonomyInvalidator(engine, taxonomy_cache, safety_poll_interval=settings.TAXONOMY_CACHE_TTL_S)
+    try:
+        invalidator.start()
+        try:
+            async with async_session_factory() as session:
+                await taxonomy_cache.get(
+                    PostgresCategoryRepository(session), PostgresSubCategoryReadRepository(session)
+                )
+        except Exception:
+            # Not fatal: the first write that needs a name loads it instead.
+            logger.warning("Taxonomy snapshot not loaded at startup", exc_info=True)
+        yield
+    finally:
+        try:
+            await invalidator.close()
+        finally:
+            await categorization_client.aclose()
+
+
 app = FastAPI(
     title="Transaction Service",
     version="0.2.0",
     description="Handles financial transactions and planned transactions. "
     "Domain events are persisted via transactional outbox and "
     "published by a separate worker process.",
+    lifespan=lifespan,
 )
 
 
@@ -93,6 +131,16 @@ async def invalid_transaction_handler(_request: Request, exc: InvalidTransaction
     return JSONResponse(status_code=400, content={"detail": str(exc)})
 
 
+@app.exception_handler(InvalidCursorException)
+async def invalid_cursor_handler(_request: Request, exc: InvalidCursorException) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(ExportFormatUnavailableException)
+async def export_format_unavailable_handler(_request: Request, exc: ExportFormatUnavailableException) -> JSONResponse:
+    return JSONResponse(status_code=501, content={"detail": str(exc)})
+
+
 @app.exception_handler(CSVImportException)
 async def csv_import_handler(_request: Request, exc: CSVImportException) -> JSONResponse:
     return JSONResponse(status_code=400, content={"detail": str(exc)})
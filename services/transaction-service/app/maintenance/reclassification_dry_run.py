@@ -16,16 +16,20 @@ from app.database import async_session_factory
 
 async def _run(args: argparse.Namespace) -> None:
     mapping = load_mapping(Path(args.mapping))
-    async with async_session_factory() as session, session.begin():
-        if session.bind is not None and session.bind.dialect.name == "postgresql":
-            await session.execute(text("SET TRANSACTION READ ONLY"))
-        report = await scan_transactions(
-            session,
-            run_id=args.run_id,
-            captured_at=args.captured_at,
-            mapping=mapping,
-            evidence_categorizer=CategorizationClient(),
-        )
+    categorizer = CategorizationClient()
+    try:
+        async with async_session_factory() as session, session.begin():
+            if session.bind is not None and session.bind.dialect.name == "postgresql":
+                await session.execute(text("SET TRANSACTION READ ONLY"))
+            report = await scan_transactions(
+                session,
+                run_id=args.run_id,
+                captured_at=args.captured_at,
+                mapping=mapping,
+                evidence_categorizer=categorizer,
+            )
+    finally:
+        await categorizer.aclose()
     write_report(report, Path(args.output_dir).resolve())
 
 
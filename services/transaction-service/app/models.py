@@ -96,6 +96,9 @@ class TransactionModel(Base):
     # undtagelse — den skal kunne se rækken for at skelne "slettet" fra
     # "ikke committet endnu".
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # SHA-256 of the import dedup key (migration 018).  Held by at most one
+    # live row per key; deliberate duplicates are stored with NULL.
+    dedup_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime | None] = mapped_column(onupdate=func.now())
 
@@ -112,6 +115,26 @@ class TransactionModel(Base):
             "amount",
             "description",
         ),
+        # Keyset listing (migration 017): ``(date, id) < (:date, :id)``
+        # under ``date DESC, id DESC`` is a backward range scan here.
+        # Partial like every read path — tombstones never need an entry.
+        Index(
+            "ix_transactions_user_date_id",
+            "user_id",
+            "date",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Import dedup (migration 018): ``INSERT ... ON CONFLICT DO NOTHING``
+        # arbitrates on this.  Partial on ``deleted_at IS NULL`` so a
+        # tombstone releases its key and re-import re-creates the row.
+        Index(
+            "uq_transactions_dedup_fingerprint",
+            "dedup_fingerprint",
+            unique=True,
+            postgresql_where=text("dedup_fingerprint IS NOT NULL AND deleted_at IS NULL"),
+            sqlite_where=text("dedup_fingerprint IS NOT NULL AND deleted_at IS NULL"),
+        ),
         # Idempotency key for bank imports — unique only where an
         # external_id exists, so manual/CSV duplicates stay legal.
         # Doubles as the concurrent-saga backstop (migration 012).
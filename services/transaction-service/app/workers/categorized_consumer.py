@@ -13,12 +13,15 @@ deliberately does NOT use the base's ``InboxDeduplicator`` hook: the inbox
 row must commit atomically with the transaction update, so it is written
 inside ``handle``'s own DB transaction.
 
-The stale-retry backoff is preserved: when the transaction row is not
-persisted yet (categorized event raced ahead of the tx commit), ``handle``
-sleeps ``2**retry_count`` seconds before raising, and the base's retry
-ladder republishes with an incremented ``x-retry-count`` header.  The
-inline sleep blocks this consumer only (prefetch=1) — same behavior as
-the pre-shared implementation, observed load-bearing in live runs.
+When the transaction row is not persisted yet (categorized event raced
+ahead of the tx commit), ``handle`` raises and the base parks the
+message in its retry delay tiers (1 s, 5 s, then 25 s; ``MAX_RETRIES``
+attempts) before it comes back.  That wait used to be an inline
+``2**retry_count`` sleep — load-bearing while retries were republished
+immediately, but it held the partition, and every message batched
+behind it, for the whole backoff.  Handling is partitioned by
+``transaction_id`` (``CATEGORIZED_CONSUMER_CONCURRENCY``), so two events
+for one transaction still apply in order.
 
 A row that exists with ``deleted_at`` set is the *other* case, and since
 P2-25 it is distinguishable: the categorization is moot, retrying cannot
@@ -27,6 +30,21 @@ soft-delete both states looked like "row not found", which is why tx 1133
 burned five retries and landed in the DLQ — see
 ``dev-notes/findings/2026-07-25-transaction-hard-delete-categorized-dlq.md``.
 
+The v1-payload fallback to a local parent-name lookup is served from a
+process-local taxonomy snapshot (``app.application.taxonomy_cache``),
+invalidated by the taxonomy sync consumer's NOTIFY.
+
+After an import thousands of these events arrive in a burst, so each
+partition also micro-batches up to ``CATEGORIZED_CONSUMER_BATCH_SIZE``
+messages through ``handle_batch``: one inbox lookup (only for ids the
+``InboxFilter`` cannot rule out), one existence check, one
+``UPDATE ... FROM (VALUES ...)`` carrying the manual-tier guard and the
+no-op check in its WHERE clause, the inbox rows, and one commit.  Events
+whose transaction is not visible yet are returned as deferred: the base
+re-runs them through ``handle``, which looks again and otherwise sends
+them to the retry tiers — no waiting in the partition.  Any failure rolls the
+batch back and the base replays it one message at a time.
+
 Run as a standalone process::
 
     python -m app.workers.categorized_consumer
@@ -36,16 +54,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Collection, Iterable
 from typing import Any
 
-from aio_pika.abc import AbstractIncomingMessage
-from messaging import ConsumerBase, PoisonMessageError, setup_worker_logging
-from sqlalchemy import select
+from aio_pika.abc import AbstractIncomingMessage, AbstractRobustConnection
+from messaging import ConsumerBase, InboxFilter, PoisonMessageError, setup_worker_logging
+from sqlalchemy import Integer, String, cast, column, func, or_, select, update, values
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters.outbound.postgres_category_repository import PostgresCategoryRepository
+from app.adapters.outbound.postgres_subcategory_repository import PostgresSubCategoryReadRepository
+from app.adapters.outbound.taxonomy_notify import TaxonomyInvalidator
+from app.application.taxonomy_cache import TaxonomyCache
 from app.config import settings
-from app.database import async_session_factory
+from app.database import async_session_factory, engine
 from app.models import CategoryModel, ProcessedEventModel, TransactionModel
 from app.workers.retry_headers import retry_count
 
@@ -63,8 +86,33 @@ class TransactionCategorizedConsumer(ConsumerBase):
             queue_name=QUEUE_NAME,
             routing_keys=ROUTING_KEY,
             max_retries=MAX_RETRIES,
+            concurrency=settings.CATEGORIZED_CONSUMER_CONCURRENCY,
+            batch_size=settings.CATEGORIZED_CONSUMER_BATCH_SIZE,
+        )
+        self._inbox = InboxFilter()
+        self._taxonomy = TaxonomyCache(settings.TAXONOMY_CACHE_TTL_S)
+        self._invalidator = TaxonomyInvalidator(
+            engine, self._taxonomy, safety_poll_interval=settings.TAXONOMY_CACHE_TTL_S
         )
 
+    def ordering_key(self, payload: dict[str, Any]) -> str | None:
+        transaction_id = payload.get("transaction_id")
+        return None if transaction_id is None else str(transaction_id)
+
+    async def on_start(self) -> None:
+        async with async_session_factory() as session:
+            await self._inbox.warm(
+                session,
+                select(ProcessedEventModel.message_id).where(ProcessedEventModel.consumer_name == QUEUE_NAME),
+            )
+        self._invalidator.start()
+
+    async def run(self, connection: AbstractRobustConnection | None = None) -> None:
+        try:
+            await super().run(connection)
+        finally:
+            await self._invalidator.close()
+
     async def handle(self, payload: dict[str, Any], message: AbstractIncomingMessage) -> None:
         message_id = payload.get("correlation_id", "")
         transaction_id = payload.get("transaction_id")
@@ -73,13 +121,20 @@ class TransactionCategorizedConsumer(ConsumerBase):
             raise PoisonMessageError("Missing transaction_id in event payload")
 
         async with async_session_factory() as session:
-            if message_id and await self._is_duplicate(session, message_id):
+            if message_id and await self._inbox.is_duplicate(
+                message_id, lambda: self._is_duplicate(session, message_id)
+            ):
                 logger.info("Skipping duplicate (message_id=%s)", message_id)
                 return
 
             tx = await self._get_transaction(session, transaction_id)
             if tx is None:
-                await self._stale_backoff(message, transaction_id)
+                logger.warning(
+                    "Transaction %s not found yet (retry=%d/%d) — retrying after a delay",
+                    transaction_id,
+                    retry_count(message) + 1,
+                    MAX_RETRIES,
+                )
                 raise _TransactionNotFoundYet(transaction_id)
             if tx.deleted_at is not None:
                 # Gone for good — retrying cannot help (P2-25).  Ack quietly
@@ -114,23 +169,176 @@ class TransactionCategorizedConsumer(ConsumerBase):
                     return
                 raise
 
+            if message_id:
+                self._inbox.add(message_id)
+
+    async def handle_batch(self, payloads: list[dict[str, Any]]) -> Collection[int] | None:
+        """Apply a micro-batch of categorizations in one UPDATE and one commit.
+
+        Returns the indexes of events whose transaction is not visible
+        yet; they get no inbox row and go back through :meth:`handle`.
+        Exceptions propagate on purpose — the base then replays the batch
+        message by message, which also settles a processed_events race.
+        """
+        if any(not payload.get("transaction_id") for payload in payloads):
+            raise PoisonMessageError("Missing transaction_id in event payload")
+
+        async with async_session_factory() as session:
+            message_ids = [p.get("correlation_id", "") for p in payloads]
+            verdicts = {m: self._inbox.seen(m) for m in message_ids if m}
+            seen = {m for m, verdict in verdicts.items() if verdict}
+            seen |= await self._processed_message_ids(
+                session, [m for m, verdict in verdicts.items() if verdict is None]
+            )
+
+            fresh: list[tuple[int, str, dict[str, Any]]] = []
+            for index, (message_id, payload) in enumerate(zip(message_ids, payloads, strict=True)):
+                if message_id and message_id in seen:
+                    logger.info("Skipping duplicate (message_id=%s)", message_id)
+                    continue
+                if message_id:
+                    # A redelivery inside the same batch counts as seen too.
+                    seen.add(message_id)
+                fresh.append((index, message_id, payload))
+            if not fresh:
+                return None
+
+            # Like _get_transaction, deliberately blind to deleted_at: a
+            # missing row means "not committed yet", a tombstone means gone.
+            stmt = select(TransactionModel.id, TransactionModel.deleted_at).where(
+                TransactionModel.id.in_({int(payload["transaction_id"]) for _, _, payload in fresh})
+            )
+            deleted_at_by_id = dict((await session.execute(stmt)).tuples().all())
+
+            deferred: list[int] = []
+            applied: list[str] = []
+            # Events for one transaction arrive in order within a partition,
+            # so the last one in the batch is the one the serial path would
+            # have left behind.
+            latest: dict[int, dict[str, Any]] = {}
+            for index, message_id, payload in fresh:
+                transaction_id = int(payload["transaction_id"])
+                if transaction_id not in deleted_at_by_id:
+                    deferred.append(index)
+                    continue
+                if deleted_at_by_id[transaction_id] is not None:
+                    logger.info("Transaction %s deleted — categorization moot, acking", transaction_id)
+                else:
+                    latest[transaction_id] = payload
+                if message_id:
+                    self._add_inbox_row(session, message_id, payload.get("event_type", ""))
+                    applied.append(message_id)
+
+            updated = 0
+            if latest:
+                parent_names = await self._lookup_parent_names(session, latest.values())
+                result = await session.execute(
+                    self._batch_update_statement(latest, parent_names),
+                    execution_options={"synchronize_session": False},
+                )
+                updated = result.rowcount
+            await session.commit()
+
+        for message_id in applied:
+            self._inbox.add(message_id)
+
+        logger.info(
+            "Applied categorization batch: %d updated, %d unchanged or manual, %d not visible yet, %d duplicate",
+            updated,
+            len(latest) - updated,
+            len(deferred),
+            len(payloads) - len(fresh),
+        )
+        return deferred or None
+
     @staticmethod
-    async def _stale_backoff(message: AbstractIncomingMessage, transaction_id: int) -> None:
-        """Exponential wait before the base republishes a not-found-yet event."""
-        retries = retry_count(message)
-        if retries < MAX_RETRIES:
-            delay = 2**retries
+    def _batch_update_statement(latest: dict[int, dict[str, Any]], parent_names: dict[int, str]) -> Any:
+        """One ``UPDATE transactions ... FROM (VALUES ...)`` for the batch.
+
+        Mirrors :meth:`_apply_categorization` row for row: a manual tier is
+        never overwritten, an unresolved parent name or an absent
+        ``category_id``/``subcategory_name`` keeps the current value, and
+        a row already matching the event is not written at all.
+        """
+        rows = values(
+            column("id", Integer),
+            column("category_id", Integer),
+            column("category_name", String),
+            column("subcategory_id", Integer),
+            column("subcategory_name", String),
+            column("tier", String),
+            column("confidence", String),
+            name="categorized",
+        ).data(
+            [
+                (
+                    transaction_id,
+                    event.get("category_id"),
+                    event.get("category_name") or parent_names.get(event.get("category_id")),  # type: ignore[arg-type]
+                    event.get("subcategory_id"),
+                    event.get("subcategory_name", "") or None,
+                    event.get("tier", ""),
+                    event.get("confidence", ""),
+                )
+                for transaction_id, event in latest.items()
+            ]
+        )
+        tx = TransactionModel
+        # A VALUES column whose rows are all NULL is typed text by Postgres
+        # (SQLAlchemy renders None as a bare NULL), so pin the integer ones.
+        category_id = cast(rows.c.category_id, Integer)
+        target = {
+            "subcategory_id": cast(rows.c.subcategory_id, Integer),
+            "categorization_tier": rows.c.tier,
+            "categorization_confidence": rows.c.confidence,
+            "category_id": func.coalesce(category_id, tx.category_id),
+            "category_name": func.coalesce(rows.c.category_name, tx.category_name),
+            "subcategory_name": func.coalesce(rows.c.subcategory_name, tx.subcategory_name),
+        }
+        return (
+            update(tx)
+            .where(
+                tx.id == rows.c.id,
+                tx.deleted_at.is_(None),
+                # Protect a manual user choice, as the per-message path does.
+                tx.categorization_tier.is_distinct_from("manual"),
+                or_(*(getattr(tx, name).is_distinct_from(value) for name, value in target.items())),
+            )
+            .values(target)
+        )
+
+    async def _lookup_parent_names(self, session: AsyncSession, events: Iterable[dict[str, Any]]) -> dict[int, str]:
+        """Parent names for the v1 events in a batch (those without ``category_name``).
+
+        Snapshot first, then one SELECT for the ids it lacks; an id still
+        unknown is left out, so the UPDATE keeps that row's current name.
+        """
+        wanted = {
+            event["category_id"]
+            for event in events
+            if not event.get("category_name") and event.get("category_id") is not None
+        }
+        if not wanted:
+            return {}
+        snapshot = await self._taxonomy.get(
+            PostgresCategoryRepository(session), PostgresSubCategoryReadRepository(session)
+        )
+        names = {
+            category_id: snapshot.categories[category_id].name for category_id in wanted & snapshot.categories.keys()
+        }
+        missing = wanted - names.keys()
+        if missing:
+            stmt = select(CategoryModel.id, CategoryModel.name).where(CategoryModel.id.in_(missing))
+            names.update((await session.execute(stmt)).tuples().all())
+        for category_id in sorted(wanted - names.keys()):
             logger.warning(
-                "Transaction %s not found yet (retry=%d/%d, backoff=%ds)",
-                transaction_id,
-                retries + 1,
-                MAX_RETRIES,
-                delay,
+                "Cannot resolve parent name for category_id=%s — "
+                "category_name left unchanged (categories table not synced?)",
+                category_id,
             )
-            await asyncio.sleep(delay)
+        return names
 
-    @staticmethod
-    async def _lookup_parent_name(session: AsyncSession, category_id: int | None) -> str | None:
+    async def _lookup_parent_name(self, session: AsyncSession, category_id: int | None) -> str | None:
         """Resolve the parent category name from the local categories table.
 
         ``category_name`` on a transaction is always the parent-level name, so
@@ -141,7 +349,10 @@ class TransactionCategorizedConsumer(ConsumerBase):
         """
         if category_id is None:
             return None
-        cat = await session.get(CategoryModel, category_id)
+        snapshot = await self._taxonomy.get(
+            PostgresCategoryRepository(session), PostgresSubCategoryReadRepository(session)
+        )
+        cat = snapshot.categories.get(category_id) or await session.get(CategoryModel, category_id)
         if cat is None:
             # category_id not in the local categories table (e.g. not yet
             # synced).  category_name is left stale while subcategory_name is
@@ -234,6 +445,16 @@ class TransactionCategorizedConsumer(ConsumerBase):
         result = await session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    @staticmethod
+    async def _processed_message_ids(session: AsyncSession, message_ids: list[str]) -> set[str]:
+        if not message_ids:
+            return set()
+        stmt = select(ProcessedEventModel.message_id).where(
+            ProcessedEventModel.message_id.in_(message_ids),
+            ProcessedEventModel.consumer_name == QUEUE_NAME,
+        )
+        return set((await session.execute(stmt)).scalars().all())
+
     @staticmethod
     def _add_inbox_row(session: AsyncSession, message_id: str, event_type: str) -> None:
         session.add(
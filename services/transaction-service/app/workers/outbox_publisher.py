@@ -7,25 +7,60 @@ Run as a standalone process::
 All poll/publish/backoff logic lives in ``messaging.OutboxPublisherWorker``
 (same exchange ``finans_tracker.events``, routing key = ``event_type``,
 persistent JSON messages, ``min(2**attempts * 5, 300)`` backoff).
+
+Wakes on the ``outbox_events`` NOTIFY trigger (migration 015) rather than
+a 2s poll; the listener falls back to a 30s safety poll.
+
+Runs in pipelined mode: CSV imports and bank-sync saga imports write
+thousands of ``transaction.created`` rows in one commit, and the
+per-entry mode drains those one broker round trip at a time.
+
+outbox_events is range-partitioned (migration 016); this worker also
+maintains its partitions on its hourly housekeeping tick, polls only
+the hot partitions, and trims expired processed_events rows in batches.
 """
 
 from __future__ import annotations
 
 import asyncio
+from datetime import timedelta
 
-from messaging import OutboxPublisherWorker, setup_worker_logging
+from messaging import (
+    OUTBOX_EVENTS,
+    InboxPurger,
+    OutboxNotifyListener,
+    OutboxPublisherWorker,
+    OutboxRepository,
+    PartitionMaintainer,
+    setup_worker_logging,
+)
 
 from app.config import settings
-from app.database import async_session_factory
+from app.database import async_session_factory, engine
 from app.models import OutboxEventModel
 
+#: Pending poll only looks at rows created this recently (today's and
+#: yesterday's partitions); older unpublished rows are moved back in.
+OUTBOX_HOT_WINDOW = timedelta(days=1)
+OUTBOX_RETENTION = timedelta(days=7)
+INBOX_RETENTION = timedelta(days=30)
+
 
 async def main() -> None:
     setup_worker_logging(__name__)
     worker = OutboxPublisherWorker(
         session_factory=async_session_factory,
-        repository_or_model=OutboxEventModel,
+        repository_or_model=lambda session: OutboxRepository(session, OutboxEventModel, hot_window=OUTBOX_HOT_WINDOW),
         rabbitmq_url=settings.RABBITMQ_URL,
+        wakeup=OutboxNotifyListener(engine),
+        partitions=[
+            PartitionMaintainer(
+                async_session_factory, OUTBOX_EVENTS, retention=OUTBOX_RETENTION, hot_window=OUTBOX_HOT_WINDOW
+            ),
+        ],
+        inbox_purge=InboxPurger(async_session_factory, retention=INBOX_RETENTION),
+        batch_size=200,
+        pipelined=True,
     )
     try:
         await worker.run_forever()
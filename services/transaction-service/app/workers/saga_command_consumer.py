@@ -15,6 +15,7 @@ from decimal import Decimal
 import aio_pika
 from aio_pika import ExchangeType
 from aio_pika.abc import AbstractIncomingMessage
+from messaging import RetryTiers
 
 from app.adapters.outbound.unit_of_work import SQLAlchemyUnitOfWork
 from app.application.dto import BulkCreateTransactionDTO, BulkCreateTransactionItemDTO
@@ -31,6 +32,10 @@ EXCHANGE_NAME = "finans_tracker.events"
 QUEUE_NAME = "transaction_service.saga_commands"
 ROUTING_KEYS = ["saga.cmd.bulk_import_transactions", "saga.cmd.rollback_import"]
 MAX_RETRIES = 3
+#: Failed commands wait in TTL'd delay queues (1 s, 5 s, 25 s) that
+#: dead-letter back to QUEUE_NAME, instead of an immediate republish that
+#: burns every retry within milliseconds of a downstream outage.
+RETRY_TIERS = RetryTiers(QUEUE_NAME)
 
 # BulkCreateTransactionDTO caps items at 500 per call (public-contract
 # bound), but an EB fetch can exceed that — chunk here instead of
@@ -66,6 +71,7 @@ class TransactionSagaCommandConsumer:
         )
         for key in ROUTING_KEYS:
             await queue.bind(exchange, routing_key=key)
+        await RETRY_TIERS.declare(self._channel)
         await queue.consume(self._on_message)
 
         logger.info("Transaction saga command consumer started, listening on %s", ROUTING_KEYS)
@@ -273,16 +279,9 @@ class TransactionSagaCommandConsumer:
     async def _republish(self, original: AbstractIncomingMessage, retry_count: int) -> None:
         if self._channel is None:
             return
-        exchange = await self._channel.declare_exchange(EXCHANGE_NAME, ExchangeType.TOPIC, durable=True)
-        headers = dict(original.headers or {})
-        headers["x-retry-count"] = retry_count
-        msg = aio_pika.Message(
-            body=original.body,
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-            content_type="application/json",
-            headers=headers,
-        )
-        await exchange.publish(msg, routing_key=original.routing_key or "")
+        # Via the delay tier straight back to our own queue — not the topic
+        # exchange, which would fan the retry out to every bound queue.
+        await RETRY_TIERS.schedule(self._channel, original.body, retry_count, headers=original.headers)
 
 
 async def main() -> None:
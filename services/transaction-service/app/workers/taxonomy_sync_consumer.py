@@ -10,7 +10,9 @@ never saw simply creates it (upsert), and ``*.deleted`` for a missing row
 is a no-op. Note that ``display_order`` is deliberately NOT projected —
 ordering is a presentation concern served by categorization-service.
 
-Atomicity: upsert/delete + inbox row committed in one DB transaction.
+Atomicity: upsert/delete + inbox row committed in one DB transaction,
+together with a ``NOTIFY taxonomy_changed`` that tells every process
+holding a taxonomy snapshot to drop it (``adapters/outbound/taxonomy_notify.py``).
 Idempotency: inbox pattern on (message_id, consumer_name) with UNIQUE constraint.
 
 Connection/topology/retry/DLQ boilerplate lives in the shared
@@ -31,11 +33,12 @@ import logging
 from typing import Any
 
 from aio_pika.abc import AbstractIncomingMessage
-from messaging import ConsumerBase, setup_worker_logging
+from messaging import ConsumerBase, InboxFilter, setup_worker_logging
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters.outbound.taxonomy_notify import notify_taxonomy_changed
 from app.config import settings
 from app.database import async_session_factory
 from app.models import CategoryModel, ProcessedEventModel, SubCategoryModel
@@ -55,13 +58,23 @@ class TaxonomySyncConsumer(ConsumerBase):
             routing_keys=ROUTING_KEYS,
             max_retries=MAX_RETRIES,
         )
+        self._inbox = InboxFilter()
+
+    async def on_start(self) -> None:
+        async with async_session_factory() as session:
+            await self._inbox.warm(
+                session,
+                select(ProcessedEventModel.message_id).where(ProcessedEventModel.consumer_name == QUEUE_NAME),
+            )
 
     async def handle(self, payload: dict[str, Any], message: AbstractIncomingMessage) -> None:
         message_id = payload.get("correlation_id", "")
         event_type = payload.get("event_type", "")
 
         async with async_session_factory() as session:
-            if message_id and await self._is_duplicate(session, message_id):
+            if message_id and await self._inbox.is_duplicate(
+                message_id, lambda: self._is_duplicate(session, message_id)
+            ):
                 logger.info("Skipping duplicate (message_id=%s)", message_id)
                 return
 
@@ -72,6 +85,7 @@ class TaxonomySyncConsumer(ConsumerBase):
 
             if message_id:
                 self._add_inbox_row(session, message_id, event_type)
+            await notify_taxonomy_changed(session)
 
             try:
                 await session.commit()
@@ -82,6 +96,9 @@ class TaxonomySyncConsumer(ConsumerBase):
                     return
                 raise
 
+            if message_id:
+                self._inbox.add(message_id)
+
     async def _dispatch(self, session: AsyncSession, event_type: str, body: dict) -> bool:
         if event_type in ("category.created", "category.updated"):
             await self._upsert_category(session, body)
@@ -0,0 +1,111 @@
+"""Export path: time and peak Python memory of a streamed export.
+
+Runs ``TransactionService.export_transactions`` over ``--rows`` seeded
+transactions in each format and reports throughput and the peak traced
+allocation (``tracemalloc``) while the export is consumed.  Peak memory
+should stay flat as ``--rows`` grows: one ``EXPORT_BATCH_ROWS`` batch
+and its encoded chunk, never the result set.
+
+Seeding and the export share one transaction that is rolled back, so
+the target database keeps no rows.  Postgres is the number that
+matters (``session.stream`` is a real server-side cursor there)::
+
+    python benchmarks/bench_export.py --url postgresql+asyncpg://u:p@localhost/bench --rows 1000000
+
+Without ``--url`` it runs against a throwaway sqlite file (needs
+``aiosqlite``).  Parquet is skipped when ``pyarrow`` is not installed.
+
+sqlite, 2026-10 (seconds under tracemalloc / peak MiB): 100k rows —
+csv 4.7 / 3.4, ndjson 11.4 / 3.8, parquet 3.8 / 3.3; 1M rows — csv
+45.8 / 3.4, ndjson 114 / 3.8, parquet 48.3 / 3.3.  Ten times the rows,
+the same peak.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("JWT_SECRET", "bench")
+
+from app.adapters.outbound.unit_of_work import SQLAlchemyUnitOfWork  # noqa: E402
+from app.application import export  # noqa: E402
+from app.application.dto import TransactionFilterSetDTO  # noqa: E402
+from app.application.export import ExportFormat  # noqa: E402
+from app.application.service import TransactionService  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import TransactionModel  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+SEED_PAGE = 10_000
+
+
+async def _seed(session: AsyncSession, count: int) -> None:
+    start = date(2016, 1, 1)
+    for offset in range(0, count, SEED_PAGE):
+        await session.execute(
+            insert(TransactionModel),
+            [
+                {
+                    "user_id": 1,
+                    "account_id": 7,
+                    "account_name": "Lønkonto",
+                    "amount": Decimal(f"{10 + i % 5000}.{i % 100:02d}"),
+                    "transaction_type": "expense" if i % 7 else "income",
+                    "description": f"NETTO NORDHAVN {i}",
+                    "date": start + timedelta(days=i % 3650),
+                    "currency": "DKK",
+                }
+                for i in range(offset, min(offset + SEED_PAGE, count))
+            ],
+        )
+
+
+async def _export(session: AsyncSession, export_format: ExportFormat) -> tuple[float, int, float]:
+    service = TransactionService(uow=SQLAlchemyUnitOfWork(session))
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = 0
+    async for chunk in service.export_transactions(1, TransactionFilterSetDTO(), export_format):
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, peak / 2**20
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="async SQLAlchemy URL (default: temporary sqlite file)")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    formats = [f for f in ExportFormat if f is not ExportFormat.PARQUET or export.pyarrow is not None]
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(args.url or f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[TransactionModel.__table__], checkfirst=True)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await _seed(session, args.rows)
+            print(f"{'format':>8} {'seconds':>9} {'rows/s':>10} {'MiB out':>9} {'peak MiB':>9}")
+            for export_format in formats:
+                elapsed, size, peak = await _export(session, export_format)
+                print(
+                    f"{export_format.value:>8} {elapsed:9.2f} {args.rows / elapsed:10.0f} "
+                    f"{size / 2**20:9.1f} {peak:9.1f}"
+                )
+            await session.rollback()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""Add the keyset-listing index on transactions (user_id, date, id).
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-17
+
+Cursor mode on ``GET /api/v1/transactions/`` pages with
+``(date, id) < (:date, :id) ORDER BY date DESC, id DESC``.  With
+``user_id`` as the equality prefix and ``(date, id)`` following in
+index order, Postgres starts a backward range scan at the cursor and
+stops after one page — O(page) at any depth, where OFFSET walked every
+row before it.  The same index serves the offset path's unfiltered
+ordering, which until now sorted the user's whole history per request.
+
+Partial on ``deleted_at IS NULL``: every listing read excludes
+tombstones (migration 013), so they never need an entry.
+
+Not ``CONCURRENTLY``, for the reason given in 013: it cannot run inside
+Alembic's transaction, and at current volume the build is brief.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "017"
+down_revision: str = "016"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_INDEX_NAME = "ix_transactions_user_date_id"
+
+
+def upgrade() -> None:
+    op.create_index(
+        _INDEX_NAME,
+        "transactions",
+        ["user_id", "date", "id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(_INDEX_NAME, table_name="transactions")
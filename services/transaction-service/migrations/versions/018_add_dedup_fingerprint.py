@@ -0,0 +1,84 @@
+"""Add transactions.dedup_fingerprint and its partial unique index.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-17
+
+The CSV and id-less bulk import paths deduplicated with a lookup first
+(``find_existing_dedup_keys`` over the 011 index) and an insert second.
+Two concurrent imports of the same file both saw "no match" and both
+inserted.  They now insert with ``ON CONFLICT DO NOTHING`` on a
+SHA-256 of the key ``(user_id, account_id, date, amount, description)``,
+so the check and the insert are one statement and the database decides.
+
+Still not a blanket unique constraint on the key, for 011's reason: two
+identical rows are legitimate (two same-day purchases, a bank statement
+with two identical lines).  The fingerprint is a *claim*: at most one
+live row per key holds it, and every row written while the key is
+already held (a manual entry, a bank row with its own ``external_id``)
+is stored with NULL.  The import paths' rule, "skip if any live row
+has this key", becomes "skip if the key is claimed".
+
+The backfill gives each key to its lowest-id live row.  The SQL
+expression must stay equal to
+``app.adapters.outbound.postgres_transaction_repository.dedup_fingerprint``:
+a NULL description hashes as ``''`` and any other as ``'=' ||
+description``, and the date is formatted explicitly rather than left to
+``DateStyle``.
+
+Partial on ``deleted_at IS NULL``, as the external-id index is since
+013, so a tombstone gives up its key.  Edge case: when the claimant is
+deleted but an unclaimed twin is still live, a re-import inserts the
+key again.  The old lookup would have skipped it.  That is accepted.
+An edit that changes a key column moves the claim: the old
+key is released and the new one claimed if no live row holds it, in a
+savepoint, so an edited row never hits a unique violation — on
+conflict it keeps NULL (``update``).
+
+Not ``CONCURRENTLY``, for the reason given in 013.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "018"
+down_revision: str = "017"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_INDEX_NAME = "uq_transactions_dedup_fingerprint"
+
+_FINGERPRINT_SQL = (
+    "encode(sha256(convert_to(concat_ws('|', user_id, account_id, to_char(date, 'YYYY-MM-DD'), amount::text, "
+    "CASE WHEN description IS NULL THEN '' ELSE '=' || description END), 'UTF8')), 'hex')"
+)
+
+_BACKFILL_SQL = f"""
+UPDATE transactions AS t
+SET dedup_fingerprint = claims.fingerprint
+FROM (
+    SELECT DISTINCT ON (fingerprint) id, fingerprint
+    FROM (SELECT id, {_FINGERPRINT_SQL} AS fingerprint FROM transactions WHERE deleted_at IS NULL) AS keyed
+    ORDER BY fingerprint, id
+) AS claims
+WHERE t.id = claims.id
+"""
+
+
+def upgrade() -> None:
+    op.add_column("transactions", sa.Column("dedup_fingerprint", sa.String(64), nullable=True))
+    op.execute(_BACKFILL_SQL)
+    op.create_index(
+        _INDEX_NAME,
+        "transactions",
+        ["dedup_fingerprint"],
+        unique=True,
+        postgresql_where=sa.text("dedup_fingerprint IS NOT NULL AND deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(_INDEX_NAME, table_name="transactions")
+    op.drop_column("transactions", "dedup_fingerprint")
@@ -0,0 +1,137 @@
+"""Integration tests for the bulk ``INSERT ... RETURNING`` write path.
+
+``PostgresTransactionRepository.bulk_create`` builds its entities from
+the rows the INSERT returns, so the returned list must line up with the
+input — across insertmanyvalues pages too — and carry the generated ids
+and server defaults that the old per-row ``refresh()`` used to fetch.
+
+Requires Docker running.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from testcontainers.postgres import PostgresContainer
+
+os.environ.setdefault("TESTCONTAINERS_RYUK_DISABLED", "true")
+
+_USER = 777
+
+
+@pytest.fixture(scope="module")
+def postgres():  # type: ignore[no-untyped-def]
+    with PostgresContainer("postgres:16") as pg:
+        yield pg
+
+
+@pytest.fixture(scope="module")
+def _migrated_db(postgres) -> None:  # type: ignore[no-untyped-def]
+    url = postgres.get_connection_url()
+    os.environ["DATABASE_URL"] = url.replace("postgresql://", "postgresql+asyncpg://").replace("psycopg2", "asyncpg")
+    os.environ["JWT_SECRET"] = "test-secret"
+
+    alembic_cfg = Config("alembic.ini")
+    alembic_cfg.set_main_option("sqlalchemy.url", url)
+    command.upgrade(alembic_cfg, "head")
+
+
+@pytest.fixture()
+async def session(postgres, _migrated_db):  # type: ignore[no-untyped-def]
+    url = postgres.get_connection_url()
+    async_url = url.replace("postgresql://", "postgresql+asyncpg://").replace("psycopg2", "asyncpg")
+    engine = create_async_engine(async_url, echo=False)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+        await session.rollback()
+    await engine.dispose()
+
+
+def _row(i: int, **overrides):  # type: ignore[no-untyped-def]
+    row = {
+        "user_id": _USER,
+        "account_id": 1,
+        "account_name": "Checking",
+        "amount": Decimal(f"{i + 1}.50"),
+        "transaction_type": "expense",
+        "description": f"row {i}",
+        "tx_date": date(2026, 1, 1) + timedelta(days=i % 365),
+    }
+    row.update(overrides)
+    return row
+
+
+async def test_returned_entities_line_up_with_input_across_pages(session) -> None:  # type: ignore[no-untyped-def]
+    from app.adapters.outbound.postgres_transaction_repository import PostgresTransactionRepository
+
+    rows = [_row(i) for i in range(2_500)]  # > two insertmanyvalues pages
+
+    created = await PostgresTransactionRepository(session).bulk_create(rows)
+
+    assert [tx.description for tx in created] == [row["description"] for row in rows]
+    assert [tx.amount for tx in created] == [row["amount"] for row in rows]
+    assert len({tx.id for tx in created}) == len(rows)
+    assert all(tx.created_at is not None for tx in created)
+
+
+async def test_server_defaults_and_optional_fields(session) -> None:  # type: ignore[no-untyped-def]
+    from app.adapters.outbound.postgres_transaction_repository import PostgresTransactionRepository
+    from app.domain.entities import TransactionType
+
+    created = await PostgresTransactionRepository(session).bulk_create(
+        [
+            _row(0),
+            _row(1, transaction_type=TransactionType.INCOME, external_id="EB-9", currency="EUR", category_id=3),
+        ]
+    )
+
+    assert (created[0].currency, created[0].external_id) == ("DKK", None)
+    assert created[1].transaction_type is TransactionType.INCOME
+    assert (created[1].currency, created[1].external_id, created[1].category_id) == ("EUR", "EB-9", 3)
+
+
+async def test_empty_input_runs_no_statement(session) -> None:  # type: ignore[no-untyped-def]
+    from app.adapters.outbound.postgres_transaction_repository import PostgresTransactionRepository
+
+    assert await PostgresTransactionRepository(session).bulk_create([]) == []
+
+
+async def test_outbox_entries_share_the_bulk_path(session) -> None:  # type: ignore[no-untyped-def]
+    from app.adapters.outbound.outbox_adapter import TransactionOutboxAdapter
+    from app.adapters.outbound.postgres_transaction_repository import PostgresTransactionRepository
+    from app.models import OutboxEventModel
+    from contracts.events.transaction import TransactionCreatedEvent
+
+    created = await PostgresTransactionRepository(session).bulk_create([_row(i) for i in range(3)])
+    await TransactionOutboxAdapter(session).add_batch(
+        [
+            (
+                TransactionCreatedEvent(
+                    transaction_id=tx.id,
+                    account_id=tx.account_id,
+                    user_id=_USER,
+                    amount=str(tx.amount),
+                    transaction_type=tx.transaction_type.value,
+                    tx_date=tx.date,
+                ),
+                "transaction",
+                str(tx.id),
+            )
+            for tx in created
+        ]
+    )
+
+    aggregate_ids = await session.scalars(
+        select(OutboxEventModel.aggregate_id).where(OutboxEventModel.aggregate_id.in_([str(tx.id) for tx in created]))
+    )
+    assert sorted(aggregate_ids) == sorted(str(tx.id) for tx in created)
+    pending = await session.scalar(select(func.count()).select_from(OutboxEventModel))
+    assert pending >= 3
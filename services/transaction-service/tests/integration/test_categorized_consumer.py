@@ -286,18 +286,18 @@ class TestGoneVsNotYet:
     Before soft-delete, a categorization for a deleted transaction and one
     that raced ahead of its INSERT were the same observation — "row not
     found" — so the consumer retried both.  For the deleted one that meant
-    five retries with 1/2/4/8/16 s backoff on a prefetch=1 consumer, then
-    the DLQ.  See
+    five retries with 1/2/4/8/16 s inline backoff on a prefetch=1
+    consumer, then the DLQ.  See
     ``dev-notes/findings/2026-07-25-transaction-hard-delete-categorized-dlq.md``.
 
     **Which change fixes which half — measured, by deleting the branch and
     re-running this class.**  The soft-delete alone (migration 013 + the
     repository) already kills the DLQ path: the row now exists, so
-    ``_get_transaction`` returns it and nothing backs off.  Only
+    ``_get_transaction`` returns it and nothing retries.  Only
     ``test_deleted_transaction_is_not_categorized`` fails without the
     branch, and that is the branch's real job — a tombstone must not get
     its categorization fields rewritten, and the skip must be traceable in
-    the log.  The backoff assertions below are regression guards on the
+    the log.  The retry assertions below are regression guards on the
     property soft-delete bought, not evidence for the branch; saying
     otherwise would make this docstring the untrue kind.
     """
@@ -315,22 +315,14 @@ class TestGoneVsNotYet:
             str(uuid4()),
         )
 
-    async def test_deleted_transaction_is_acked_without_backoff(self, consumer, session_factory, monkeypatch) -> None:
-        """Done-criterion (b): acked, no DLQ, no 16 s sleep on a
-        prefetch=1 consumer.
+    async def test_deleted_transaction_is_acked_without_retry(self, consumer, session_factory) -> None:
+        """Done-criterion (b): acked, no retry, no DLQ.
 
         This holds from migration 013 onward regardless of the branch —
         see the class docstring.  It is kept because it is the criterion
         the finding was written against, and because it would catch a
         future change that reintroduced hard-delete underneath.
         """
-        slept: list[int] = []
-        monkeypatch.setattr(
-            consumer,
-            "_stale_backoff",
-            AsyncMock(side_effect=lambda *a, **k: slept.append(1)),
-        )
-
         async with session_factory() as session:
             await session.execute(text("UPDATE transactions SET deleted_at = now() WHERE id = 1"))
             await session.commit()
@@ -340,7 +332,6 @@ class TestGoneVsNotYet:
 
         msg.ack.assert_awaited()
         msg.nack.assert_not_awaited()
-        assert slept == []
 
     async def test_deleted_transaction_is_not_categorized(self, consumer, session_factory, caplog) -> None:
         """The load-bearing one: acking must mean "we skipped it", not "we
@@ -369,24 +360,19 @@ class TestGoneVsNotYet:
         # started swallowing real work.
         assert any("Transaction 1 deleted" in r.message for r in caplog.records)
 
-    async def test_missing_transaction_still_retries(self, consumer, monkeypatch) -> None:
+    async def test_missing_transaction_still_retries(self, consumer) -> None:
         """The other control, and the one that proves we split the branch
-        rather than closed it: an id that never existed must still back off
-        and raise, so the retry ladder (and eventually the DLQ) is intact.
+        rather than closed it: an id that never existed must still raise,
+        so the retry tiers (and eventually the DLQ) are intact.
         """
         from app.workers.categorized_consumer import _TransactionNotFoundYet
 
-        backoff = AsyncMock()
-        monkeypatch.setattr(consumer, "_stale_backoff", backoff)
-
         msg = self._msg(999_999)
         payload = json.loads(msg.body)
 
         with pytest.raises(_TransactionNotFoundYet):
             await consumer.handle(payload, msg)
 
-        backoff.assert_awaited_once()
-
     async def test_live_transaction_is_still_categorized(self, consumer, session_factory) -> None:
         """The third branch, unchanged — guards against the new check
         accidentally matching a live row (e.g. ``is not None`` inverted)."""
@@ -397,3 +383,103 @@ class TestGoneVsNotYet:
         async with session_factory() as session:
             tx = (await session.execute(select(TransactionModel).where(TransactionModel.id == 1))).scalar_one()
             assert tx.subcategory_id == 7
+
+
+class TestBatchedApply:
+    """``handle_batch``: one UPDATE ... FROM (VALUES ...) and one commit."""
+
+    @staticmethod
+    def _payload(transaction_id: int, **overrides: object) -> dict:
+        payload = {
+            "event_type": "transaction.categorized",
+            "transaction_id": transaction_id,
+            "subcategory_id": 7,
+            "tier": "rule",
+            "confidence": "high",
+            "correlation_id": str(uuid4()),
+        }
+        payload.update(overrides)
+        return payload
+
+    async def test_applies_the_batch_and_writes_every_inbox_row(self, consumer, session_factory) -> None:
+        from app.models import ProcessedEventModel, TransactionModel
+
+        payloads = [
+            self._payload(1, category_id=1, subcategory_id=1, subcategory_name="Dagligvarer"),
+            self._payload(2, subcategory_id=32, tier="fallback", confidence="low"),
+        ]
+
+        assert await consumer.handle_batch(payloads) is None
+
+        async with session_factory() as session:
+            rows = (await session.execute(select(TransactionModel).order_by(TransactionModel.id))).scalars().all()
+            by_id = {tx.id: tx for tx in rows}
+            # v1 payload: parent name resolved from the local read copy.
+            assert (by_id[1].category_name, by_id[1].subcategory_name) == ("Mad & drikke", "Dagligvarer")
+            assert (by_id[2].subcategory_id, by_id[2].categorization_tier) == (32, "fallback")
+            inbox = (await session.execute(select(ProcessedEventModel.message_id))).scalars().all()
+            assert set(inbox) == {p["correlation_id"] for p in payloads}
+
+    async def test_manual_tier_is_not_overwritten(self, consumer, session_factory) -> None:
+        from app.models import TransactionModel
+
+        async with session_factory() as session:
+            await session.execute(text("UPDATE transactions SET categorization_tier = 'manual' WHERE id = 1"))
+            await session.commit()
+
+        await consumer.handle_batch([self._payload(1, subcategory_id=9)])
+
+        async with session_factory() as session:
+            tx = (await session.execute(select(TransactionModel).where(TransactionModel.id == 1))).scalar_one()
+            assert (tx.subcategory_id, tx.categorization_tier) == (1, "manual")
+
+    async def test_unchanged_row_is_not_written(self, consumer, session_factory) -> None:
+        from app.models import TransactionModel
+
+        await consumer.handle_batch([self._payload(1, subcategory_id=1)])
+
+        async with session_factory() as session:
+            tx = (await session.execute(select(TransactionModel).where(TransactionModel.id == 1))).scalar_one()
+            assert tx.updated_at is None
+
+    async def test_last_event_per_transaction_wins(self, consumer, session_factory) -> None:
+        from app.models import TransactionModel
+
+        await consumer.handle_batch([self._payload(2, subcategory_id=31), self._payload(2, subcategory_id=33)])
+
+        async with session_factory() as session:
+            tx = (await session.execute(select(TransactionModel).where(TransactionModel.id == 2))).scalar_one()
+            assert tx.subcategory_id == 33
+
+    async def test_not_yet_visible_rows_are_deferred_without_an_inbox_row(self, consumer, session_factory) -> None:
+        from app.models import ProcessedEventModel, TransactionModel
+
+        missing = self._payload(999_999)
+        payloads = [self._payload(2, subcategory_id=32), missing]
+
+        assert list(await consumer.handle_batch(payloads)) == [1]
+
+        async with session_factory() as session:
+            tx = (await session.execute(select(TransactionModel).where(TransactionModel.id == 2))).scalar_one()
+            assert tx.subcategory_id == 32
+            inbox = (await session.execute(select(ProcessedEventModel.message_id))).scalars().all()
+            assert missing["correlation_id"] not in inbox
+
+    async def test_deleted_row_is_acked_but_left_alone(self, consumer, session_factory) -> None:
+        from app.models import TransactionModel
+
+        async with session_factory() as session:
+            await session.execute(text("UPDATE transactions SET deleted_at = now() WHERE id = 1"))
+            await session.commit()
+
+        assert await consumer.handle_batch([self._payload(1, subcategory_id=9)]) is None
+
+        async with session_factory() as session:
+            tx = (await session.execute(select(TransactionModel).where(TransactionModel.id == 1))).scalar_one()
+            assert tx.subcategory_id == 1
+
+    async def test_duplicates_are_skipped(self, consumer) -> None:
+        payload = self._payload(2)
+        await consumer.handle_batch([payload])
+
+        assert await consumer.handle_batch([payload, dict(payload)]) is None
@@ -19,8 +19,8 @@ Two deliberate deviations from ``notification-service``'s ASGI-test template:
     with those rows.  That is precisely the area where SQLite is permitted to
     differ from Postgres, so testing it on SQLite would prove the wrong thing.
 *   **Seeding goes through the repository, not ``POST /transactions/``.**
-    ``get_transaction_service`` injects a real ``CategorizationClient``, so a
-    POST per row would fire an outbound HTTP call with a live timeout.
+    Seeding through the API would exercise far more than the list query
+    under test, one request per row.
 
 The seeded rows are never committed: the app and the seeding share one
 session, and closing it rolls back, so every test starts from a clean slate
@@ -211,7 +211,9 @@ async def test_list_returns_an_envelope_with_a_total_and_items(client: httpx.Asy
     assert response.status_code == 200
     body = response.json()
     assert isinstance(body, dict)
-    assert set(body) == {"total_count", "items"}
+    # ``next_cursor`` joined with cursor mode; it is null in OFFSET mode.
+    assert set(body) == {"total_count", "items", "next_cursor"}
+    assert body["next_cursor"] is None
     assert isinstance(body["total_count"], int)
     assert all(isinstance(row, dict) and "id" in row for row in body["items"])
 
@@ -394,6 +396,94 @@ async def test_the_boundary_values_are_still_accepted(client: httpx.AsyncClient)
         assert response.status_code == 200, params
 
 
+# --------------------------------------------------------------------------
+# Cursor mode — keyset paging by (date, id), opt-in with ``cursor``.
+# --------------------------------------------------------------------------
+
+
+async def test_cursor_pages_walk_the_same_order_as_offset(client: httpx.AsyncClient) -> None:
+    """Following ``next_cursor`` yields exactly the OFFSET ordering, once each.
+
+    The filler rows repeat dates, so this only holds if the cursor carries
+    the id tie-break as well as the date.
+    """
+    everything = await _get(client, {**_FILLER_ONLY, "limit": 200})
+    expected = [r["id"] for r in _rows(everything)]
+
+    seen: list[int] = []
+    cursor = ""
+    while cursor is not None:
+        response = await _get(client, {**_FILLER_ONLY, "limit": 20, "cursor": cursor})
+        assert response.status_code == 200
+        seen.extend(r["id"] for r in _rows(response))
+        assert _total(response) == _FILLER_ROWS
+        cursor = response.json()["next_cursor"]
+
+    assert seen == expected
+
+
+async def test_cursor_mode_applies_the_filters(client: httpx.AsyncClient) -> None:
+    response = await _get(client, {**_FEB_EXPENSES, "limit": 2, "cursor": ""})
+    rest = await _get(client, {**_FEB_EXPENSES, "limit": 2, "cursor": response.json()["next_cursor"]})
+
+    assert [r["description"] for r in _rows(response)] == ["in range #3", "in range #2"]
+    assert [r["description"] for r in _rows(rest)] == ["in range #1"]
+    assert rest.json()["next_cursor"] is None
+
+
+async def test_include_total_false_returns_a_null_total(client: httpx.AsyncClient) -> None:
+    response = await _get(client, {**_FILLER_ONLY, "cursor": "", "include_total": "false"})
+
+    assert response.status_code == 200
+    assert _total(response) is None
+    assert len(_rows(response)) == 50
+
+
+@pytest.mark.parametrize("params", [{"cursor": "not-a-cursor"}, {"cursor": "", "skip": 10}])
+async def test_bad_cursor_requests_are_a_400(client: httpx.AsyncClient, params: dict) -> None:
+    response = await _get(client, params)
+
+    assert response.status_code == 400
+
+
+# --------------------------------------------------------------------------
+# Export — the whole filtered set, streamed.
+# --------------------------------------------------------------------------
+
+
+async def _export(client: httpx.AsyncClient, params: dict) -> httpx.Response:
+    return await client.get("/api/v1/transactions/export", params=params, headers=_auth())
+
+
+async def test_csv_export_is_the_whole_filtered_set_in_import_format(client: httpx.AsyncClient) -> None:
+    """More rows than one listing page, and every one of them re-imports."""
+    from app.application.csv_parsers.internal import InternalCSVParser
+
+    response = await _export(client, _FILLER_ONLY)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    parsed = InternalCSVParser().parse(response.content, user_id=_USER, account_id=0, account_name="")
+    assert parsed.errors == []
+    assert len(parsed.rows) == _FILLER_ROWS
+
+
+async def test_ndjson_export_applies_the_listing_filters(client: httpx.AsyncClient) -> None:
+    import json
+
+    response = await _export(client, {**_FEB_EXPENSES, "format": "ndjson"})
+
+    assert response.status_code == 200
+    descriptions = [json.loads(line)["description"] for line in response.text.splitlines()]
+    assert descriptions == ["in range #3", "in range #2", "in range #1"]
+
+
+async def test_unknown_export_format_is_rejected(client: httpx.AsyncClient) -> None:
+    response = await _export(client, {"format": "xlsx"})
+
+    assert response.status_code == 422
+
+
 # --------------------------------------------------------------------------
 # Auth — the endpoint is not reachable without a valid token.
 # --------------------------------------------------------------------------
@@ -22,6 +22,7 @@ What this suite catches that the unit tests can't:
 
 from __future__ import annotations
 
+from datetime import date
 from decimal import Decimal
 
 import pytest
@@ -581,3 +582,63 @@ class TestNoOrphanCategoryIds:
             ).scalar()
 
         assert orphans == 1
+
+
+# ─────────────────────────────────────────────────────────────
+# Migration 018 — import dedup fingerprint
+# ─────────────────────────────────────────────────────────────
+
+
+class TestMigration018DedupFingerprint:
+    def test_backfill_matches_python_and_claims_lowest_id(
+        self,
+        clean_db: Engine,
+        alembic_cfg,  # type: ignore[no-untyped-def]
+    ) -> None:
+        """The SQL backfill and ``dedup_fingerprint`` must agree byte for
+        byte, or every pre-018 row would be re-imported as "new".  Of two
+        identical live rows only the first claims the key."""
+        from alembic import command
+        from app.adapters.outbound.postgres_transaction_repository import dedup_fingerprint
+
+        command.upgrade(alembic_cfg, "017")
+        insert = sa.text(
+            "INSERT INTO transactions "
+            "(user_id, account_id, account_name, amount, transaction_type, date, description) "
+            "VALUES (1, 7, 'Test', :amt, 'expense', '2026-03-01', :desc) RETURNING id"
+        )
+        with clean_db.begin() as conn:
+            first = conn.execute(insert, {"amt": Decimal("49.9"), "desc": "Netto Ø"}).scalar_one()
+            twin = conn.execute(insert, {"amt": Decimal("49.90"), "desc": "Netto Ø"}).scalar_one()
+            bare = conn.execute(insert, {"amt": Decimal("5.00"), "desc": None}).scalar_one()
+            empty = conn.execute(insert, {"amt": Decimal("5.00"), "desc": ""}).scalar_one()
+
+        _upgrade_head(alembic_cfg)
+
+        with clean_db.connect() as conn:
+            fingerprints = dict(conn.execute(sa.text("SELECT id, dedup_fingerprint FROM transactions")).all())
+
+        assert fingerprints == {
+            first: dedup_fingerprint(1, 7, date(2026, 3, 1), Decimal("49.90"), "Netto Ø"),
+            twin: None,
+            bare: dedup_fingerprint(1, 7, date(2026, 3, 1), Decimal("5.00"), None),
+            empty: dedup_fingerprint(1, 7, date(2026, 3, 1), Decimal("5.00"), ""),
+        }
+        assert fingerprints[bare] != fingerprints[empty]
+
+    def test_downgrade_drops_index_and_column(
+        self,
+        clean_db: Engine,
+        alembic_cfg,  # type: ignore[no-untyped-def]
+    ) -> None:
+        _upgrade_head(alembic_cfg)
+        _downgrade_to(alembic_cfg, "017")
+
+        with clean_db.connect() as conn:
+            columns = {
+                r.column_name
+                for r in conn.execute(
+                    sa.text("SELECT column_name FROM information_schema.columns WHERE table_name = 'transactions'")
+                )
+            }
+        assert "dedup_fingerprint" not in columns
@@ -0,0 +1,63 @@
+"""The app lifespan owns the pooled categorization client.
+
+It is created per lifespan and stored on ``app.state``, so a second
+startup in the same process (tests, reloads) gets a fresh pool instead of
+the one the first shutdown closed, and shutdown closes it even when the
+invalidator fails to stop.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app import main
+from app.dependencies import get_categorization_client
+
+
+@pytest.fixture
+def invalidator(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    instance = MagicMock()
+    instance.close = AsyncMock()
+    monkeypatch.setattr(main, "TaxonomyInvalidator", MagicMock(return_value=instance))
+    monkeypatch.setattr(main.taxonomy_cache, "get", AsyncMock())
+    return instance
+
+
+def _request() -> MagicMock:
+    request = MagicMock()
+    request.app = main.app
+    return request
+
+
+@pytest.mark.asyncio()
+async def test_each_lifespan_opens_and_closes_its_own_client(invalidator: MagicMock) -> None:
+    clients = []
+    for _ in range(2):
+        async with main.lifespan(main.app):
+            client = get_categorization_client(_request())
+            assert client is main.app.state.categorization_client
+            assert not client._http.is_closed
+            clients.append(client)
+        assert client._http.is_closed
+
+    assert clients[0] is not clients[1]
+    assert invalidator.close.await_count == 2
+
+
+@pytest.mark.asyncio()
+async def test_client_is_closed_when_the_invalidator_fails_to_stop(invalidator: MagicMock) -> None:
+    invalidator.close.side_effect = RuntimeError("listener stuck")
+
+    with pytest.raises(RuntimeError, match="listener stuck"):
+        async with main.lifespan(main.app):
+            client = main.app.state.categorization_client
+
+    assert client._http.is_closed
+
+
+def test_no_client_without_the_lifespan() -> None:
+    request = MagicMock()
+    request.app.state = MagicMock(spec=[])
+
+    assert get_categorization_client(request) is None
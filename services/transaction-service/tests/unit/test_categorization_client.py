@@ -1,65 +1,62 @@
 """Unit tests for the CategorizationClient (HTTP client to categorization-service).
 
 Tests the graceful degradation behavior when categorization-service
-is unavailable or slow.
+is unavailable or slow, the circuit breaker that stops waiting on it
+while it is, and request coalescing on the pooled client.  Requests go
+through an ``httpx.MockTransport``; no socket is opened.
 """
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from collections.abc import Callable
 
+import httpx
 import pytest
-from app.adapters.outbound.categorization_client import CategorizationClient
+from app.adapters.outbound.categorization_client import CategorizationClient, CircuitBreaker
+from app.config import settings
 
+_RESULT = {"category_id": 1, "subcategory_id": 3, "merchant_id": None, "tier": "rule", "confidence": "high"}
 
-@pytest.fixture()
-def client() -> CategorizationClient:
-    return CategorizationClient()
+
+def _client(handler: Callable[[httpx.Request], httpx.Response]) -> CategorizationClient:
+    return CategorizationClient(transport=httpx.MockTransport(handler))
+
+
+def _refuse(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("connection refused", request=request)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
 
 
 class TestGracefulDegradation:
-    async def test_returns_none_on_timeout(self, client: CategorizationClient) -> None:
-        import httpx
-
-        with patch("app.adapters.outbound.categorization_client.httpx.AsyncClient") as mock_cls:
-            mock_instance = AsyncMock()
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_instance.post.side_effect = httpx.TimeoutException("timeout")
-            mock_cls.return_value = mock_instance
-
-            result = await client.categorize("Netto Nordhavn", -150.0, "outgoing")
-            assert result is None
-
-    async def test_returns_none_on_connection_error(self, client: CategorizationClient) -> None:
-        import httpx
-
-        with patch("app.adapters.outbound.categorization_client.httpx.AsyncClient") as mock_cls:
-            mock_instance = AsyncMock()
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_instance.post.side_effect = httpx.ConnectError("connection refused")
-            mock_cls.return_value = mock_instance
-
-            result = await client.categorize("Netto Nordhavn", -150.0, "outgoing")
-            assert result is None
-
-    async def test_batch_returns_nones_on_failure(self, client: CategorizationClient) -> None:
-        import httpx
-
-        with patch("app.adapters.outbound.categorization_client.httpx.AsyncClient") as mock_cls:
-            mock_instance = AsyncMock()
-            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_instance.post.side_effect = httpx.ConnectError("connection refused")
-            mock_cls.return_value = mock_instance
-
-            items = [
-                {"description": "Netto", "amount": -100.0, "direction": "outgoing"},
-                {"description": "DSB", "amount": -89.0, "direction": "outgoing"},
-            ]
-            results = await client.categorize_batch(items)
-            assert results == [None, None]
+    async def test_returns_none_on_timeout(self) -> None:
+        def timeout(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        assert await _client(timeout).categorize("Netto Nordhavn", -150.0, "outgoing") is None
+
+    async def test_returns_none_on_connection_error(self) -> None:
+        assert await _client(_refuse).categorize("Netto Nordhavn", -150.0, "outgoing") is None
+
+    async def test_returns_none_on_malformed_response(self) -> None:
+        client = _client(lambda request: httpx.Response(200, json={"tier": "rule"}))
+
+        assert await client.categorize("Netto Nordhavn", -150.0, "outgoing") is None
+
+    async def test_batch_returns_nones_on_failure(self) -> None:
+        items = [
+            {"description": "Netto", "amount": -100.0, "direction": "outgoing"},
+            {"description": "DSB", "amount": -89.0, "direction": "outgoing"},
+        ]
+
+        assert await _client(_refuse).categorize_batch(items) == [None, None]
 
 
 class TestInternalApiKeyHeader:
@@ -72,55 +69,191 @@ class TestInternalApiKeyHeader:
     """
 
     @staticmethod
-    def _mock_client() -> AsyncMock:
-        import httpx
-
-        mock_instance = AsyncMock()
-        mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
-        mock_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_instance.post.side_effect = httpx.ConnectError("connection refused")
-        return mock_instance
-
-    async def test_single_sends_configured_key(self) -> None:
-        with patch("app.adapters.outbound.categorization_client.settings") as mock_settings:
-            mock_settings.CATEGORIZATION_SERVICE_URL = "http://categorization:8005"
-            mock_settings.CATEGORIZATION_TIMEOUT_S = 0.5
-            mock_settings.INTERNAL_API_KEY = "s3cret"
-            client = CategorizationClient()
-
-        with patch("app.adapters.outbound.categorization_client.httpx.AsyncClient") as mock_cls:
-            mock_instance = self._mock_client()
-            mock_cls.return_value = mock_instance
-            await client.categorize("Netto", -100.0, "outgoing")
-
-        assert mock_instance.post.await_args.kwargs["headers"] == {"X-Internal-API-Key": "s3cret"}
-
-    async def test_batch_sends_configured_key(self) -> None:
-        with patch("app.adapters.outbound.categorization_client.settings") as mock_settings:
-            mock_settings.CATEGORIZATION_SERVICE_URL = "http://categorization:8005"
-            mock_settings.CATEGORIZATION_TIMEOUT_S = 0.5
-            mock_settings.INTERNAL_API_KEY = "s3cret"
-            client = CategorizationClient()
-
-        with patch("app.adapters.outbound.categorization_client.httpx.AsyncClient") as mock_cls:
-            mock_instance = self._mock_client()
-            mock_cls.return_value = mock_instance
-            await client.categorize_batch([{"description": "Netto", "amount": -100.0, "direction": "outgoing"}])
-
-        assert mock_instance.post.await_args.kwargs["headers"] == {"X-Internal-API-Key": "s3cret"}
-
-    async def test_unconfigured_key_sends_no_header(self) -> None:
+    def _recording_client(seen: list[httpx.Request]) -> CategorizationClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json=[_RESULT] if request.url.path.endswith("/batch") else _RESULT)
+
+        return _client(handler)
+
+    async def test_single_sends_configured_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "INTERNAL_API_KEY", "s3cret")
+        seen: list[httpx.Request] = []
+
+        await self._recording_client(seen).categorize("Netto", -100.0, "outgoing")
+
+        assert seen[0].headers["X-Internal-API-Key"] == "s3cret"
+
+    async def test_batch_sends_configured_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "INTERNAL_API_KEY", "s3cret")
+        seen: list[httpx.Request] = []
+
+        await self._recording_client(seen).categorize_batch(
+            [{"description": "Netto", "amount": -100.0, "direction": "outgoing"}]
+        )
+
+        assert seen[0].headers["X-Internal-API-Key"] == "s3cret"
+
+    async def test_unconfigured_key_sends_no_header(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Keeps A1 harmless on its own: an unset key must not send an
         empty header value that A2 would then reject."""
-        with patch("app.adapters.outbound.categorization_client.settings") as mock_settings:
-            mock_settings.CATEGORIZATION_SERVICE_URL = "http://categorization:8005"
-            mock_settings.CATEGORIZATION_TIMEOUT_S = 0.5
-            mock_settings.INTERNAL_API_KEY = None
-            client = CategorizationClient()
-
-        with patch("app.adapters.outbound.categorization_client.httpx.AsyncClient") as mock_cls:
-            mock_instance = self._mock_client()
-            mock_cls.return_value = mock_instance
-            await client.categorize("Netto", -100.0, "outgoing")
-
-        assert mock_instance.post.await_args.kwargs["headers"] == {}
+        monkeypatch.setattr(settings, "INTERNAL_API_KEY", None)
+        seen: list[httpx.Request] = []
+
+        await self._recording_client(seen).categorize("Netto", -100.0, "outgoing")
+
+        assert "X-Internal-API-Key" not in seen[0].headers
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures_and_half_opens_after_reset(self) -> None:
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout_s=30, clock=clock)
+        for _ in range(3):
+            assert breaker.allow()
+            breaker.record_failure()
+
+        assert not breaker.allow()
+        clock.now = 30.0
+        assert breaker.allow()  # the one trial call
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.allow()
+        assert not breaker.is_open
+
+    def test_success_resets_the_count(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_s=30)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.allow()
+
+    def test_failed_trial_reopens_for_a_full_period(self) -> None:
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 30.0
+        assert breaker.allow()
+
+        breaker.record_failure()
+        clock.now = 59.0
+
+        assert not breaker.allow()
+
+    async def test_open_breaker_skips_the_call(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "CATEGORIZATION_BREAKER_FAILURES", 2)
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        client = _client(handler)
+        for i in range(5):
+            assert await client.categorize(f"Netto {i}", -1.0, "outgoing") is None
+        assert await client.categorize_batch([{"description": "x", "amount": 1.0, "direction": "outgoing"}]) == [None]
+
+        assert calls == 2
+
+    async def test_cancelled_batch_trial_frees_the_half_open_slot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client, trial_started = _half_open_client(monkeypatch)
+        items = [{"description": "Netto", "amount": 1.0, "direction": "outgoing"}]
+        assert await client.categorize_batch(items) == [None]  # opens the breaker
+
+        trial = asyncio.create_task(client.categorize_batch(items))
+        await trial_started.wait()
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        assert not client._breaker._trial_in_flight
+        assert client._breaker.allow()
+        await client.aclose()
+
+    async def test_cancelled_single_trial_frees_the_half_open_slot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client, trial_started = _half_open_client(monkeypatch)
+        assert await client.categorize("Netto", -1.0, "outgoing") is None  # opens the breaker
+
+        waiter = asyncio.create_task(client.categorize("Netto", -1.0, "outgoing"))
+        await trial_started.wait()
+        request = client._inflight[("Netto", -1.0, "outgoing")]
+        request.cancel()  # e.g. the loop shutting down under it
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert client._breaker.allow()
+        await client.aclose()
+
+
+def _half_open_client(monkeypatch: pytest.MonkeyPatch) -> tuple[CategorizationClient, asyncio.Event]:
+    """A client whose first call fails (opening the breaker, trial due at
+    once) and whose half-open trial hangs until cancelled."""
+    monkeypatch.setattr(settings, "CATEGORIZATION_BREAKER_FAILURES", 1)
+    monkeypatch.setattr(settings, "CATEGORIZATION_BREAKER_RESET_S", 0.0)
+    trial_started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if client._breaker.is_open:
+            trial_started.set()
+            await asyncio.Event().wait()
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = CategorizationClient(transport=httpx.MockTransport(handler))
+    return client, trial_started
+
+
+class TestPooledClient:
+    async def test_identical_concurrent_calls_share_one_request(self) -> None:
+        calls = 0
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return httpx.Response(200, json=_RESULT)
+
+        client = CategorizationClient(transport=httpx.MockTransport(handler))
+        waiting = [asyncio.create_task(client.categorize("Netto", -49.0, "outgoing")) for _ in range(3)]
+        other = asyncio.create_task(client.categorize("Føtex", -49.0, "outgoing"))
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiting, other)
+
+        assert calls == 2
+        assert {r.tier for r in results if r is not None} == {"rule"}
+        assert results[0] is results[1] is results[2]
+
+    async def test_sequential_calls_request_again(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json=_RESULT)
+
+        client = _client(handler)
+        await client.categorize("Netto", -49.0, "outgoing")
+        await client.categorize("Netto", -49.0, "outgoing")
+
+        assert calls == 2
+
+    async def test_one_waiter_cancelled_does_not_cancel_the_others(self) -> None:
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(200, json=_RESULT)
+
+        client = CategorizationClient(transport=httpx.MockTransport(handler))
+        first = asyncio.create_task(client.categorize("Netto", -49.0, "outgoing"))
+        second = asyncio.create_task(client.categorize("Netto", -49.0, "outgoing"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert (await second) is not None
+        await client.aclose()
@@ -80,8 +80,7 @@ class TestBulkImportProducer:
     async def test_sends_a_direction_per_item(self) -> None:
         service, uow = _build_service()
         service._cat_client = _cat_client()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [_make_transaction(id=1), _make_transaction(id=2)]
+        uow.transactions.insert_new.return_value = [_make_transaction(id=1), _make_transaction(id=2)]
         dto = BulkCreateTransactionDTO(
             items=[
                 BulkCreateTransactionItemDTO(
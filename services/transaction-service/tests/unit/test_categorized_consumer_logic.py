@@ -13,8 +13,13 @@ Invariants under test:
 
 from __future__ import annotations
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 from app.models import TransactionModel
 from app.workers.categorized_consumer import TransactionCategorizedConsumer
+from messaging import PoisonMessageError
 
 apply = TransactionCategorizedConsumer._apply_categorization
 
@@ -102,3 +107,31 @@ def test_noop_when_already_consistent() -> None:
     assert tx.category_name == "Mad & drikke"
     assert tx.subcategory_name == "Dagligvarer"
     assert tx.categorization_tier == "rule"
+
+
+async def test_batch_without_transaction_id_is_poison_before_any_query() -> None:
+    """The base then replays the batch per message, so only the bad one is dead-lettered."""
+    consumer = TransactionCategorizedConsumer()
+
+    with pytest.raises(PoisonMessageError):
+        await consumer.handle_batch([_event(), _event(transaction_id=None)])
+
+
+async def test_not_yet_visible_transaction_goes_to_the_retry_tiers_without_waiting(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """No inline sleep: the base's delay tiers provide the wait, so a
+    deferred batch member no longer holds its partition."""
+    import app.workers.categorized_consumer as consumer_module
+
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+    session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr(consumer_module, "async_session_factory", session_factory)
+    monkeypatch.setattr(asyncio, "sleep", AsyncMock(side_effect=AssertionError("slept inline")))
+    consumer = TransactionCategorizedConsumer()
+    consumer._get_transaction = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    message = MagicMock(headers={"x-retry-count": 3})
+
+    with pytest.raises(consumer_module._TransactionNotFoundYet):
+        await consumer.handle(_event(correlation_id=""), message)
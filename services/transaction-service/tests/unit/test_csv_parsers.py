@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import io
 from datetime import date
 from decimal import Decimal
 
 import pytest
 from app.application.csv_parsers.base import ParsedCSVResult
 from app.application.csv_parsers.internal import InternalCSVParser
+from app.application.csv_parsers.nordea import NordeaCSVParser
 from app.application.csv_parsers.registry import get_parser
+from app.application.csv_parsers.utils import iter_lines
+from app.config import settings
 from app.domain.exceptions import CSVImportException
 
 
@@ -135,3 +139,68 @@ class TestParserRegistry:
     def test_error_lists_supported_formats(self) -> None:
         with pytest.raises(CSVImportException, match="internal"):
             get_parser("bad")
+
+
+class TestIterLines:
+    """Incremental decoding must give the parsers what whole-file decoding did."""
+
+    def test_matches_whole_file_split_for_any_chunk_size(self) -> None:
+        text = 'a;b\r\n"multi\nline";ø\næøå;x\nno-newline-at-end'
+        content = text.encode("utf-8")
+
+        for chunk_size in (1, 2, 3, 7, len(content)):
+            assert list(iter_lines(content, "utf-8", chunk_size=chunk_size)) == list(io.StringIO(text))
+
+    def test_reads_file_objects(self) -> None:
+        assert list(iter_lines(io.BytesIO(b"x\ny\n"), "utf-8", chunk_size=1)) == ["x\n", "y\n"]
+
+    def test_bom_is_stripped(self) -> None:
+        assert list(iter_lines("\ufeffh\n".encode("utf-8"), "utf-8-sig", chunk_size=1)) == ["h\n"]
+
+    def test_falls_back_mid_stream(self) -> None:
+        content = ("ascii header\n" * 10 + "Beløb;Købmand\n").encode("windows-1252")
+
+        lines = list(iter_lines(content, "utf-8-sig", "windows-1252", chunk_size=8))
+
+        assert "".join(lines) == content.decode("windows-1252")
+
+    def test_without_fallback_undecodable_bytes_raise(self) -> None:
+        with pytest.raises(UnicodeDecodeError):
+            list(iter_lines("ø".encode("windows-1252"), "utf-8"))
+
+
+class TestStreamingRows:
+    def test_iter_rows_is_lazy(self) -> None:
+        """A bad row far down the file has not been read when the first row is yielded."""
+        content = (
+            b"date,amount,transaction_type,account_id,account_name\n"
+            b"2026-01-01,10.00,expense,1,A\n" + b"2026-01-02,BAD,expense,1,A\n"
+        )
+        result = ParsedCSVResult()
+
+        rows = InternalCSVParser().iter_rows(io.BytesIO(content), 1, 0, "", result)
+        first = next(rows)
+
+        assert first["amount"] == Decimal("10.00")
+        assert result.skipped == 0
+        assert list(rows) == []
+        assert result.skipped == 1
+        assert result.rows == []
+        assert result.rows_read == 2
+
+    def test_windows_1252_upload_streams(self) -> None:
+        header = "Bogføringsdato;Beløb;Afsender;Modtager;Navn;Beskrivelse;Saldo;Valuta;Afstemt\n"
+        content = (header + "2026/03/01;-35,00;;;;Købmand;100,00;DKK;\n").encode("windows-1252")
+
+        rows = list(NordeaCSVParser().iter_rows(io.BytesIO(content), 1, 42, "Konto", ParsedCSVResult()))
+
+        assert [row["description"] for row in rows] == ["Købmand"]
+
+    def test_reported_errors_are_capped_but_all_counted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "CSV_MAX_REPORTED_ERRORS", 2)
+        content = b"date,amount,transaction_type,account_id,account_name\n" + b"2026-01-01,BAD,expense,1,A\n" * 5
+
+        result = InternalCSVParser().parse(content, user_id=1, account_id=0, account_name="")
+
+        assert result.skipped == 5
+        assert [error.split(":")[0] for error in result.errors] == ["Row 2", "Row 3"]
@@ -0,0 +1,134 @@
+"""Import dedup by fingerprint claim (migration 018), on the real repository.
+
+sqlite supports the same partial unique index and ``ON CONFLICT DO
+NOTHING`` target as Postgres, so the claim semantics of ``insert_new``
+and ``bulk_create`` are exercised here; the SQL backfill's agreement with
+:func:`dedup_fingerprint` is Postgres-only and lives in
+``tests/migrations/test_alembic_upgrade.py``.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from app.adapters.outbound.postgres_transaction_repository import PostgresTransactionRepository, dedup_fingerprint
+from app.database import Base
+from app.models import TransactionModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+@pytest.fixture
+async def repository():  # type: ignore[no-untyped-def]
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield PostgresTransactionRepository(session)
+    await engine.dispose()
+
+
+def _row(description: str | None = "Netto", **overrides):  # type: ignore[no-untyped-def]
+    row = {
+        "user_id": 10,
+        "account_id": 100,
+        "account_name": "Lønkonto",
+        "amount": Decimal("49.99"),
+        "transaction_type": "expense",
+        "description": description,
+        "tx_date": date(2026, 3, 1),
+    }
+    row.update(overrides)
+    return row
+
+
+async def _fingerprints(repository: PostgresTransactionRepository) -> dict[int, str | None]:
+    result = await repository._session.execute(select(TransactionModel.id, TransactionModel.dedup_fingerprint))
+    return dict(result.all())
+
+
+class TestFingerprint:
+    def test_amount_scale_does_not_matter(self) -> None:
+        assert dedup_fingerprint(1, 2, date(2026, 3, 1), Decimal("49.9"), "x") == dedup_fingerprint(
+            1, 2, date(2026, 3, 1), Decimal("49.90"), "x"
+        )
+
+    def test_null_and_empty_description_differ(self) -> None:
+        assert dedup_fingerprint(1, 2, date(2026, 3, 1), Decimal("1.00"), None) != dedup_fingerprint(
+            1, 2, date(2026, 3, 1), Decimal("1.00"), ""
+        )
+
+    def test_fields_cannot_run_together(self) -> None:
+        assert dedup_fingerprint(1, 23, date(2026, 3, 1), Decimal("1.00"), None) != dedup_fingerprint(
+            12, 3, date(2026, 3, 1), Decimal("1.00"), None
+        )
+
+
+class TestInsertNew:
+    async def test_skips_claimed_keys_and_repeats(self, repository: PostgresTransactionRepository) -> None:
+        await repository.insert_new([_row("Netto")])
+
+        created = await repository.insert_new([_row("Føtex"), _row("Netto"), _row("Føtex"), _row("Irma")])
+
+        assert [tx.description for tx in created] == ["Føtex", "Irma"]
+
+    async def test_other_user_same_key_is_not_a_duplicate(self, repository: PostgresTransactionRepository) -> None:
+        await repository.insert_new([_row()])
+
+        assert len(await repository.insert_new([_row(user_id=11)])) == 1
+
+    async def test_soft_deleted_row_releases_its_key(self, repository: PostgresTransactionRepository) -> None:
+        [first] = await repository.insert_new([_row()])
+        await repository.delete(first.id, 10)
+
+        assert len(await repository.insert_new([_row()])) == 1
+
+    async def test_edit_moves_the_claim_to_the_new_key(self, repository: PostgresTransactionRepository) -> None:
+        [first] = await repository.insert_new([_row()])
+        await repository.update(first.id, 10, description="Netto Nordhavn")
+
+        assert len(await repository.insert_new([_row()])) == 1
+        assert await repository.insert_new([_row("Netto Nordhavn")]) == []
+
+    async def test_edit_onto_a_claimed_key_stays_unclaimed(self, repository: PostgresTransactionRepository) -> None:
+        [held, edited] = await repository.insert_new([_row("Netto"), _row("Føtex")])
+
+        updated = await repository.update(edited.id, 10, description="Netto")
+
+        assert updated.description == "Netto"
+        fingerprints = await _fingerprints(repository)
+        assert fingerprints[held.id] == dedup_fingerprint(10, 100, date(2026, 3, 1), Decimal("49.99"), "Netto")
+        assert fingerprints[edited.id] is None
+
+
+class TestBulkCreateKeepsDeliberateDuplicates:
+    async def test_repeats_are_inserted_unclaimed_in_input_order(
+        self, repository: PostgresTransactionRepository
+    ) -> None:
+        created = await repository.bulk_create([_row("Netto"), _row("Netto"), _row("Føtex")])
+
+        assert [tx.description for tx in created] == ["Netto", "Netto", "Føtex"]
+        fingerprints = await _fingerprints(repository)
+        assert [fingerprints[tx.id] is not None for tx in created] == [True, False, True]
+
+    async def test_manual_twin_does_not_claim_and_import_still_skips(
+        self, repository: PostgresTransactionRepository
+    ) -> None:
+        await repository.insert_new([_row()])
+        twin = await repository.create(
+            user_id=10,
+            account_id=100,
+            account_name="Lønkonto",
+            category_id=None,
+            category_name=None,
+            amount=Decimal("49.99"),
+            transaction_type="expense",  # type: ignore[arg-type]
+            description="Netto",
+            tx_date=date(2026, 3, 1),
+        )
+
+        assert (await _fingerprints(repository))[twin.id] is None
+        assert await repository.insert_new([_row()]) == []
@@ -0,0 +1,141 @@
+"""Transaction export: encoders, and the streamed path through a real UoW.
+
+The end-to-end cases run the real repository on sqlite, so
+``stream_filtered``'s cursor and the service's batching are exercised
+without Postgres; the server-side cursor itself is Postgres behaviour
+and is covered in ``tests/integration/test_transaction_list_api.py``.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from app.adapters.outbound.postgres_transaction_repository import PostgresTransactionRepository
+from app.adapters.outbound.unit_of_work import SQLAlchemyUnitOfWork
+from app.application import export as export_module
+from app.application.csv_parsers.internal import InternalCSVParser
+from app.application.dto import TransactionFilterSetDTO
+from app.application.export import EXPORT_COLUMNS, ExportFormat, encode
+from app.application.service import TransactionService
+from app.config import settings
+from app.database import Base
+from app.domain.entities import TransactionType
+from app.domain.exceptions import ExportFormatUnavailableException
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+_ROW = (date(2026, 3, 1), Decimal("49.99"), "expense", 100, "Lønkonto", 5, "Mad", 'Netto, "Nordhavn"', 7, "DKK")
+_BARE_ROW = (date(2026, 2, 1), Decimal("15000.00"), "income", 100, "Lønkonto", None, None, None, 6, "DKK")
+
+
+async def _batches(*batches: list) -> AsyncIterator[list]:
+    for batch in batches:
+        yield batch
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestEncoders:
+    async def test_csv_reimports_through_the_internal_parser(self) -> None:
+        body = await _collect(encode(ExportFormat.CSV, _batches([_ROW], [_BARE_ROW])))
+
+        result = InternalCSVParser().parse(body, user_id=10, account_id=0, account_name="")
+
+        assert result.errors == []
+        assert [(r["tx_date"], r["amount"], r["description"], r["category_id"]) for r in result.rows] == [
+            (date(2026, 3, 1), Decimal("49.99"), 'Netto, "Nordhavn"', 5),
+            (date(2026, 2, 1), Decimal("15000.00"), None, None),
+        ]
+
+    async def test_empty_csv_is_just_the_header(self) -> None:
+        body = await _collect(encode(ExportFormat.CSV, _batches()))
+
+        assert body == (",".join(EXPORT_COLUMNS) + "\n").encode()
+
+    async def test_ndjson_keeps_amounts_exact(self) -> None:
+        body = await _collect(encode(ExportFormat.NDJSON, _batches([_ROW, _BARE_ROW])))
+
+        first, second = (json.loads(line) for line in body.decode().splitlines())
+        assert first["amount"] == "49.99"
+        assert first["date"] == "2026-03-01"
+        assert first["account_name"] == "Lønkonto"
+        assert second["category_id"] is None
+
+    async def test_parquet_round_trip(self) -> None:
+        parquet = pytest.importorskip("pyarrow.parquet")
+
+        chunks = [chunk async for chunk in encode(ExportFormat.PARQUET, _batches([_ROW], [_BARE_ROW]))]
+        table = parquet.read_table(io.BytesIO(b"".join(chunks)))
+
+        assert len(chunks) >= 3  # a chunk per batch, then the footer
+        assert table.num_rows == 2
+        assert table.column_names == list(EXPORT_COLUMNS)
+        assert table.column("amount").to_pylist() == [Decimal("49.99"), Decimal("15000.00")]
+        assert table.column("date").to_pylist() == [date(2026, 3, 1), date(2026, 2, 1)]
+
+    def test_parquet_without_pyarrow_is_refused_up_front(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(export_module, "pyarrow", None)
+        service = TransactionService(uow=None)  # type: ignore[arg-type]
+
+        with pytest.raises(ExportFormatUnavailableException, match="pyarrow"):
+            service.export_transactions(10, TransactionFilterSetDTO(), ExportFormat.PARQUET)
+
+
+@pytest.fixture
+async def session():  # type: ignore[no-untyped-def]
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as s:
+        yield s
+    await engine.dispose()
+
+
+def _tx(i: int, **overrides):  # type: ignore[no-untyped-def]
+    row = {
+        "user_id": 10,
+        "account_id": 100,
+        "account_name": "Lønkonto",
+        "amount": Decimal(f"{i + 1}.25"),
+        "transaction_type": "expense",
+        "description": f"row {i}",
+        "tx_date": date(2026, 1, 1 + i % 28),
+    }
+    row.update(overrides)
+    return row
+
+
+class TestExportThroughTheRepository:
+    async def test_streams_every_row_in_batches_with_the_filters(
+        self, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "EXPORT_BATCH_ROWS", 4)
+        repository = PostgresTransactionRepository(session)
+        await repository.bulk_create([_tx(i) for i in range(10)])
+        await repository.bulk_create([_tx(10, account_id=200), _tx(11, user_id=11)])
+        income = await repository.bulk_create([_tx(12, transaction_type=TransactionType.INCOME.value)])
+        await repository.delete(income[0].id, 10)
+        service = TransactionService(uow=SQLAlchemyUnitOfWork(session))
+
+        body = await _collect(
+            service.export_transactions(10, TransactionFilterSetDTO(account_id=100), ExportFormat.NDJSON)
+        )
+
+        rows = [json.loads(line) for line in body.decode().splitlines()]
+        assert sorted(r["description"] for r in rows) == sorted(f"row {i}" for i in range(10))
+        assert [(r["date"], r["id"]) for r in rows] == sorted(((r["date"], r["id"]) for r in rows), reverse=True)
+
+    async def test_batches_are_bounded(self, session: AsyncSession) -> None:
+        repository = PostgresTransactionRepository(session)
+        await repository.bulk_create([_tx(i) for i in range(10)])
+
+        sizes = [len(batch) async for batch in repository.stream_filtered(10, EXPORT_COLUMNS, 4)]
+
+        assert sizes == [4, 4, 2]
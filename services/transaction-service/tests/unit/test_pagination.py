@@ -0,0 +1,63 @@
+"""Keyset cursor codec and the per-filter-shape total cache."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from app.application.pagination import TotalCountCache, decode_cursor, encode_cursor
+from app.domain.exceptions import InvalidCursorException
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCursor:
+    def test_round_trip(self) -> None:
+        cursor = encode_cursor(date(2026, 2, 10), 123456)
+
+        assert decode_cursor(cursor) == (date(2026, 2, 10), 123456)
+
+    def test_is_url_safe_without_padding(self) -> None:
+        cursor = encode_cursor(date(2026, 2, 10), 7)
+
+        assert "=" not in cursor
+        assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+    @pytest.mark.parametrize("cursor", ["", "%%%", "bm90IGEgY3Vyc29y", "MjAyNi0wMi0xMDp4"])
+    def test_garbage_is_an_invalid_cursor(self, cursor: str) -> None:
+        with pytest.raises(InvalidCursorException):
+            decode_cursor(cursor)
+
+
+class TestTotalCountCache:
+    def test_hit_within_ttl_miss_after(self) -> None:
+        clock = _Clock()
+        cache = TotalCountCache(ttl_s=30, max_entries=10, clock=clock)
+        cache.put((1, None), 93)
+
+        clock.now = 29.9
+        assert cache.get((1, None)) == 93
+        clock.now = 30.0
+        assert cache.get((1, None)) is None
+
+    def test_zero_is_a_hit(self) -> None:
+        cache = TotalCountCache(ttl_s=30, max_entries=10)
+        cache.put((1, None), 0)
+
+        assert cache.get((1, None)) == 0
+
+    def test_least_recently_used_shape_is_evicted(self) -> None:
+        cache = TotalCountCache(ttl_s=30, max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        cache.put("c", 3)
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
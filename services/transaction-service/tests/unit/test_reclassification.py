@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from types import SimpleNamespace
 
 import pytest
+from app.application import reclassification
 from app.application.reclassification import (
     EvidenceResolution,
     _proposal_row,
     _resolve_evidence,
     apply_reclassification,
+    scan_transactions,
 )
-from app.models import CategoryModel, SubCategoryModel, TransactionModel
+from app.database import Base
+from app.models import CategoryModel, PlannedTransactionModel, SubCategoryModel, TransactionModel
 from contracts.reclassification import (
     Disposition,
     ExecutionManifest,
@@ -20,7 +23,9 @@ from contracts.reclassification import (
     MappingEntry,
     MappingRegistry,
     MappingTarget,
+    ServiceReport,
 )
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 
 def _mapping() -> MappingRegistry:
@@ -327,3 +332,76 @@ async def test_writer_updates_names_and_emits_exactly_one_idempotent_outbox_even
     assert len(session.added) == 1
     assert await apply_reclassification(session, manifest, execute=True) == {"already_applied": 1}
     assert len(session.added) == 1
+
+
+async def _scan_with(monkeypatch: pytest.MonkeyPatch, chunk_rows: int) -> tuple[ServiceReport, list[int]]:
+    monkeypatch.setattr(reclassification, "SCAN_CHUNK_ROWS", chunk_rows)
+    monkeypatch.setattr(reclassification, "EVIDENCE_CONCURRENCY", 2)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        for index in range(1, 12):
+            session.add(
+                TransactionModel(
+                    id=index,
+                    user_id=1,
+                    account_id=1,
+                    account_name="Account",
+                    category_id=index % 4 or None,
+                    subcategory_id=(16, 1, 29, None, 109)[index % 5],
+                    amount=Decimal(f"{index}.50"),
+                    transaction_type="income" if index % 3 == 0 else "expense",
+                    description=f"row {index}",
+                    date=date(2026, 3, 1),
+                    categorization_tier="manual" if index == 6 else "rule",
+                    deleted_at=datetime(2026, 3, 2, tzinfo=timezone.utc) if index == 11 else None,
+                )
+            )
+        for index in range(1, 4):
+            session.add(
+                PlannedTransactionModel(
+                    id=index,
+                    user_id=1,
+                    account_id=1,
+                    account_name="Account",
+                    category_id=index,
+                    amount=Decimal("5.00"),
+                    transaction_type="expense",
+                    recurrence="monthly",
+                    next_execution=date(2026, 4, 1),
+                )
+            )
+        await session.commit()
+        categorizer = _ChunkRecordingCategorizer()
+        report = await scan_transactions(
+            session,
+            run_id="run",
+            captured_at="2026-03-03T00:00:00Z",
+            mapping=_mapping(),
+            evidence_categorizer=categorizer,
+        )
+    await engine.dispose()
+    return report, categorizer.batch_sizes
+
+
+@pytest.mark.asyncio
+async def test_streamed_scan_matches_a_single_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    single, single_batches = await _scan_with(monkeypatch, chunk_rows=10_000)
+    streamed, streamed_batches = await _scan_with(monkeypatch, chunk_rows=3)
+
+    assert streamed == single
+    assert single_batches == [2]
+    assert sum(streamed_batches) == 2
+    assert single.snapshot.table_counts == {"transactions": 10, "planned_transactions": 3}
+    # 4 and 9 reference the new taxonomy, 8 nothing, 11 is deleted.
+    assert [row.source_id for row in single.rows if row.source_kind == "transaction"] == [
+        "1",
+        "2",
+        "3",
+        "5",
+        "6",
+        "7",
+        "10",
+    ]
@@ -0,0 +1,191 @@
+"""Taxonomy snapshot cache, and name resolution served from it."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+from app.adapters.outbound.taxonomy_notify import TaxonomyInvalidator, notify_taxonomy_changed
+from app.application.dto import BulkCreateTransactionDTO, CreateTransactionDTO, UpdateTransactionDTO
+from app.application.taxonomy_cache import TaxonomyCache
+from app.domain.entities import Category, CategoryType, SubCategory, TransactionType
+from app.domain.exceptions import SubcategoryMismatchException
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from tests.unit.test_transaction_service import _build_service, _bulk_item, _make_transaction
+
+_FOOD = Category(id=1, name="Mad & drikke", type=CategoryType.EXPENSE)
+_HOUSING = Category(id=2, name="Bolig", type=CategoryType.EXPENSE)
+_GROCERIES = SubCategory(id=3, name="Dagligvarer", category_id=1)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _repos(categories=(_FOOD, _HOUSING), subcategories=(_GROCERIES,)):  # type: ignore[no-untyped-def]
+    category_repo = AsyncMock()
+    category_repo.find_all.return_value = list(categories)
+    subcategory_repo = AsyncMock()
+    subcategory_repo.find_all.return_value = list(subcategories)
+    return category_repo, subcategory_repo
+
+
+class TestTaxonomyCache:
+    async def test_loads_once_within_ttl(self) -> None:
+        clock = _Clock()
+        cache = TaxonomyCache(ttl_s=300, clock=clock)
+        categories, subcategories = _repos()
+
+        first = await cache.get(categories, subcategories)
+        clock.now = 299.0
+        second = await cache.get(categories, subcategories)
+
+        assert first is second
+        assert first.version == 1
+        assert first.categories[1].name == "Mad & drikke"
+        assert first.subcategories[3].category_id == 1
+        categories.find_all.assert_awaited_once()
+
+    async def test_ttl_expiry_reloads_with_a_new_version(self) -> None:
+        clock = _Clock()
+        cache = TaxonomyCache(ttl_s=300, clock=clock)
+        categories, subcategories = _repos()
+        await cache.get(categories, subcategories)
+
+        clock.now = 300.0
+        snapshot = await cache.get(categories, subcategories)
+
+        assert snapshot.version == 2
+        assert categories.find_all.await_count == 2
+
+    async def test_invalidate_reloads(self) -> None:
+        cache = TaxonomyCache(ttl_s=300)
+        categories, subcategories = _repos()
+        await cache.get(categories, subcategories)
+        categories.find_all.return_value = [Category(id=1, name="Mad", type=CategoryType.EXPENSE)]
+
+        cache.invalidate()
+
+        assert (await cache.get(categories, subcategories)).categories[1].name == "Mad"
+
+    async def test_concurrent_misses_share_one_load(self) -> None:
+        cache = TaxonomyCache(ttl_s=300)
+        categories, subcategories = _repos()
+
+        snapshots = await asyncio.gather(*(cache.get(categories, subcategories) for _ in range(5)))
+
+        assert len({id(s) for s in snapshots}) == 1
+        categories.find_all.assert_awaited_once()
+
+    async def test_load_overtaken_by_invalidate_is_not_kept(self) -> None:
+        """A NOTIFY that lands while a load is reading must not be
+        swallowed by that load finishing afterwards."""
+        cache = TaxonomyCache(ttl_s=300)
+        categories, subcategories = _repos()
+
+        async def _find_all_then_invalidate() -> list[Category]:
+            cache.invalidate()
+            return [_FOOD]
+
+        categories.find_all.side_effect = _find_all_then_invalidate
+        await cache.get(categories, subcategories)
+        categories.find_all.side_effect = None
+
+        await cache.get(categories, subcategories)
+
+        assert categories.find_all.await_count == 2
+
+
+def _service_with_taxonomy():  # type: ignore[no-untyped-def]
+    service, uow = _build_service()
+    uow.categories.find_all.return_value = [_FOOD, _HOUSING]
+    uow.subcategories.find_all.return_value = [_GROCERIES]
+    service._taxonomy = TaxonomyCache(ttl_s=300)
+    return service, uow
+
+
+class TestServiceNameResolution:
+    async def test_create_resolves_names_without_point_lookups(self) -> None:
+        service, uow = _service_with_taxonomy()
+        uow.transactions.create.return_value = _make_transaction()
+        dto = CreateTransactionDTO(
+            account_id=100,
+            account_name="Main Account",
+            category_id=1,
+            category_name="stale",
+            subcategory_id=3,
+            amount=Decimal("49.99"),
+            transaction_type=TransactionType.EXPENSE,
+            date=date(2026, 3, 1),
+        )
+
+        await service.create_transaction(user_id=10, dto=dto)
+        await service.create_transaction(user_id=10, dto=dto)
+
+        repo_kwargs = uow.transactions.create.call_args.kwargs
+        assert (repo_kwargs["category_name"], repo_kwargs["subcategory_name"]) == ("Mad & drikke", "Dagligvarer")
+        uow.categories.find_by_id.assert_not_awaited()
+        uow.subcategories.find_by_id.assert_not_awaited()
+        uow.categories.find_all.assert_awaited_once()
+
+    async def test_id_missing_from_snapshot_asks_the_read_copy(self) -> None:
+        """Synced a moment ago, notification still in flight."""
+        service, uow = _service_with_taxonomy()
+        uow.categories.find_by_id.return_value = Category(id=9, name="Ferie", type=CategoryType.EXPENSE)
+        uow.transactions.create.return_value = _make_transaction()
+        dto = CreateTransactionDTO(
+            account_id=100,
+            account_name="Main Account",
+            category_id=9,
+            amount=Decimal("49.99"),
+            transaction_type=TransactionType.EXPENSE,
+            date=date(2026, 3, 1),
+        )
+
+        await service.create_transaction(user_id=10, dto=dto)
+
+        assert uow.transactions.create.call_args.kwargs["category_name"] == "Ferie"
+        uow.categories.find_by_id.assert_awaited_once_with(9)
+
+    async def test_update_validates_subcategory_from_the_snapshot(self) -> None:
+        service, uow = _service_with_taxonomy()
+        uow.transactions.find_by_id.return_value = _make_transaction(category_id=2, subcategory_id=None)
+
+        with pytest.raises(SubcategoryMismatchException):
+            await service.update_transaction(transaction_id=1, user_id=10, dto=UpdateTransactionDTO(subcategory_id=3))
+
+        uow.subcategories.find_by_id.assert_not_awaited()
+
+    async def test_bulk_rows_resolve_from_the_snapshot(self) -> None:
+        service, uow = _service_with_taxonomy()
+        uow.transactions.insert_new.return_value = [_make_transaction()]
+        dto = BulkCreateTransactionDTO(items=[_bulk_item(category_id=1, subcategory_id=3, category_name="x")])
+
+        await service.bulk_import(user_id=10, dto=dto)
+
+        row = uow.transactions.insert_new.call_args[0][0][0]
+        assert (row["category_name"], row["subcategory_name"]) == ("Mad & drikke", "Dagligvarer")
+        uow.categories.find_by_id.assert_not_awaited()
+        uow.subcategories.find_by_ids.assert_not_awaited()
+
+
+class TestNotify:
+    async def test_sqlite_session_sends_nothing_and_invalidator_stays_idle(self) -> None:
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        invalidator = TaxonomyInvalidator(engine, TaxonomyCache(ttl_s=300), safety_poll_interval=300)
+        async with AsyncSession(engine) as session:
+            await notify_taxonomy_changed(session)
+
+        invalidator.start()
+
+        assert invalidator._task is None
+        await invalidator.close()
+        await engine.dispose()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import io
+import threading
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
@@ -10,10 +12,13 @@ from app.application.dto import (
     BulkCreateTransactionItemDTO,
     CreatePlannedTransactionDTO,
     CreateTransactionDTO,
+    CSVImportProgressDTO,
     TransactionFiltersDTO,
     UpdateTransactionDTO,
 )
+from app.application.pagination import TotalCountCache, decode_cursor, encode_cursor
 from app.application.service import TransactionService
+from app.config import settings
 from app.domain.entities import (
     Category,
     CategoryType,
@@ -24,6 +29,7 @@ from app.domain.entities import (
 )
 from app.domain.exceptions import (
     CSVImportException,
+    InvalidCursorException,
     PlannedTransactionNotFoundException,
     SubcategoryMismatchException,
     SubcategoryNotFoundException,
@@ -436,6 +442,115 @@ class TestListTransactions:
         assert uow.__aenter__.await_count == 1
         uow.transactions.count_filtered.assert_awaited_once()
 
+    @pytest.mark.asyncio()
+    async def test_include_total_false_skips_the_count(self) -> None:
+        service, uow = _build_service()
+        uow.transactions.find_filtered.return_value = [_make_transaction()]
+
+        result = await service.list_transactions(user_id=10, filters=TransactionFiltersDTO(include_total=False))
+
+        uow.transactions.count_filtered.assert_not_awaited()
+        assert result.total_count is None
+        assert result.next_cursor is None
+
+
+class TestListTransactionsCursorMode:
+    @pytest.mark.asyncio()
+    async def test_empty_cursor_starts_at_the_top_and_reads_one_extra_row(self) -> None:
+        service, uow = _build_service()
+        uow.transactions.find_page_after.return_value = [
+            _make_transaction(id=9, date=date(2026, 3, 2)),
+            _make_transaction(id=8, date=date(2026, 3, 1)),
+            _make_transaction(id=7, date=date(2026, 3, 1)),
+        ]
+        filters = TransactionFiltersDTO(account_id=100, limit=2, cursor="")
+
+        result = await service.list_transactions(user_id=10, filters=filters)
+
+        uow.transactions.find_page_after.assert_awaited_once_with(
+            10,
+            None,
+            3,
+            account_id=100,
+            category_id=None,
+            start_date=None,
+            end_date=None,
+            transaction_type=None,
+        )
+        uow.transactions.find_filtered.assert_not_awaited()
+        assert [item.id for item in result.items] == [9, 8]
+        assert decode_cursor(result.next_cursor) == (date(2026, 3, 1), 8)
+
+    @pytest.mark.asyncio()
+    async def test_cursor_is_forwarded_as_a_position(self) -> None:
+        service, uow = _build_service()
+        uow.transactions.find_page_after.return_value = []
+
+        await service.list_transactions(
+            user_id=10, filters=TransactionFiltersDTO(cursor=encode_cursor(date(2026, 3, 1), 8))
+        )
+
+        assert uow.transactions.find_page_after.await_args.args[1] == (date(2026, 3, 1), 8)
+
+    @pytest.mark.asyncio()
+    async def test_last_page_has_no_next_cursor(self) -> None:
+        service, uow = _build_service()
+        uow.transactions.find_page_after.return_value = [_make_transaction(id=2), _make_transaction(id=1)]
+
+        result = await service.list_transactions(user_id=10, filters=TransactionFiltersDTO(limit=2, cursor=""))
+
+        assert len(result.items) == 2
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio()
+    async def test_total_is_counted_once_per_filter_shape(self) -> None:
+        uow = _build_service()[1]
+        service = TransactionService(uow=uow, total_cache=TotalCountCache(ttl_s=60, max_entries=10))
+        uow.transactions.find_page_after.return_value = []
+        uow.transactions.count_filtered.return_value = 93
+
+        first = await service.list_transactions(user_id=10, filters=TransactionFiltersDTO(cursor=""))
+        second = await service.list_transactions(
+            user_id=10, filters=TransactionFiltersDTO(cursor=encode_cursor(date(2026, 1, 1), 5))
+        )
+        other_shape = await service.list_transactions(
+            user_id=10, filters=TransactionFiltersDTO(account_id=100, cursor="")
+        )
+
+        assert first.total_count == second.total_count == other_shape.total_count == 93
+        assert uow.transactions.count_filtered.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_include_total_false_never_counts(self) -> None:
+        service, uow = _build_service()
+        uow.transactions.find_page_after.return_value = []
+
+        result = await service.list_transactions(
+            user_id=10, filters=TransactionFiltersDTO(cursor="", include_total=False)
+        )
+
+        uow.transactions.count_filtered.assert_not_awaited()
+        assert result.total_count is None
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("cursor", ["not base64!", encode_cursor(date(2026, 1, 1), 1)[:-2], "MjAyNi0xMy0wMTox"])
+    async def test_malformed_cursor_is_rejected(self, cursor: str) -> None:
+        service, uow = _build_service()
+
+        with pytest.raises(InvalidCursorException):
+            await service.list_transactions(user_id=10, filters=TransactionFiltersDTO(cursor=cursor))
+
+        uow.transactions.find_page_after.assert_not_awaited()
+
+    @pytest.mark.asyncio()
+    async def test_skip_with_a_cursor_is_rejected(self) -> None:
+        service, uow = _build_service()
+
+        with pytest.raises(InvalidCursorException, match="skip"):
+            await service.list_transactions(user_id=10, filters=TransactionFiltersDTO(cursor="", skip=50))
+
+        uow.transactions.find_page_after.assert_not_awaited()
+
 
 class TestUpdateTransaction:
     @pytest.mark.asyncio()
@@ -807,8 +922,7 @@ class TestImportCSV:
     async def test_success_uses_add_batch(self) -> None:
         service, uow = _build_service()
         tx = _make_transaction()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [tx]
+        uow.transactions.insert_new.return_value = [tx]
         csv_content = (
             b"date,amount,transaction_type,account_id,account_name,"
             b"category_id,category_name,description\n"
@@ -833,8 +947,7 @@ class TestImportCSV:
     async def test_partial_failure(self) -> None:
         service, uow = _build_service()
         tx = _make_transaction()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [tx]
+        uow.transactions.insert_new.return_value = [tx]
         csv_content = (
             b"date,amount,transaction_type,account_id,account_name\n"
             b"2026-03-01,49.99,expense,100,Main Account\n"
@@ -850,11 +963,8 @@ class TestImportCSV:
     @pytest.mark.asyncio()
     async def test_duplicates_skipped(self) -> None:
         service, uow = _build_service()
-        # The row's dedup key already exists in the DB (no description
-        # column in this CSV -> description is None in the key).
-        uow.transactions.find_existing_dedup_keys.return_value = {
-            (100, date(2026, 3, 1), Decimal("49.99"), None),
-        }
+        # A live row already claims the dedup key: nothing is inserted.
+        uow.transactions.insert_new.return_value = []
         csv_content = (
             b"date,amount,transaction_type,account_id,account_name\n2026-03-01,49.99,expense,100,Main Account\n"
         )
@@ -868,11 +978,10 @@ class TestImportCSV:
 
     @pytest.mark.asyncio()
     async def test_intra_file_duplicate_imported_once(self) -> None:
-        """The same row twice in one file must import once and count the
-        repeat as a skipped duplicate — even when the DB has no match."""
+        """The same row twice in one file: ``insert_new`` keeps the first
+        and the repeat is counted as a skipped duplicate."""
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [_make_transaction()]
+        uow.transactions.insert_new.return_value = [_make_transaction()]
         csv_content = (
             b"date,amount,transaction_type,account_id,account_name,"
             b"category_id,category_name,description\n"
@@ -884,19 +993,14 @@ class TestImportCSV:
 
         assert result.imported == 1
         assert result.duplicates_skipped == 1
-        rows_arg = uow.transactions.bulk_create.call_args[0][0]
-        assert len(rows_arg) == 1
+        assert len(uow.transactions.insert_new.call_args[0][0]) == 2
 
     @pytest.mark.asyncio()
-    async def test_dedup_uses_single_batch_query(self) -> None:
-        """One anti-join query for the whole file — never one per row."""
+    async def test_dedup_is_the_insert(self) -> None:
+        """One ``insert_new`` for the file, no lookup beforehand — the
+        duplicate check and the insert are the same statement."""
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [
-            _make_transaction(id=1),
-            _make_transaction(id=2),
-            _make_transaction(id=3),
-        ]
+        uow.transactions.insert_new.return_value = [_make_transaction(id=1), _make_transaction(id=3)]
         csv_content = (
             b"date,amount,transaction_type,account_id,account_name,"
             b"category_id,category_name,description\n"
@@ -907,15 +1011,16 @@ class TestImportCSV:
 
         result = await service.import_csv(user_id=10, csv_content=csv_content)
 
-        assert result.imported == 3
-        uow.transactions.find_existing_dedup_keys.assert_awaited_once()
-        _user_id, keys = uow.transactions.find_existing_dedup_keys.call_args[0]
-        assert _user_id == 10
-        assert keys == [
-            (100, date(2026, 3, 1), Decimal("49.99"), "Netto"),
-            (100, date(2026, 3, 2), Decimal("12.50"), "Kaffe"),
-            (100, date(2026, 3, 3), Decimal("7.00"), "Kiosk"),
+        assert (result.imported, result.duplicates_skipped) == (2, 1)
+        uow.transactions.find_existing_dedup_keys.assert_not_awaited()
+        uow.transactions.bulk_create.assert_not_awaited()
+        rows = uow.transactions.insert_new.call_args[0][0]
+        assert [(r["user_id"], r["tx_date"], r["amount"], r["description"]) for r in rows] == [
+            (10, date(2026, 3, 1), Decimal("49.99"), "Netto"),
+            (10, date(2026, 3, 2), Decimal("12.50"), "Kaffe"),
+            (10, date(2026, 3, 3), Decimal("7.00"), "Kiosk"),
         ]
+        assert len(uow.outbox.add_batch.call_args[0][0]) == 2
 
     @pytest.mark.asyncio()
     async def test_all_invalid_no_outbox(self) -> None:
@@ -931,6 +1036,43 @@ class TestImportCSV:
         uow.outbox.add_batch.assert_not_awaited()
         uow.commit.assert_not_awaited()
 
+    @pytest.mark.asyncio()
+    async def test_streams_in_chunks_within_one_commit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Dedup-insert + outbox per chunk; one commit for the file."""
+        monkeypatch.setattr(settings, "CSV_IMPORT_CHUNK_ROWS", 2)
+        service, uow = _build_service()
+        uow.transactions.insert_new.side_effect = lambda rows: [_make_transaction(id=i) for i in range(len(rows))]
+        csv_content = b"date,amount,transaction_type,account_id,account_name\n" + b"".join(
+            f"2026-03-0{day},10.00,expense,100,Main Account\n".encode() for day in range(1, 6)
+        )
+        progress: list[CSVImportProgressDTO] = []
+
+        result = await service.import_csv(user_id=10, csv_content=io.BytesIO(csv_content), on_progress=progress.append)
+
+        assert result.imported == 5
+        assert (result.rows_read, result.chunks) == (5, 3)
+        assert [len(call.args[0]) for call in uow.transactions.insert_new.call_args_list] == [2, 2, 1]
+        assert uow.outbox.add_batch.await_count == 3
+        uow.commit.assert_awaited_once()
+        assert [(p.rows_read, p.imported) for p in progress] == [(2, 2), (4, 4), (5, 5)]
+
+    @pytest.mark.asyncio()
+    async def test_row_cap_hit_mid_file_commits_nothing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "CSV_IMPORT_CHUNK_ROWS", 2)
+        monkeypatch.setattr(settings, "CSV_MAX_ROWS", 3)
+        service, uow = _build_service()
+        uow.transactions.insert_new.side_effect = lambda rows: [_make_transaction(id=i) for i in range(len(rows))]
+        csv_content = b"date,amount,transaction_type,account_id,account_name\n" + b"".join(
+            f"2026-03-0{day},10.00,expense,100,Main Account\n".encode() for day in range(1, 6)
+        )
+
+        with pytest.raises(CSVImportException, match="for mange rækker"):
+            await service.import_csv(user_id=10, csv_content=csv_content)
+
+        uow.commit.assert_not_awaited()
+        uow.__aexit__.assert_awaited_once()
+        assert uow.__aexit__.call_args.args[0] is CSVImportException
+
     @pytest.mark.asyncio()
     async def test_unknown_bank_format_raises(self) -> None:
         service, _uow = _build_service()
@@ -955,6 +1097,114 @@ class TestImportCSV:
                 bank_format="nordea",
             )
 
+    @pytest.mark.asyncio()
+    async def test_rows_are_batch_categorized_before_insert(self) -> None:
+        service, uow = _build_service()
+        service._cat_client = AsyncMock()
+        service._cat_client.categorize_batch.return_value = [
+            MagicMock(category_id=1, subcategory_id=3, tier="rule", confidence="high"),
+            None,
+        ]
+        uow.transactions.insert_new.return_value = [_make_transaction()]
+        csv_content = (
+            b"date,amount,transaction_type,account_id,account_name,description\n"
+            b"2026-03-01,49.99,expense,100,Main Account,Netto\n"
+            b"2026-03-02,12000,income,100,Main Account,Loen\n"
+        )
+
+        await service.import_csv(user_id=10, csv_content=csv_content)
+
+        items = service._cat_client.categorize_batch.call_args.args[0]
+        assert [(i["description"], i["direction"]) for i in items] == [("Netto", "outgoing"), ("Loen", "incoming")]
+        categorized, unanswered = uow.transactions.insert_new.call_args.args[0]
+        assert (categorized["category_id"], categorized["subcategory_id"]) == (1, 3)
+        assert (categorized["categorization_tier"], categorized["categorization_confidence"]) == ("rule", "high")
+        assert unanswered["category_id"] is None
+        assert "categorization_tier" not in unanswered
+
+    @pytest.mark.asyncio()
+    async def test_categorization_runs_before_the_transaction_opens(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "CSV_IMPORT_CHUNK_ROWS", 2)
+        service, uow = _build_service()
+        transaction_opened_at_call: list[bool] = []
+
+        async def categorize_batch(items: list[dict]) -> list[MagicMock]:
+            transaction_opened_at_call.append(uow.__aenter__.await_count > 0)
+            return [MagicMock(category_id=1, subcategory_id=3, tier="rule", confidence="high") for _ in items]
+
+        service._cat_client = AsyncMock()
+        service._cat_client.categorize_batch.side_effect = categorize_batch
+        uow.transactions.insert_new.side_effect = lambda rows: [_make_transaction(id=i) for i in range(len(rows))]
+        csv_content = b"date,amount,transaction_type,account_id,account_name,description\n" + b"".join(
+            b"2026-03-0%d,1,expense,100,Main Account,Netto\n" % day for day in range(1, 6)
+        )
+
+        result = await service.import_csv(user_id=10, csv_content=io.BytesIO(csv_content))
+
+        assert transaction_opened_at_call == [False, False, False]
+        assert result.imported == 5
+        inserted = [row for call in uow.transactions.insert_new.call_args_list for row in call.args[0]]
+        assert [row["categorization_tier"] for row in inserted] == ["rule"] * 5
+
+    @pytest.mark.asyncio()
+    async def test_upload_is_read_off_the_event_loop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Both passes read the spooled file on worker threads, never the loop's."""
+        monkeypatch.setattr(settings, "CSV_IMPORT_CHUNK_ROWS", 2)
+        service, uow = _build_service()
+        service._cat_client = AsyncMock()
+        service._cat_client.categorize_batch.side_effect = lambda items: [None] * len(items)
+        uow.transactions.insert_new.side_effect = lambda rows: [_make_transaction(id=i) for i in range(len(rows))]
+        loop_thread = threading.get_ident()
+        read_threads: list[int] = []
+
+        class RecordingUpload(io.BytesIO):
+            def read(self, size: int | None = -1) -> bytes:
+                read_threads.append(threading.get_ident())
+                return super().read(size)
+
+        csv_content = b"date,amount,transaction_type,account_id,account_name\n" + b"".join(
+            f"2026-03-0{day},10.00,expense,100,Main Account\n".encode() for day in range(1, 6)
+        )
+
+        result = await service.import_csv(user_id=10, csv_content=RecordingUpload(csv_content))
+
+        assert result.imported == 5
+        assert read_threads
+        assert loop_thread not in read_threads
+
+    @pytest.mark.asyncio()
+    async def test_unparseable_file_is_rejected_before_the_transaction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "CSV_MAX_ROWS", 3)
+        service, uow = _build_service()
+        service._cat_client = AsyncMock()
+        service._cat_client.categorize_batch.side_effect = lambda items: [None] * len(items)
+        csv_content = b"date,amount,transaction_type,account_id,account_name\n" + b"".join(
+            f"2026-03-0{day},10.00,expense,100,Main Account\n".encode() for day in range(1, 6)
+        )
+
+        with pytest.raises(CSVImportException, match="for mange rækker"):
+            await service.import_csv(user_id=10, csv_content=csv_content)
+
+        uow.__aenter__.assert_not_awaited()
+        uow.transactions.insert_new.assert_not_awaited()
+
+    @pytest.mark.asyncio()
+    async def test_categorization_calls_respect_the_batch_cap(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "CATEGORIZATION_BATCH_ITEMS", 2)
+        service, uow = _build_service()
+        service._cat_client = AsyncMock()
+        service._cat_client.categorize_batch.side_effect = lambda items: [None] * len(items)
+        uow.transactions.insert_new.return_value = []
+        csv_content = b"date,amount,transaction_type,account_id,account_name,description\n" + b"".join(
+            b"2026-03-0%d,1,expense,100,Main Account,Row\n" % day for day in range(1, 6)
+        )
+
+        await service.import_csv(user_id=10, csv_content=csv_content)
+
+        sizes = [len(c.args[0]) for c in service._cat_client.categorize_batch.call_args_list]
+        assert sizes == [2, 2, 1]
+        assert len(uow.transactions.insert_new.call_args.args[0]) == 5
+
 
 def _bulk_item(**overrides) -> BulkCreateTransactionItemDTO:  # type: ignore[no-untyped-def]
     defaults = {
@@ -975,8 +1225,7 @@ class TestBulkImport:
     @pytest.mark.asyncio()
     async def test_all_new_items_imported(self) -> None:
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [
+        uow.transactions.insert_new.return_value = [
             _make_transaction(id=1),
             _make_transaction(id=2),
         ]
@@ -996,10 +1245,8 @@ class TestBulkImport:
     @pytest.mark.asyncio()
     async def test_duplicates_are_skipped(self) -> None:
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = {
-            (100, date(2026, 3, 1), Decimal("49.99"), "Netto"),
-        }
-        uow.transactions.bulk_create.return_value = [_make_transaction(id=3)]
+        # "Netto" collides with a live row's fingerprint; only "Føtex" lands.
+        uow.transactions.insert_new.return_value = [_make_transaction(id=3)]
         dto = BulkCreateTransactionDTO(
             items=[_bulk_item(description="Netto"), _bulk_item(description="Føtex")],
         )
@@ -1011,16 +1258,15 @@ class TestBulkImport:
         assert result.errors == 0
         assert result.imported_ids == [3]
 
-        bulk_arg = uow.transactions.bulk_create.call_args[0][0]
-        assert len(bulk_arg) == 1
-        assert bulk_arg[0]["description"] == "Føtex"
+        assert [row["description"] for row in uow.transactions.insert_new.call_args[0][0]] == ["Netto", "Føtex"]
+        uow.transactions.bulk_create.assert_not_awaited()
 
     @pytest.mark.asyncio()
-    async def test_dedup_uses_single_batch_query(self) -> None:
-        """One anti-join query for the whole payload — never per item."""
+    async def test_id_less_items_dedup_in_the_insert(self) -> None:
+        """Id-less items go straight to ``insert_new`` — no lookup query
+        beforehand, so no window between the check and the insert."""
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [
+        uow.transactions.insert_new.return_value = [
             _make_transaction(id=1),
             _make_transaction(id=2),
         ]
@@ -1030,29 +1276,27 @@ class TestBulkImport:
 
         await service.bulk_import(user_id=10, dto=dto)
 
-        uow.transactions.find_existing_dedup_keys.assert_awaited_once()
-        _user_id, keys = uow.transactions.find_existing_dedup_keys.call_args[0]
-        assert _user_id == 10
-        assert keys == [
-            (100, date(2026, 3, 1), Decimal("49.99"), "Netto"),
-            (100, date(2026, 3, 1), Decimal("49.99"), "Føtex"),
+        uow.transactions.find_existing_dedup_keys.assert_not_awaited()
+        uow.transactions.insert_new.assert_awaited_once()
+        rows = uow.transactions.insert_new.call_args[0][0]
+        assert [(r["user_id"], r["account_id"], r["description"]) for r in rows] == [
+            (10, 100, "Netto"),
+            (10, 100, "Føtex"),
         ]
 
     @pytest.mark.asyncio()
     async def test_intra_batch_duplicate_imported_once(self) -> None:
-        """A key repeated within one payload imports once — the repeat
-        counts as a skipped duplicate even with an empty DB."""
+        """A key repeated within one payload imports once (``insert_new``
+        claims it for the first row) and the repeat counts as skipped."""
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [_make_transaction(id=1)]
+        uow.transactions.insert_new.return_value = [_make_transaction(id=1)]
         dto = BulkCreateTransactionDTO(items=[_bulk_item(), _bulk_item()])
 
         result = await service.bulk_import(user_id=10, dto=dto)
 
         assert result.imported == 1
         assert result.duplicates_skipped == 1
-        bulk_arg = uow.transactions.bulk_create.call_args[0][0]
-        assert len(bulk_arg) == 1
+        assert len(uow.transactions.insert_new.call_args[0][0]) == 2
 
     @pytest.mark.asyncio()
     async def test_skip_duplicates_false_bypasses_lookup(self) -> None:
@@ -1068,6 +1312,7 @@ class TestBulkImport:
         result = await service.bulk_import(user_id=10, dto=dto)
 
         uow.transactions.find_existing_dedup_keys.assert_not_awaited()
+        uow.transactions.insert_new.assert_not_awaited()
         uow.transactions.bulk_create.assert_awaited_once()
         assert result.duplicates_skipped == 0
         assert len(uow.transactions.bulk_create.call_args[0][0]) == 2
@@ -1075,11 +1320,9 @@ class TestBulkImport:
     @pytest.mark.asyncio()
     async def test_all_duplicates_still_commits(self) -> None:
         """If every item is a duplicate we still close the UoW cleanly
-        without calling ``bulk_create`` or writing outbox events."""
+        without writing outbox events."""
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = {
-            (100, date(2026, 3, 1), Decimal("49.99"), "Groceries"),
-        }
+        uow.transactions.insert_new.return_value = []
         dto = BulkCreateTransactionDTO(items=[_bulk_item(), _bulk_item()])
 
         result = await service.bulk_import(user_id=10, dto=dto)
@@ -1097,8 +1340,7 @@ class TestBulkImport:
         consumed by TransactionSyncConsumer.
         """
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [_make_transaction()]
+        uow.transactions.insert_new.return_value = [_make_transaction()]
         dto = BulkCreateTransactionDTO(items=[_bulk_item()])
 
         await service.bulk_import(user_id=10, dto=dto)
@@ -1118,8 +1360,7 @@ class TestBulkImport:
         round-trip all the way to the MySQL projection).
         """
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [
+        uow.transactions.insert_new.return_value = [
             _make_transaction(
                 subcategory_id=77,
                 categorization_tier="rule",
@@ -1138,7 +1379,7 @@ class TestBulkImport:
 
         await service.bulk_import(user_id=10, dto=dto)
 
-        row = uow.transactions.bulk_create.call_args[0][0][0]
+        row = uow.transactions.insert_new.call_args[0][0][0]
         assert row["subcategory_id"] == 77
         assert row["categorization_tier"] == "rule"
         assert row["categorization_confidence"] == "high"
@@ -1254,8 +1495,7 @@ class TestBulkImport:
     @pytest.mark.asyncio()
     async def test_items_without_external_id_never_query_external_ids(self) -> None:
         service, uow = _build_service()
-        uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [_make_transaction()]
+        uow.transactions.insert_new.return_value = [_make_transaction()]
         dto = BulkCreateTransactionDTO(items=[_bulk_item()])
 
         await service.bulk_import(user_id=10, dto=dto)
@@ -1265,15 +1505,13 @@ class TestBulkImport:
     @pytest.mark.asyncio()
     async def test_mixed_batch_queries_each_path_once(self) -> None:
         """One external-id lookup + one NULL-scoped fuzzy lookup for the
-        id-bearing items, one plain fuzzy lookup for the rest — never
-        per item."""
+        id-bearing items, one ``insert_new`` for the rest — never per
+        item."""
         service, uow = _build_service()
         uow.transactions.find_existing_external_ids.return_value = set()
         uow.transactions.find_existing_dedup_keys.return_value = set()
-        uow.transactions.bulk_create.return_value = [
-            _make_transaction(id=1, external_id="EB-1"),
-            _make_transaction(id=2),
-        ]
+        uow.transactions.bulk_create.return_value = [_make_transaction(id=1, external_id="EB-1")]
+        uow.transactions.insert_new.return_value = [_make_transaction(id=2)]
         dto = BulkCreateTransactionDTO(
             items=[
                 _bulk_item(description="Netto", external_id="EB-1"),
@@ -1285,13 +1523,12 @@ class TestBulkImport:
 
         assert result.imported == 2
         uow.transactions.find_existing_external_ids.assert_awaited_once_with(10, [(100, "EB-1")])
-        fuzzy_calls = uow.transactions.find_existing_dedup_keys.await_args_list
-        assert len(fuzzy_calls) == 2
-        scoped = [c for c in fuzzy_calls if c.kwargs.get("only_missing_external_id")]
-        plain = [c for c in fuzzy_calls if not c.kwargs.get("only_missing_external_id")]
-        assert len(scoped) == len(plain) == 1
-        assert scoped[0].args[1] == [(100, date(2026, 3, 1), Decimal("49.99"), "Netto")]
-        assert plain[0].args[1] == [(100, date(2026, 3, 1), Decimal("49.99"), "Føtex")]
+        uow.transactions.find_existing_dedup_keys.assert_awaited_once()
+        scoped = uow.transactions.find_existing_dedup_keys.call_args
+        assert scoped.kwargs == {"only_missing_external_id": True}
+        assert scoped.args[1] == [(100, date(2026, 3, 1), Decimal("49.99"), "Netto")]
+        assert [r["description"] for r in uow.transactions.bulk_create.call_args[0][0]] == ["Netto"]
+        assert [r["description"] for r in uow.transactions.insert_new.call_args[0][0]] == ["Føtex"]
 
 
 class TestCreatePlanned: